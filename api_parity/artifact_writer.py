@@ -11,6 +11,7 @@ from __future__ import annotations
 import copy
 import json
 import re
+import shutil
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -41,12 +42,19 @@ class RunStats:
     mismatches: int = 0
     errors: int = 0
     skipped: int = 0
+    # Cases where a target throttled (adaptive rate control); not compared
+    throttled: int = 0
     operations: dict[str, int] = field(default_factory=dict)
     # Chain-specific stats
     total_chains: int = 0
     chain_matches: int = 0
     chain_mismatches: int = 0
     chain_errors: int = 0
+    chain_throttled: int = 0
+    # Final rate per target under adaptive rate control ("Target A" -> req/s)
+    adaptive_rates: dict[str, float] = field(default_factory=dict)
+    # Body comparisons that skipped rules because the bodies were identical
+    identical_bodies: int = 0
     # Set to True if run was interrupted (SIGINT)
     interrupted: bool = False
 
@@ -72,6 +80,8 @@ class ReplayStats:
     different_mismatch: int = 0
     errors: int = 0
     skipped: int = 0
+    # Bundles where a target throttled (adaptive rate control); not classified
+    throttled: int = 0
 
     # Breakdown by type
     stateless_bundles: int = 0
@@ -159,6 +169,9 @@ class ArtifactWriter:
             StatelessExecution(request=case, response=response_b).model_dump()
         )
 
+        self._copy_spilled_bodies(bundle_dir, [("target_a.body", exec_a_data["response"])])
+        self._copy_spilled_bodies(bundle_dir, [("target_b.body", exec_b_data["response"])])
+
         # Write case.json
         self._write_json(bundle_dir / "case.json", case_data)
 
@@ -234,6 +247,15 @@ class ArtifactWriter:
         exec_a_data = self._redact(execution_a.model_dump())
         exec_b_data = self._redact(execution_b.model_dump())
 
+        for prefix, exec_data in (("target_a", exec_a_data), ("target_b", exec_b_data)):
+            self._copy_spilled_bodies(
+                bundle_dir,
+                [
+                    (f"{prefix}.step{step['step_index']}.body", step["response"])
+                    for step in exec_data["steps"]
+                ],
+            )
+
         # Write chain.json
         self._write_json(bundle_dir / "chain.json", chain_data)
 
@@ -278,7 +300,8 @@ class ArtifactWriter:
 
         Args:
             chains: List of chains that were executed.
-            outcomes: Outcome for each chain ("match", "mismatch", or "error").
+            outcomes: Outcome for each chain ("match", "mismatch", "error", or
+                      "throttled").
             max_chains: Max chains setting used.
             max_steps: Max steps setting used.
 
@@ -334,6 +357,9 @@ class ArtifactWriter:
         lines.append(f"Matches: {match_count}")
         lines.append(f"Mismatches: {mismatch_count}")
         lines.append(f"Errors: {error_count}")
+        throttled_count = outcomes.count("throttled")
+        if throttled_count:
+            lines.append(f"Throttled: {throttled_count}")
         lines.append(f"Links traversed: {len(used_links)}")
 
         # Write to file
@@ -361,12 +387,16 @@ class ArtifactWriter:
             "mismatches": stats.mismatches,
             "errors": stats.errors,
             "skipped": stats.skipped,
+            "throttled": stats.throttled,
             "operations": stats.operations,
             # Chain stats (zero in stateless mode)
             "total_chains": stats.total_chains,
             "chain_matches": stats.chain_matches,
             "chain_mismatches": stats.chain_mismatches,
             "chain_errors": stats.chain_errors,
+            "chain_throttled": stats.chain_throttled,
+            "adaptive_rates": stats.adaptive_rates,
+            "identical_bodies": stats.identical_bodies,
         }
         self._write_json(self._output_dir / "summary.json", summary)
 
@@ -392,6 +422,7 @@ class ArtifactWriter:
             "different_mismatch": stats.different_mismatch,
             "errors": stats.errors,
             "skipped": stats.skipped,
+            "throttled": stats.throttled,
             # Type breakdown
             "stateless_bundles": stats.stateless_bundles,
             "chain_bundles": stats.chain_bundles,
@@ -402,6 +433,31 @@ class ArtifactWriter:
         }
         self._write_json(self._output_dir / "replay_summary.json", summary)
 
+    def _copy_spilled_bodies(
+        self, bundle_dir: Path, responses: list[tuple[str, dict[str, Any]]]
+    ) -> None:
+        """Copy truncated bodies' spill files into the bundle.
+
+        Spill files belong to the executor and are deleted once the result is
+        reported, so the bundle keeps its own copy and body_file is rewritten
+        to that bundle-relative name.
+
+        Args:
+            bundle_dir: Bundle directory.
+            responses: (file name, dumped ResponseCase) pairs; the dicts are
+                       modified in place.
+        """
+        for name, response in responses:
+            source = response.get("body_file")
+            if source is None:
+                continue
+            try:
+                shutil.copyfile(source, bundle_dir / name)
+            except OSError:
+                response["body_file"] = None
+                continue
+            response["body_file"] = name
+
     def _write_json(self, path: Path, data: Any) -> None:
         """Write data as JSON to a file atomically.
 
@@ -239,18 +239,28 @@ def extract_by_jsonpointer(data: Any, pointer: str) -> Any:
         path doesn't exist. Callers must check ``value is not _MISSING``
         to distinguish JSON null from absent paths.
     """
+    return extract_by_segments(data, split_jsonpointer(pointer))
+
+
+def split_jsonpointer(pointer: str) -> tuple[str, ...]:
+    """Split a JSONPointer path (without leading slash) into decoded segments.
+
+    The empty pointer refers to the whole document and has no segments.
+    """
     if not pointer:
-        return data
+        return ()
+    return tuple(_decode_jsonpointer_segment(part) for part in pointer.split("/"))
 
-    parts = pointer.split("/")
-    current = data
 
-    for part in parts:
-        # Decode RFC 6901 escape sequences
-        part = _decode_jsonpointer_segment(part)
+def extract_by_segments(data: Any, segments: tuple[str, ...]) -> Any:
+    """Extract a value using JSONPointer segments from split_jsonpointer().
 
-        if current is _MISSING:
-            return _MISSING
+    Same semantics as extract_by_jsonpointer(), for callers that look up the
+    same pointer many times and split it once.
+    """
+    current = data
+
+    for part in segments:
         if current is None:
             # JSON null value mid-traversal — path doesn't continue
             return _MISSING
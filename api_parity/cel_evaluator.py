@@ -1,23 +1,79 @@
-"""CEL Evaluator - Python wrapper for the Go CEL subprocess.
+"""CEL Evaluator - Python wrapper for the Go CEL evaluator.
 
 This module provides a CELEvaluator class that manages the Go subprocess
 and provides a simple evaluate() interface for CEL expression evaluation.
+If the Go evaluator has been built as a shared library, CELEvaluator loads
+it with ctypes instead and evaluates in-process: the same messages are
+passed to a function call rather than over pipes.
 
 Protocol (newline-delimited JSON):
-    Startup: Go sends {"ready":true}
-    Request: Python sends {"id":"<uuid>","expr":"a == b","data":{"a":1,"b":1}}
-    Response: Go sends {"id":"<uuid>","ok":true,"result":true}
-    Error: Go sends {"id":"<uuid>","ok":false,"error":"..."}
+    Startup: Go sends {"ready":true,"pipelined":true,"handles":true,"documents":true,"framed":true}
+    Framing: Python sends {"id":"<id>","framed":true} first, Go responds {"id":"<id>","ok":true}
+    Request: Python sends {"id":"<id>","expr":"a == b","data":{"a":1,"b":1}}
+    Response: Go sends {"id":"<id>","ok":true,"result":true}
+    Error: Go sends {"id":"<id>","ok":false,"error":"..."}
+    Batch request: Python sends {"id":"<id>","batch":[{"expr":...,"data":...},...]}
+    Batch response: Go sends {"id":"<id>","ok":true,"results":[{"ok":true,"result":true},...]}
+    Register: Python sends {"id":"<id>","register":[{"expr":"a == b","vars":["a","b"]},...]}
+    Register response: Go sends {"id":"<id>","ok":true,"results":[{"ok":true,"handle":1},...]}
+    By handle: {"id":"<id>","handle":1,"data":{...}}, or batch items {"handle":1,"data":{...}}
+    Upload: Python sends {"id":"<id>","upload":{"a":<body>,"b":<body>}}, Go responds {...,"doc":1}
+    By reference: batch items {"handle":1,"data":{...},"doc":1,"refs":{"a":["a","items",0]}}
+    Release: Python sends {"id":"<id>","release":1}
+
+Framing: lines are capped at 10 MB on the Go side, and a longer one ends
+the subprocess. If the ready message says "framed", Python switches both
+directions to messages prefixed with their length (4 bytes, big-endian)
+before sending anything else, so large bindings (e.g. a binary rule over a
+big body_base64) go through whole. Go reads each frame into one buffer of
+exactly its size. Python keeps a message as its parts (each item's bindings
+encoded once, as bytes) and writes them one after another, so a large
+binding is never copied into a whole-message string or buffer.
+
+Pipelining: if the ready message says "pipelined", requests are written
+without waiting for earlier responses. Go evaluates them concurrently and
+responds as each finishes; a reader thread matches responses to requests by
+id. Without it (older binaries), each request waits for its response.
+
+Handles: if the ready message says "handles", each (expression, variable
+names) is registered once per subprocess, and evaluations send its integer
+handle instead of the expression. Go evicts least recently used programs
+when its cache is full; items whose handle was evicted are resent with
+their expression, and the program is registered again on next use.
+
+Documents: if the ready message says "documents", evaluate_batch() can
+upload named documents (a response pair) once and bind variables given as
+DocumentValue to a path into them, instead of sending each value. Items
+whose reference cannot be resolved (the upload is gone, or the path does
+not lead to a value) are resent with their values.
+
+In-process: CelCall() in the library takes one request message and returns
+its response, with handles (but no ready message or pipelining). Calls
+release the GIL, so messages of a large batch are evaluated on several
+threads at once. There is no subprocess to restart; a crash in the library
+is a crash of the Python process.
+
+CELEvaluatorPool runs several subprocesses behind the same interface, so
+evaluations from concurrent callers, and the parts of a large batch, are
+evaluated in parallel.
 """
 
 from __future__ import annotations
 
+import ctypes
+import functools
+import itertools
 import json
+import os
 import select
 import subprocess
-import uuid
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, Iterable
 
 
 class CELEvaluationError(Exception):
@@ -28,9 +84,138 @@ class CELSubprocessError(Exception):
     """Raised when the CEL subprocess fails or cannot be started."""
 
 
+# Starts of the Go errors for items to resend with their expression and
+# values: the program or upload was evicted, or a reference does not lead to
+# a value
+_RESEND_ERRORS = ("unknown program handle", "unknown data handle", "unresolvable reference")
+
+
+@dataclass(frozen=True)
+class DocumentValue:
+    """A variable binding that is part of a document passed to evaluate_batch().
+
+    Attributes:
+        document: Name of the document in evaluate_batch()'s documents.
+        path: Object member names and list indexes from the document to value.
+        value: The value itself, sent instead when documents are not uploaded.
+    """
+
+    document: str
+    path: tuple[str | int, ...]
+    value: Any
+
+
+class _CELLibrary:
+    """The Go evaluator built as a shared library (see cmd/cel-evaluator/library.go)."""
+
+    def __init__(self, path: Path) -> None:
+        library = ctypes.CDLL(str(path))
+        library.CelCall.argtypes = [ctypes.c_char_p]
+        # void pointer, not c_char_p, so the response can be freed
+        library.CelCall.restype = ctypes.c_void_p
+        library.CelFree.argtypes = [ctypes.c_void_p]
+        library.CelFree.restype = None
+        self._call = library.CelCall
+        self._free = library.CelFree
+
+    def call(self, message: list[bytes]) -> dict[str, Any]:
+        """Evaluate one protocol message and return its response."""
+        # A C string is one buffer, so only here are the parts joined
+        pointer = self._call(b"".join(message))
+        try:
+            return json.loads(ctypes.string_at(pointer))
+        finally:
+            self._free(pointer)
+
+
+def _write_messages(stream: IO[bytes], messages: list[list[bytes]], framed: bool) -> None:
+    """Write protocol messages as lines, or as length-prefixed frames, and flush.
+
+    Each message is given as the parts of its JSON, which are written in
+    order without being joined.
+    """
+    for message in messages:
+        if framed:
+            stream.write(sum(map(len, message)).to_bytes(4, "big"))
+        for part in message:
+            stream.write(part)
+        if not framed:
+            stream.write(b"\n")
+    stream.flush()
+
+
+def _encode_message(message: dict[str, Any]) -> list[bytes]:
+    """A small protocol message, as the one part of its JSON."""
+    return [json.dumps(message).encode()]
+
+
+def _read_message(stream: IO[bytes], framed: bool) -> bytes:
+    """Read one protocol message (b"" once the stream ends)."""
+    if not framed:
+        return stream.readline()
+    header = stream.read(4)
+    if len(header) < 4:
+        return b""
+    size = int.from_bytes(header, "big")
+    data = stream.read(size)
+    return data if len(data) == size else b""
+
+
+@functools.lru_cache(maxsize=None)
+def _load_library(path: Path) -> _CELLibrary:
+    """Load a shared library build once per process (it cannot be unloaded)."""
+    return _CELLibrary(path)
+
+
+class _PendingReplies:
+    """Responses awaited from one pipelined subprocess, by request id.
+
+    Once the subprocess's output ends, every awaited (and later expected)
+    response resolves to None.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._futures: dict[str, Future] = {}
+        self._closed = False
+
+    def expect(self, request_id: str) -> Future:
+        """A future for the response to request_id."""
+        future: Future = Future()
+        with self._lock:
+            if not self._closed:
+                self._futures[request_id] = future
+                return future
+        future.set_result(None)
+        return future
+
+    def discard(self, request_id: str) -> None:
+        """Stop waiting for a response (a late one is dropped)."""
+        with self._lock:
+            self._futures.pop(request_id, None)
+
+    def resolve(self, response: dict[str, Any]) -> None:
+        """Hand a response to whoever awaits its id."""
+        with self._lock:
+            future = self._futures.pop(response.get("id"), None)
+        if future is not None:
+            future.set_result(response)
+
+    def close(self) -> None:
+        """The subprocess is gone: resolve everything awaited to None."""
+        with self._lock:
+            self._closed = True
+            futures, self._futures = list(self._futures.values()), {}
+        for future in futures:
+            future.set_result(None)
+
+
 class CELEvaluator:
     """Manages a Go CEL evaluator subprocess.
 
+    Safe to use from several threads; with a pipelined subprocess their
+    requests are in flight at the same time.
+
     Usage:
         evaluator = CELEvaluator()
         try:
@@ -47,6 +232,11 @@ class CELEvaluator:
     # Default path to cel-evaluator binary (relative to this file's directory)
     DEFAULT_BINARY_PATH = Path(__file__).parent.parent / "cel-evaluator"
 
+    # Default path to the shared library build, used instead of the binary if present
+    DEFAULT_LIBRARY_PATH = Path(__file__).parent.parent / (
+        "libcelevaluator.dylib" if sys.platform == "darwin" else "libcelevaluator.so"
+    )
+
     # Maximum restart attempts before giving up (prevents infinite restart loops)
     MAX_RESTARTS = 3
 
@@ -55,19 +245,67 @@ class CELEvaluator:
 
     # Timeout for individual evaluation (seconds)
     # Go CEL evaluator has internal 5s timeout, so use 10s to allow for IPC overhead
+    # and for a builtin call (e.g. matches()) that finishes after the deadline.
+    # A batch shares one Go-side 5s deadline, so the same timeout applies to it.
+    # Pipelined messages queued behind others get it from the previous response.
     EVALUATION_TIMEOUT = 10.0
 
-    def __init__(self, binary_path: str | Path | None = None):
+    # Maximum size of one batch message (bytes). Without framing, the Go side
+    # reads lines of at most 10 MB; larger batches are split into several
+    # messages. A single larger item only fits in a frame.
+    MAX_BATCH_BYTES = 8 * 1024 * 1024
+
+    # Maximum items per batch message when pipelined, so Go evaluates the
+    # parts of a large batch concurrently
+    PIPELINE_BATCH_ITEMS = 512
+
+    def __init__(
+        self,
+        binary_path: str | Path | None = None,
+        library_path: str | Path | None = None,
+    ):
         """Initialize the CEL evaluator.
 
+        With neither path given, the shared library at DEFAULT_LIBRARY_PATH
+        is loaded if it exists; otherwise the binary at DEFAULT_BINARY_PATH
+        runs as a subprocess.
+
         Args:
-            binary_path: Path to cel-evaluator binary. Defaults to ./cel-evaluator
-                        relative to the api_parity package.
+            binary_path: Path to cel-evaluator binary, run as a subprocess.
+            library_path: Path to the shared library build, loaded in-process.
+
+        Raises:
+            CELSubprocessError: If the subprocess cannot be started, or the
+                                library cannot be loaded.
         """
+        if binary_path is None and library_path is None and self.DEFAULT_LIBRARY_PATH.exists():
+            library_path = self.DEFAULT_LIBRARY_PATH
         self._binary_path = Path(binary_path) if binary_path else self.DEFAULT_BINARY_PATH
+        self._library: _CELLibrary | None = None
+        self._library_threads: ThreadPoolExecutor | None = None
         self._process: subprocess.Popen | None = None
         self._restart_count = 0
-        self._start_subprocess()
+        # Request ids: a counter is unique per evaluator and cheaper than uuid4
+        self._ids = itertools.count(1)
+        # Serializes unpipelined exchanges, and restarts
+        self._lock = threading.RLock()
+        # Serializes writes of pipelined requests
+        self._write_lock = threading.Lock()
+        self._pipelined = False
+        self._handles_supported = False
+        self._documents_supported = False
+        # Whether messages are length-prefixed frames instead of lines
+        self._framed = False
+        # Bumped per (re)start: handles are only valid in the subprocess that issued them
+        self._generation = 0
+        # (expression, variable names) -> handle, or the compile error
+        self._handles: dict[tuple[str, tuple[str, ...]], int | CELEvaluationError] = {}
+        self._replies = _PendingReplies()
+        self._reader: threading.Thread | None = None
+        if library_path is not None:
+            self._load_library(Path(library_path))
+        else:
+            self._start_subprocess()
 
     def __enter__(self) -> "CELEvaluator":
         return self
@@ -75,6 +313,31 @@ class CELEvaluator:
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         self.close()
 
+    @property
+    def pipelined(self) -> bool:
+        """Whether requests are sent without waiting for earlier responses."""
+        return self._pipelined
+
+    @property
+    def in_process(self) -> bool:
+        """Whether evaluation runs in the shared library instead of a subprocess."""
+        return self._library is not None
+
+    def _load_library(self, path: Path) -> None:
+        """Evaluate in-process with the shared library at path."""
+        if not path.exists():
+            raise CELSubprocessError(f"CEL evaluator library not found: {path}")
+        try:
+            self._library = _load_library(path)
+        except (OSError, AttributeError) as e:
+            raise CELSubprocessError(f"Cannot load CEL evaluator library {path}: {e}") from e
+        self._handles_supported = True
+        self._documents_supported = True
+        self._generation = 1
+        self._library_threads = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1, thread_name_prefix="cel-library"
+        )
+
     def _start_subprocess(self) -> None:
         """Start the Go subprocess and wait for ready signal."""
         if not self._binary_path.exists():
@@ -85,9 +348,8 @@ class CELEvaluator:
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1,  # Line buffered for immediate JSON line flushing
         )
+        self._framed = False
 
         # Wait for ready signal with timeout
         ready, _, _ = select.select([self._process.stdout], [], [], self.STARTUP_TIMEOUT)
@@ -103,7 +365,7 @@ class CELEvaluator:
             stderr = ""
             stderr_ready, _, _ = select.select([self._process.stderr], [], [], 1.0)
             if stderr_ready:
-                stderr = self._process.stderr.read(4096)  # Read available data, don't block
+                stderr = self._process.stderr.read(4096).decode(errors="replace")  # Read available data, don't block
             raise CELSubprocessError(f"CEL subprocess died during startup: {stderr}")
 
         try:
@@ -113,6 +375,55 @@ class CELEvaluator:
         except json.JSONDecodeError as e:
             raise CELSubprocessError(f"Invalid ready message: {ready_line}") from e
 
+        self._pipelined = ready_msg.get("pipelined") is True
+        self._handles_supported = ready_msg.get("handles") is True
+        self._documents_supported = self._handles_supported and ready_msg.get("documents") is True
+        if ready_msg.get("framed") is True:
+            self._switch_to_frames()
+        self._generation += 1
+        self._handles = {}
+        if self._pipelined:
+            self._replies = _PendingReplies()
+            self._reader = threading.Thread(
+                target=self._read_replies,
+                args=(self._process, self._replies, self._framed),
+                name="cel-replies",
+                daemon=True,
+            )
+            self._reader.start()
+
+    def _switch_to_frames(self) -> None:
+        """Have the just started subprocess use length-prefixed messages."""
+        request_id = self._next_id()
+        _write_messages(self._process.stdin, [_encode_message({"id": request_id, "framed": True})], False)
+        ready, _, _ = select.select([self._process.stdout], [], [], self.STARTUP_TIMEOUT)
+        line = self._process.stdout.readline() if ready else b""
+        try:
+            response = json.loads(line) if line else {}
+        except json.JSONDecodeError:
+            response = {}
+        if response.get("id") != request_id or not response.get("ok"):
+            self._cleanup_process()
+            raise CELSubprocessError(f"CEL subprocess did not switch to framed messages: {line!r}")
+        self._framed = True
+
+    def _read_replies(
+        self, process: subprocess.Popen, replies: _PendingReplies, framed: bool
+    ) -> None:
+        """Reader thread: hand each response to the request awaiting it."""
+        try:
+            while line := _read_message(process.stdout, framed):
+                try:
+                    response = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Cannot be matched to a request; it will time out
+                if isinstance(response, dict):
+                    replies.resolve(response)
+        except (OSError, ValueError):
+            pass  # stdout closed by _cleanup_process
+        finally:
+            replies.close()
+
     def _restart_subprocess(self) -> None:
         """Restart the subprocess after a crash."""
         if self._restart_count >= self.MAX_RESTARTS:
@@ -125,20 +436,17 @@ class CELEvaluator:
         self._start_subprocess()
 
     def _cleanup_process(self) -> None:
-        """Clean up the subprocess (best-effort, all exceptions suppressed)."""
+        """Clean up the subprocess (best-effort, all exceptions suppressed).
+
+        The process is stopped before its output pipes are closed, so a
+        reader thread blocked on stdout sees EOF instead of a close racing
+        its read.
+        """
         if self._process:
             try:
                 self._process.stdin.close()
             except Exception:
                 pass
-            try:
-                self._process.stdout.close()
-            except Exception:
-                pass
-            try:
-                self._process.stderr.close()
-            except Exception:
-                pass
             try:
                 self._process.terminate()
                 self._process.wait(timeout=1)
@@ -157,8 +465,23 @@ class CELEvaluator:
                     self._process.wait(timeout=1)
                 except Exception:
                     pass
+            if self._reader is not None:
+                self._reader.join(timeout=1)
+                self._reader = None
+            try:
+                self._process.stdout.close()
+            except Exception:
+                pass
+            try:
+                self._process.stderr.close()
+            except Exception:
+                pass
             self._process = None
 
+    def _next_id(self) -> str:
+        """A request id unique within this evaluator."""
+        return str(next(self._ids))
+
     def evaluate(self, expression: str, data: dict[str, Any]) -> bool:
         """Evaluate a CEL expression with the given data.
 
@@ -173,18 +496,422 @@ class CELEvaluator:
             CELEvaluationError: If the expression fails to evaluate.
             CELSubprocessError: If the subprocess crashes and cannot be restarted.
         """
+        if self._handles_supported:
+            (result,) = self.evaluate_batch([(expression, data)])
+            if isinstance(result, CELEvaluationError):
+                raise result
+            return result
+
+        request_id = self._next_id()
+        request = {"id": request_id, "expr": expression, "data": data}
+        (response,) = self._exchange_all([(request_id, _encode_message(request))])
+
+        if not response.get("ok"):
+            raise CELEvaluationError(response.get("error", "Unknown CEL evaluation error"))
+
+        return response["result"]
+
+    def evaluate_batch(
+        self,
+        items: list[tuple[str, dict[str, Any]]],
+        documents: dict[str, Any] | None = None,
+    ) -> list[bool | CELEvaluationError]:
+        """Evaluate many CEL expressions in as few round-trips as possible.
+
+        Items are sent as batch messages of at most MAX_BATCH_BYTES each
+        (usually one), instead of one message per expression. When
+        pipelined, messages hold at most PIPELINE_BATCH_ITEMS items and are
+        all sent before the first response is read. With handles, programs
+        not yet registered are registered first, in one message.
+
+        Args:
+            items: (expression, variable bindings) pairs. A binding may be a
+                   DocumentValue into one of documents.
+            documents: Named documents that DocumentValue bindings refer
+                       to. If given, and the evaluator supports it, they
+                       are uploaded once and those bindings are sent as
+                       paths; otherwise their values are sent.
+
+        Returns:
+            One entry per item, in order: the boolean result, or a
+            CELEvaluationError for an item that failed to evaluate. A failing
+            item does not affect the others, including an item whose data
+            cannot be sent as JSON (e.g. NaN, which Go would reject along
+            with the whole batch line).
+
+        Raises:
+            CELEvaluationError: If a batch reply is missing or malformed.
+            CELSubprocessError: If the subprocess crashes and cannot be restarted.
+        """
+        results: list[bool | CELEvaluationError | None] = [None] * len(items)
+        with self._lock:
+            generation, handles = self._generation, self._handles
+        doc = None
+        if documents is not None and self._documents_supported and items:
+            doc = self._upload(documents, generation)
+        try:
+            # (item index, JSON of its bindings) for each item that can be sent
+            pending = self._encode_items(items, range(len(items)), doc, results)
+            if pending and self._handles_supported:
+                pending = self._evaluate_by_handle(items, pending, results, generation, handles, doc)
+            if pending:
+                expressions: dict[str, bytes] = {}
+                entries = []
+                for index, bindings in pending:
+                    expression = items[index][0]
+                    head = expressions.get(expression)
+                    if head is None:
+                        head = expressions[expression] = f'{{"expr":{json.dumps(expression)},'.encode()
+                    entries.append((index, [head, *bindings, b"}"]))
+                self._send_items(entries, results)
+        finally:
+            if doc is not None:
+                self._release(doc, generation)
+        return results
+
+    def _encode_items(
+        self,
+        items: list[tuple[str, dict[str, Any]]],
+        indexes: Iterable[int],
+        doc: int | None,
+        results: list[bool | CELEvaluationError | None],
+    ) -> list[tuple[int, list[bytes]]]:
+        """Encode the bindings of items as batch item members.
+
+        DocumentValue bindings become references into upload doc, or their
+        value if doc is None. An item that cannot be sent as JSON gets a
+        CELEvaluationError result instead.
+
+        Returns:
+            (item index, parts of '"data":{...}' plus "doc" and "refs" if
+            any) pairs. The data is one bytes part, which later messages
+            reuse rather than copy.
+        """
+        encoded = []
+        for index in indexes:
+            data = items[index][1]
+            values = data
+            refs = None
+            for name, value in data.items():
+                if type(value) is DocumentValue:
+                    if values is data:
+                        values = dict(data)
+                    if doc is None:
+                        values[name] = value.value
+                    else:
+                        del values[name]
+                        if refs is None:
+                            refs = {}
+                        refs[name] = [value.document, *value.path]
+            try:
+                bindings = [b'"data":', json.dumps(values, allow_nan=False).encode()]
+            except (TypeError, ValueError) as e:
+                results[index] = CELEvaluationError(f"Data is not JSON-serializable: {e}")
+                continue
+            if refs is not None:
+                bindings.append(f',"doc":{doc},"refs":{json.dumps(refs)}'.encode())
+            encoded.append((index, bindings))
+        return encoded
+
+    def _upload(self, documents: dict[str, Any], generation: int) -> int | None:
+        """Upload documents to the subprocess of the given generation.
+
+        Returns:
+            The data handle, or None if the documents cannot be sent as JSON
+            or that subprocess has been replaced.
+        """
+        try:
+            documents_json = json.dumps(documents, allow_nan=False).encode()
+        except (TypeError, ValueError):
+            return None
+        request_id = self._next_id()
+        message = [f'{{"id":{json.dumps(request_id)},"upload":'.encode(), documents_json, b"}"]
+        (response,) = self._exchange_all([(request_id, message)], generation)
+        if response is None or not response.get("ok"):
+            return None
+        return response.get("doc")
+
+    def _release(self, doc: int, generation: int) -> None:
+        """Drop an upload from the subprocess of the given generation, if it still runs."""
+        request_id = self._next_id()
+        message = _encode_message({"id": request_id, "release": doc})
+        self._exchange_all([(request_id, message)], generation)
+
+    def _evaluate_by_handle(
+        self,
+        items: list[tuple[str, dict[str, Any]]],
+        pending: list[tuple[int, list[bytes]]],
+        results: list[bool | CELEvaluationError | None],
+        generation: int,
+        handles: dict[tuple[str, tuple[str, ...]], int | CELEvaluationError],
+        doc: int | None,
+    ) -> list[tuple[int, list[bytes]]]:
+        """Evaluate pending items by program handle, registering programs as needed.
+
+        Handles (and upload doc, if any) are those of the subprocess of the
+        given generation.
+
+        Returns:
+            The pending items still without a result, with their bindings
+            sent by value: their handle was evicted, a reference could not
+            be resolved, or the subprocess restarted. They are to be sent
+            with their expression instead.
+        """
+        keys = [(items[index][0], tuple(items[index][1])) for index, _ in pending]
+        missing = [key for key in dict.fromkeys(keys) if key not in handles]
+        if missing:
+            self._register(missing, generation, handles)
+
+        entries = []
+        entry_keys = {}
+        left = []
+        for (index, bindings), key in zip(pending, keys):
+            handle = handles.get(key)
+            if handle is None:
+                left.append(index)
+            elif isinstance(handle, CELEvaluationError):
+                results[index] = handle
+            else:
+                entries.append((index, [b'{"handle":%d,' % handle, *bindings, b"}"]))
+                entry_keys[index] = key
+
+        for index in self._send_items(entries, results, generation):
+            # The subprocess may no longer have the program; register it again next time
+            handles.pop(entry_keys[index], None)
+            left.append(index)
+        if doc is None:
+            bindings = dict(pending)
+            return [(index, bindings[index]) for index in left]
+        return self._encode_items(items, left, None, results)
+
+    def _register(
+        self,
+        programs: list[tuple[str, tuple[str, ...]]],
+        generation: int,
+        handles: dict[tuple[str, tuple[str, ...]], int | CELEvaluationError],
+    ) -> None:
+        """Compile programs in the subprocess of the given generation.
+
+        Stores each program's handle, or its compile error, in handles.
+        Stores nothing if that subprocess has been replaced.
+        """
+        request_id = self._next_id()
+        message = _encode_message({
+            "id": request_id,
+            "register": [{"expr": expression, "vars": list(names)} for expression, names in programs],
+        })
+        (response,) = self._exchange_all([(request_id, message)], generation)
+        if response is None:
+            return
+        for key, handle in zip(programs, self._unpack_batch(response, len(programs), "handle")):
+            handles[key] = handle
+
+    def _send_items(
+        self,
+        entries: list[tuple[int, list[bytes]]],
+        results: list[bool | CELEvaluationError | None],
+        generation: int | None = None,
+    ) -> list[int]:
+        """Send encoded batch items and store their results by item index.
+
+        Args:
+            entries: (item index, parts of the item JSON) pairs.
+            results: Per-item results to fill in.
+            generation: For items referencing handles, the subprocess
+                        generation that issued them.
+
+        Returns:
+            Indexes of items left without a result because their handle or
+            upload is no longer known, a reference could not be resolved,
+            or the subprocess was replaced.
+        """
+        split = self._pipelined or self._library is not None
+        max_items = self.PIPELINE_BATCH_ITEMS if split else len(entries)
+        chunks: list[list[tuple[int, list[bytes]]]] = []
+        chunk: list[tuple[int, list[bytes]]] = []
+        chunk_bytes = 0
+        for entry in entries:
+            entry_bytes = sum(map(len, entry[1]))
+            if chunk and (
+                chunk_bytes + entry_bytes > self.MAX_BATCH_BYTES or len(chunk) >= max_items
+            ):
+                chunks.append(chunk)
+                chunk = []
+                chunk_bytes = 0
+            chunk.append(entry)
+            chunk_bytes += entry_bytes + 1
+        if chunk:
+            chunks.append(chunk)
+        if not chunks:
+            return []
+
+        messages = []
+        for chunk in chunks:
+            request_id = self._next_id()
+            # The items' parts are shared with the message, not copied into it
+            message = [f'{{"id":{json.dumps(request_id)},"batch":['.encode()]
+            for position, (_, item) in enumerate(chunk):
+                if position:
+                    message.append(b",")
+                message.extend(item)
+            message.append(b"]}")
+            messages.append((request_id, message))
+        responses = self._exchange_all(messages, generation)
+
+        stale = []
+        for chunk, response in zip(chunks, responses):
+            if response is None:
+                stale.extend(index for index, _ in chunk)
+                continue
+            for (index, _), result in zip(chunk, self._unpack_batch(response, len(chunk))):
+                if (
+                    generation is not None
+                    and isinstance(result, CELEvaluationError)
+                    and str(result).startswith(_RESEND_ERRORS)
+                ):
+                    stale.append(index)
+                else:
+                    results[index] = result
+        return stale
+
+    def _unpack_batch(
+        self, response: dict[str, Any], count: int, field: str = "result"
+    ) -> list[Any]:
+        """Per-item field values (or CELEvaluationErrors) of one batch or register response."""
+        if not response.get("ok"):
+            raise CELEvaluationError(response.get("error", "Unknown CEL evaluation error"))
+
+        item_results = response.get("results", [])
+        if len(item_results) != count:
+            raise CELEvaluationError(
+                f"Batch result count mismatch: sent {count}, got {len(item_results)}"
+            )
+
+        return [
+            r[field] if r.get("ok")
+            else CELEvaluationError(r.get("error", "Unknown CEL evaluation error"))
+            for r in item_results
+        ]
+
+    def cache_stats(self) -> dict[str, int]:
+        """Program cache counters of the subprocess.
+
+        Returns:
+            hits, misses, evictions and size, counted since the subprocess
+            (re)started; empty if the binary does not support handles.
+        """
+        if not self._handles_supported:
+            return {}
+        request_id = self._next_id()
+        message = _encode_message({"id": request_id, "stats": True})
+        (response,) = self._exchange_all([(request_id, message)])
+        return response.get("stats", {})
+
+    def _exchange_all(
+        self, messages: list[tuple[str, list[bytes]]], generation: int | None = None
+    ) -> list[dict[str, Any] | None]:
+        """Send protocol messages and return their responses, in message order.
+
+        Messages referencing handles pass the subprocess generation that
+        issued them. They are never sent to another subprocess: their
+        response is None if that one has been replaced.
+        """
+        if self._library is not None:
+            return self._call_library(messages)
+        if not self._pipelined:
+            with self._lock:
+                return [
+                    self._exchange(request_id, message, generation)
+                    for request_id, message in messages
+                ]
+        return self._exchange_pipelined(messages, generation)
+
+    def _call_library(self, messages: list[tuple[str, list[bytes]]]) -> list[dict[str, Any]]:
+        """Evaluate messages in-process, several at once if there are several."""
+        threads = self._library_threads
+        if threads is None:
+            raise CELSubprocessError("CEL evaluator not running (was close() called?)")
+        if len(messages) == 1:
+            return [self._library.call(messages[0][1])]
+        return list(threads.map(self._library.call, [message for _, message in messages]))
+
+    def _exchange_pipelined(
+        self, messages: list[tuple[str, list[bytes]]], generation: int | None
+    ) -> list[dict[str, Any] | None]:
+        """Send every message at once and collect the responses as they arrive.
+
+        If the subprocess dies, it is restarted (up to MAX_RESTARTS) and the
+        messages still unanswered are resent, unless tied to a generation.
+
+        Raises:
+            CELEvaluationError: If a response does not arrive within
+                                EVALUATION_TIMEOUT of the previous one.
+            CELSubprocessError: If the subprocess is not running or cannot be restarted.
+        """
+        responses: dict[str, dict[str, Any]] = {}
+        unanswered = messages
+        while unanswered:
+            with self._lock:
+                process, replies, framed = self._process, self._replies, self._framed
+                replaced = generation is not None and generation != self._generation
+            if process is None:
+                raise CELSubprocessError(
+                    "CEL evaluator not running (was close() called, or did startup fail?)"
+                )
+            if replaced:
+                break
+
+            futures = [replies.expect(request_id) for request_id, _ in unanswered]
+            with self._write_lock:
+                try:
+                    _write_messages(process.stdin, [message for _, message in unanswered], framed)
+                except (BrokenPipeError, ValueError):
+                    pass  # The reader sees EOF and resolves the futures to None
+
+            for (request_id, _), future in zip(unanswered, futures):
+                try:
+                    response = future.result(timeout=self.EVALUATION_TIMEOUT)
+                except FutureTimeoutError:
+                    for pending_id, _ in unanswered:
+                        replies.discard(pending_id)
+                    raise CELEvaluationError(
+                        f"CEL evaluation timeout ({self.EVALUATION_TIMEOUT}s)"
+                    ) from None
+                if response is not None:
+                    responses[request_id] = response
+
+            unanswered = [m for m in unanswered if m[0] not in responses]
+            if unanswered:
+                # Subprocess died; restart it unless another caller already did
+                with self._lock:
+                    if self._process is process:
+                        self._restart_subprocess()
+
+        return [responses.get(request_id) for request_id, _ in messages]
+
+    def _exchange(
+        self, request_id: str, message: list[bytes], generation: int | None
+    ) -> dict[str, Any] | None:
+        """Send one protocol message and return the matching response.
+
+        Unpipelined only. Restarts the subprocess and resends if it died
+        (up to MAX_RESTARTS). Returns None instead of sending if the
+        message is tied to a generation that has been replaced.
+
+        Raises:
+            CELEvaluationError: On timeout, invalid JSON, or ID mismatch.
+            CELSubprocessError: If the subprocess is not running or cannot be restarted.
+        """
         if self._process is None:
             raise CELSubprocessError(
                 "CEL evaluator not running (was close() called, or did startup fail?)"
             )
-
-        request_id = str(uuid.uuid4())
-        request = {"id": request_id, "expr": expression, "data": data}
+        if generation is not None and generation != self._generation:
+            return None
 
         try:
             # Send request
-            self._process.stdin.write(json.dumps(request) + "\n")
-            self._process.stdin.flush()
+            _write_messages(self._process.stdin, [message], self._framed)
 
             # Wait for response with timeout to prevent indefinite blocking
             ready, _, _ = select.select(
@@ -196,16 +923,16 @@ class CELEvaluator:
                 )
 
             # Read response (EOF = subprocess died, restart and retry)
-            response_line = self._process.stdout.readline()
+            response_line = _read_message(self._process.stdout, self._framed)
             if not response_line:
                 self._restart_subprocess()
-                return self.evaluate(expression, data)
+                return self._exchange(request_id, message, generation)
 
             response = json.loads(response_line)
 
         except BrokenPipeError:
             self._restart_subprocess()
-            return self.evaluate(expression, data)
+            return self._exchange(request_id, message, generation)
         except json.JSONDecodeError as e:
             raise CELEvaluationError(f"Invalid response from subprocess: {response_line}") from e
 
@@ -215,16 +942,217 @@ class CELEvaluator:
                 f"Response ID mismatch: expected {request_id}, got {response.get('id')}"
             )
 
-        if not response.get("ok"):
-            raise CELEvaluationError(response.get("error", "Unknown CEL evaluation error"))
-
-        return response["result"]
+        return response
 
     def close(self) -> None:
-        """Shut down the CEL evaluator subprocess."""
-        self._cleanup_process()
+        """Shut down the CEL evaluator subprocess (or stop using the library)."""
+        with self._lock:
+            self._cleanup_process()
+            threads, self._library_threads = self._library_threads, None
+        if threads is not None:
+            threads.shutdown(wait=False)
 
     @property
     def is_running(self) -> bool:
-        """Check if the subprocess is running."""
+        """Check if the subprocess is running (or the library is in use)."""
+        if self._library is not None:
+            return self._library_threads is not None
         return self._process is not None and self._process.poll() is None
+
+
+class _PoolMember(CELEvaluator):
+    """One subprocess of a CELEvaluatorPool.
+
+    Restarts draw on the pool's shared budget, and a (re)started subprocess
+    compiles the pool's known programs before it takes evaluations.
+    """
+
+    def __init__(self, pool: CELEvaluatorPool, binary_path: Path) -> None:
+        self._pool = pool
+        # Evaluations dispatched to this member and not yet finished
+        self.in_flight = 0
+        super().__init__(binary_path)
+
+    def _start_subprocess(self) -> None:
+        super()._start_subprocess()
+        self._pool._warm(self)
+
+    def _restart_subprocess(self) -> None:
+        self._pool._spend_restart()
+        self._cleanup_process()
+        self._start_subprocess()
+
+
+class CELEvaluatorPool:
+    """Several CEL evaluator subprocesses behind the CELEvaluator interface.
+
+    Each evaluation goes to the member with the fewest evaluations in
+    flight. A batch of at least 2 * MIN_SPLIT_ITEMS items is split into
+    contiguous parts evaluated on several members at once. A member that
+    crashes is restarted; restarts across all members count against one
+    MAX_RESTARTS budget, as for a single CELEvaluator. Programs the pool has
+    evaluated are compiled by every member that (re)starts.
+
+    Usage:
+        with CELEvaluatorPool(size=4) as evaluator:
+            results = evaluator.evaluate_batch(items)
+    """
+
+    MAX_RESTARTS = CELEvaluator.MAX_RESTARTS
+
+    # Smallest part a batch is split into; smaller batches go to one member
+    MIN_SPLIT_ITEMS = 256
+
+    def __init__(self, size: int | None = None, binary_path: str | Path | None = None):
+        """Start the pool's subprocesses.
+
+        Args:
+            size: Number of subprocesses. Defaults to the number of CPUs.
+            binary_path: Path to cel-evaluator binary. Defaults to
+                        CELEvaluator.DEFAULT_BINARY_PATH.
+
+        Raises:
+            ValueError: If size is less than 1.
+            CELSubprocessError: If a subprocess cannot be started.
+        """
+        size = size if size is not None else os.cpu_count() or 1
+        if size < 1:
+            raise ValueError(f"CELEvaluatorPool size must be at least 1, got {size}")
+        path = Path(binary_path) if binary_path else CELEvaluator.DEFAULT_BINARY_PATH
+        self._lock = threading.Lock()
+        self._restart_count = 0
+        # (expression, variable names) of every program evaluated, in first-use order
+        self._programs: dict[tuple[str, tuple[str, ...]], None] = {}
+        self._members: list[_PoolMember] = []
+        try:
+            for _ in range(size):
+                self._members.append(_PoolMember(self, path))
+        except BaseException:
+            self.close()
+            raise
+        self._threads = ThreadPoolExecutor(max_workers=size, thread_name_prefix="cel-pool")
+
+    def __enter__(self) -> "CELEvaluatorPool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @property
+    def size(self) -> int:
+        """Number of subprocesses."""
+        return len(self._members)
+
+    def evaluate(self, expression: str, data: dict[str, Any]) -> bool:
+        """Evaluate a CEL expression on the least busy subprocess.
+
+        Same contract as CELEvaluator.evaluate().
+        """
+        self._record([(expression, data)])
+        return self._dispatch(lambda member: member.evaluate(expression, data))
+
+    def evaluate_batch(
+        self,
+        items: list[tuple[str, dict[str, Any]]],
+        documents: dict[str, Any] | None = None,
+    ) -> list[bool | CELEvaluationError]:
+        """Evaluate many CEL expressions, splitting large batches across subprocesses.
+
+        Same contract as CELEvaluator.evaluate_batch(): one result per item,
+        in item order. Each member that takes a part uploads the documents.
+        """
+        self._record(items)
+        parts = min(self.size, len(items) // self.MIN_SPLIT_ITEMS)
+        if parts < 2:
+            return self._dispatch(lambda member: member.evaluate_batch(items, documents))
+
+        step = -(-len(items) // parts)  # ceiling division
+        futures = [
+            self._threads.submit(
+                self._dispatch,
+                lambda member, part=items[i:i + step]: member.evaluate_batch(part, documents),
+            )
+            for i in range(0, len(items), step)
+        ]
+        results: list[bool | CELEvaluationError] = []
+        for future in futures:
+            results.extend(future.result())
+        return results
+
+    def _dispatch(self, call: Any) -> Any:
+        """Run call(member) on the member with the fewest evaluations in flight."""
+        with self._lock:
+            if not self._members:
+                raise CELSubprocessError("CEL evaluator pool is closed")
+            member = min(self._members, key=lambda m: m.in_flight)
+            member.in_flight += 1
+        try:
+            return call(member)
+        finally:
+            with self._lock:
+                member.in_flight -= 1
+
+    def _record(self, items: list[tuple[str, dict[str, Any]]]) -> None:
+        """Add the programs items use to the set restarted members compile."""
+        programs = self._programs
+        for expression, data in items:
+            key = (expression, tuple(data))
+            if key not in programs:
+                with self._lock:
+                    programs[key] = None
+
+    def _warm(self, member: _PoolMember) -> None:
+        """Compile the known programs in a newly started member.
+
+        They are registered, so the member also has their handles. Binaries
+        without handles evaluate them with variables bound to null instead:
+        the Go side caches a program once it compiles, whatever its
+        evaluation result.
+        """
+        with self._lock:
+            programs = list(self._programs)
+        if not programs:
+            return
+        if member._handles_supported:
+            member._register(programs, member._generation, member._handles)
+        else:
+            CELEvaluator.evaluate_batch(
+                member, [(expr, dict.fromkeys(names)) for expr, names in programs]
+            )
+
+    def cache_stats(self) -> dict[str, int]:
+        """Program cache counters, summed over the members.
+
+        Same keys as CELEvaluator.cache_stats().
+        """
+        with self._lock:
+            members = list(self._members)
+        totals: dict[str, int] = {}
+        for member in members:
+            for name, value in member.cache_stats().items():
+                totals[name] = totals.get(name, 0) + value
+        return totals
+
+    def _spend_restart(self) -> None:
+        """Count one member restart against the shared MAX_RESTARTS budget."""
+        with self._lock:
+            if self._restart_count >= self.MAX_RESTARTS:
+                raise CELSubprocessError(
+                    f"CEL subprocess crashed {self.MAX_RESTARTS} times, giving up"
+                )
+            self._restart_count += 1
+
+    def close(self) -> None:
+        """Shut down every subprocess."""
+        with self._lock:
+            members, self._members = self._members, []
+        for member in members:
+            member.close()
+        threads = getattr(self, "_threads", None)
+        if threads is not None:
+            threads.shutdown(wait=False)
+
+    @property
+    def is_running(self) -> bool:
+        """Check if every subprocess is running."""
+        return bool(self._members) and all(member.is_running for member in self._members)
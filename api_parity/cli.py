@@ -6,10 +6,11 @@ Handles argument parsing and dispatches to explore or replay mode.
 from __future__ import annotations
 
 import argparse
+import os
 import sys
 import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable
 
@@ -18,10 +19,16 @@ from api_parity.mismatch_classifier import is_same_chain_mismatch, is_same_misma
 if TYPE_CHECKING:
     from api_parity.artifact_writer import ArtifactWriter, ReplayStats, RunStats
     from api_parity.bundle_loader import LoadedBundle
-    from api_parity.case_generator import CaseGenerator
-    from api_parity.comparator import Comparator
-    from api_parity.executor import Executor
-    from api_parity.models import ChainCase, ComparisonResult, ComparisonRules, TargetInfo
+    from api_parity.cel_evaluator import CELEvaluator, CELEvaluatorPool
+    from api_parity.case_generator import CaseGenerator, LinkFields
+    from api_parity.comparator import Comparator, ComparisonPlans
+    from api_parity.executor import AsyncExecutor, Executor
+    from api_parity.models import (
+        ChainCase,
+        ComparisonResult,
+        TargetConfig,
+        TargetInfo,
+    )
 
 
 DEFAULT_TIMEOUT = 30.0
@@ -244,6 +251,10 @@ class ExploreArgs:
     ensure_coverage: bool
     min_hits_per_op: int
     min_coverage: int
+    # Execution options
+    concurrency: int = 1
+    parallel_targets: bool = False
+    max_body_size: int | None = None
 
 
 @dataclass
@@ -258,6 +269,9 @@ class ReplayArgs:
     validate: bool
     timeout: float
     operation_timeout: dict[str, float]
+    concurrency: int = 1
+    parallel_targets: bool = False
+    max_body_size: int | None = None
 
 
 @dataclass
@@ -479,6 +493,34 @@ def build_parser() -> argparse.ArgumentParser:
         help="Percentage (0-100) of linked operations that must meet --min-hits-per-op "
         "before seed walking stops. (default: 100, stateful mode only)",
     )
+    explore_parser.add_argument(
+        "--concurrency",
+        type=positive_int,
+        default=1,
+        metavar="N",
+        help="Maximum number of cases (or chains, with --stateful) in flight at once "
+        "(default: 1, serial). "
+        "Results are reported in the same order as a serial run",
+    )
+    explore_parser.add_argument(
+        "--parallel-targets",
+        action="store_true",
+        default=False,
+        dest="parallel_targets",
+        help="Send each request to both targets at the same time instead of A then B. "
+        "Send-time skew is recorded in each response as send_skew_ms",
+    )
+    explore_parser.add_argument(
+        "--max-body-size",
+        type=positive_int,
+        default=None,
+        metavar="BYTES",
+        dest="max_body_size",
+        help="Stream response bodies and keep at most BYTES of each in memory. "
+        "Length and SHA-256 are recorded for every body; larger bodies are spilled "
+        "to a temp file and compared by digest (binary rules only). "
+        "Default: read bodies whole",
+    )
 
     # Replay subcommand
     replay_parser = subparsers.add_parser(
@@ -540,6 +582,33 @@ def build_parser() -> argparse.ArgumentParser:
         dest="operation_timeout",
         help="Set timeout for a specific operation (can be repeated)",
     )
+    replay_parser.add_argument(
+        "--concurrency",
+        type=positive_int,
+        default=1,
+        metavar="N",
+        help="Maximum number of bundles replayed at once (default: 1, serial). "
+        "Results are reported in the same order as a serial run",
+    )
+    replay_parser.add_argument(
+        "--parallel-targets",
+        action="store_true",
+        default=False,
+        dest="parallel_targets",
+        help="Send each request to both targets at the same time instead of A then B. "
+        "Send-time skew is recorded in each response as send_skew_ms",
+    )
+    replay_parser.add_argument(
+        "--max-body-size",
+        type=positive_int,
+        default=None,
+        metavar="BYTES",
+        dest="max_body_size",
+        help="Stream response bodies and keep at most BYTES of each in memory. "
+        "Length and SHA-256 are recorded for every body; larger bodies are spilled "
+        "to a temp file and compared by digest (binary rules only). "
+        "Default: read bodies whole",
+    )
 
     # Merge subcommand
     merge_parser = subparsers.add_parser(
@@ -621,6 +690,9 @@ def parse_explore_args(namespace: argparse.Namespace) -> ExploreArgs:
         ensure_coverage=namespace.ensure_coverage,
         min_hits_per_op=namespace.min_hits_per_op,
         min_coverage=namespace.min_coverage,
+        concurrency=namespace.concurrency,
+        parallel_targets=namespace.parallel_targets,
+        max_body_size=namespace.max_body_size,
     )
 
 
@@ -636,6 +708,9 @@ def parse_replay_args(namespace: argparse.Namespace) -> ReplayArgs:
         validate=namespace.validate,
         timeout=namespace.timeout,
         operation_timeout=op_timeouts,
+        concurrency=namespace.concurrency,
+        parallel_targets=namespace.parallel_targets,
+        max_body_size=namespace.max_body_size,
     )
 
 
@@ -1745,6 +1820,172 @@ def _format_mermaid_node(op_id: str, method: str, path: str) -> str:
     return f'{op_id}[{method} {simplified_path}]'
 
 
+def _create_executor(
+    target_a: TargetConfig,
+    target_b: TargetConfig,
+    default_timeout: float,
+    operation_timeouts: dict[str, float],
+    link_fields: LinkFields | None,
+    requests_per_second: float | None,
+    concurrency: int,
+    parallel_targets: bool = False,
+    max_body_size: int | None = None,
+) -> Executor | AsyncExecutor:
+    """Create the executor for a run.
+
+    concurrency=1 keeps the serial Executor (the default, and the simplest
+    thing to debug); anything higher uses AsyncExecutor with that many units
+    in flight. Both expose the same run_ordered() loop contract, and both
+    support parallel_targets (A and B sent together within each unit).
+    """
+    from api_parity.executor import AsyncExecutor, Executor
+
+    executor_kwargs: dict[str, Any] = {
+        "default_timeout": default_timeout,
+        "operation_timeouts": operation_timeouts,
+        "link_fields": link_fields,
+        "requests_per_second": requests_per_second,
+        "parallel_targets": parallel_targets,
+        "max_body_size": max_body_size,
+    }
+    if concurrency > 1:
+        return AsyncExecutor(target_a, target_b, concurrency=concurrency, **executor_kwargs)
+    return Executor(target_a, target_b, **executor_kwargs)
+
+
+def _start_cel_evaluator(concurrency: int) -> CELEvaluator | CELEvaluatorPool:
+    """Start the CEL evaluator for a run.
+
+    If the shared library build is present, one in-process evaluator serves
+    any concurrency: it evaluates large batches on several threads itself.
+    Otherwise concurrency=1 keeps a single subprocess, and higher values
+    start a pool of up to one subprocess per CPU, so large batches are
+    evaluated in parallel.
+
+    Raises:
+        CELSubprocessError: If a subprocess cannot be started, or the
+                            library cannot be loaded.
+    """
+    from api_parity.cel_evaluator import CELEvaluator, CELEvaluatorPool
+
+    if CELEvaluator.DEFAULT_LIBRARY_PATH.exists():
+        return CELEvaluator(library_path=CELEvaluator.DEFAULT_LIBRARY_PATH)
+    if concurrency > 1:
+        return CELEvaluatorPool(size=min(concurrency, os.cpu_count() or 1))
+    return CELEvaluator()
+
+
+def _target_info(name: str, target: TargetConfig) -> TargetInfo:
+    """Build the metadata.json record for a target.
+
+    Connection settings are included because they shape the latency recorded
+    in bundles: HTTP/2 multiplexing and pool size decide whether requests
+    queue for a connection or open new ones.
+    """
+    from api_parity.models import TargetInfo
+
+    return TargetInfo(
+        name=name,
+        base_url=target.base_url,
+        http2=target.http2,
+        max_connections=target.max_connections,
+        max_keepalive_connections=target.max_keepalive_connections,
+        keepalive_expiry=target.keepalive_expiry,
+    )
+
+
+def _print_transport_settings(
+    args: ExploreArgs | ReplayArgs,
+    target_a_config: TargetConfig,
+    target_b_config: TargetConfig,
+) -> None:
+    """Print the per-target and transport lines of the run configuration.
+
+    Shared by explore and replay, which take the same transport options.
+    """
+    for target_name, target_config in ((args.target_a, target_a_config), (args.target_b, target_b_config)):
+        if target_config.rate_limit:
+            print(f"  Rate limit ({target_name}): {target_config.rate_limit.requests_per_second} req/s, "
+                  f"burst {target_config.rate_limit.burst}")
+        if target_config.http2:
+            print(f"  HTTP/2 ({target_name}): enabled")
+        if args.concurrency > target_config.max_connections:
+            print(f"  Warning: --concurrency {args.concurrency} exceeds max_connections "
+                  f"({target_config.max_connections}) for {target_name}; requests will queue for a connection")
+    if args.concurrency > 1:
+        print(f"  Concurrency: {args.concurrency}")
+    if args.parallel_targets:
+        print("  Parallel targets: enabled")
+    if args.max_body_size is not None:
+        print(f"  Max body size: {args.max_body_size} bytes")
+
+
+def _report_plan_errors(plans: ComparisonPlans) -> bool:
+    """Print comparison rule errors found while compiling plans.
+
+    Returns:
+        True if there were none and the run can start.
+    """
+    if not plans.errors:
+        return True
+    print("Error in comparison rules:", file=sys.stderr)
+    for location, message in plans.errors:
+        print(f"  {location}: {message}", file=sys.stderr)
+    return False
+
+
+def _throttled_description(response_a: Any, response_b: Any) -> str | None:
+    """Describe which targets throttled a request, or None if neither did.
+
+    Throttled responses (adaptive rate control, see DESIGN.md "Adaptive Rate
+    Control (AIMD)") are a capacity signal, not a parity signal, so callers
+    count them separately instead of comparing them.
+    """
+    throttled = [
+        f"{target_name} {response.status_code}"
+        for target_name, response in (("Target A", response_a), ("Target B", response_b))
+        if response.throttled
+    ]
+    return ", ".join(throttled) if throttled else None
+
+
+@dataclass
+class _ChainRun:
+    """Per-chain comparison state collected while a chain executes.
+
+    One instance per chain, so concurrently executing chains never share
+    step results. on_step is passed to execute_chain() and stops the chain
+    at the first mismatch (DESIGN.md "Chain Stops at First Mismatch") or at
+    the first throttled step.
+    """
+
+    chain: ChainCase
+    compare: Callable[[str, Any, Any], ComparisonResult]
+    step_diffs: list[ComparisonResult] = field(default_factory=list)
+    step_ops: list[str] = field(default_factory=list)
+    mismatch_found: bool = False
+    # Set when a step was throttled; later steps would run on missing state
+    throttled: str | None = None
+
+    def on_step(self, response_a: Any, response_b: Any) -> bool:
+        """Compare responses after each step; return False to stop on mismatch."""
+        step_idx = len(self.step_ops)
+        op_id = self.chain.steps[step_idx].request_template.operation_id
+        self.step_ops.append(op_id)
+
+        self.throttled = _throttled_description(response_a, response_b)
+        if self.throttled is not None:
+            return False  # Stop chain execution
+
+        result = self.compare(op_id, response_a, response_b)
+        self.step_diffs.append(result)
+
+        if not result.match:
+            self.mismatch_found = True
+            return False  # Stop chain execution
+        return True  # Continue
+
+
 def run_explore(args: ExploreArgs) -> int:
     """Run explore mode.
 
@@ -1752,11 +1993,10 @@ def run_explore(args: ExploreArgs) -> int:
     """
     from api_parity.artifact_writer import ArtifactWriter, RunStats
     from api_parity.case_generator import CaseGenerator, CaseGeneratorError
-    from api_parity.cel_evaluator import CELEvaluator, CELSubprocessError
+    from api_parity.cel_evaluator import CELSubprocessError
     from api_parity.comparator import Comparator
     from api_parity.config_loader import (
         ConfigError,
-        get_operation_rules,
         load_comparison_library,
         load_comparison_rules,
         load_runtime_config,
@@ -1765,8 +2005,7 @@ def run_explore(args: ExploreArgs) -> int:
         validate_comparison_rules,
         validate_targets,
     )
-    from api_parity.executor import Executor, RequestError
-    from api_parity.models import TargetInfo
+    from api_parity.executor import RequestError
     from api_parity.schema_validator import SchemaValidator, SchemaExtractionError
 
     # Load configuration
@@ -1921,14 +2160,15 @@ def run_explore(args: ExploreArgs) -> int:
             print(f"  Timeout for {op_id}: {timeout}s")
     if runtime_config.rate_limit:
         print(f"  Rate limit: {runtime_config.rate_limit.requests_per_second} req/s")
+    _print_transport_settings(args, target_a_config, target_b_config)
     print()
 
     # Initialize components
     stats = RunStats()
     writer = ArtifactWriter(args.out, runtime_config.secrets)
 
-    target_a_info = TargetInfo(name=args.target_a, base_url=target_a_config.base_url)
-    target_b_info = TargetInfo(name=args.target_b, base_url=target_b_config.base_url)
+    target_a_info = _target_info(args.target_a, target_a_config)
+    target_b_info = _target_info(args.target_b, target_b_config)
 
     # Initialize schema validator for OpenAPI Spec as Field Authority
     try:
@@ -1939,7 +2179,7 @@ def run_explore(args: ExploreArgs) -> int:
 
     # Start CEL evaluator
     try:
-        cel_evaluator = CELEvaluator()
+        cel_evaluator = _start_cel_evaluator(args.concurrency)
     except CELSubprocessError as e:
         print(f"Error starting CEL evaluator: {e}", file=sys.stderr)
         return 1
@@ -1949,6 +2189,11 @@ def run_explore(args: ExploreArgs) -> int:
     try:
         comparator = Comparator(cel_evaluator, comparison_library, schema_validator)
 
+        # Compile rules once per operation; rule errors stop the run before any request
+        comparison_plans = comparator.compile_plans(comparison_rules)
+        if not _report_plan_errors(comparison_plans):
+            return 1
+
         # Start executor
         requests_per_second = (
             runtime_config.rate_limit.requests_per_second
@@ -1967,52 +2212,61 @@ def run_explore(args: ExploreArgs) -> int:
         if not args.stateful:
             progress_reporter.start()
 
-        with Executor(
+        with _create_executor(
             target_a_config,
             target_b_config,
             default_timeout=args.timeout,
             operation_timeouts=args.operation_timeout,
             link_fields=generator.get_link_fields(),
             requests_per_second=requests_per_second,
+            concurrency=args.concurrency,
+            parallel_targets=args.parallel_targets,
+            max_body_size=args.max_body_size,
         ) as executor:
 
-            if args.stateful:
-                # Stateful chain testing
-                _run_stateful_explore(
-                    generator=generator,
-                    executor=executor,
-                    comparator=comparator,
-                    comparison_rules=comparison_rules,
-                    writer=writer,
-                    stats=stats,
-                    target_a_info=target_a_info,
-                    target_b_info=target_b_info,
-                    max_chains=args.max_chains,
-                    max_steps=args.max_steps,
-                    seed=args.seed,
-                    get_operation_rules=get_operation_rules,
-                    progress_reporter=progress_reporter,
-                    log_chains=args.log_chains,
-                    ensure_coverage=args.ensure_coverage,
-                    exclude=args.exclude,
-                    min_hits_per_op=args.min_hits_per_op,
-                    min_coverage=args.min_coverage,
-                )
-            else:
-                # Stateless testing
-                _run_stateless_explore(
-                    generator=generator,
-                    executor=executor,
-                    comparator=comparator,
-                    comparison_rules=comparison_rules,
-                    writer=writer,
-                    stats=stats,
-                    target_a_info=target_a_info,
-                    target_b_info=target_b_info,
-                    seed=args.seed,
-                    get_operation_rules=get_operation_rules,
-                    progress_reporter=progress_reporter,
-                )
+            try:
+                if args.stateful:
+                    # Stateful chain testing
+                    _run_stateful_explore(
+                        generator=generator,
+                        executor=executor,
+                        comparator=comparator,
+                        comparison_plans=comparison_plans,
+                        writer=writer,
+                        stats=stats,
+                        target_a_info=target_a_info,
+                        target_b_info=target_b_info,
+                        max_chains=args.max_chains,
+                        max_steps=args.max_steps,
+                        seed=args.seed,
+                        progress_reporter=progress_reporter,
+                        log_chains=args.log_chains,
+                        ensure_coverage=args.ensure_coverage,
+                        exclude=args.exclude,
+                        min_hits_per_op=args.min_hits_per_op,
+                        min_coverage=args.min_coverage,
+                    )
+                else:
+                    # Stateless testing
+                    _run_stateless_explore(
+                        generator=generator,
+                        executor=executor,
+                        comparator=comparator,
+                        comparison_plans=comparison_plans,
+                        writer=writer,
+                        stats=stats,
+                        target_a_info=target_a_info,
+                        target_b_info=target_b_info,
+                        seed=args.seed,
+                        progress_reporter=progress_reporter,
+                    )
+            finally:
+                # Record where adaptive rate control settled (also on interrupt)
+                target_names = {"Target A": args.target_a, "Target B": args.target_b}
+                stats.adaptive_rates = {
+                    target_names[label]: rate for label, rate in executor.adaptive_rates().items()
+                }
+                stats.identical_bodies = comparator.identical_bodies
 
     except CELSubprocessError as e:
         print(f"\nFatal: CEL evaluator crashed: {e}", file=sys.stderr)
@@ -2038,11 +2292,19 @@ def run_explore(args: ExploreArgs) -> int:
         print(f"  Matches:    {stats.chain_matches}")
         print(f"  Mismatches: {stats.chain_mismatches}")
         print(f"  Errors:     {stats.chain_errors}")
+        if stats.chain_throttled > 0:
+            print(f"  Throttled:  {stats.chain_throttled}")
     else:
         print(f"Total cases: {stats.total_cases}")
         print(f"  Matches:    {stats.matches}")
         print(f"  Mismatches: {stats.mismatches}")
         print(f"  Errors:     {stats.errors}")
+        if stats.throttled > 0:
+            print(f"  Throttled:  {stats.throttled}")
+    for target_name, rate in stats.adaptive_rates.items():
+        print(f"Adaptive rate ({target_name}): {rate:.2f} req/s")
+    if stats.identical_bodies > 0:
+        print(f"Identical bodies (rules skipped): {stats.identical_bodies}")
     print(f"Summary written to: {args.out / 'summary.json'}")
 
     return 0
@@ -2050,32 +2312,42 @@ def run_explore(args: ExploreArgs) -> int:
 
 def _run_stateless_explore(
     generator: CaseGenerator,
-    executor: Executor,
+    executor: Executor | AsyncExecutor,
     comparator: Comparator,
-    comparison_rules: ComparisonRules,
+    comparison_plans: ComparisonPlans,
     writer: ArtifactWriter,
     stats: RunStats,
     target_a_info: TargetInfo,
     target_b_info: TargetInfo,
     seed: int | None,
-    get_operation_rules: Callable[[ComparisonRules, str], Any],
     progress_reporter: ProgressReporter | None = None,
 ) -> None:
-    """Execute stateless (single-request) testing."""
+    """Execute stateless (single-request) testing.
+
+    Cases are executed through executor.run_ordered(), which runs them one at
+    a time (Executor) or concurrently (AsyncExecutor). Either way, results are
+    compared and reported in generation order, so output, stats, and bundles
+    are the same as a serial run.
+    """
     from api_parity.executor import RequestError
 
-    for case in generator.generate(seed=seed):
+    def report(case, outcome) -> None:
         stats.total_cases += 1
         stats.add_operation(case.operation_id)
 
         print(f"[{stats.total_cases}] {case.operation_id}: {case.method} {case.rendered_path}", end=" ")
 
-        try:
-            # Execute request against both targets
-            response_a, response_b = executor.execute(case)
+        if isinstance(outcome, RequestError):
+            stats.errors += 1
+            print(f"ERROR: {outcome}")
+        elif (throttled := _throttled_description(*outcome)) is not None:
+            stats.throttled += 1
+            print(f"THROTTLED: {throttled}")
+        else:
+            response_a, response_b = outcome
 
             # Get rules for this operation
-            rules = get_operation_rules(comparison_rules, case.operation_id)
+            rules = comparison_plans.for_operation(case.operation_id)
 
             # Compare responses (with operation_id for schema validation)
             result = comparator.compare(response_a, response_b, rules, case.operation_id)
@@ -2099,20 +2371,18 @@ def _run_stateless_explore(
                 )
                 print(f"         Bundle: {bundle_path}")
 
-        except RequestError as e:
-            stats.errors += 1
-            print(f"ERROR: {e}")
-
         # Update progress reporter
         if progress_reporter is not None:
             progress_reporter.increment()
 
+    executor.run_ordered(generator.generate(seed=seed), executor.execute, report)
+
 
 def _run_stateful_explore(
     generator: CaseGenerator,
-    executor: Executor,
+    executor: Executor | AsyncExecutor,
     comparator: Comparator,
-    comparison_rules: ComparisonRules,
+    comparison_plans: ComparisonPlans,
     writer: ArtifactWriter,
     stats: RunStats,
     target_a_info: TargetInfo,
@@ -2120,7 +2390,6 @@ def _run_stateful_explore(
     max_chains: int | None,
     max_steps: int,
     seed: int | None,
-    get_operation_rules: Callable[[ComparisonRules, str], Any],
     progress_reporter: ProgressReporter | None = None,
     log_chains: bool = False,
     ensure_coverage: bool = False,
@@ -2136,6 +2405,11 @@ def _run_stateful_explore(
 
     If ensure_coverage=True, also runs single-request tests on any operations
     that weren't covered by the generated chains (orphans).
+
+    Chains and coverage cases go through executor.run_ordered(), so with an
+    AsyncExecutor several chains run at once. Each chain keeps its own
+    extracted variables and its own _ChainRun comparison state; stats,
+    output, bundles, and the --log-chains order match a serial run.
     """
     from api_parity.executor import RequestError
 
@@ -2243,7 +2517,20 @@ def _run_stateful_explore(
     executed_chains: list = []
     chain_outcomes: list[str] = []
 
-    for chain in chains:
+    def compare(op_id: str, response_a, response_b) -> ComparisonResult:
+        rules = comparison_plans.for_operation(op_id)
+        return comparator.compare(response_a, response_b, rules, op_id)
+
+    # Track comparison results as each chain executes. We use a callback
+    # (_ChainRun.on_step) instead of post-execution comparison because:
+    # 1. Chains should stop at first mismatch to avoid wasting requests
+    # 2. Later steps may depend on earlier responses (variable extraction)
+    # 3. Executor owns response lifecycle; callback lets us compare before cleanup
+    def run_chain(chain_run: _ChainRun):
+        return executor.execute_chain(chain_run.chain, on_step=chain_run.on_step)
+
+    def report_chain(chain_run: _ChainRun, outcome) -> None:
+        chain = chain_run.chain
         stats.total_chains += 1
 
         # Build chain description
@@ -2251,72 +2538,53 @@ def _run_stateful_explore(
         chain_desc = " → ".join(ops)
         print(f"[Chain {stats.total_chains}] {chain_desc}")
 
-        try:
-            # Track comparison results as we execute.
-            # We use a callback (on_step) instead of post-execution comparison because:
-            # 1. Chains should stop at first mismatch to avoid wasting requests
-            # 2. Later steps may depend on earlier responses (variable extraction)
-            # 3. Executor owns response lifecycle; callback lets us compare before cleanup
-            step_diffs: list[ComparisonResult] = []
-            step_ops: list[str] = []
-            mismatch_found = False
-
-            def on_step(response_a, response_b) -> bool:
-                """Compare responses after each step; return False to stop on mismatch."""
-                nonlocal mismatch_found
-                step_idx = len(step_diffs)
-                op_id = chain.steps[step_idx].request_template.operation_id
-                step_ops.append(op_id)
-
-                rules = get_operation_rules(comparison_rules, op_id)
-                result = comparator.compare(response_a, response_b, rules, op_id)
-                step_diffs.append(result)
-
-                if not result.match:
-                    mismatch_found = True
-                    return False  # Stop chain execution
-                return True  # Continue
-
-            # Execute chain, stopping at first mismatch
-            execution_a, execution_b = executor.execute_chain(chain, on_step=on_step)
-
-            # Determine overall result
-            if not mismatch_found:
-                stats.chain_matches += 1
-                print("  MATCH (all steps)")
-                executed_chains.append(chain)
-                chain_outcomes.append("match")
-            else:
-                stats.chain_mismatches += 1
-                mismatch_step = len(step_diffs) - 1
-                mismatch_op = step_ops[mismatch_step]
-                print(f"  MISMATCH at step {mismatch_step} ({mismatch_op}): {step_diffs[mismatch_step].summary}")
-                executed_chains.append(chain)
-                chain_outcomes.append("mismatch")
-
-                # Write chain mismatch bundle
-                bundle_path = writer.write_chain_mismatch(
-                    chain=chain,
-                    execution_a=execution_a,
-                    execution_b=execution_b,
-                    step_diffs=step_diffs,
-                    mismatch_step=mismatch_step,
-                    target_a_info=target_a_info,
-                    target_b_info=target_b_info,
-                    seed=seed,
-                )
-                print(f"  Bundle: {bundle_path}")
-
-        except RequestError as e:
+        executed_chains.append(chain)
+        if isinstance(outcome, RequestError):
             stats.chain_errors += 1
-            print(f"  ERROR: {e}")
-            executed_chains.append(chain)
+            print(f"  ERROR: {outcome}")
             chain_outcomes.append("error")
+        elif chain_run.throttled is not None:
+            stats.chain_throttled += 1
+            throttled_step = len(chain_run.step_ops) - 1
+            print(f"  THROTTLED at step {throttled_step} ({chain_run.step_ops[throttled_step]}): "
+                  f"{chain_run.throttled}")
+            chain_outcomes.append("throttled")
+        elif not chain_run.mismatch_found:
+            stats.chain_matches += 1
+            print("  MATCH (all steps)")
+            chain_outcomes.append("match")
+        else:
+            execution_a, execution_b = outcome
+            stats.chain_mismatches += 1
+            mismatch_step = len(chain_run.step_diffs) - 1
+            mismatch_op = chain_run.step_ops[mismatch_step]
+            print(f"  MISMATCH at step {mismatch_step} ({mismatch_op}): "
+                  f"{chain_run.step_diffs[mismatch_step].summary}")
+            chain_outcomes.append("mismatch")
+
+            # Write chain mismatch bundle
+            bundle_path = writer.write_chain_mismatch(
+                chain=chain,
+                execution_a=execution_a,
+                execution_b=execution_b,
+                step_diffs=chain_run.step_diffs,
+                mismatch_step=mismatch_step,
+                target_a_info=target_a_info,
+                target_b_info=target_b_info,
+                seed=seed,
+            )
+            print(f"  Bundle: {bundle_path}")
 
         # Update progress reporter
         if progress_reporter is not None:
             progress_reporter.increment()
 
+    executor.run_ordered(
+        (_ChainRun(chain=chain, compare=compare) for chain in chains),
+        run_chain,
+        report_chain,
+    )
+
     # Write chains log if requested
     if log_chains and executed_chains:
         chains_path = writer.write_chains_log(
@@ -2351,55 +2619,63 @@ def _run_stateful_explore(
             coverage_case_count = 0
             op_coverage_counts: dict[str, int] = {}
 
-            for case in generator.generate(max_cases=len(uncovered_operations) * cases_per_op * 2, seed=seed):
-                if case.operation_id not in uncovered_operations:
-                    continue  # Skip operations already covered by chains
+            def coverage_cases():
+                for case in generator.generate(max_cases=len(uncovered_operations) * cases_per_op * 2, seed=seed):
+                    if case.operation_id not in uncovered_operations:
+                        continue  # Skip operations already covered by chains
 
-                # Limit to a few cases per uncovered operation
-                current_count = op_coverage_counts.get(case.operation_id, 0)
-                if current_count >= cases_per_op:
-                    continue
-                op_coverage_counts[case.operation_id] = current_count + 1
+                    # Limit to a few cases per uncovered operation
+                    current_count = op_coverage_counts.get(case.operation_id, 0)
+                    if current_count >= cases_per_op:
+                        continue
+                    op_coverage_counts[case.operation_id] = current_count + 1
 
-                coverage_case_count += 1
-                # Mark as covered for tracking
-                operations_covered_by_chains.add(case.operation_id)
+                    # Mark as covered for tracking
+                    operations_covered_by_chains.add(case.operation_id)
+                    yield case
 
+            def report_coverage_case(case, outcome) -> None:
+                nonlocal coverage_case_count
+                coverage_case_count += 1
                 print(f"[Coverage {coverage_case_count}] {case.operation_id}: {case.method} {case.rendered_path}")
 
-                try:
-                    # Execute against both targets
-                    response_a, response_b = executor.execute(case)
-
-                    # Compare responses
-                    rules = get_operation_rules(comparison_rules, case.operation_id)
-                    result = comparator.compare(response_a, response_b, rules, case.operation_id)
-
-                    if result.match:
-                        stats.total_cases += 1
-                        stats.matches += 1
-                        print("  MATCH")
-                    else:
-                        stats.total_cases += 1
-                        stats.mismatches += 1
-                        print(f"  MISMATCH: {result.summary}")
-
-                        # Write mismatch bundle
-                        bundle_path = writer.write_mismatch(
-                            case=case,
-                            response_a=response_a,
-                            response_b=response_b,
-                            diff=result,
-                            target_a_info=target_a_info,
-                            target_b_info=target_b_info,
-                            seed=seed,
-                        )
-                        print(f"  Bundle: {bundle_path}")
-
-                except RequestError as e:
-                    stats.total_cases += 1
+                stats.total_cases += 1
+                if isinstance(outcome, RequestError):
                     stats.errors += 1
-                    print(f"  ERROR: {e}")
+                    print(f"  ERROR: {outcome}")
+                    return
+
+                response_a, response_b = outcome
+                throttled = _throttled_description(response_a, response_b)
+                if throttled is not None:
+                    stats.throttled += 1
+                    print(f"  THROTTLED: {throttled}")
+                    return
+
+                # Compare responses
+                rules = comparison_plans.for_operation(case.operation_id)
+                result = comparator.compare(response_a, response_b, rules, case.operation_id)
+
+                if result.match:
+                    stats.matches += 1
+                    print("  MATCH")
+                else:
+                    stats.mismatches += 1
+                    print(f"  MISMATCH: {result.summary}")
+
+                    # Write mismatch bundle
+                    bundle_path = writer.write_mismatch(
+                        case=case,
+                        response_a=response_a,
+                        response_b=response_b,
+                        diff=result,
+                        target_a_info=target_a_info,
+                        target_b_info=target_b_info,
+                        seed=seed,
+                    )
+                    print(f"  Bundle: {bundle_path}")
+
+            executor.run_ordered(coverage_cases(), executor.execute, report_coverage_case)
 
             # Report final coverage
             still_uncovered = all_operations - operations_covered_by_chains
@@ -2433,19 +2709,18 @@ def run_replay(args: ReplayArgs) -> int:
         load_bundle,
     )
     from api_parity.case_generator import LinkFields
-    from api_parity.cel_evaluator import CELEvaluator, CELSubprocessError
+    from api_parity.cel_evaluator import CELSubprocessError
     from api_parity.comparator import Comparator
     from api_parity.config_loader import (
         ConfigError,
-        get_operation_rules,
         load_comparison_library,
         load_comparison_rules,
         load_runtime_config,
         resolve_comparison_rules_path,
         validate_targets,
     )
-    from api_parity.executor import Executor, RequestError
-    from api_parity.models import ComparisonResult, TargetInfo
+    from api_parity.executor import RequestError
+    from api_parity.models import ComparisonResult
 
     # Validate input directory exists
     if not args.input_dir.exists():
@@ -2566,6 +2841,7 @@ def run_replay(args: ReplayArgs) -> int:
             print(f"  Timeout for {op_id}: {timeout}s")
     if runtime_config.rate_limit:
         print(f"  Rate limit: {runtime_config.rate_limit.requests_per_second} req/s")
+    _print_transport_settings(args, target_a_config, target_b_config)
     print()
 
     # Report load errors
@@ -2581,12 +2857,12 @@ def run_replay(args: ReplayArgs) -> int:
     stats.skipped = len(load_errors)
     writer = ArtifactWriter(args.out, runtime_config.secrets)
 
-    target_a_info = TargetInfo(name=args.target_a, base_url=target_a_config.base_url)
-    target_b_info = TargetInfo(name=args.target_b, base_url=target_b_config.base_url)
+    target_a_info = _target_info(args.target_a, target_a_config)
+    target_b_info = _target_info(args.target_b, target_b_config)
 
     # Start CEL evaluator
     try:
-        cel_evaluator = CELEvaluator()
+        cel_evaluator = _start_cel_evaluator(args.concurrency)
     except CELSubprocessError as e:
         print(f"Error starting CEL evaluator: {e}", file=sys.stderr)
         return 1
@@ -2596,6 +2872,11 @@ def run_replay(args: ReplayArgs) -> int:
     try:
         comparator = Comparator(cel_evaluator, comparison_library)
 
+        # Compile rules once per operation; rule errors stop the run before any request
+        comparison_plans = comparator.compile_plans(comparison_rules)
+        if not _report_plan_errors(comparison_plans):
+            return 1
+
         # Start executor with link_fields for chain variable extraction
         requests_per_second = (
             runtime_config.rate_limit.requests_per_second
@@ -2610,29 +2891,30 @@ def run_replay(args: ReplayArgs) -> int:
         # Check if we have any link fields to extract (either body or headers)
         has_link_fields = link_fields.body_pointers or link_fields.headers
 
-        with Executor(
+        with _create_executor(
             target_a_config,
             target_b_config,
             default_timeout=args.timeout,
             operation_timeouts=args.operation_timeout,
             link_fields=link_fields if has_link_fields else None,
             requests_per_second=requests_per_second,
+            concurrency=args.concurrency,
+            parallel_targets=args.parallel_targets,
+            max_body_size=args.max_body_size,
         ) as executor:
 
             # Replay each pre-loaded bundle
-            for bundle in loaded_bundles:
-                _replay_loaded_bundle(
-                    bundle=bundle,
-                    executor=executor,
-                    comparator=comparator,
-                    comparison_rules=comparison_rules,
-                    writer=writer,
-                    stats=stats,
-                    target_a_info=target_a_info,
-                    target_b_info=target_b_info,
-                    get_operation_rules=get_operation_rules,
-                )
-                progress_reporter.increment()
+            _replay_loaded_bundles(
+                bundles=loaded_bundles,
+                executor=executor,
+                comparator=comparator,
+                comparison_plans=comparison_plans,
+                writer=writer,
+                stats=stats,
+                target_a_info=target_a_info,
+                target_b_info=target_b_info,
+                progress_reporter=progress_reporter,
+            )
 
     except CELSubprocessError as e:
         print(f"\nFatal: CEL evaluator crashed: {e}", file=sys.stderr)
@@ -2658,6 +2940,8 @@ def run_replay(args: ReplayArgs) -> int:
     print(f"  Still mismatch:        {stats.still_mismatch}")
     print(f"  Different mismatch:    {stats.different_mismatch}")
     print(f"  Errors:                {stats.errors}")
+    if stats.throttled > 0:
+        print(f"  Throttled:             {stats.throttled}")
     if stats.skipped > 0:
         print(f"  Skipped:               {stats.skipped}")
     print(f"Summary written to: {args.out / 'replay_summary.json'}")
@@ -2670,63 +2954,123 @@ def run_replay(args: ReplayArgs) -> int:
     return 0
 
 
+def _replay_loaded_bundles(
+    bundles: list["LoadedBundle"],
+    executor: "Executor | AsyncExecutor",
+    comparator: "Comparator",
+    comparison_plans: "ComparisonPlans",
+    writer: "ArtifactWriter",
+    stats: "ReplayStats",
+    target_a_info: "TargetInfo",
+    target_b_info: "TargetInfo",
+    progress_reporter: ProgressReporter | None = None,
+) -> None:
+    """Replay pre-loaded mismatch bundles, reporting results in bundle order.
+
+    Bundles are executed through executor.run_ordered(), so with an
+    AsyncExecutor several bundles are in flight at once while stats,
+    output, and written bundles stay in the same order as a serial replay.
+    """
+    from api_parity.bundle_loader import BundleType
+
+    def compare(op_id: str, response_a, response_b) -> "ComparisonResult":
+        # operation_id passed for consistency, but replay has no schema validation
+        rules = comparison_plans.for_operation(op_id)
+        return comparator.compare(response_a, response_b, rules, op_id)
+
+    # Chain comparison state is created up front, one per chain bundle, so it
+    # is available both to the executing chain and to the ordered report.
+    units = [
+        (
+            bundle,
+            _ChainRun(chain=bundle.chain_case, compare=compare)
+            if bundle.bundle_type == BundleType.CHAIN and bundle.chain_case is not None
+            else None,
+        )
+        for bundle in bundles
+    ]
+
+    def work(unit):
+        bundle, chain_run = unit
+        if chain_run is not None:
+            return executor.execute_chain(chain_run.chain, on_step=chain_run.on_step)
+        if bundle.bundle_type == BundleType.STATELESS and bundle.request_case is not None:
+            return executor.execute(bundle.request_case)
+        return None  # Missing case data; reported as an error
+
+    def report(unit, outcome) -> None:
+        bundle, chain_run = unit
+        _replay_loaded_bundle(
+            bundle=bundle,
+            chain_run=chain_run,
+            outcome=outcome,
+            compare=compare,
+            writer=writer,
+            stats=stats,
+            target_a_info=target_a_info,
+            target_b_info=target_b_info,
+        )
+        if progress_reporter is not None:
+            progress_reporter.increment()
+
+    executor.run_ordered(units, work, report)
+
+
 def _replay_loaded_bundle(
     bundle: "LoadedBundle",
-    executor: "Executor",
-    comparator: "Comparator",
-    comparison_rules: "ComparisonRules",
+    chain_run: _ChainRun | None,
+    outcome: Any,
+    compare: Callable,
     writer: "ArtifactWriter",
     stats: "ReplayStats",
     target_a_info: "TargetInfo",
     target_b_info: "TargetInfo",
-    get_operation_rules: Callable,
 ) -> None:
-    """Replay a pre-loaded mismatch bundle."""
+    """Classify and record the outcome of replaying one bundle."""
     from api_parity.bundle_loader import BundleType
 
     stats.total_bundles += 1
 
-    # Execute based on type
+    # Report based on type
     if bundle.bundle_type == BundleType.STATELESS:
         stats.stateless_bundles += 1
         _replay_stateless_bundle(
             bundle=bundle,
-            executor=executor,
-            comparator=comparator,
-            comparison_rules=comparison_rules,
+            outcome=outcome,
+            compare=compare,
             writer=writer,
             stats=stats,
             target_a_info=target_a_info,
             target_b_info=target_b_info,
-            get_operation_rules=get_operation_rules,
         )
     else:
         stats.chain_bundles += 1
         _replay_chain_bundle(
             bundle=bundle,
-            executor=executor,
-            comparator=comparator,
-            comparison_rules=comparison_rules,
+            chain_run=chain_run,
+            outcome=outcome,
             writer=writer,
             stats=stats,
             target_a_info=target_a_info,
             target_b_info=target_b_info,
-            get_operation_rules=get_operation_rules,
         )
 
 
 def _replay_stateless_bundle(
     bundle: "LoadedBundle",
-    executor: "Executor",
-    comparator: "Comparator",
-    comparison_rules: "ComparisonRules",
+    outcome: Any,
+    compare: Callable,
     writer: "ArtifactWriter",
     stats: "ReplayStats",
     target_a_info: "TargetInfo",
     target_b_info: "TargetInfo",
-    get_operation_rules: Callable,
 ) -> None:
-    """Replay a stateless (single-request) bundle."""
+    """Report a replayed stateless (single-request) bundle.
+
+    Args:
+        outcome: (response_a, response_b) from executor.execute(), or the
+                 RequestError it raised.
+    """
     from api_parity.executor import RequestError
 
     case = bundle.request_case
@@ -2737,67 +3081,73 @@ def _replay_stateless_bundle(
 
     print(f"[{stats.total_bundles}] {case.operation_id}: {case.method} {case.rendered_path}", end=" ")
 
-    try:
-        # Re-execute
-        response_a, response_b = executor.execute(case)
-
-        # Compare (operation_id passed for consistency, but replay has no schema validation)
-        rules = get_operation_rules(comparison_rules, case.operation_id)
-        result = comparator.compare(response_a, response_b, rules, case.operation_id)
-
-        # Classify outcome
-        if result.match:
-            stats.now_match += 1
-            stats.fixed_bundles.append(bundle.bundle_path.name)
-            print("FIXED")
-        elif is_same_mismatch(bundle.original_diff, result):
-            stats.still_mismatch += 1
-            stats.persistent_bundles.append(bundle.bundle_path.name)
-            print(f"STILL MISMATCH: {result.summary}")
-            # Write new bundle to output
-            writer.write_mismatch(
-                case=case,
-                response_a=response_a,
-                response_b=response_b,
-                diff=result,
-                target_a_info=target_a_info,
-                target_b_info=target_b_info,
-            )
-        else:
-            stats.different_mismatch += 1
-            stats.changed_bundles.append(bundle.bundle_path.name)
-            print(f"DIFFERENT MISMATCH: {result.summary}")
-            # Write new bundle to output
-            writer.write_mismatch(
-                case=case,
-                response_a=response_a,
-                response_b=response_b,
-                diff=result,
-                target_a_info=target_a_info,
-                target_b_info=target_b_info,
-            )
-
-    except RequestError as e:
+    if isinstance(outcome, RequestError):
         stats.errors += 1
-        print(f"ERROR: {e}")
+        print(f"ERROR: {outcome}")
+        return
+
+    response_a, response_b = outcome
+    throttled = _throttled_description(response_a, response_b)
+    if throttled is not None:
+        stats.throttled += 1
+        print(f"THROTTLED: {throttled}")
+        return
+
+    result = compare(case.operation_id, response_a, response_b)
+
+    # Classify outcome
+    if result.match:
+        stats.now_match += 1
+        stats.fixed_bundles.append(bundle.bundle_path.name)
+        print("FIXED")
+    elif is_same_mismatch(bundle.original_diff, result):
+        stats.still_mismatch += 1
+        stats.persistent_bundles.append(bundle.bundle_path.name)
+        print(f"STILL MISMATCH: {result.summary}")
+        # Write new bundle to output
+        writer.write_mismatch(
+            case=case,
+            response_a=response_a,
+            response_b=response_b,
+            diff=result,
+            target_a_info=target_a_info,
+            target_b_info=target_b_info,
+        )
+    else:
+        stats.different_mismatch += 1
+        stats.changed_bundles.append(bundle.bundle_path.name)
+        print(f"DIFFERENT MISMATCH: {result.summary}")
+        # Write new bundle to output
+        writer.write_mismatch(
+            case=case,
+            response_a=response_a,
+            response_b=response_b,
+            diff=result,
+            target_a_info=target_a_info,
+            target_b_info=target_b_info,
+        )
 
 
 def _replay_chain_bundle(
     bundle: "LoadedBundle",
-    executor: "Executor",
-    comparator: "Comparator",
-    comparison_rules: "ComparisonRules",
+    chain_run: _ChainRun | None,
+    outcome: Any,
     writer: "ArtifactWriter",
     stats: "ReplayStats",
     target_a_info: "TargetInfo",
     target_b_info: "TargetInfo",
-    get_operation_rules: Callable,
 ) -> None:
-    """Replay a chain (stateful) bundle."""
+    """Report a replayed chain (stateful) bundle.
+
+    Args:
+        chain_run: Step comparisons collected by on_step during execution.
+        outcome: (execution_a, execution_b) from executor.execute_chain(),
+                 or the RequestError it raised.
+    """
     from api_parity.executor import RequestError
 
     chain = bundle.chain_case
-    if chain is None:
+    if chain is None or chain_run is None:
         stats.errors += 1
         print(f"ERROR: {bundle.bundle_path.name} - missing chain_case")
         return
@@ -2806,68 +3156,54 @@ def _replay_chain_bundle(
     chain_desc = " -> ".join(ops)
     print(f"[Chain {stats.total_bundles}] {chain_desc}")
 
-    try:
-        # Track comparison results during execution.
-        # Same callback pattern as _run_stateful_explore - see comments there.
-        step_diffs: list[ComparisonResult] = []
-        mismatch_found = False
-
-        def on_step(response_a, response_b) -> bool:
-            nonlocal mismatch_found
-            step_idx = len(step_diffs)
-            op_id = chain.steps[step_idx].request_template.operation_id
-
-            rules = get_operation_rules(comparison_rules, op_id)
-            result = comparator.compare(response_a, response_b, rules, op_id)
-            step_diffs.append(result)
-
-            if not result.match:
-                mismatch_found = True
-                return False  # Stop chain execution
-            return True
+    if isinstance(outcome, RequestError):
+        stats.errors += 1
+        print(f"  ERROR: {outcome}")
+        return
 
-        # Execute chain
-        execution_a, execution_b = executor.execute_chain(chain, on_step=on_step)
-
-        # Classify outcome
-        if not mismatch_found:
-            stats.now_match += 1
-            stats.fixed_bundles.append(bundle.bundle_path.name)
-            print("  FIXED (all steps)")
-        elif is_same_chain_mismatch(bundle.original_diff, step_diffs):
-            stats.still_mismatch += 1
-            stats.persistent_bundles.append(bundle.bundle_path.name)
-            mismatch_step = len(step_diffs) - 1
-            print(f"  STILL MISMATCH at step {mismatch_step}: {step_diffs[mismatch_step].summary}")
-            # Write new bundle to output
-            writer.write_chain_mismatch(
-                chain=chain,
-                execution_a=execution_a,
-                execution_b=execution_b,
-                step_diffs=step_diffs,
-                mismatch_step=mismatch_step,
-                target_a_info=target_a_info,
-                target_b_info=target_b_info,
-            )
-        else:
-            stats.different_mismatch += 1
-            stats.changed_bundles.append(bundle.bundle_path.name)
-            mismatch_step = len(step_diffs) - 1
-            print(f"  DIFFERENT MISMATCH at step {mismatch_step}: {step_diffs[mismatch_step].summary}")
-            # Write new bundle to output
-            writer.write_chain_mismatch(
-                chain=chain,
-                execution_a=execution_a,
-                execution_b=execution_b,
-                step_diffs=step_diffs,
-                mismatch_step=mismatch_step,
-                target_a_info=target_a_info,
-                target_b_info=target_b_info,
-            )
+    execution_a, execution_b = outcome
+    step_diffs = chain_run.step_diffs
 
-    except RequestError as e:
-        stats.errors += 1
-        print(f"  ERROR: {e}")
+    if chain_run.throttled is not None:
+        stats.throttled += 1
+        print(f"  THROTTLED at step {len(chain_run.step_ops) - 1}: {chain_run.throttled}")
+        return
+
+    # Classify outcome
+    if not chain_run.mismatch_found:
+        stats.now_match += 1
+        stats.fixed_bundles.append(bundle.bundle_path.name)
+        print("  FIXED (all steps)")
+    elif is_same_chain_mismatch(bundle.original_diff, step_diffs):
+        stats.still_mismatch += 1
+        stats.persistent_bundles.append(bundle.bundle_path.name)
+        mismatch_step = len(step_diffs) - 1
+        print(f"  STILL MISMATCH at step {mismatch_step}: {step_diffs[mismatch_step].summary}")
+        # Write new bundle to output
+        writer.write_chain_mismatch(
+            chain=chain,
+            execution_a=execution_a,
+            execution_b=execution_b,
+            step_diffs=step_diffs,
+            mismatch_step=mismatch_step,
+            target_a_info=target_a_info,
+            target_b_info=target_b_info,
+        )
+    else:
+        stats.different_mismatch += 1
+        stats.changed_bundles.append(bundle.bundle_path.name)
+        mismatch_step = len(step_diffs) - 1
+        print(f"  DIFFERENT MISMATCH at step {mismatch_step}: {step_diffs[mismatch_step].summary}")
+        # Write new bundle to output
+        writer.write_chain_mismatch(
+            chain=chain,
+            execution_a=execution_a,
+            execution_b=execution_b,
+            step_diffs=step_diffs,
+            mismatch_step=mismatch_step,
+            target_a_info=target_a_info,
+            target_b_info=target_b_info,
+        )
 
 
 def run_merge(args: MergeArgs) -> int:
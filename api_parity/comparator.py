@@ -12,17 +12,35 @@ See ARCHITECTURE.md "Comparator Component" for specifications.
 
 from __future__ import annotations
 
+import base64
+import hashlib
+import json
+import re
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 from jsonpath_ng import parse as jsonpath_parse
 from jsonpath_ng.exceptions import JsonPathLexerError, JsonPathParserError
 
-from api_parity.cel_evaluator import CELEvaluator, CELEvaluationError
+from api_parity.cel_evaluator import (
+    CELEvaluationError,
+    CELEvaluator,
+    CELEvaluatorPool,
+    DocumentValue,
+)
+from api_parity.config_loader import get_operation_rules
+from api_parity.jsonpath_accessor import (
+    JSONPathAccessor,
+    Location,
+    compile_jsonpath,
+    concrete_path,
+    location_segments,
+    replace_matches,
+)
 from api_parity.models import (
-    BodyRules,
     ComparisonLibrary,
     ComparisonResult,
+    ComparisonRulesFile,
     ComponentResult,
     FieldDifference,
     FieldRule,
@@ -31,6 +49,14 @@ from api_parity.models import (
     PresenceMode,
     ResponseCase,
 )
+from api_parity.native_comparisons import (
+    NativeColumnComparison,
+    NativeComparison,
+    compile_native_column,
+    compile_native_comparison,
+    is_reflexive,
+)
+from api_parity.structural_diff import diff_bodies
 
 if TYPE_CHECKING:
     from api_parity.schema_validator import SchemaValidator
@@ -80,6 +106,31 @@ class _NotFound:
 NOT_FOUND = _NotFound()
 
 
+# =============================================================================
+# Digest Comparisons for Truncated Bodies
+# =============================================================================
+
+# Binary predefineds that can be decided from (length, SHA-256) alone, used
+# when a body exceeded --max-body-size and only its digest was kept. Each
+# keeps the meaning of its CEL expression over base64 strings:
+# binary_length_match compares base64 lengths, which are 4 * ceil(n / 3).
+_DIGEST_COMPARISONS: dict[str, Any] = {
+    "exact_match": lambda a, b: a == b,
+    "binary_exact_match": lambda a, b: a == b,
+    "binary_length_match": lambda a, b: -(-a[0] // 3) == -(-b[0] // 3),
+    "binary_nonempty": lambda a, b: a[0] > 0 and b[0] > 0,
+    "ignore": lambda a, b: True,
+}
+
+
+def _binary_digest(response: ResponseCase) -> tuple[int, str]:
+    """(length, hex SHA-256) of a binary body, preferring the captured digest."""
+    if response.body_sha256 is not None and response.body_size is not None:
+        return response.body_size, response.body_sha256
+    content = base64.b64decode(response.body_base64 or "")
+    return len(content), hashlib.sha256(content).hexdigest()
+
+
 # =============================================================================
 # Presence Check Result
 # =============================================================================
@@ -102,6 +153,276 @@ class PresenceResult:
     skip_value_comparison: bool
 
 
+# =============================================================================
+# Comparison Plans
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class _CompiledRule:
+    """A FieldRule prepared for evaluation.
+
+    Attributes:
+        rule: The source rule.
+        name: Rule name for differences (the predefined, or "custom").
+        expr: Expanded CEL expression; None for presence-only rules and on error.
+        native: Native comparison for the predefined, if it has one.
+        column: Native comparison over columns of wildcard matches, if the
+                predefined has a native comparison.
+        presence: Presence check result for each (a_present, b_present).
+        error: Why the rule cannot be evaluated (unknown predefined, missing
+               parameter), reported as an "error: ..." difference.
+        uses_bodies: Whether the custom expression uses body_a or body_b,
+                     the whole bodies.
+    """
+
+    rule: FieldRule
+    name: str
+    expr: str | None
+    native: NativeComparison | None
+    column: NativeColumnComparison | None
+    presence: dict[tuple[bool, bool], PresenceResult]
+    error: str | None = None
+    uses_bodies: bool = False
+
+    @property
+    def compares_values(self) -> bool:
+        """False for presence-only rules."""
+        return self.rule.predefined is not None or self.rule.expr is not None
+
+
+@dataclass(frozen=True)
+class _PlannedField:
+    """A header or body field rule in a ComparisonPlan.
+
+    Attributes:
+        path: Header name or JSONPath as written in the rules.
+        rule: The compiled rule.
+        key: Lowercased header name, or the compiled JSONPath (None if invalid).
+        error: Why the JSONPath cannot be parsed, if it cannot.
+    """
+
+    path: str
+    rule: _CompiledRule
+    key: Any
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class _IdenticalBodies:
+    """Body rules that canonically identical bodies pass without evaluation.
+
+    Attributes:
+        masks: JSONPaths whose values are left out of the identity check:
+               ignore and presence-only rules, and rules evaluated anyway.
+        remaining: Body field rules still evaluated on identical bodies,
+                   in rules order.
+    """
+
+    masks: tuple[JSONPathAccessor, ...]
+    remaining: tuple[_PlannedField, ...]
+
+
+# Stands in for masked values when checking bodies for identity
+_MASKED = "<masked>"
+
+
+def _canonical_json(value: Any) -> str:
+    """JSON with sorted keys; raises ValueError for NaN and Infinity."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), allow_nan=False)
+
+
+@dataclass(frozen=True)
+class ComparisonPlan:
+    """OperationRules compiled for repeated comparisons.
+
+    Predefineds are expanded (or resolved to native comparisons), JSONPaths
+    parsed, presence checks tabulated, and header names lowercased once, so
+    Comparator.compare() only runs the plan. Build with Comparator.compile_plan().
+
+    Attributes:
+        rules: The OperationRules the plan was compiled from.
+        status_code: Status code rule, or None for exact match.
+        headers: Header rules, in rules order.
+        body_fields: Body field rules, in rules order.
+        binary_rule: Binary body rule, or None to skip binary comparison.
+        identical_bodies: Rules skipped when the bodies are identical, or
+                          None if no rule can be skipped.
+        structural_diff: Whether JSON bodies are also diffed outside the
+                         body field rules' matches.
+    """
+
+    rules: OperationRules
+    status_code: _CompiledRule | None
+    headers: tuple[_PlannedField, ...]
+    body_fields: tuple[_PlannedField, ...]
+    binary_rule: _CompiledRule | None
+    identical_bodies: _IdenticalBodies | None = None
+    structural_diff: bool = False
+
+    @property
+    def errors(self) -> list[tuple[str, str]]:
+        """Rule errors found while compiling, as (location, message) pairs."""
+        errors: list[tuple[str, str]] = []
+        if self.status_code is not None and self.status_code.error:
+            errors.append(("status_code", self.status_code.error))
+        for field in self.headers:
+            if field.rule.error:
+                errors.append((f"headers.{field.path}", field.rule.error))
+        for field in self.body_fields:
+            for error in (field.error, field.rule.error):
+                if error:
+                    errors.append((f"body.field_rules[{field.path}]", error))
+        if self.binary_rule is not None and self.binary_rule.error:
+            errors.append(("body.binary_rule", self.binary_rule.error))
+        return errors
+
+
+@dataclass(frozen=True)
+class ComparisonPlans:
+    """Comparison plans for every operation in a rules file.
+
+    Attributes:
+        default: Plan for operations without operation_rules.
+        operations: operationId -> plan, for operations with operation_rules.
+    """
+
+    default: ComparisonPlan
+    operations: dict[str, ComparisonPlan]
+
+    def for_operation(self, operation_id: str) -> ComparisonPlan:
+        """The plan for an operation (override semantics as get_operation_rules)."""
+        return self.operations.get(operation_id, self.default)
+
+    @property
+    def errors(self) -> list[tuple[str, str]]:
+        """Rule errors in any plan, with locations as in the rules file."""
+        errors = [(f"default_rules.{loc}", msg) for loc, msg in self.default.errors]
+        for operation_id, plan in self.operations.items():
+            for location, message in plan.errors:
+                # Sections inherited from default_rules are reported once, above
+                section = location.split(".", 1)[0]
+                if getattr(plan.rules, section) is getattr(self.default.rules, section):
+                    continue
+                errors.append((f"operation_rules.{operation_id}.{location}", message))
+        return errors
+
+
+# =============================================================================
+# Batched CEL Evaluation
+# =============================================================================
+
+
+@dataclass
+class _PendingEvaluation:
+    """A field comparison waiting for its CEL result.
+
+    Attributes:
+        path: Path for error reporting.
+        value_a: Value from target A.
+        value_b: Value from target B.
+        rule: The compiled rule being evaluated.
+        index: Position of the evaluation in its _EvaluationBatch.
+    """
+
+    path: str
+    value_a: Any
+    value_b: Any
+    rule: _CompiledRule
+    index: int
+
+
+# Custom expressions that use the whole bodies (body field rules only)
+_BODY_VARIABLES = re.compile(r"\bbody_[ab]\b")
+
+# Objects and arrays bound in one body batch from which the bodies are
+# uploaded once and the bindings sent as paths into them
+_DOCUMENT_MIN_CONTAINERS = 8
+
+
+class _EvaluationBatch:
+    """CEL evaluations collected during one comparison phase.
+
+    Field comparisons add their (expression, bindings) pairs here instead of
+    calling the evaluator one at a time; run() then sends them all in a
+    single batch round-trip (CELEvaluator.evaluate_batch).
+
+    For the body phase, the batch also holds the bodies. If enough bound
+    values are objects or arrays at known locations, or a rule uses
+    body_a/body_b, the bodies go to the evaluator as documents and those
+    values as paths into them, so subtrees several rules cover are encoded
+    and decoded once. Scalars are always sent as values: a path is no
+    smaller.
+    """
+
+    def __init__(self, bodies: tuple[Any, Any] | None = None) -> None:
+        """Args:
+            bodies: (body_a, body_b) for the body phase.
+        """
+        self._documents = {"a": bodies[0], "b": bodies[1]} if bodies is not None else None
+        # (expr, value_a, value_b, location_a, location_b, uses_bodies); the
+        # locations of values that are not objects or arrays are "", which
+        # like jsonpath_ng fallback locations has no path
+        self._entries: list[tuple[str, Any, Any, Location, Location, bool]] = []
+        self._containers = 0
+        self._uses_bodies = False
+
+    def add(
+        self,
+        expr: str,
+        value_a: Any,
+        value_b: Any,
+        locations: tuple[Location, Location] | None = None,
+        uses_bodies: bool = False,
+    ) -> int:
+        """Queue an evaluation and return its index.
+
+        Args:
+            locations: Where value_a and value_b are in the bodies, if known.
+            uses_bodies: Whether the expression also binds body_a and body_b.
+        """
+        location_a = location_b = ""
+        if locations is not None and self._documents is not None:
+            if type(value_a) in (dict, list):
+                location_a = locations[0]
+                self._containers += 1
+            if type(value_b) in (dict, list):
+                location_b = locations[1]
+                self._containers += 1
+        if uses_bodies:
+            self._uses_bodies = True
+        self._entries.append((expr, value_a, value_b, location_a, location_b, uses_bodies))
+        return len(self._entries) - 1
+
+    def run(self, cel: CELEvaluator | CELEvaluatorPool) -> list[bool | CELEvaluationError]:
+        """Evaluate all queued expressions (no round-trip if none were queued)."""
+        if not self._entries:
+            return []
+        documents = self._documents
+        if not self._uses_bodies and self._containers < _DOCUMENT_MIN_CONTAINERS:
+            documents = None
+        items = []
+        for expr, value_a, value_b, location_a, location_b, uses_bodies in self._entries:
+            if documents is not None:
+                value_a = self._bind("a", value_a, location_a)
+                value_b = self._bind("b", value_b, location_b)
+            data = {"a": value_a, "b": value_b}
+            if uses_bodies and self._documents is not None:
+                data["body_a"] = self._bind("a", self._documents["a"], None)
+                data["body_b"] = self._bind("b", self._documents["b"], None)
+            items.append((expr, data))
+        if documents is None:
+            return cel.evaluate_batch(items)
+        return cel.evaluate_batch(items, documents=documents)
+
+    def _bind(self, document: str, value: Any, location: Location) -> Any:
+        """value as a DocumentValue if its location in the document is known."""
+        path = location_segments(location)
+        if path is None:
+            return value
+        return DocumentValue(document, path, value)
+
+
 # =============================================================================
 # Comparator
 # =============================================================================
@@ -117,6 +438,14 @@ class Comparator:
             if not result.match:
                 print(f"Mismatch: {result.summary}")
 
+    With rules compiled once per operation (rule errors surface before any comparison):
+        plans = comparator.compile_plans(rules_file)
+        if plans.errors:
+            ...
+        result = comparator.compare(
+            response_a, response_b, plans.for_operation("createWidget"), "createWidget"
+        )
+
     With schema validation (OpenAPI Spec as Field Authority):
         from api_parity.schema_validator import SchemaValidator
         validator = SchemaValidator(spec_path)
@@ -126,14 +455,14 @@ class Comparator:
 
     def __init__(
         self,
-        cel_evaluator: CELEvaluator,
+        cel_evaluator: CELEvaluator | CELEvaluatorPool,
         comparison_library: ComparisonLibrary,
         schema_validator: "SchemaValidator | None" = None,
     ) -> None:
         """Initialize the Comparator.
 
         Args:
-            cel_evaluator: CEL evaluator instance (caller owns lifecycle).
+            cel_evaluator: CEL evaluator or evaluator pool (caller owns lifecycle).
             comparison_library: Library of predefined comparisons.
             schema_validator: Optional schema validator for OpenAPI Spec as Field Authority.
         """
@@ -141,13 +470,161 @@ class Comparator:
         self._library = comparison_library
         self._schema_validator = schema_validator
         # Cache compiled JSONPath expressions for performance
-        self._jsonpath_cache: dict[str, Any] = {}
+        self._jsonpath_cache: dict[str, JSONPathAccessor] = {}
+        # Compiled rules keyed by id(rule); the rule is kept in the entry so
+        # its id cannot be reused while cached
+        self._compiled_rules: dict[int, tuple[FieldRule, _CompiledRule]] = {}
+        # Body comparisons that skipped rules because the bodies were identical
+        self.identical_bodies = 0
+
+    def compile_plans(self, rules_file: ComparisonRulesFile) -> ComparisonPlans:
+        """Compile the plan for every operation in a rules file.
+
+        Args:
+            rules_file: Loaded comparison rules file.
+
+        Returns:
+            ComparisonPlans; check its errors before comparing.
+        """
+        return ComparisonPlans(
+            default=self.compile_plan(rules_file.default_rules),
+            operations={
+                operation_id: self.compile_plan(get_operation_rules(rules_file, operation_id))
+                for operation_id in rules_file.operation_rules
+            },
+        )
+
+    def compile_plan(self, rules: OperationRules) -> ComparisonPlan:
+        """Compile OperationRules into a ComparisonPlan.
+
+        Rule errors do not raise: they are recorded in the plan (see
+        ComparisonPlan.errors) and reported as differences when the rule is
+        evaluated, as for uncompiled rules.
+
+        Args:
+            rules: Comparison rules for one operation.
+
+        Returns:
+            ComparisonPlan for compare().
+        """
+        headers = tuple(
+            _PlannedField(path=name, rule=self._compile_rule(rule), key=name.lower())
+            for name, rule in rules.headers.items()
+        )
+
+        body_fields: list[_PlannedField] = []
+        binary_rule = None
+        if rules.body is not None:
+            for path, rule in rules.body.field_rules.items():
+                compiled = self._compile_rule(rule)
+                try:
+                    body_fields.append(_PlannedField(path, compiled, self._parse_jsonpath(path)))
+                except JSONPathError as e:
+                    body_fields.append(_PlannedField(path, compiled, None, str(e)))
+            if rules.body.binary_rule is not None:
+                binary_rule = self._compile_rule(rules.body.binary_rule)
+
+        return ComparisonPlan(
+            rules=rules,
+            status_code=self._compile_rule(rules.status_code) if rules.status_code else None,
+            headers=headers,
+            body_fields=tuple(body_fields),
+            binary_rule=binary_rule,
+            identical_bodies=self._compile_identical_bodies(tuple(body_fields)),
+            structural_diff=rules.body is not None and rules.body.structural_diff,
+        )
+
+    def _compile_identical_bodies(
+        self, body_fields: tuple[_PlannedField, ...]
+    ) -> _IdenticalBodies | None:
+        """Work out which body rules identical bodies are known to pass.
+
+        A rule is skipped on identical bodies if its presence mode passes
+        whenever both sides agree (parity, optional), it is presence-only or
+        reflexive (ignore, exact_match, ...), and none of the masked paths can
+        reach a location at, above or below its matches.
+        """
+        masks: list[JSONPathAccessor] = []
+        candidates: list[_PlannedField] = []
+        for field in body_fields:
+            if field.key is None or field.rule.error is not None:
+                continue  # Evaluated to report the error; its values stay in
+            rule = field.rule
+            value_free = not rule.compares_values or (
+                rule.rule.predefined == "ignore"
+                and is_reflexive("ignore", self._library.predefined["ignore"])
+            )
+            implied = rule.rule.presence in (PresenceMode.PARITY, PresenceMode.OPTIONAL) and (
+                value_free
+                or (
+                    rule.rule.predefined is not None
+                    and is_reflexive(rule.rule.predefined, self._library.predefined[rule.rule.predefined])
+                )
+            )
+            if field.key.steps is not None and (value_free or not implied):
+                masks.append(field.key)
+            if implied:
+                candidates.append(field)
+
+        skipped = [
+            field
+            for field in candidates
+            if not any(mask is not field.key and field.key.may_overlap(mask) for mask in masks)
+        ]
+        if not skipped:
+            return None
+        return _IdenticalBodies(
+            masks=tuple(masks),
+            remaining=tuple(field for field in body_fields if field not in skipped),
+        )
+
+    def _compile_rule(self, rule: FieldRule) -> _CompiledRule:
+        """Compile a FieldRule (cached per rule object)."""
+        cached = self._compiled_rules.get(id(rule))
+        if cached is not None and cached[0] is rule:
+            return cached[1]
+
+        presence = {
+            (a_present, b_present): self._check_presence(
+                None if a_present else NOT_FOUND,
+                None if b_present else NOT_FOUND,
+                rule.presence,
+            )
+            for a_present in (True, False)
+            for b_present in (True, False)
+        }
+        expr = native = column = error = None
+        if rule.expr is not None:
+            # Custom CEL expression
+            expr = rule.expr
+        elif rule.predefined is not None:
+            try:
+                expr = self._expand_predefined(rule)
+            except ComparatorConfigError as e:
+                error = str(e)
+            else:
+                predefined = self._library.predefined[rule.predefined]
+                native = compile_native_comparison(rule.predefined, predefined, rule)
+                column = compile_native_column(rule.predefined, predefined, rule)
+
+        compiled = _CompiledRule(
+            rule=rule,
+            name=rule.predefined or "custom",
+            expr=expr,
+            native=native,
+            column=column,
+            presence=presence,
+            error=error,
+            uses_bodies=rule.expr is not None and _BODY_VARIABLES.search(rule.expr) is not None,
+        )
+        self._compiled_rules[id(rule)] = (rule, compiled)
+        return compiled
 
     def compare(
         self,
         response_a: ResponseCase,
         response_b: ResponseCase,
-        rules: OperationRules,
+        rules: OperationRules | ComparisonPlan,
         operation_id: str | None = None,
     ) -> ComparisonResult:
         """Compare two responses according to the given rules.
@@ -155,12 +632,13 @@ class Comparator:
         Args:
             response_a: Response from target A.
             response_b: Response from target B.
-            rules: Comparison rules to apply.
+            rules: Comparison rules to apply, or a plan compiled from them.
             operation_id: Optional operationId for schema validation lookup.
 
         Returns:
             ComparisonResult with match status and details.
         """
+        plan = rules if isinstance(rules, ComparisonPlan) else self.compile_plan(rules)
         details: dict[str, ComponentResult] = {}
 
         # Phase 0: Schema validation (if schema_validator is configured)
@@ -186,7 +664,7 @@ class Comparator:
         status_result = self._compare_status_code(
             response_a.status_code,
             response_b.status_code,
-            rules.status_code,
+            plan.status_code,
         )
         details["status_code"] = status_result
 
@@ -202,7 +680,7 @@ class Comparator:
         header_result = self._compare_headers(
             response_a.headers,
             response_b.headers,
-            rules.headers,
+            plan.headers,
         )
         details["headers"] = header_result
 
@@ -218,7 +696,8 @@ class Comparator:
         body_result = self._compare_body(
             response_a.body,
             response_b.body,
-            rules.body,
+            plan.body_fields,
+            plan.identical_bodies,
         )
         details["body"] = body_result
 
@@ -230,11 +709,11 @@ class Comparator:
                 details=details,
             )
 
-        # Phase 3b: Compare binary body (non-JSON responses)
+        # Phase 3b: Compare binary body (non-JSON or truncated responses)
         binary_result = self._compare_binary_body(
-            response_a.body_base64,
-            response_b.body_base64,
-            rules.body.binary_rule if rules.body else None,
+            response_a,
+            response_b,
+            plan.binary_rule,
         )
         details["binary_body"] = binary_result
 
@@ -246,6 +725,22 @@ class Comparator:
                 details=details,
             )
 
+        # Phase 3c: Structural diff (opt-in): every differing value of the
+        # JSON bodies outside what the body field rules matched
+        if plan.structural_diff and response_a.body is not None and response_b.body is not None:
+            structure_result = self._compare_structure(
+                response_a.body, response_b.body, plan.body_fields
+            )
+            details["structural_diff"] = structure_result
+
+            if not structure_result.match:
+                return ComparisonResult(
+                    match=False,
+                    mismatch_type=MismatchType.BODY,
+                    summary=self._format_structural_summary(structure_result.differences),
+                    details=details,
+                )
+
         # Phase 4: Compare extra fields (fields not in schema but allowed)
         # These fields exist in the response but aren't defined in the OpenAPI spec.
         # When additionalProperties is true/unspecified, we still need to compare them.
@@ -293,7 +788,7 @@ class Comparator:
 
         # Validate response A
         result_a = self._schema_validator.validate_response(
-            response_a.body, operation_id, response_a.status_code
+            self._body_for_schema(response_a, operation_id), operation_id, response_a.status_code
         )
         for violation in result_a.violations:
             differences.append(
@@ -308,7 +803,7 @@ class Comparator:
 
         # Validate response B
         result_b = self._schema_validator.validate_response(
-            response_b.body, operation_id, response_b.status_code
+            self._body_for_schema(response_b, operation_id), operation_id, response_b.status_code
         )
         for violation in result_b.violations:
             differences.append(
@@ -327,6 +822,17 @@ class Comparator:
             extra_fields_b,
         )
 
+    def _body_for_schema(self, response: ResponseCase, operation_id: str) -> Any:
+        """The body to validate, or None when no schema applies.
+
+        Response bodies are parsed on first access (ResponseCase.with_lazy_body),
+        so a response without a schema for its status code is never parsed here.
+        validate_response() passes both cases alike.
+        """
+        if not self._schema_validator.has_schema(operation_id, response.status_code):
+            return None
+        return response.body
+
     def _compare_extra_fields(
         self,
         body_a: Any,
@@ -389,6 +895,51 @@ class Comparator:
 
         return ComponentResult(match=len(differences) == 0, differences=differences)
 
+    def _compare_structure(
+        self,
+        body_a: Any,
+        body_b: Any,
+        body_rules: tuple[_PlannedField, ...],
+    ) -> ComponentResult:
+        """Report every differing value of two JSON bodies no body rule covers.
+
+        Rules take precedence: the subtree at each location a body field
+        rule matches on either side is left to that rule.
+
+        Args:
+            body_a: Parsed JSON body from target A.
+            body_b: Parsed JSON body from target B.
+            body_rules: Compiled body field rules from the plan.
+
+        Returns:
+            ComponentResult for the structural diff.
+        """
+        governed: set[Location] = set()
+        rendered: set[str] = set()
+        for field in body_rules:
+            if field.key is None:
+                continue
+            for body in (body_a, body_b):
+                for location, _ in field.key.find(body):
+                    if type(location) is str:
+                        # jsonpath_ng fallback: only the rendered path is known
+                        rendered.add(location)
+                    else:
+                        governed.add(location)
+
+        differences = [
+            FieldDifference(
+                path=path,
+                target_a=value_a,
+                target_b=value_b,
+                rule="structural_diff",
+            )
+            for location, value_a, value_b in diff_bodies(body_a, body_b, governed)
+            if (path := concrete_path(location)) not in rendered
+            and not any(path.startswith(f"{prefix}.") for prefix in rendered)
+        ]
+        return ComponentResult(match=len(differences) == 0, differences=differences)
+
     def _format_schema_summary(self, differences: list[FieldDifference]) -> str:
         """Format a summary for schema violations."""
         if len(differences) == 1:
@@ -405,7 +956,7 @@ class Comparator:
         self,
         status_a: int,
         status_b: int,
-        rule: FieldRule | None,
+        rule: _CompiledRule | None,
     ) -> ComponentResult:
         """Compare status codes.
 
@@ -460,7 +1011,7 @@ class Comparator:
                     path="status_code",
                     target_a=status_a,
                     target_b=status_b,
-                    rule=rule.predefined or "custom",
+                    rule=rule.name,
                 )
             ],
         )
@@ -469,34 +1020,37 @@ class Comparator:
         self,
         headers_a: dict[str, list[str]],
         headers_b: dict[str, list[str]],
-        header_rules: dict[str, FieldRule],
+        header_rules: tuple[_PlannedField, ...],
     ) -> ComponentResult:
         """Compare response headers.
 
         Args:
             headers_a: Headers from target A (lowercase keys, list values).
             headers_b: Headers from target B (lowercase keys, list values).
-            header_rules: Header name -> FieldRule mapping.
+            header_rules: Compiled header rules from the plan.
 
         Returns:
             ComponentResult for header comparison.
         """
-        differences: list[FieldDifference] = []
+        entries: list[FieldDifference | _PendingEvaluation] = []
+        batch = _EvaluationBatch()
 
-        for header_name, rule in header_rules.items():
-            value_a = self._get_header_value(headers_a, header_name)
-            value_b = self._get_header_value(headers_b, header_name)
+        for field in header_rules:
+            header_name = field.path
+            rule = field.rule
+            value_a = self._get_header_value(headers_a, field.key)
+            value_b = self._get_header_value(headers_b, field.key)
 
             # Check presence
-            presence_result = self._check_presence(value_a, value_b, rule.presence)
+            presence_result = rule.presence[value_a is not NOT_FOUND, value_b is not NOT_FOUND]
 
             if not presence_result.passed:
-                differences.append(
+                entries.append(
                     FieldDifference(
                         path=f"headers.{header_name}",
                         target_a=value_a if value_a is not NOT_FOUND else "<missing>",
                         target_b=value_b if value_b is not NOT_FOUND else "<missing>",
-                        rule=f"presence:{rule.presence.value}",
+                        rule=f"presence:{rule.rule.presence.value}",
                     )
                 )
                 continue
@@ -505,47 +1059,31 @@ class Comparator:
                 continue
 
             # Both present and rule has a comparison (not just presence-only)
-            if rule.predefined is None and rule.expr is None:
+            if not rule.compares_values:
                 # Presence-only rule, no value comparison needed
                 continue
 
-            try:
-                result = self._evaluate_field_rule(value_a, value_b, rule)
-            except (CELEvaluationError, ComparatorConfigError) as e:
-                differences.append(
-                    FieldDifference(
-                        path=f"headers.{header_name}",
-                        target_a=value_a,
-                        target_b=value_b,
-                        rule=f"error: {e}",
-                    )
-                )
-                continue
-
-            if not result:
-                differences.append(
-                    FieldDifference(
-                        path=f"headers.{header_name}",
-                        target_a=value_a,
-                        target_b=value_b,
-                        rule=rule.predefined or "custom",
-                    )
-                )
+            entry = self._queue_evaluation(f"headers.{header_name}", value_a, value_b, rule, batch)
+            if entry is not None:
+                entries.append(entry)
 
+        differences = self._resolve_evaluations(entries, batch)
         return ComponentResult(match=len(differences) == 0, differences=differences)
 
     def _compare_body(
         self,
         body_a: Any,
         body_b: Any,
-        body_rules: BodyRules | None,
+        body_rules: tuple[_PlannedField, ...],
+        identical_bodies: _IdenticalBodies | None = None,
     ) -> ComponentResult:
         """Compare response bodies.
 
         Args:
             body_a: Body from target A (parsed JSON or None).
             body_b: Body from target B (parsed JSON or None).
-            body_rules: Body comparison rules.
+            body_rules: Compiled body field rules from the plan.
+            identical_bodies: Rules to skip if the bodies are identical.
 
         Returns:
             ComponentResult for body comparison.
@@ -569,28 +1107,67 @@ class Comparator:
             )
 
         # No rules specified - treat as match (no fields to compare)
-        if body_rules is None or not body_rules.field_rules:
+        if not body_rules:
             return ComponentResult(match=True, differences=[])
 
-        differences: list[FieldDifference] = []
+        if identical_bodies is not None and self._bodies_identical(
+            body_a, body_b, identical_bodies.masks
+        ):
+            # The skipped rules cannot fail on identical values
+            self.identical_bodies += 1
+            body_rules = identical_bodies.remaining
+            if not body_rules:
+                return ComponentResult(match=True, differences=[])
+
+        # All CEL evaluations for the body (every rule, every wildcard
+        # match) go to the evaluator as one batch.
+        entries: list[FieldDifference | _PendingEvaluation] = []
+        batch = _EvaluationBatch(bodies=(body_a, body_b))
 
-        for jsonpath, rule in body_rules.field_rules.items():
-            path_differences = self._compare_jsonpath(body_a, body_b, jsonpath, rule)
-            differences.extend(path_differences)
+        for field in body_rules:
+            entries.extend(self._compare_jsonpath(body_a, body_b, field, batch))
 
+        differences = self._resolve_evaluations(entries, batch)
         return ComponentResult(match=len(differences) == 0, differences=differences)
 
+    def _bodies_identical(
+        self,
+        body_a: Any,
+        body_b: Any,
+        masks: tuple[JSONPathAccessor, ...],
+    ) -> bool:
+        """Whether two bodies have the same canonical JSON outside masked paths.
+
+        Canonical JSON sorts keys and keeps JSON types apart (1, 1.0 and true
+        all differ), so equal forms mean equal CEL values. Python's == is
+        looser (True == 1) but much cheaper, so it rules out differing bodies
+        first. Bodies with NaN or Infinity, or whose masked paths do not
+        address plain members and items, are never identical.
+        """
+        try:
+            if masks:
+                body_a = replace_matches(body_a, masks, _MASKED)
+                body_b = replace_matches(body_b, masks, _MASKED)
+            if body_a != body_b:
+                return False
+            return _canonical_json(body_a) == _canonical_json(body_b)
+        except (TypeError, ValueError):
+            return False
+
     def _compare_binary_body(
         self,
-        body_a: str | None,
-        body_b: str | None,
-        binary_rule: FieldRule | None,
+        response_a: ResponseCase,
+        response_b: ResponseCase,
+        binary_rule: _CompiledRule | None,
     ) -> ComponentResult:
         """Compare binary response bodies (base64-encoded).
 
+        A truncated body (over --max-body-size) counts as binary content and
+        is compared by length and digest instead of through CEL.
+
         Args:
-            body_a: Base64-encoded body from target A (None if not binary).
-            body_b: Base64-encoded body from target B (None if not binary).
+            response_a: Response from target A.
+            response_b: Response from target B.
             binary_rule: Comparison rule for binary bodies.
 
         Returns:
@@ -600,24 +1177,32 @@ class Comparator:
         if binary_rule is None:
             return ComponentResult(match=True, differences=[])
 
+        body_a = response_a.body_base64
+        body_b = response_b.body_base64
+        has_a = body_a is not None or response_a.body_truncated
+        has_b = body_b is not None or response_b.body_truncated
+
         # Neither response has binary body - nothing to compare
-        if body_a is None and body_b is None:
+        if not has_a and not has_b:
             return ComponentResult(match=True, differences=[])
 
         # One has binary body, one doesn't - mismatch
-        if body_a is None or body_b is None:
+        if not has_a or not has_b:
             return ComponentResult(
                 match=False,
                 differences=[
                     FieldDifference(
                         path="body_base64",
-                        target_a="<no binary body>" if body_a is None else "<has binary body>",
-                        target_b="<no binary body>" if body_b is None else "<has binary body>",
+                        target_a="<no binary body>" if not has_a else "<has binary body>",
+                        target_b="<no binary body>" if not has_b else "<has binary body>",
                         rule="binary_presence",
                     )
                 ],
             )
 
+        if response_a.body_truncated or response_b.body_truncated:
+            return self._compare_binary_digests(response_a, response_b, binary_rule.rule)
+
         # Evaluate the rule using CEL with base64 strings as values
         try:
             result = self._evaluate_field_rule(body_a, body_b, binary_rule)
@@ -644,7 +1229,50 @@ class Comparator:
                     path="body_base64",
                     target_a=f"<{len(body_a)} chars>",
                     target_b=f"<{len(body_b)} chars>",
-                    rule=binary_rule.predefined or "custom",
+                    rule=binary_rule.name,
+                )
+            ],
+        )
+
+    def _compare_binary_digests(
+        self,
+        response_a: ResponseCase,
+        response_b: ResponseCase,
+        binary_rule: FieldRule,
+    ) -> ComponentResult:
+        """Compare binary bodies by (length, SHA-256) when one was truncated.
+
+        Only rules decidable from the digest are supported (see
+        _DIGEST_COMPARISONS); anything else needs the full body, which is not
+        in memory, and is reported as an error difference.
+        """
+        digest_a = _binary_digest(response_a)
+        digest_b = _binary_digest(response_b)
+        rule_name = binary_rule.predefined or "custom"
+
+        if binary_rule.expr is None and binary_rule.predefined is None:
+            # Presence-only rule: both have content, nothing else to check
+            return ComponentResult(match=True, differences=[])
+
+        comparison = _DIGEST_COMPARISONS.get(binary_rule.predefined or "")
+        if binary_rule.expr is not None or comparison is None:
+            rule = (
+                f"error: {rule_name} needs the full body, which exceeded --max-body-size; "
+                f"use binary_exact_match, binary_length_match or binary_nonempty"
+            )
+        elif comparison(digest_a, digest_b):
+            return ComponentResult(match=True, differences=[])
+        else:
+            rule = rule_name
+
+        return ComponentResult(
+            match=False,
+            differences=[
+                FieldDifference(
+                    path="body_base64",
+                    target_a=f"<{digest_a[0]} bytes, sha256 {digest_a[1][:16]}>",
+                    target_b=f"<{digest_b[0]} bytes, sha256 {digest_b[1][:16]}>",
+                    rule=rule,
                 )
             ],
         )
@@ -660,9 +1288,9 @@ class Comparator:
         self,
         body_a: Any,
         body_b: Any,
-        jsonpath: str,
-        rule: FieldRule,
-    ) -> list[FieldDifference]:
+        field: _PlannedField,
+        batch: _EvaluationBatch,
+    ) -> list[FieldDifference | _PendingEvaluation]:
         """Compare values at a JSONPath location.
 
         Handles wildcards by expanding the path and comparing paired values.
@@ -670,28 +1298,31 @@ class Comparator:
         Args:
             body_a: Body from target A.
             body_b: Body from target B.
-            jsonpath: JSONPath expression.
-            rule: Field comparison rule.
+            field: Compiled body field rule (JSONPath and rule).
+            batch: Batch that value comparisons are queued on.
 
         Returns:
-            List of FieldDifference for any mismatches.
+            FieldDifference for each mismatch found so far, and a
+            _PendingEvaluation for each value comparison queued on batch.
         """
-        differences: list[FieldDifference] = []
+        differences: list[FieldDifference | _PendingEvaluation] = []
+        jsonpath = field.path
+        rule = field.rule
 
-        try:
-            matches_a = self._expand_jsonpath(body_a, jsonpath)
-            matches_b = self._expand_jsonpath(body_b, jsonpath)
-        except JSONPathError as e:
+        if field.error is not None:
             # Invalid JSONPath - treat as error
             return [
                 FieldDifference(
                     path=jsonpath,
                     target_a="<error>",
                     target_b="<error>",
-                    rule=f"jsonpath_error: {e}",
+                    rule=f"jsonpath_error: {field.error}",
                 )
             ]
 
+        matches_a = self._find(field.key, body_a)
+        matches_b = self._find(field.key, body_b)
+
         # Detect multi-match paths by actual match count, not by inspecting the path syntax.
         # This handles all wildcards: [*], .., [?()], [0:5], [0,1,2], etc.
         # We compare by index pairing (matches_a[i] vs matches_b[i]), which requires equal counts.
@@ -702,8 +1333,9 @@ class Comparator:
             # Single-value path - extract the value (or NOT_FOUND if no match)
             value_a = matches_a[0][1] if matches_a else NOT_FOUND
             value_b = matches_b[0][1] if matches_b else NOT_FOUND
+            locations = (matches_a[0][0], matches_b[0][0]) if matches_a and matches_b else None
 
-            diff = self._compare_single_field(jsonpath, value_a, value_b, rule)
+            diff = self._compare_single_field(jsonpath, value_a, value_b, rule, batch, locations)
             if diff:
                 differences.append(diff)
         else:
@@ -720,70 +1352,209 @@ class Comparator:
                 )
             else:
                 # Compare paired by index
-                for (path_a, value_a), (path_b, value_b) in zip(matches_a, matches_b):
-                    # Use the concrete path from target A for reporting
-                    diff = self._compare_single_field(path_a, value_a, value_b, rule)
-                    if diff:
-                        differences.append(diff)
+                differences.extend(self._compare_columns(matches_a, matches_b, rule, batch))
 
         return differences
 
+    def _compare_columns(
+        self,
+        matches_a: list[tuple[Location, Any]],
+        matches_b: list[tuple[Location, Any]],
+        rule: _CompiledRule,
+        batch: _EvaluationBatch,
+    ) -> list[FieldDifference | _PendingEvaluation]:
+        """Compare index-paired wildcard matches under one rule.
+
+        Every match is present, so the presence check and rule errors are
+        decided once for the whole column, and a native comparison runs over
+        all value pairs in one call. Only mismatched pairs become differences
+        and only undecided pairs are queued for CEL.
+
+        Args:
+            matches_a: (location, value) matches from target A.
+            matches_b: Matches from target B, same length as matches_a.
+            rule: Compiled comparison rule.
+            batch: Batch that undecided value comparisons are queued on.
+
+        Returns:
+            Differences and pending evaluations in match order. Paths are
+            the concrete paths from target A, rendered only for these.
+        """
+        presence_result = rule.presence[True, True]
+        if not presence_result.passed:
+            return [
+                FieldDifference(
+                    path=concrete_path(location),
+                    target_a=value_a,
+                    target_b=value_b,
+                    rule=f"presence:{rule.rule.presence.value}",
+                )
+                for (location, value_a), (_, value_b) in zip(matches_a, matches_b)
+            ]
+
+        if presence_result.skip_value_comparison or not rule.compares_values:
+            return []
+
+        if rule.error is not None or rule.column is None:
+            # Pair by pair: error differences, or CEL for every pair
+            return [
+                self._queue_evaluation(
+                    concrete_path(location_a), value_a, value_b, rule, batch, (location_a, location_b)
+                )
+                for (location_a, value_a), (location_b, value_b) in zip(matches_a, matches_b)
+            ]
+
+        values_a = [value for _, value in matches_a]
+        values_b = [value for _, value in matches_b]
+        results = rule.column(values_a, values_b)
+
+        entries: list[FieldDifference | _PendingEvaluation] = []
+        for i, result in enumerate(results):
+            if result is True:
+                continue
+            path = concrete_path(matches_a[i][0])
+            if result is False:
+                entries.append(
+                    FieldDifference(
+                        path=path, target_a=values_a[i], target_b=values_b[i], rule=rule.name
+                    )
+                )
+            else:
+                locations = (matches_a[i][0], matches_b[i][0])
+                index = batch.add(rule.expr, values_a[i], values_b[i], locations, rule.uses_bodies)
+                entries.append(_PendingEvaluation(path, values_a[i], values_b[i], rule, index))
+        return entries
+
     def _compare_single_field(
         self,
         path: str,
         value_a: Any,
         value_b: Any,
-        rule: FieldRule,
-    ) -> FieldDifference | None:
+        rule: _CompiledRule,
+        batch: _EvaluationBatch,
+        locations: tuple[Location, Location] | None = None,
+    ) -> FieldDifference | _PendingEvaluation | None:
         """Compare a single field value pair.
 
         Args:
             path: Path for error reporting.
             value_a: Value from target A (may be NOT_FOUND).
             value_b: Value from target B (may be NOT_FOUND).
-            rule: Comparison rule.
+            rule: Compiled comparison rule.
+            batch: Batch that the value comparison is queued on.
+            locations: Match locations of both values in the bodies, if known.
 
         Returns:
-            FieldDifference if mismatch, None if match.
+            FieldDifference on a presence mismatch or rule error, a
+            _PendingEvaluation if the values still need to be compared, or
+            None if the field matches.
         """
         # Check presence
-        presence_result = self._check_presence(value_a, value_b, rule.presence)
+        presence_result = rule.presence[value_a is not NOT_FOUND, value_b is not NOT_FOUND]
 
         if not presence_result.passed:
             return FieldDifference(
                 path=path,
                 target_a=value_a if value_a is not NOT_FOUND else "<missing>",
                 target_b=value_b if value_b is not NOT_FOUND else "<missing>",
-                rule=f"presence:{rule.presence.value}",
+                rule=f"presence:{rule.rule.presence.value}",
             )
 
         if presence_result.skip_value_comparison:
             return None
 
         # Both present - check for value comparison rule
-        if rule.predefined is None and rule.expr is None:
+        if not rule.compares_values:
             # Presence-only rule
             return None
 
-        try:
-            result = self._evaluate_field_rule(value_a, value_b, rule)
-        except (CELEvaluationError, ComparatorConfigError) as e:
+        return self._queue_evaluation(path, value_a, value_b, rule, batch, locations)
+
+    def _queue_evaluation(
+        self,
+        path: str,
+        value_a: Any,
+        value_b: Any,
+        rule: _CompiledRule,
+        batch: _EvaluationBatch,
+        locations: tuple[Location, Location] | None = None,
+    ) -> FieldDifference | _PendingEvaluation | None:
+        """Queue a rule's CEL evaluation for a value pair.
+
+        Predefined rules with a native implementation are decided here
+        without CEL when possible. locations are the values' match
+        locations in the bodies, if known.
+
+        Returns:
+            _PendingEvaluation to resolve after the batch runs, a
+            FieldDifference if the values differ or the rule cannot be
+            expanded, or None if the values match.
+        """
+        if rule.error is not None:
             return FieldDifference(
                 path=path,
                 target_a=value_a,
                 target_b=value_b,
-                rule=f"error: {e}",
+                rule=f"error: {rule.error}",
             )
 
-        if not result:
-            return FieldDifference(
-                path=path,
-                target_a=value_a,
-                target_b=value_b,
-                rule=rule.predefined or "custom",
+        if rule.native is not None:
+            result = rule.native(value_a, value_b)
+            if result is True:
+                return None
+            if result is False:
+                return FieldDifference(
+                    path=path,
+                    target_a=value_a,
+                    target_b=value_b,
+                    rule=rule.name,
+                )
+
+        index = batch.add(rule.expr, value_a, value_b, locations, rule.uses_bodies)
+        return _PendingEvaluation(path, value_a, value_b, rule, index)
+
+    def _resolve_evaluations(
+        self,
+        entries: list[FieldDifference | _PendingEvaluation],
+        batch: _EvaluationBatch,
+    ) -> list[FieldDifference]:
+        """Run the batch and turn its results into differences, in entry order.
+
+        Args:
+            entries: Differences and pending evaluations from one phase.
+            batch: The batch the pending evaluations were queued on.
+
+        Returns:
+            FieldDifference for each mismatch or evaluation error.
+
+        Raises:
+            CELSubprocessError: If the CEL subprocess fails.
+        """
+        results = batch.run(self._cel)
+        differences: list[FieldDifference] = []
+
+        for entry in entries:
+            if isinstance(entry, FieldDifference):
+                differences.append(entry)
+                continue
+
+            result = results[entry.index]
+            if isinstance(result, CELEvaluationError):
+                rule = f"error: {result}"
+            elif not result:
+                rule = entry.rule.name
+            else:
+                continue
+            differences.append(
+                FieldDifference(
+                    path=entry.path,
+                    target_a=entry.value_a,
+                    target_b=entry.value_b,
+                    rule=rule,
+                )
             )
 
-        return None
+        return differences
 
     def _check_presence(
         self,
@@ -874,14 +1645,14 @@ class Comparator:
         self,
         value_a: Any,
         value_b: Any,
-        rule: FieldRule,
+        rule: _CompiledRule,
     ) -> bool:
         """Evaluate a field comparison rule.
 
         Args:
             value_a: Value from target A.
             value_b: Value from target B.
-            rule: The field rule to evaluate.
+            rule: The compiled rule to evaluate.
 
         Returns:
             True if comparison passes, False otherwise.
@@ -890,17 +1661,19 @@ class Comparator:
             ComparatorConfigError: If rule configuration is invalid.
             CELEvaluationError: If CEL evaluation fails.
         """
-        if rule.expr is not None:
-            # Custom CEL expression
-            expr = rule.expr
-        elif rule.predefined is not None:
-            # Expand predefined to CEL expression
-            expr = self._expand_predefined(rule)
-        else:
+        if rule.error is not None:
+            raise ComparatorConfigError(rule.error)
+
+        if rule.native is not None:
+            result = rule.native(value_a, value_b)
+            if result is not None:
+                return result
+
+        if rule.expr is None:
             # No comparison specified (presence-only) - treat as pass
             return True
 
-        return self._cel.evaluate(expr, {"a": value_a, "b": value_b})
+        return self._cel.evaluate(rule.expr, {"a": value_a, "b": value_b})
 
     def _expand_predefined(self, rule: FieldRule) -> str:
         """Expand a predefined rule to its CEL expression.
@@ -954,26 +1727,40 @@ class Comparator:
         Raises:
             JSONPathError: If path is syntactically invalid.
         """
-        # Use cache for compiled paths
+        return [
+            (concrete_path(location), value)
+            for location, value in self._find(self._parse_jsonpath(path), body)
+        ]
+
+    def _parse_jsonpath(self, path: str) -> JSONPathAccessor:
+        """Parse and compile a JSONPath expression (cached).
+
+        Raises:
+            JSONPathError: If path is syntactically invalid.
+        """
         if path not in self._jsonpath_cache:
             try:
-                self._jsonpath_cache[path] = jsonpath_parse(path)
+                parsed = jsonpath_parse(path)
             except (JsonPathParserError, JsonPathLexerError) as e:
                 # JsonPathParserError: invalid JSONPath syntax
                 # JsonPathLexerError: non-printable or unexpected characters in path
                 # (can occur when schema validator reports extra fields with
                 # fuzz-generated names containing non-ASCII bytes)
                 raise JSONPathError(f"Invalid JSONPath '{path}': {e}") from e
+            self._jsonpath_cache[path] = compile_jsonpath(parsed)
+        return self._jsonpath_cache[path]
 
-        compiled = self._jsonpath_cache[path]
-        matches = compiled.find(body)
+    def _find(self, compiled: JSONPathAccessor, body: Any) -> list[tuple[Location, Any]]:
+        """(location, value) for each match of a compiled JSONPath.
 
-        return [(str(match.full_path), match.value) for match in matches]
+        Render a location with concrete_path() only when it is reported.
+        """
+        return compiled.find(body)
 
     def _get_header_value(
         self,
         headers: dict[str, list[str]],
-        name: str,
+        name_lower: str,
     ) -> str | _NotFound:
         """Get a header value (case-insensitive).
 
@@ -981,19 +1768,27 @@ class Comparator:
 
         Args:
             headers: Response headers dict (lowercase keys, list values).
-            name: Header name to find.
+            name_lower: Lowercased header name to find.
 
         Returns:
             First header value, or NOT_FOUND if not present.
         """
+        values = headers.get(name_lower)
+        if values:
+            return values[0]
         # Headers should already be lowercase (per ResponseCase normalization), but we
         # compare case-insensitively as a defensive measure against upstream changes.
-        name_lower = name.lower()
         for key, values in headers.items():
             if key.lower() == name_lower and values:
                 return values[0]
         return NOT_FOUND
 
+    def _format_structural_summary(self, differences: list[FieldDifference]) -> str:
+        """Format a summary for structural diff mismatches."""
+        if len(differences) == 1:
+            return f"Structural difference at {differences[0].path}"
+        return f"Structural differences: {len(differences)} differences"
+
     def _format_status_summary(self, status_a: int, status_b: int) -> str:
         """Format a summary for status code mismatch."""
         return f"Status code mismatch: {status_a} vs {status_b}"
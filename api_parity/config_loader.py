@@ -15,6 +15,8 @@ from pathlib import Path
 from typing import Any
 
 import yaml
+from jsonpath_ng import parse as jsonpath_parse
+from jsonpath_ng.exceptions import JsonPathLexerError, JsonPathParserError
 
 from api_parity.models import (
     ComparisonLibrary,
@@ -390,6 +392,13 @@ def _validate_operation_rules(
     # Check body field rules
     if rules.body and rules.body.field_rules:
         for jsonpath, field_rule in rules.body.field_rules.items():
+            try:
+                jsonpath_parse(jsonpath)
+            except (JsonPathParserError, JsonPathLexerError) as e:
+                result.add_error(
+                    "jsonpath",
+                    f"{context}.body.field_rules[{jsonpath}]: Invalid JSONPath: {e}"
+                )
             if field_rule.predefined:
                 _validate_field_rule(
                     field_rule, valid_predefined, library,
@@ -1,32 +1,53 @@
 """Executor - Sends requests to targets and captures responses.
 
-The Executor sends HTTP requests to both targets (serially) and captures
-the responses as ResponseCase objects for comparison.
+The Executor sends HTTP requests to both targets (serially, or both at once
+with --parallel-targets) and captures the responses as ResponseCase objects
+for comparison. AsyncExecutor offers the same execute/execute_chain
+contract on httpx.AsyncClient so that many cases or chains can be in
+flight at once (see --concurrency).
 
 See ARCHITECTURE.md "Executor" for specifications.
 """
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import copy
+import hashlib
+import importlib.util
+import inspect
 import json
+import os
 import re
+import shutil
 import ssl
+import tempfile
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from threading import Lock
-from typing import Any, Callable
+from typing import Any, Awaitable, Callable, Iterable, TypeVar
 
 import httpx
 
-from api_parity.case_generator import LinkFields, _MISSING, extract_by_jsonpointer
+from api_parity.case_generator import (
+    LinkFields,
+    _MISSING,
+    extract_by_segments,
+    split_jsonpointer,
+)
 from api_parity.models import (
     ChainCase,
     ChainExecution,
+    ChainStep,
     ChainStepExecution,
     RequestCase,
     ResponseCase,
     TargetConfig,
 )
+from api_parity.rate_limiter import TargetRateLimiter
 from api_parity.xml_body import dict_to_xml, xml_to_dict
 
 
@@ -95,19 +116,458 @@ def _sanitize_header_value(value: str) -> str:
     return value.encode('ascii', errors='replace').decode('ascii')
 
 
-class Executor:
-    """Executes requests against two targets and captures responses.
+def _to_request_error(target_name: str, error: Exception) -> RequestError:
+    """Translate an httpx/encoding exception into a RequestError.
 
-    Usage:
-        executor = Executor(target_a_config, target_b_config)
-        try:
-            resp_a, resp_b = executor.execute(request_case)
-        finally:
-            executor.close()
+    Shared by the sync and async send paths so both report failures with
+    identical messages (replay classification and logs depend on them).
 
-    Or with context manager:
-        with Executor(target_a_config, target_b_config) as executor:
-            resp_a, resp_b = executor.execute(request_case)
+    Args:
+        target_name: Name for error messages (e.g., "Target A").
+        error: The exception raised while sending the request.
+
+    Returns:
+        RequestError describing the failure.
+    """
+    if isinstance(error, httpx.TimeoutException):
+        return RequestError(f"{target_name} request timeout: {error}")
+    if isinstance(error, httpx.ConnectError):
+        return RequestError(f"{target_name} connection error: {error}")
+    if isinstance(error, UnicodeEncodeError):
+        # Fallback for non-ASCII in places we don't sanitize: header keys, query
+        # params, paths. These are protocol violations that should fail loudly
+        # rather than silently corrupt data.
+        return RequestError(
+            f"{target_name} encoding error: non-ASCII characters in request "
+            f"(header key, query param, or path). Character: "
+            f"{error.object[error.start:error.end]!r} "
+            f"at position {error.start}. HTTP requires ASCII for these fields."
+        )
+    return RequestError(f"{target_name} request error: {error}")
+
+
+class _BodyCapture:
+    """Streaming capture of one response body under a size cap.
+
+    Length and SHA-256 are computed as chunks arrive. Bytes are kept in
+    memory only up to max_size; past that, everything received so far is
+    written to a spill file in spill_dir and later chunks are appended there,
+    so memory stays bounded by max_size plus one chunk whatever the body size.
+    """
+
+    def __init__(self, max_size: int, spill_dir: str) -> None:
+        """Initialize an empty capture.
+
+        Args:
+            max_size: Largest body (in bytes) kept in memory.
+            spill_dir: Directory for the spill file of an oversized body.
+        """
+        self._max_size = max_size
+        self._spill_dir = spill_dir
+        self._digest = hashlib.sha256()
+        self._buffer = bytearray()
+        self._spill: Any = None
+        self.size = 0
+        self.spill_path: str | None = None
+
+    @property
+    def truncated(self) -> bool:
+        """Whether the body exceeded max_size and was spilled to disk."""
+        return self.spill_path is not None
+
+    @property
+    def content(self) -> bytes:
+        """The full body. Only valid when not truncated."""
+        return bytes(self._buffer)
+
+    @property
+    def sha256(self) -> str:
+        """Hex SHA-256 of all bytes fed so far."""
+        return self._digest.hexdigest()
+
+    def feed(self, chunk: bytes) -> None:
+        """Add one chunk of the body."""
+        self._digest.update(chunk)
+        self.size += len(chunk)
+        if self._spill is not None:
+            self._spill.write(chunk)
+            return
+        self._buffer += chunk
+        if len(self._buffer) > self._max_size:
+            fd, self.spill_path = tempfile.mkstemp(
+                prefix="body-", suffix=".bin", dir=self._spill_dir
+            )
+            self._spill = os.fdopen(fd, "wb")
+            self._spill.write(self._buffer)
+            self._buffer = bytearray()
+
+    def close(self) -> None:
+        """Flush and close the spill file, if any."""
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+
+    def discard(self) -> None:
+        """Close and delete the spill file (e.g., after a failed read)."""
+        self.close()
+        if self.spill_path is not None:
+            _remove_file(self.spill_path)
+            self.spill_path = None
+
+
+def _remove_file(path: str) -> None:
+    """Delete a file, ignoring one that is already gone."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+@dataclass
+class _ResponseBody:
+    """Undecoded response body, parsed by content-type on first access.
+
+    Implements models.LazyBody:
+      JSON         -> parsed dict/list/scalar
+      XML          -> parsed dict via xml_to_dict (see DESIGN.md "XML Body Conversion")
+      text/*       -> str
+      everything else -> base64
+    XML branch MUST come before text/* because text/xml is a valid content-type.
+    """
+
+    content: bytes
+    content_type: str
+    encoding: str
+
+    def decode(self) -> tuple[Any, bool]:
+        """Return (parsed body or None, whether to keep the content as base64)."""
+        content_type = self.content_type.lower()
+        if "json" in content_type:
+            try:
+                return json.loads(self.content), False
+            except Exception:
+                # Not valid JSON despite content-type
+                return None, True
+        if "xml" in content_type:
+            try:
+                return xml_to_dict(self.content), False
+            except Exception:
+                # Not valid XML despite content-type — fall back to base64
+                return None, True
+        if self.content_type.startswith("text/"):
+            try:
+                return self.content.decode(self.encoding, errors="replace"), False
+            except Exception:
+                return None, True
+        # Binary content
+        return None, True
+
+
+@dataclass
+class _ChainTargetState:
+    """Per-target state threaded through one chain execution.
+
+    Each target keeps its own extracted variables and request history so that
+    target A's IDs are never sent to target B (DESIGN.md "Live Chain Generation").
+    """
+
+    extracted_vars: dict[str, Any] = field(default_factory=dict)
+    prev_request: RequestCase | None = None
+    steps: list[ChainStepExecution] = field(default_factory=list)
+
+
+def _variable_to_string(var_value: Any) -> str:
+    """Convert a variable value to string for path/body substitution.
+
+    Lists (e.g., header values) use first element to avoid "['value']" in URLs.
+    """
+    if isinstance(var_value, list):
+        return str(var_value[0]) if var_value else ""
+    return str(var_value)
+
+
+def _substitute_placeholders(
+    value: str,
+    variables: dict[str, Any],
+    direct_match: bool = False,
+) -> str:
+    """Replace {variable_name} placeholders in a string, in variable order.
+
+    With direct_match, a value equal to a variable name is replaced too
+    (Schemathesis may have already resolved the placeholder).
+    """
+    for var_name, var_value in variables.items():
+        placeholder = f"{{{var_name}}}"
+        if placeholder in value:
+            value = value.replace(placeholder, _variable_to_string(var_value))
+        if direct_match and value == var_name:
+            value = _variable_to_string(var_value)
+    return value
+
+
+def _render_path(path_template: str, path_parameters: dict[str, Any]) -> str:
+    """Render a path template with the given parameter values."""
+    rendered_path = path_template
+    for key, value in path_parameters.items():
+        rendered_path = rendered_path.replace(f"{{{key}}}", str(value))
+    return rendered_path
+
+
+# Location of a string inside a request body: the sequence of dict keys and
+# list indices leading to it from the body root.
+_BodyPath = tuple[Any, ...]
+
+
+class _RequestTemplate:
+    """A ChainStep request template analysed once for cheap per-target builds.
+
+    Compiling records where a concrete request can differ from its template:
+    string path parameters, query values and body strings that contain a
+    "{" (the only ones placeholder substitution can touch), and the header
+    keys that link overrides may replace. build() then fills just those
+    slots and copies the template with model_copy(), instead of a
+    model_dump()/model_validate() round-trip and a full body walk per
+    target. Containers without a changed slot are shared with the template,
+    so built requests must be treated as read-only (as all RequestCases are).
+    """
+
+    def __init__(self, template: RequestCase) -> None:
+        self.template = template
+        self._string_path_params = tuple(
+            key for key, value in template.path_parameters.items()
+            if isinstance(value, str)
+        )
+        self._query_slots = tuple(
+            (key, index)
+            for key, values in template.query.items()
+            for index, value in enumerate(values)
+            if "{" in value
+        )
+        self._body_slots: tuple[_BodyPath, ...] = ()
+        if isinstance(template.body, dict):
+            slots: list[_BodyPath] = []
+            self._collect_body_slots(template.body, (), slots)
+            self._body_slots = tuple(slots)
+        # First header key matching each lowercased name (link overrides
+        # match header parameters case-insensitively).
+        self._header_keys: dict[str, str] = {}
+        for key in template.headers:
+            self._header_keys.setdefault(key.lower(), key)
+        self._rendered_path = _render_path(template.path_template, template.path_parameters)
+
+    @classmethod
+    def _collect_body_slots(cls, node: Any, path: _BodyPath, slots: list[_BodyPath]) -> None:
+        items = node.items() if isinstance(node, dict) else enumerate(node)
+        for key, value in items:
+            if isinstance(value, str):
+                if "{" in value:
+                    slots.append(path + (key,))
+            elif isinstance(value, (dict, list)):
+                cls._collect_body_slots(value, path + (key,), slots)
+
+    def build(
+        self,
+        overrides: dict[str, Any],
+        variables: dict[str, Any],
+    ) -> RequestCase:
+        """Build the concrete request for one target.
+
+        Link overrides are applied first, then {variable_name} placeholders
+        are substituted in path parameters, query values and a dict body.
+        A path parameter whose whole value equals a variable name is also
+        replaced (Schemathesis may have already resolved the placeholder).
+
+        Args:
+            overrides: Link-resolved parameter values (see
+                       _BaseExecutor._resolve_link_overrides).
+            variables: Variables extracted from this target's prior steps.
+
+        Returns:
+            New RequestCase, or the template itself if nothing changed.
+        """
+        template = self.template
+        path_parameters = template.path_parameters
+        query = template.query
+        headers = template.headers
+        overridden_query: list[str] = []
+
+        for param_name, value in overrides.items():
+            str_value = _variable_to_string(value)
+            if param_name in path_parameters:
+                if path_parameters is template.path_parameters:
+                    path_parameters = dict(path_parameters)
+                # Strip leading slashes from path parameter values.
+                path_parameters[param_name] = str_value.lstrip("/")
+            elif param_name in query:
+                if query is template.query:
+                    query = dict(query)
+                query[param_name] = [str_value]
+                overridden_query.append(param_name)
+            else:
+                hdr_key = self._header_keys.get(param_name.lower())
+                if hdr_key is not None:
+                    if headers is template.headers:
+                        headers = dict(headers)
+                    headers[hdr_key] = [str_value]
+
+        body = template.body
+        if variables:
+            path_keys = self._string_path_params
+            if path_parameters is not template.path_parameters:
+                path_keys = tuple(
+                    key for key, value in path_parameters.items() if isinstance(value, str)
+                )
+            for key in path_keys:
+                value = path_parameters[key]
+                new_value = _substitute_placeholders(value, variables, direct_match=True)
+                if new_value != value:
+                    if path_parameters is template.path_parameters:
+                        path_parameters = dict(path_parameters)
+                    path_parameters[key] = new_value
+
+            query_slots = [
+                (key, index) for key, index in self._query_slots if key not in overridden_query
+            ]
+            query_slots.extend(
+                (key, 0) for key in overridden_query if "{" in query[key][0]
+            )
+            for key, index in query_slots:
+                value = query[key][index]
+                new_value = _substitute_placeholders(value, variables)
+                if new_value != value:
+                    if query is template.query:
+                        query = dict(query)
+                    if query[key] is template.query.get(key):
+                        query[key] = list(query[key])
+                    query[key][index] = new_value
+
+            copied: set[int] = set()
+            for slot in self._body_slots:
+                value = _get_at(template.body, slot)
+                new_value = _substitute_placeholders(value, variables)
+                if new_value != value:
+                    body = _set_at(body, slot, new_value, copied)
+
+        update: dict[str, Any] = {}
+        if path_parameters is not template.path_parameters:
+            update["path_parameters"] = path_parameters
+            update["rendered_path"] = _render_path(template.path_template, path_parameters)
+        elif self._rendered_path != template.rendered_path:
+            update["rendered_path"] = self._rendered_path
+        if query is not template.query:
+            update["query"] = query
+        if headers is not template.headers:
+            update["headers"] = headers
+        if body is not template.body:
+            update["body"] = body
+
+        if not update:
+            return template
+        return template.model_copy(update=update)
+
+
+def _get_at(root: Any, path: _BodyPath) -> Any:
+    """Return the value at a body path."""
+    node = root
+    for key in path:
+        node = node[key]
+    return node
+
+
+def _set_at(root: Any, path: _BodyPath, value: Any, copied: set[int]) -> Any:
+    """Set a body path on a copy of root, copying only the containers on the path.
+
+    Args:
+        root: Body root, possibly already a copy made by an earlier call.
+        path: Location to set.
+        value: New value.
+        copied: ids of containers already copied during this build; they
+                are modified in place instead of copied again.
+
+    Returns:
+        The (copied) body root.
+    """
+    if id(root) not in copied:
+        root = copy.copy(root)
+        copied.add(id(root))
+    node = root
+    for key in path[:-1]:
+        child = node[key]
+        if id(child) not in copied:
+            child = copy.copy(child)
+            copied.add(id(child))
+            node[key] = child
+        node = child
+    node[path[-1]] = value
+    return root
+
+
+@dataclass(frozen=True)
+class _ExtractionPlan:
+    """LinkFields compiled for _extract_variables().
+
+    Built once per executor, so per-response extraction does no string
+    processing: pointers are pre-split, the last-segment aliases are
+    resolved, and header indices are grouped by header name.
+
+    Attributes:
+        body_pointers: (pointer, decoded segments) for each body pointer.
+        aliases: (alias, pointer) for nested pointers whose last segment is
+                 unambiguous, e.g. ("userId", "data/user/userId").
+        headers: (lowercase header name, "header/{name}" key, and
+                 (index, "header/{name}/{index}" key) pairs) for each header.
+    """
+
+    body_pointers: tuple[tuple[str, tuple[str, ...]], ...]
+    aliases: tuple[tuple[str, str], ...]
+    headers: tuple[tuple[str, str, tuple[tuple[int, str], ...]], ...]
+
+    @classmethod
+    def from_link_fields(cls, link_fields: LinkFields) -> _ExtractionPlan:
+        body_pointers = tuple(
+            (pointer, split_jsonpointer(pointer)) for pointer in link_fields.body_pointers
+        )
+
+        # Shortcut aliases: "userId" -> "data/user/userId". Only when
+        # unambiguous (single pointer with that last segment).
+        last_segments: dict[str, list[str]] = {}
+        for pointer in link_fields.body_pointers:
+            last_segment = pointer.split("/")[-1]
+            if last_segment != pointer:  # Only for nested paths
+                last_segments.setdefault(last_segment, []).append(pointer)
+        aliases = tuple(
+            (last_segment, pointers[0])
+            for last_segment, pointers in last_segments.items()
+            if len(pointers) == 1
+        )
+
+        indexed_headers: dict[str, set[int]] = {}
+        for header_ref in link_fields.headers:
+            indices = indexed_headers.setdefault(header_ref.name, set())
+            if header_ref.index is not None:
+                indices.add(header_ref.index)
+        headers = tuple(
+            (
+                name,
+                f"header/{name}",
+                tuple((index, f"header/{name}/{index}") for index in sorted(indices)),
+            )
+            for name, indices in indexed_headers.items()
+        )
+
+        return cls(body_pointers=body_pointers, aliases=aliases, headers=headers)
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class _BaseExecutor:
+    """Request building, chain bookkeeping, and response conversion.
+
+    Everything here is independent of how bytes go over the wire, so the
+    sync Executor and the AsyncExecutor share it and produce identical
+    RequestCase/ResponseCase data for the same inputs.
     """
 
     def __init__(
@@ -118,8 +578,10 @@ class Executor:
         operation_timeouts: dict[str, float] | None = None,
         link_fields: LinkFields | None = None,
         requests_per_second: float | None = None,
+        parallel_targets: bool = False,
+        max_body_size: int | None = None,
     ) -> None:
-        """Initialize the executor.
+        """Initialize shared executor state.
 
         Args:
             target_a: Configuration for target A.
@@ -130,12 +592,34 @@ class Executor:
                          for variable extraction during chain execution.
             requests_per_second: Maximum requests per second (rate limit).
                                  If None, no rate limiting is applied.
+            parallel_targets: Send each request to both targets at the same
+                              time instead of A then B.
+            max_body_size: Stream response bodies and keep at most this many
+                           bytes in memory; larger bodies are spilled to a
+                           temp file and captured as length + SHA-256 only.
+                           If None, bodies are read whole (no digests).
+
+        Raises:
+            ValueError: If max_body_size is less than 1.
         """
+        if max_body_size is not None and max_body_size < 1:
+            raise ValueError(f"max_body_size must be at least 1, got {max_body_size}")
+
         self._target_a = target_a
         self._target_b = target_b
         self._default_timeout = default_timeout
         self._operation_timeouts = operation_timeouts or {}
         self._link_fields = link_fields or LinkFields()
+        self._extraction_plan = _ExtractionPlan.from_link_fields(self._link_fields)
+        self._parallel_targets = parallel_targets
+
+        # Streaming capture. Spill files live in a private directory that is
+        # removed on close(); run_ordered() also deletes each result's files
+        # once on_result has had the chance to copy them into a bundle.
+        self._max_body_size = max_body_size
+        self._spill_dir: str | None = None
+        if max_body_size is not None:
+            self._spill_dir = tempfile.mkdtemp(prefix="api-parity-bodies-")
 
         # Rate limiting state
         self._requests_per_second = requests_per_second
@@ -143,36 +627,60 @@ class Executor:
         self._last_request_time: float = 0.0
         self._rate_limit_lock = Lock()
 
-        # Create HTTP clients for each target. If second client creation fails,
-        # ensure first client is closed to prevent connection leak.
-        self._client_a = httpx.Client(**self._build_client_kwargs(target_a, default_timeout))
-        try:
-            self._client_b = httpx.Client(**self._build_client_kwargs(target_b, default_timeout))
-        except Exception:
-            self._client_a.close()
-            raise
+        # Per-target token buckets (TargetConfig.rate_limit), keyed by the
+        # target label passed to _send_single. Each target spends its own
+        # budget; the global limit above still caps both targets combined.
+        self._target_rate_limiters: dict[str, TargetRateLimiter] = {
+            target_name: TargetRateLimiter(target.rate_limit)
+            for target_name, target in (("Target A", target_a), ("Target B", target_b))
+            if target.rate_limit is not None
+        }
 
-    def __enter__(self) -> "Executor":
-        return self
+    def _new_body_capture(self) -> _BodyCapture | None:
+        """Start a streaming capture, or None when bodies are read whole."""
+        if self._max_body_size is None or self._spill_dir is None:
+            return None
+        return _BodyCapture(self._max_body_size, self._spill_dir)
 
-    def __exit__(
-        self,
-        exc_type: type[BaseException] | None,
-        exc_val: BaseException | None,
-        exc_tb: Any,
-    ) -> None:
-        self.close()
+    def _release_spilled_bodies(self, result: Any) -> None:
+        """Delete spill files referenced by a run_ordered() result.
 
-    def close(self) -> None:
-        """Close HTTP clients.
+        Called after on_result, which is where bundles copy spilled bodies.
+        Without this, every oversized response of a run would stay on disk
+        until close().
+        """
+        if self._spill_dir is None or not isinstance(result, tuple):
+            return
+        for execution in result:
+            if isinstance(execution, ResponseCase):
+                responses = [execution]
+            elif isinstance(execution, ChainExecution):
+                responses = [step.response for step in execution.steps]
+            else:
+                continue
+            for response in responses:
+                if response.body_file is not None:
+                    _remove_file(response.body_file)
+                    response.body_file = None
 
-        Uses try/finally to ensure both clients are closed even if the first
-        close() raises an exception. This prevents HTTP connection leaks.
+    def _remove_spill_dir(self) -> None:
+        """Delete the spill directory and anything left in it."""
+        if self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
+
+    def adaptive_rates(self) -> dict[str, float]:
+        """Current target-wide rate for each target under adaptive control.
+
+        Returns:
+            Mapping of "Target A"/"Target B" to requests per second. Empty
+            when no target has rate_limit.adaptive configured.
         """
-        try:
-            self._client_a.close()
-        finally:
-            self._client_b.close()
+        return {
+            target_name: limiter.rate
+            for target_name, limiter in self._target_rate_limiters.items()
+            if limiter.adaptive
+        }
 
     def _build_client_kwargs(self, target: TargetConfig, timeout: float) -> dict[str, Any]:
         """Build kwargs for httpx.Client including TLS configuration.
@@ -183,13 +691,33 @@ class Executor:
 
         Returns:
             Dictionary of kwargs for httpx.Client constructor.
+
+        Raises:
+            ExecutorError: If the cipher string is invalid or HTTP/2 is
+                           requested without the h2 package.
         """
         kwargs: dict[str, Any] = {
             "base_url": target.base_url,
             "headers": target.headers,
             "timeout": timeout,
+            "limits": httpx.Limits(
+                max_connections=target.max_connections,
+                max_keepalive_connections=target.max_keepalive_connections,
+                keepalive_expiry=target.keepalive_expiry,
+            ),
         }
 
+        # httpx only checks for h2 when the client is built, with an
+        # ImportError that does not name the target. Fail with a config-level
+        # message instead.
+        if target.http2:
+            if importlib.util.find_spec("h2") is None:
+                raise ExecutorError(
+                    f"Target {target.base_url} sets http2: true but the 'h2' package "
+                    f"is not installed (pip install 'api-parity[http2]')"
+                )
+            kwargs["http2"] = True
+
         # Handle client certificate (mTLS)
         if target.cert and target.key:
             if target.key_password:
@@ -223,150 +751,9 @@ class Executor:
 
         return kwargs
 
-    def execute(
-        self,
-        request: RequestCase,
-    ) -> tuple[ResponseCase, ResponseCase]:
-        """Execute a request against both targets (serially, A then B).
-
-        Serial execution simplifies debugging (timing differences don't mask issues)
-        and keeps rate limiting predictable.
-
-        Args:
-            request: The request to execute.
-
-        Returns:
-            Tuple of (response_a, response_b).
-
-        Raises:
-            RequestError: If a request fails due to connection/timeout.
-        """
-        timeout = self._get_timeout(request.operation_id)
-
-        # Execute against Target A
-        response_a = self._execute_single(
-            self._client_a, request, timeout, "Target A"
-        )
-
-        # Execute against Target B
-        response_b = self._execute_single(
-            self._client_b, request, timeout, "Target B"
-        )
-
-        return response_a, response_b
-
-    def execute_chain(
-        self,
-        chain: ChainCase,
-        on_step: Callable[[ResponseCase, ResponseCase], bool] | None = None,
-    ) -> tuple[ChainExecution, ChainExecution]:
-        """Execute a chain against both targets.
-
-        Each step is executed against both targets before proceeding to the next.
-        Each target uses its own extracted response data for subsequent steps
-        (per DESIGN.md "Live Chain Generation").
-
-        Args:
-            chain: The chain to execute.
-            on_step: Optional callback called after each step with (response_a, response_b).
-                     Return False to stop execution (per DESIGN.md "Chain Stops at First Mismatch").
-                     Return True to continue.
-
-        Returns:
-            Tuple of (execution_a, execution_b) containing step-by-step traces.
-            If stopped early via on_step, contains only executed steps.
-
-        Raises:
-            RequestError: If a request fails due to connection/timeout.
-        """
-        steps_a: list[ChainStepExecution] = []
-        steps_b: list[ChainStepExecution] = []
-        extracted_vars_a: dict[str, Any] = {}
-        extracted_vars_b: dict[str, Any] = {}
-        # Per-target request history for $request.path/header resolution
-        prev_request_a: RequestCase | None = None
-        prev_request_b: RequestCase | None = None
-
-        for step in chain.steps:
-            # Resolve OpenAPI link expressions if this step has link_source.
-            # This maps parameter names to actual values from prior responses
-            # (e.g., widget_id → the real ID from a POST response body).
-            template_a = step.request_template
-            template_b = step.request_template
-
-            if step.link_source is not None and step.link_source.get("parameters"):
-                overrides_a = self._resolve_link_overrides(
-                    step.link_source, extracted_vars_a, prev_request_a
-                )
-                overrides_b = self._resolve_link_overrides(
-                    step.link_source, extracted_vars_b, prev_request_b
-                )
-
-                # If resolution failed for BOTH targets, the source step
-                # returned errors and no variables were extracted. Continuing
-                # would send garbage fuzz values to both targets, producing
-                # spurious mismatches from different error responses.
-                if not overrides_a and not overrides_b:
-                    break
-
-                template_a = self._apply_link_overrides(template_a, overrides_a)
-                template_b = self._apply_link_overrides(template_b, overrides_b)
-
-            # Each target gets request populated with its own extracted variables
-            request_a = self._apply_variables(template_a, extracted_vars_a)
-            request_b = self._apply_variables(template_b, extracted_vars_b)
-
-            timeout = self._get_timeout(request_a.operation_id)
-
-            # Execute against both targets
-            response_a = self._execute_single(
-                self._client_a, request_a, timeout, "Target A"
-            )
-            response_b = self._execute_single(
-                self._client_b, request_b, timeout, "Target B"
-            )
-
-            # Extract variables from each target's own response
-            extracted_a = self._extract_variables(response_a)
-            extracted_b = self._extract_variables(response_b)
-            extracted_vars_a.update(extracted_a)
-            extracted_vars_b.update(extracted_b)
-
-            # Record step executions
-            steps_a.append(ChainStepExecution(
-                step_index=step.step_index,
-                request=request_a,
-                response=response_a,
-                extracted=extracted_a,
-            ))
-            steps_b.append(ChainStepExecution(
-                step_index=step.step_index,
-                request=request_b,
-                response=response_b,
-                extracted=extracted_b,
-            ))
-
-            # Track requests for $request.path/header resolution in future steps
-            prev_request_a = request_a
-            prev_request_b = request_b
-
-            # Check if caller wants to stop (mismatch detected)
-            if on_step is not None and not on_step(response_a, response_b):
-                break
-
-        return (
-            ChainExecution(steps=steps_a),
-            ChainExecution(steps=steps_b),
-        )
-
-    def _variable_to_string(self, var_value: Any) -> str:
-        """Convert a variable value to string for path/body substitution.
-
-        Lists (e.g., header values) use first element to avoid "['value']" in URLs.
-        """
-        if isinstance(var_value, list):
-            return str(var_value[0]) if var_value else ""
-        return str(var_value)
+    def _get_timeout(self, operation_id: str) -> float:
+        """Get timeout for an operation."""
+        return self._operation_timeouts.get(operation_id, self._default_timeout)
 
     def _apply_variables(
         self,
@@ -383,103 +770,9 @@ class Executor:
             variables: Extracted variables from previous steps.
 
         Returns:
-            New RequestCase with variables substituted.
-        """
-        # Deep copy the template to avoid mutation
-        request_dict = template.model_dump()
-
-        # Apply variables to path parameters
-        for key, value in list(request_dict.get("path_parameters", {}).items()):
-            if isinstance(value, str):
-                for var_name, var_value in variables.items():
-                    if f"{{{var_name}}}" in value:
-                        value = value.replace(f"{{{var_name}}}", self._variable_to_string(var_value))
-                    # Also check for direct match (Schemathesis may have already resolved)
-                    if value == var_name:
-                        value = self._variable_to_string(var_value)
-                request_dict["path_parameters"][key] = value
-
-        # Re-render the path with updated parameters
-        rendered_path = request_dict["path_template"]
-        for key, value in request_dict.get("path_parameters", {}).items():
-            rendered_path = rendered_path.replace(f"{{{key}}}", str(value))
-        request_dict["rendered_path"] = rendered_path
-
-        # Apply variables to query parameters (dict[str, list[str]])
-        for key, values in list(request_dict.get("query", {}).items()):
-            new_values = []
-            for value in values:
-                for var_name, var_value in variables.items():
-                    if f"{{{var_name}}}" in value:
-                        value = value.replace(f"{{{var_name}}}", self._variable_to_string(var_value))
-                new_values.append(value)
-            request_dict["query"][key] = new_values
-
-        # Apply variables to body if it's a dict
-        if isinstance(request_dict.get("body"), dict):
-            request_dict["body"] = self._substitute_in_dict(
-                request_dict["body"], variables
-            )
-
-        return RequestCase.model_validate(request_dict)
-
-    def _substitute_in_dict(
-        self,
-        data: dict[str, Any],
-        variables: dict[str, Any],
-    ) -> dict[str, Any]:
-        """Recursively substitute variables in a dictionary.
-
-        Args:
-            data: Dictionary to process.
-            variables: Variables to substitute.
-
-        Returns:
-            New dictionary with substitutions applied.
+            RequestCase with variables substituted (see _RequestTemplate.build).
         """
-        result = {}
-        for key, value in data.items():
-            if isinstance(value, str):
-                for var_name, var_value in variables.items():
-                    if f"{{{var_name}}}" in value:
-                        value = value.replace(f"{{{var_name}}}", self._variable_to_string(var_value))
-                result[key] = value
-            elif isinstance(value, dict):
-                result[key] = self._substitute_in_dict(value, variables)
-            elif isinstance(value, list):
-                result[key] = self._substitute_in_list(value, variables)
-            else:
-                result[key] = value
-        return result
-
-    def _substitute_in_list(
-        self,
-        data: list[Any],
-        variables: dict[str, Any],
-    ) -> list[Any]:
-        """Recursively substitute variables in a list.
-
-        Args:
-            data: List to process.
-            variables: Variables to substitute.
-
-        Returns:
-            New list with substitutions applied.
-        """
-        result = []
-        for item in data:
-            if isinstance(item, str):
-                for var_name, var_value in variables.items():
-                    if f"{{{var_name}}}" in item:
-                        item = item.replace(f"{{{var_name}}}", self._variable_to_string(var_value))
-                result.append(item)
-            elif isinstance(item, dict):
-                result.append(self._substitute_in_dict(item, variables))
-            elif isinstance(item, list):
-                result.append(self._substitute_in_list(item, variables))
-            else:
-                result.append(item)
-        return result
+        return _RequestTemplate(template).build({}, variables)
 
     def _extract_variables(self, response: ResponseCase) -> dict[str, Any]:
         """Extract variables from a response for chain substitution.
@@ -488,50 +781,33 @@ class Executor:
         or "header/{name}/{index}" (single value).
         """
         extracted: dict[str, Any] = {}
-
-        # Extract body fields (if response has a dict body)
-        if isinstance(response.body, dict):
-            # First pass: extract all values under full pointer paths
-            for field_pointer in self._link_fields.body_pointers:
-                value = extract_by_jsonpointer(response.body, field_pointer)
+        plan = self._extraction_plan
+
+        # Extract body fields (if response has a dict body). Checking for
+        # pointers first keeps chains without body links from parsing bodies.
+        if plan.body_pointers and isinstance(response.body, dict):
+            body = response.body
+            for pointer, segments in plan.body_pointers:
+                value = extract_by_segments(body, segments)
                 if value is not _MISSING:
-                    extracted[field_pointer] = value
-
-            # Add shortcut aliases: "userId" -> value (from "data/user/userId")
-            # Only when unambiguous (single pointer with that last segment)
-            last_segments: dict[str, list[str]] = {}
-            for field_pointer in self._link_fields.body_pointers:
-                last_segment = field_pointer.split("/")[-1]
-                if last_segment != field_pointer:  # Only for nested paths
-                    last_segments.setdefault(last_segment, []).append(field_pointer)
-
-            for last_segment, pointers in last_segments.items():
-                if len(pointers) == 1:
-                    pointer = pointers[0]
-                    if pointer in extracted:
-                        extracted[last_segment] = extracted[pointer]
+                    extracted[pointer] = value
 
-        # Extract header values: "header/{name}" (list) and "header/{name}/{index}" (single)
-        headers_to_extract: set[str] = set()
-        indexed_headers: dict[str, set[int]] = {}
-
-        for header_ref in self._link_fields.headers:
-            headers_to_extract.add(header_ref.name)
-            if header_ref.index is not None:
-                indexed_headers.setdefault(header_ref.name, set()).add(header_ref.index)
+            for alias, pointer in plan.aliases:
+                if pointer in extracted:
+                    extracted[alias] = extracted[pointer]
 
-        for header_name in headers_to_extract:
+        # Extract header values: "header/{name}" (list) and "header/{name}/{index}" (single)
+        for header_name, list_key, indexed_keys in plan.headers:
             # ResponseCase headers are already lowercase keys with list values
-            header_values = response.headers.get(header_name, [])
+            header_values = response.headers.get(header_name)
             if header_values:
                 # Store all values as list at header/{name}
-                extracted[f"header/{header_name}"] = header_values
+                extracted[list_key] = header_values
 
                 # Store specific indexed values at header/{name}/{index}
-                if header_name in indexed_headers:
-                    for index in indexed_headers[header_name]:
-                        if index < len(header_values):
-                            extracted[f"header/{header_name}/{index}"] = header_values[index]
+                for index, key in indexed_keys:
+                    if index < len(header_values):
+                        extracted[key] = header_values[index]
 
         return extracted
 
@@ -686,70 +962,98 @@ class Executor:
         """
         if not overrides:
             return template
+        return _RequestTemplate(template).build(overrides, {})
 
-        request_dict = template.model_dump()
-
-        for param_name, value in overrides.items():
-            str_value = self._variable_to_string(value)
+    def _prepare_chain_step(
+        self,
+        step: ChainStep,
+        state_a: _ChainTargetState,
+        state_b: _ChainTargetState,
+    ) -> tuple[RequestCase, RequestCase] | None:
+        """Build the concrete requests for one chain step, one per target.
 
-            if param_name in request_dict.get("path_parameters", {}):
-                # Strip leading slashes from path parameter values.
-                request_dict["path_parameters"][param_name] = str_value.lstrip("/")
-            elif param_name in request_dict.get("query", {}):
-                request_dict["query"][param_name] = [str_value]
-            else:
-                # Check headers (case-insensitive)
-                lower_param = param_name.lower()
-                for hdr_key in list(request_dict.get("headers", {})):
-                    if hdr_key.lower() == lower_param:
-                        request_dict["headers"][hdr_key] = [str_value]
-                        break
+        Args:
+            step: The chain step whose request_template is populated.
+            state_a: Target A's chain state (extracted vars, prior request).
+            state_b: Target B's chain state.
 
-        # Re-render path with updated parameters
-        rendered_path = request_dict["path_template"]
-        for key, param_value in request_dict.get("path_parameters", {}).items():
-            rendered_path = rendered_path.replace(f"{{{key}}}", str(param_value))
-        request_dict["rendered_path"] = rendered_path
+        Returns:
+            Tuple of (request_a, request_b), or None if the step's link
+            parameters could not be resolved for either target and the
+            chain should stop.
+        """
+        # Analyse the template once; both targets fill the same slots.
+        template = _RequestTemplate(step.request_template)
+        overrides_a: dict[str, Any] = {}
+        overrides_b: dict[str, Any] = {}
+
+        # Resolve OpenAPI link expressions if this step has link_source.
+        # This maps parameter names to actual values from prior responses
+        # (e.g., widget_id → the real ID from a POST response body).
+        if step.link_source is not None and step.link_source.get("parameters"):
+            overrides_a = self._resolve_link_overrides(
+                step.link_source, state_a.extracted_vars, state_a.prev_request
+            )
+            overrides_b = self._resolve_link_overrides(
+                step.link_source, state_b.extracted_vars, state_b.prev_request
+            )
 
-        return RequestCase.model_validate(request_dict)
+            # If resolution failed for BOTH targets, the source step
+            # returned errors and no variables were extracted. Continuing
+            # would send garbage fuzz values to both targets, producing
+            # spurious mismatches from different error responses.
+            if not overrides_a and not overrides_b:
+                return None
 
-    def _get_timeout(self, operation_id: str) -> float:
-        """Get timeout for an operation."""
-        return self._operation_timeouts.get(operation_id, self._default_timeout)
+        # Each target gets request populated with its own overrides and
+        # extracted variables
+        request_a = template.build(overrides_a, state_a.extracted_vars)
+        request_b = template.build(overrides_b, state_b.extracted_vars)
+        return request_a, request_b
 
-    def _wait_for_rate_limit(self) -> None:
-        """Wait if necessary to respect rate limit."""
-        if self._min_interval <= 0:
-            return
+    def _record_chain_step(
+        self,
+        step: ChainStep,
+        state: _ChainTargetState,
+        request: RequestCase,
+        response: ResponseCase,
+    ) -> None:
+        """Extract variables from a step response and append its execution.
 
-        with self._rate_limit_lock:
-            now = time.monotonic()
-            elapsed = now - self._last_request_time
-            if elapsed < self._min_interval:
-                sleep_time = self._min_interval - elapsed
-                time.sleep(sleep_time)
-            self._last_request_time = time.monotonic()
+        Args:
+            step: The chain step that was executed.
+            state: The chain state of the target that produced the response.
+            request: The concrete request sent to that target.
+            response: The response received from that target.
+        """
+        # Extract variables from the target's own response
+        extracted = self._extract_variables(response)
+        state.extracted_vars.update(extracted)
 
-    def _execute_single(
+        state.steps.append(ChainStepExecution(
+            step_index=step.step_index,
+            request=request,
+            response=response,
+            extracted=extracted,
+        ))
+
+        # Track requests for $request.path/header resolution in future steps
+        state.prev_request = request
+
+    def _build_request_kwargs(
         self,
-        client: httpx.Client,
         request: RequestCase,
         timeout: float,
-        target_name: str,
-    ) -> ResponseCase:
-        """Execute a request against a single target.
+    ) -> dict[str, Any]:
+        """Build kwargs for client.request() from a RequestCase.
 
         Args:
-            client: HTTP client for the target.
-            request: The request to execute.
+            request: The request to send.
             timeout: Request timeout in seconds.
-            target_name: Name for error messages.
 
         Returns:
-            ResponseCase with the response.
-
-        Raises:
-            RequestError: If request fails.
+            Dictionary of kwargs accepted by httpx.Client.request and
+            httpx.AsyncClient.request.
         """
         # Build the URL — percent-encode control characters that httpx rejects.
         # Fuzz-generated path parameter values may contain arbitrary bytes.
@@ -824,53 +1128,55 @@ class Executor:
         # Add cookies
         cookies: dict[str, str] = request.cookies
 
-        # Enforce rate limit before making request
-        self._wait_for_rate_limit()
-
-        try:
-            start_time = time.perf_counter()
+        return {
+            "method": request.method,
+            "url": url,
+            "params": params if params else None,
+            "headers": headers if headers else None,
+            "content": content,
+            "json": json_body,
+            "cookies": cookies if cookies else None,
+            "timeout": timeout,
+        }
 
-            http_response = client.request(
-                method=request.method,
-                url=url,
-                params=params if params else None,
-                headers=headers if headers else None,
-                content=content,
-                json=json_body,
-                cookies=cookies if cookies else None,
-                timeout=timeout,
-            )
+    @staticmethod
+    def _set_send_skew(
+        response_a: ResponseCase,
+        response_b: ResponseCase,
+        sent_a: float,
+        sent_b: float,
+    ) -> None:
+        """Record how far apart two parallel sends actually left.
 
-            elapsed_ms = (time.perf_counter() - start_time) * 1000
+        "Simultaneous" sends can still be milliseconds apart (thread start-up,
+        rate limiting, connection setup). Each response gets its own send time
+        minus the other's, so a time-sensitive mismatch (e.g., a timestamp or
+        a TTL) can be triaged from either side of the bundle.
 
-        except httpx.TimeoutException as e:
-            raise RequestError(f"{target_name} request timeout: {e}") from e
-        except httpx.ConnectError as e:
-            raise RequestError(f"{target_name} connection error: {e}") from e
-        except httpx.RequestError as e:
-            raise RequestError(f"{target_name} request error: {e}") from e
-        except UnicodeEncodeError as e:
-            # Fallback for non-ASCII in places we don't sanitize: header keys, query
-            # params, paths. These are protocol violations that should fail loudly
-            # rather than silently corrupt data.
-            raise RequestError(
-                f"{target_name} encoding error: non-ASCII characters in request "
-                f"(header key, query param, or path). Character: {e.object[e.start:e.end]!r} "
-                f"at position {e.start}. HTTP requires ASCII for these fields."
-            ) from e
-
-        return self._convert_response(http_response, elapsed_ms)
+        Args:
+            response_a: Response from Target A (updated in place).
+            response_b: Response from Target B (updated in place).
+            sent_a: time.perf_counter() when A's request was sent.
+            sent_b: time.perf_counter() when B's request was sent.
+        """
+        skew_ms = (sent_b - sent_a) * 1000
+        response_a.send_skew_ms = -skew_ms
+        response_b.send_skew_ms = skew_ms
 
     def _convert_response(
         self,
         response: httpx.Response,
         elapsed_ms: float,
+        capture: _BodyCapture | None = None,
     ) -> ResponseCase:
         """Convert httpx Response to ResponseCase.
 
         Args:
             response: httpx Response object.
             elapsed_ms: Elapsed time in milliseconds.
+            capture: Streaming capture of the body, if it was streamed. A
+                     truncated capture yields no body at all, only its
+                     length, digest, and spill file.
 
         Returns:
             ResponseCase model instance.
@@ -883,49 +1189,773 @@ class Executor:
                 headers[key_lower] = []
             headers[key_lower].append(value)
 
-        # Parse body based on content-type:
-        #   JSON         -> parsed dict/list/scalar
-        #   XML          -> parsed dict via xml_to_dict (see DESIGN.md "XML Body Conversion")
-        #   text/*       -> str
-        #   everything else -> base64
-        # XML branch MUST come before text/* because text/xml is a valid content-type.
-        body: Any = None
-        body_base64: str | None = None
-
         content_type = response.headers.get("content-type", "")
 
-        if response.content:
-            if "json" in content_type.lower():
-                try:
-                    body = response.json()
-                except Exception:
-                    # Not valid JSON despite content-type
-                    body_base64 = base64.b64encode(response.content).decode("ascii")
-            elif "xml" in content_type.lower():
-                try:
-                    body = xml_to_dict(response.content)
-                except Exception:
-                    # Not valid XML despite content-type — fall back to base64
-                    body_base64 = base64.b64encode(response.content).decode("ascii")
-            elif content_type.startswith("text/"):
-                try:
-                    body = response.text
-                except Exception:
-                    body_base64 = base64.b64encode(response.content).decode("ascii")
-            else:
-                # Binary content
-                body_base64 = base64.b64encode(response.content).decode("ascii")
+        # A streamed response has no .content; its bytes are in the capture.
+        if capture is None:
+            content = response.content
+        elif capture.truncated:
+            content = b""
+        else:
+            content = capture.content
 
         # Get HTTP version
         http_version = "1.1"
         if hasattr(response, "http_version"):
             http_version = response.http_version
 
-        return ResponseCase(
-            status_code=response.status_code,
-            headers=headers,
-            body=body,
-            body_base64=body_base64,
-            elapsed_ms=elapsed_ms,
-            http_version=http_version,
+        fields: dict[str, Any] = {
+            "status_code": response.status_code,
+            "headers": headers,
+            "elapsed_ms": elapsed_ms,
+            "http_version": http_version,
+        }
+        if capture is not None:
+            fields["body_size"] = capture.size
+            fields["body_sha256"] = capture.sha256
+            fields["body_truncated"] = capture.truncated
+            fields["body_file"] = capture.spill_path
+
+        if not content:
+            return ResponseCase(**fields)
+        # Parsing waits until something reads the body (see ResponseCase).
+        return ResponseCase.with_lazy_body(
+            _ResponseBody(content, content_type, response.encoding or "utf-8"), **fields
+        )
+
+
+class Executor(_BaseExecutor):
+    """Executes requests against two targets and captures responses.
+
+    Usage:
+        executor = Executor(target_a_config, target_b_config)
+        try:
+            resp_a, resp_b = executor.execute(request_case)
+        finally:
+            executor.close()
+
+    Or with context manager:
+        with Executor(target_a_config, target_b_config) as executor:
+            resp_a, resp_b = executor.execute(request_case)
+    """
+
+    def __init__(
+        self,
+        target_a: TargetConfig,
+        target_b: TargetConfig,
+        default_timeout: float = 30.0,
+        operation_timeouts: dict[str, float] | None = None,
+        link_fields: LinkFields | None = None,
+        requests_per_second: float | None = None,
+        parallel_targets: bool = False,
+        max_body_size: int | None = None,
+    ) -> None:
+        """Initialize the executor.
+
+        Args:
+            target_a: Configuration for target A.
+            target_b: Configuration for target B.
+            default_timeout: Default timeout in seconds for requests.
+            operation_timeouts: Per-operation timeout overrides.
+            link_fields: LinkFields object containing body_pointers and headers
+                         for variable extraction during chain execution.
+            requests_per_second: Maximum requests per second (rate limit).
+                                 If None, no rate limiting is applied.
+            parallel_targets: Send each request to both targets at the same
+                              time instead of A then B.
+            max_body_size: Stream bodies, keeping at most this many bytes
+                           in memory (see _BaseExecutor).
+        """
+        super().__init__(
+            target_a,
+            target_b,
+            default_timeout=default_timeout,
+            operation_timeouts=operation_timeouts,
+            link_fields=link_fields,
+            requests_per_second=requests_per_second,
+            parallel_targets=parallel_targets,
+            max_body_size=max_body_size,
+        )
+
+        # Create HTTP clients for each target. If second client creation fails,
+        # ensure first client is closed to prevent connection leak.
+        try:
+            self._client_a = httpx.Client(**self._build_client_kwargs(target_a, default_timeout))
+            try:
+                self._client_b = httpx.Client(**self._build_client_kwargs(target_b, default_timeout))
+            except Exception:
+                self._client_a.close()
+                raise
+        except Exception:
+            self._remove_spill_dir()
+            raise
+
+        # One worker is enough: Target A is sent from the calling thread while
+        # the worker sends Target B. Only B ever touches _client_b off-thread.
+        self._target_b_pool: ThreadPoolExecutor | None = None
+        if parallel_targets:
+            self._target_b_pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="api-parity-target-b"
+            )
+
+    def __enter__(self) -> "Executor":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: Any,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close HTTP clients.
+
+        Uses try/finally to ensure both clients are closed even if the first
+        close() raises an exception. This prevents HTTP connection leaks.
+        """
+        try:
+            self._client_a.close()
+        finally:
+            try:
+                self._client_b.close()
+            finally:
+                if self._target_b_pool is not None:
+                    self._target_b_pool.shutdown(wait=True)
+                self._remove_spill_dir()
+
+    def execute(
+        self,
+        request: RequestCase,
+    ) -> tuple[ResponseCase, ResponseCase]:
+        """Execute a request against both targets (A then B, or both at once).
+
+        Serial execution is the default: it simplifies debugging (timing
+        differences don't mask issues) and keeps rate limiting predictable.
+        With parallel_targets, both are sent together (see _execute_pair).
+
+        Args:
+            request: The request to execute.
+
+        Returns:
+            Tuple of (response_a, response_b).
+
+        Raises:
+            RequestError: If a request fails due to connection/timeout.
+        """
+        timeout = self._get_timeout(request.operation_id)
+        return self._execute_pair(request, request, timeout)
+
+    def execute_chain(
+        self,
+        chain: ChainCase,
+        on_step: Callable[[ResponseCase, ResponseCase], bool] | None = None,
+    ) -> tuple[ChainExecution, ChainExecution]:
+        """Execute a chain against both targets.
+
+        Each step is executed against both targets before proceeding to the next.
+        Each target uses its own extracted response data for subsequent steps
+        (per DESIGN.md "Live Chain Generation").
+
+        Args:
+            chain: The chain to execute.
+            on_step: Optional callback called after each step with (response_a, response_b).
+                     Return False to stop execution (per DESIGN.md "Chain Stops at First Mismatch").
+                     Return True to continue.
+
+        Returns:
+            Tuple of (execution_a, execution_b) containing step-by-step traces.
+            If stopped early via on_step, contains only executed steps.
+
+        Raises:
+            RequestError: If a request fails due to connection/timeout.
+        """
+        state_a = _ChainTargetState()
+        state_b = _ChainTargetState()
+
+        for step in chain.steps:
+            requests = self._prepare_chain_step(step, state_a, state_b)
+            if requests is None:
+                break
+            request_a, request_b = requests
+
+            timeout = self._get_timeout(request_a.operation_id)
+
+            # Execute against both targets
+            response_a, response_b = self._execute_pair(request_a, request_b, timeout)
+
+            self._record_chain_step(step, state_a, request_a, response_a)
+            self._record_chain_step(step, state_b, request_b, response_b)
+
+            # Check if caller wants to stop (mismatch detected)
+            if on_step is not None and not on_step(response_a, response_b):
+                break
+
+        return (
+            ChainExecution(steps=state_a.steps),
+            ChainExecution(steps=state_b.steps),
+        )
+
+    def run_ordered(
+        self,
+        items: Iterable[T],
+        work: Callable[[T], R],
+        on_result: Callable[[T, R | RequestError], None],
+    ) -> None:
+        """Run work(item) for each item and report results in input order.
+
+        The serial counterpart of AsyncExecutor.run_ordered, so explore and
+        replay loops are written once and work with either executor.
+
+        Args:
+            items: Units of work (cases, chains, bundles).
+            work: Callable that executes one item, typically wrapping
+                  execute() or execute_chain().
+            on_result: Called with (item, result) after each item. A
+                       RequestError raised by work is passed as the result.
+        """
+        for item in items:
+            try:
+                result: R | RequestError = work(item)
+            except RequestError as e:
+                result = e
+            try:
+                on_result(item, result)
+            finally:
+                self._release_spilled_bodies(result)
+
+    def _wait_for_rate_limit(self) -> None:
+        """Wait if necessary to respect rate limit."""
+        if self._min_interval <= 0:
+            return
+
+        with self._rate_limit_lock:
+            now = time.monotonic()
+            elapsed = now - self._last_request_time
+            if elapsed < self._min_interval:
+                sleep_time = self._min_interval - elapsed
+                time.sleep(sleep_time)
+            self._last_request_time = time.monotonic()
+
+    def _execute_pair(
+        self,
+        request_a: RequestCase,
+        request_b: RequestCase,
+        timeout: float,
+    ) -> tuple[ResponseCase, ResponseCase]:
+        """Execute one request per target, serially or in parallel.
+
+        In parallel mode, B is sent from the worker thread while A is sent from
+        the calling thread, so the pair costs max(latency_A, latency_B) instead
+        of the sum. If A fails, B is still awaited before A's error is raised,
+        so no request outlives the case. A's error wins when both fail, which
+        matches the serial error message.
+
+        Args:
+            request_a: Request for Target A.
+            request_b: Request for Target B (differs from A only in chains).
+            timeout: Request timeout in seconds.
+
+        Returns:
+            Tuple of (response_a, response_b).
+
+        Raises:
+            RequestError: If either request fails.
+        """
+        if self._target_b_pool is None:
+            response_a = self._execute_single(self._client_a, request_a, timeout, "Target A")
+            response_b = self._execute_single(self._client_b, request_b, timeout, "Target B")
+            return response_a, response_b
+
+        future_b = self._target_b_pool.submit(
+            self._send_single, self._client_b, request_b, timeout, "Target B"
+        )
+        try:
+            response_a, sent_a = self._send_single(
+                self._client_a, request_a, timeout, "Target A"
+            )
+        except RequestError:
+            future_b.exception()  # Wait for B; its outcome is superseded by A's error
+            raise
+        response_b, sent_b = future_b.result()
+
+        self._set_send_skew(response_a, response_b, sent_a, sent_b)
+        return response_a, response_b
+
+    def _execute_single(
+        self,
+        client: httpx.Client,
+        request: RequestCase,
+        timeout: float,
+        target_name: str,
+    ) -> ResponseCase:
+        """Execute a request against a single target.
+
+        Args:
+            client: HTTP client for the target.
+            request: The request to execute.
+            timeout: Request timeout in seconds.
+            target_name: Name for error messages.
+
+        Returns:
+            ResponseCase with the response.
+
+        Raises:
+            RequestError: If request fails.
+        """
+        response, _ = self._send_single(client, request, timeout, target_name)
+        return response
+
+    def _send_single(
+        self,
+        client: httpx.Client,
+        request: RequestCase,
+        timeout: float,
+        target_name: str,
+    ) -> tuple[ResponseCase, float]:
+        """Send a request to a single target and note when it left.
+
+        Returns:
+            Tuple of (response, send time from time.perf_counter()). The send
+            time is taken after rate limiting, right before the request.
+
+        Raises:
+            RequestError: If request fails.
+        """
+        request_kwargs = self._build_request_kwargs(request, timeout)
+
+        # Enforce rate limits before making request
+        self._wait_for_rate_limit()
+        target_limiter = self._target_rate_limiters.get(target_name)
+        if target_limiter is not None:
+            target_limiter.bucket_for(request.operation_id).acquire()
+
+        capture = self._new_body_capture()
+        try:
+            start_time = time.perf_counter()
+            if capture is None:
+                http_response = client.request(**request_kwargs)
+            else:
+                with client.stream(**request_kwargs) as http_response:
+                    for chunk in http_response.iter_bytes():
+                        capture.feed(chunk)
+                capture.close()
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+        except (httpx.RequestError, UnicodeEncodeError) as e:
+            if capture is not None:
+                capture.discard()
+            raise _to_request_error(target_name, e) from e
+
+        response = self._convert_response(http_response, elapsed_ms, capture)
+        if target_limiter is not None and target_limiter.record(
+            request.operation_id, response, start_time
+        ):
+            response.throttled = True
+        return response, start_time
+
+
+class AsyncExecutor(_BaseExecutor):
+    """Executes requests against two targets with many units in flight.
+
+    Same execute()/execute_chain() contract as Executor, but both are
+    coroutines running on httpx.AsyncClient. Up to `concurrency` cases or
+    chains run at once; within a chain, steps still run strictly in order
+    and each target keeps its own extracted variables.
+
+    The executor owns a private event loop so that the explore and replay
+    loops stay synchronous: they hand units of work to run_ordered(), which
+    reports results in input order. Output, statistics, and bundles are
+    therefore identical to a serial run over the same inputs; only wall-clock
+    time changes.
+
+    Usage:
+        with AsyncExecutor(target_a_config, target_b_config, concurrency=8) as executor:
+            executor.run_ordered(cases, executor.execute, on_result)
+    """
+
+    def __init__(
+        self,
+        target_a: TargetConfig,
+        target_b: TargetConfig,
+        default_timeout: float = 30.0,
+        operation_timeouts: dict[str, float] | None = None,
+        link_fields: LinkFields | None = None,
+        requests_per_second: float | None = None,
+        parallel_targets: bool = False,
+        max_body_size: int | None = None,
+        concurrency: int = 1,
+    ) -> None:
+        """Initialize the async executor.
+
+        Args:
+            target_a: Configuration for target A.
+            target_b: Configuration for target B.
+            default_timeout: Default timeout in seconds for requests.
+            operation_timeouts: Per-operation timeout overrides.
+            link_fields: LinkFields object containing body_pointers and headers
+                         for variable extraction during chain execution.
+            requests_per_second: Maximum requests per second (rate limit),
+                                 shared across all in-flight units.
+            parallel_targets: Send each request to both targets at the same
+                              time instead of A then B.
+            max_body_size: Stream bodies, keeping at most this many bytes
+                           in memory (see _BaseExecutor).
+            concurrency: Maximum number of cases/chains in flight at once.
+
+        Raises:
+            ValueError: If concurrency is less than 1.
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+        super().__init__(
+            target_a,
+            target_b,
+            default_timeout=default_timeout,
+            operation_timeouts=operation_timeouts,
+            link_fields=link_fields,
+            requests_per_second=requests_per_second,
+            parallel_targets=parallel_targets,
+            max_body_size=max_body_size,
+        )
+        self._concurrency = concurrency
+        self._loop = asyncio.new_event_loop()
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+        # Same leak protection as Executor: if the second client cannot be
+        # created, release the first one (and the loop) before re-raising.
+        try:
+            self._client_a = httpx.AsyncClient(
+                **self._build_client_kwargs(target_a, default_timeout)
+            )
+            try:
+                self._client_b = httpx.AsyncClient(
+                    **self._build_client_kwargs(target_b, default_timeout)
+                )
+            except Exception:
+                self._loop.run_until_complete(self._client_a.aclose())
+                raise
+        except Exception:
+            self._loop.close()
+            self._remove_spill_dir()
+            raise
+
+    def __enter__(self) -> "AsyncExecutor":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: Any,
+    ) -> None:
+        self.close()
+
+    @property
+    def concurrency(self) -> int:
+        """Maximum number of cases/chains in flight at once."""
+        return self._concurrency
+
+    def close(self) -> None:
+        """Cancel outstanding work, close HTTP clients, and close the loop.
+
+        Uses try/finally at each stage so an error closing one client never
+        leaks the other client or the event loop.
+        """
+        if self._loop.is_closed():
+            return
+        try:
+            self._cancel_pending_tasks()
+            try:
+                self._loop.run_until_complete(self._client_a.aclose())
+            finally:
+                self._loop.run_until_complete(self._client_b.aclose())
+        finally:
+            self._loop.close()
+            self._remove_spill_dir()
+
+    def _cancel_pending_tasks(self) -> None:
+        """Cancel tasks left on the loop (e.g., after KeyboardInterrupt)."""
+        pending = [task for task in asyncio.all_tasks(self._loop) if not task.done()]
+        if not pending:
+            return
+        for task in pending:
+            task.cancel()
+        self._loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+
+    async def execute(
+        self,
+        request: RequestCase,
+    ) -> tuple[ResponseCase, ResponseCase]:
+        """Execute a request against both targets (A then B, or both at once).
+
+        Args:
+            request: The request to execute.
+
+        Returns:
+            Tuple of (response_a, response_b).
+
+        Raises:
+            RequestError: If a request fails due to connection/timeout.
+        """
+        async with self._semaphore:
+            timeout = self._get_timeout(request.operation_id)
+            return await self._execute_pair(request, request, timeout)
+
+    async def execute_chain(
+        self,
+        chain: ChainCase,
+        on_step: Callable[[ResponseCase, ResponseCase], bool] | None = None,
+    ) -> tuple[ChainExecution, ChainExecution]:
+        """Execute a chain against both targets.
+
+        Same semantics as Executor.execute_chain. The whole chain holds one
+        concurrency slot, so its steps never interleave with each other.
+
+        Args:
+            chain: The chain to execute.
+            on_step: Optional callback called after each step with
+                     (response_a, response_b). Return False to stop execution.
+
+        Returns:
+            Tuple of (execution_a, execution_b) containing step-by-step traces.
+
+        Raises:
+            RequestError: If a request fails due to connection/timeout.
+        """
+        async with self._semaphore:
+            state_a = _ChainTargetState()
+            state_b = _ChainTargetState()
+
+            for step in chain.steps:
+                requests = self._prepare_chain_step(step, state_a, state_b)
+                if requests is None:
+                    break
+                request_a, request_b = requests
+
+                timeout = self._get_timeout(request_a.operation_id)
+
+                response_a, response_b = await self._execute_pair(
+                    request_a, request_b, timeout
+                )
+
+                self._record_chain_step(step, state_a, request_a, response_a)
+                self._record_chain_step(step, state_b, request_b, response_b)
+
+                if on_step is not None and not on_step(response_a, response_b):
+                    break
+
+            return (
+                ChainExecution(steps=state_a.steps),
+                ChainExecution(steps=state_b.steps),
+            )
+
+    def run_ordered(
+        self,
+        items: Iterable[T],
+        work: Callable[[T], Awaitable[R] | R],
+        on_result: Callable[[T, R | RequestError], None],
+    ) -> None:
+        """Run work(item) concurrently and report results in input order.
+
+        Items are pulled lazily from the iterable, so generators (e.g., the
+        case generator) are never fully materialized. A bounded window of
+        2 x concurrency units is scheduled ahead of the oldest unreported one:
+        a slow unit at the head does not idle the other slots, and memory
+        stays bounded.
+
+        Args:
+            items: Units of work (cases, chains, bundles).
+            work: Function returning an awaitable that executes one item,
+                  typically execute() or execute_chain(). It may return a
+                  plain value for items that need no requests.
+            on_result: Called with (item, result) in input order. A
+                       RequestError raised by work is passed as the result.
+                       Any other exception propagates and cancels the rest.
+        """
+        self._loop.run_until_complete(self._run_ordered(items, work, on_result))
+
+    async def _run_ordered(
+        self,
+        items: Iterable[T],
+        work: Callable[[T], Awaitable[R] | R],
+        on_result: Callable[[T, R | RequestError], None],
+    ) -> None:
+        """Coroutine body of run_ordered()."""
+
+        async def capture(item: T) -> R | RequestError:
+            try:
+                result = work(item)
+                # Items that need no I/O (e.g., a bundle missing its case
+                # data) may return a plain value instead of an awaitable.
+                if inspect.isawaitable(result):
+                    result = await result
+                return result
+            except RequestError as e:
+                return e
+
+        window = self._concurrency * 2
+        pending: deque[tuple[T, asyncio.Task]] = deque()
+        iterator = iter(items)
+        exhausted = False
+
+        try:
+            while True:
+                while not exhausted and len(pending) < window:
+                    try:
+                        item = next(iterator)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pending.append((item, asyncio.ensure_future(capture(item))))
+
+                if not pending:
+                    return
+
+                item, task = pending.popleft()
+                result = await task
+                try:
+                    on_result(item, result)
+                finally:
+                    self._release_spilled_bodies(result)
+        finally:
+            # Only reached with work outstanding on error/interrupt; cancel it
+            # so no task outlives the run or logs "exception never retrieved".
+            for _, task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(
+                    *(task for _, task in pending), return_exceptions=True
+                )
+
+    async def _wait_for_rate_limit(self) -> None:
+        """Wait if necessary to respect rate limit.
+
+        Reserves the next send slot under the lock and sleeps outside it, so
+        concurrent coroutines queue up at exactly min_interval spacing
+        without blocking the event loop.
+        """
+        if self._min_interval <= 0:
+            return
+
+        with self._rate_limit_lock:
+            now = time.monotonic()
+            send_at = max(now, self._last_request_time + self._min_interval)
+            self._last_request_time = send_at
+
+        if send_at > now:
+            await asyncio.sleep(send_at - now)
+
+    async def _execute_pair(
+        self,
+        request_a: RequestCase,
+        request_b: RequestCase,
+        timeout: float,
+    ) -> tuple[ResponseCase, ResponseCase]:
+        """Execute one request per target, serially or in parallel.
+
+        Same contract as Executor._execute_pair: in parallel mode both sends
+        run as concurrent coroutines, both are awaited even if one fails, and
+        A's error wins when both fail.
+
+        Args:
+            request_a: Request for Target A.
+            request_b: Request for Target B (differs from A only in chains).
+            timeout: Request timeout in seconds.
+
+        Returns:
+            Tuple of (response_a, response_b).
+
+        Raises:
+            RequestError: If either request fails.
+        """
+        if not self._parallel_targets:
+            response_a = await self._execute_single(self._client_a, request_a, timeout, "Target A")
+            response_b = await self._execute_single(self._client_b, request_b, timeout, "Target B")
+            return response_a, response_b
+
+        result_a, result_b = await asyncio.gather(
+            self._send_single(self._client_a, request_a, timeout, "Target A"),
+            self._send_single(self._client_b, request_b, timeout, "Target B"),
+            return_exceptions=True,
         )
+        if isinstance(result_a, BaseException):
+            raise result_a
+        if isinstance(result_b, BaseException):
+            raise result_b
+        response_a, sent_a = result_a
+        response_b, sent_b = result_b
+
+        self._set_send_skew(response_a, response_b, sent_a, sent_b)
+        return response_a, response_b
+
+    async def _execute_single(
+        self,
+        client: httpx.AsyncClient,
+        request: RequestCase,
+        timeout: float,
+        target_name: str,
+    ) -> ResponseCase:
+        """Execute a request against a single target.
+
+        Args:
+            client: Async HTTP client for the target.
+            request: The request to execute.
+            timeout: Request timeout in seconds.
+            target_name: Name for error messages.
+
+        Returns:
+            ResponseCase with the response.
+
+        Raises:
+            RequestError: If request fails.
+        """
+        response, _ = await self._send_single(client, request, timeout, target_name)
+        return response
+
+    async def _send_single(
+        self,
+        client: httpx.AsyncClient,
+        request: RequestCase,
+        timeout: float,
+        target_name: str,
+    ) -> tuple[ResponseCase, float]:
+        """Send a request to a single target and note when it left.
+
+        Returns:
+            Tuple of (response, send time from time.perf_counter()), taken
+            after rate limiting, right before the request.
+
+        Raises:
+            RequestError: If request fails.
+        """
+        request_kwargs = self._build_request_kwargs(request, timeout)
+
+        await self._wait_for_rate_limit()
+        target_limiter = self._target_rate_limiters.get(target_name)
+        if target_limiter is not None:
+            await target_limiter.bucket_for(request.operation_id).acquire_async()
+
+        capture = self._new_body_capture()
+        try:
+            start_time = time.perf_counter()
+            if capture is None:
+                http_response = await client.request(**request_kwargs)
+            else:
+                async with client.stream(**request_kwargs) as http_response:
+                    async for chunk in http_response.aiter_bytes():
+                        capture.feed(chunk)
+                capture.close()
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+        except (httpx.RequestError, UnicodeEncodeError) as e:
+            if capture is not None:
+                capture.discard()
+            raise _to_request_error(target_name, e) from e
+
+        response = self._convert_response(http_response, elapsed_ms, capture)
+        if target_limiter is not None and target_limiter.record(
+            request.operation_id, response, start_time
+        ):
+            response.throttled = True
+        return response, start_time
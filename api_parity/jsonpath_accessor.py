@@ -0,0 +1,357 @@
+"""JSONPath Accessor - compiled lookups for parsed JSONPaths.
+
+jsonpath_ng's find() wraps every visited value in a DatumInContext, and the
+comparator then turned each match's full_path into a string, even though
+the concrete path is only needed when a difference is reported. For the
+subset of JSONPath that comparison rules use (fields, indexes, slices such
+as [*], and ..), compile_jsonpath() turns the parsed path into plain
+functions over the body. Each match carries a location: a linked tuple of
+path segments that concrete_path() renders only when asked.
+
+Matches, their order, and rendered paths are the same as jsonpath_ng's
+find() and str(match.full_path), including its quirks (a slice wraps a
+single object or string in a list, an index also applies to strings).
+Paths using other nodes (where, |, &, `parent`, `this`) use jsonpath_ng.
+
+See DESIGN.md "Compiled JSONPath Accessors".
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Sequence
+
+from jsonpath_ng.jsonpath import Child, Descendants, Fields, Index, JSONPath, Root, Slice
+from jsonpath_ng.lexer import JsonPathLexer
+
+# A match's location: None at the root, else (parent location, segment),
+# where a segment is a field name (str) or a list index (int). jsonpath_ng
+# fallback matches carry their rendered path (str) instead.
+Location = Any
+
+# Maps matches so far to the matches after one more path step.
+_Step = Callable[[list[tuple[Location, Any]]], list[tuple[Location, Any]]]
+
+# What one step of a path selects: ("field", names, or None for '*'),
+# ("index", i), or ("slice", start, end, step).
+_StepKey = tuple[Any, ...]
+
+
+class JSONPathAccessor:
+    """A parsed JSONPath compiled for repeated lookups.
+
+    Build with compile_jsonpath().
+
+    Attributes:
+        parsed: The jsonpath_ng expression.
+        steps: What each step selects, one entry per location segment, for
+               compiled paths without ".."; None otherwise. Used for overlap
+               checks and replace_matches().
+    """
+
+    def __init__(self, parsed: JSONPath, step: _Step | None, steps: tuple[_StepKey, ...] | None) -> None:
+        self.parsed = parsed
+        self.steps = steps
+        self._step = step
+
+    @property
+    def compiled(self) -> bool:
+        """False if lookups fall back to jsonpath_ng."""
+        return self._step is not None
+
+    def find(self, body: Any) -> list[tuple[Location, Any]]:
+        """(location, value) for each match, in jsonpath_ng's order."""
+        if self._step is None:
+            return [(str(match.full_path), match.value) for match in self.parsed.find(body)]
+        return self._step([(None, body)])
+
+    def may_overlap(self, other: JSONPathAccessor) -> bool:
+        """Whether a match of one path can be at, above or below a match of the other.
+
+        Decided from the paths alone, so it holds for every body. Paths
+        without steps (using ".." or jsonpath_ng) may overlap anything.
+        """
+        if self.steps is None or other.steps is None:
+            return True
+        return all(_may_select_same(a, b) for a, b in zip(self.steps, other.steps))
+
+
+def compile_jsonpath(parsed: JSONPath) -> JSONPathAccessor:
+    """Compile a parsed JSONPath, falling back to jsonpath_ng outside the subset."""
+    step = _compile_step(parsed, leading=True)
+    steps = _step_keys(parsed, leading=True) if step is not None else None
+    return JSONPathAccessor(parsed, step, steps)
+
+
+def concrete_path(location: Location) -> str:
+    """Render a match location like jsonpath_ng's str(match.full_path)."""
+    if type(location) is str:
+        return location
+    segments = []
+    while location is not None:
+        location, segment = location
+        segments.append(_format_segment(segment))
+    if not segments:
+        return "$"
+    return ".".join(reversed(segments))
+
+
+def location_segments(location: Location) -> tuple[str | int, ...] | None:
+    """The field names and list indexes from the root to a match location.
+
+    None for jsonpath_ng fallback matches, which carry only their rendered path.
+    """
+    if type(location) is str:
+        return None
+    segments = []
+    while location is not None:
+        location, segment = location
+        segments.append(segment)
+    return tuple(reversed(segments))
+
+
+def replace_matches(body: Any, paths: Sequence[JSONPathAccessor], value: Any) -> Any:
+    """A copy of body with every match of the given paths replaced by value.
+
+    Same as replacing the value at each location find() returns, but walks
+    the paths' steps instead of finding the matches first. Only containers
+    on the way to a match are copied.
+
+    Raises:
+        ValueError: If a path has no steps, or jsonpath_ng would match
+                    something other than an object member or list item (a
+                    slice of a single value, an index into a string) or fail.
+    """
+    step_lists = []
+    for path in paths:
+        if path.steps is None:
+            raise ValueError(f"Not a compiled path without '..': {path.parsed}")
+        if not path.steps:
+            return value
+        step_lists.append(path.steps)
+    return _replace(body, step_lists, value)
+
+
+def _replace(current: Any, step_lists: list[tuple[_StepKey, ...]], value: Any) -> Any:
+    """current with the matches of non-empty step lists replaced by value."""
+    if len(step_lists) == 1 and len(step_lists[0]) == 1 and type(current) is dict:
+        # Common last step, e.g. .price in $.items[*].price: one dict copy
+        kind, names = step_lists[0][0][:2]
+        if kind == "field" and names is not None:
+            present = [name for name in names if name in current]
+            if not present:
+                return current
+            copy = dict(current)
+            for name in present:
+                copy[name] = value
+            return copy
+
+    # Selected member/item -> remaining step lists, or None if some path
+    # ends there (the whole value is replaced)
+    selected: dict[Any, list[tuple[_StepKey, ...]] | None] = {}
+    for steps in step_lists:
+        rest = steps[1:]
+        for key in _select(current, steps[0]):
+            if not rest:
+                selected[key] = None
+            else:
+                children = selected.setdefault(key, [])
+                if children is not None:
+                    children.append(rest)
+    if not selected:
+        return current
+
+    copy: Any = dict(current) if type(current) is dict else list(current)
+    for key, rest in selected.items():
+        copy[key] = value if rest is None else _replace(copy[key], rest, value)
+    return copy
+
+
+def _select(current: Any, step: _StepKey) -> Any:
+    """Keys (member names, non-negative indexes) one step selects, as jsonpath_ng would."""
+    kind = step[0]
+    if kind == "field":
+        if not isinstance(current, dict):
+            return ()
+        names = step[1]
+        return current.keys() if names is None else [name for name in names if name in current]
+    if kind == "index":
+        index = step[1]
+        if not (current and len(current) > index):
+            return ()
+        if type(current) is not list or index < -len(current):
+            raise ValueError(f"Index {index} does not select a list item")
+        return (index % len(current),)
+    if not current:
+        return ()
+    if type(current) is not list:
+        raise ValueError("Slice of a single value")
+    return range(len(current))[step[1]:step[2]:step[3]]
+
+
+def _format_segment(segment: str | int) -> str:
+    """One path segment as jsonpath_ng's Fields/Index print it."""
+    if type(segment) is int:
+        return f"[{segment}]"
+    if any(literal in segment for literal in JsonPathLexer.literals):
+        return f"'{segment}'"
+    return segment
+
+
+# =============================================================================
+# Steps
+# =============================================================================
+
+
+def _compile_step(node: JSONPath, leading: bool) -> _Step | None:
+    """Compile one parsed node; None if any part of it is outside the subset.
+
+    leading is True for the node where matching starts, the only place
+    where $ is supported (it is where matching already is).
+    """
+    node_type = type(node)
+    if node_type is Root:
+        return (lambda matches: matches) if leading else None
+    if node_type is Fields:
+        return _fields_step(node.fields)
+    if node_type is Index:
+        return _index_step(node.index)
+    if node_type is Slice:
+        return _slice_step(node.start, node.end, node.step)
+    if node_type is Child:
+        left, right = _compile_step(node.left, leading), _compile_step(node.right, False)
+        if left is None or right is None:
+            return None
+        return lambda matches: right(left(matches))
+    if node_type is Descendants:
+        left, right = _compile_step(node.left, leading), _compile_step(node.right, False)
+        if left is None or right is None:
+            return None
+        return _descendants_step(left, right)
+    return None
+
+
+def _step_keys(node: JSONPath, leading: bool) -> tuple[_StepKey, ...] | None:
+    """What each step of a compiled path selects; None if it uses ".."."""
+    node_type = type(node)
+    if node_type is Root:
+        return ()
+    if node_type is Fields:
+        return (("field", None if "*" in node.fields else frozenset(node.fields)),)
+    if node_type is Index:
+        return (("index", node.index),)
+    if node_type is Slice:
+        return (("slice", node.start, node.end, node.step),)
+    if node_type is Child:
+        left, right = _step_keys(node.left, leading), _step_keys(node.right, False)
+        if left is None or right is None:
+            return None
+        return left + right
+    return None
+
+
+def _may_select_same(a: _StepKey, b: _StepKey) -> bool:
+    """Whether two steps at the same depth can select the same segment."""
+    if a[0] == "field" or b[0] == "field":
+        # Field names are str segments, indexes int segments
+        if a[0] != b[0]:
+            return False
+        return a[1] is None or b[1] is None or not a[1].isdisjoint(b[1])
+    if a[0] == "index" and b[0] == "index":
+        # A negative index can land on any non-negative one
+        return a[1] == b[1] or (a[1] < 0) != (b[1] < 0)
+    return True
+
+
+def _fields_step(fields: tuple[str, ...]) -> _Step:
+    """Named fields of objects; '*' among them selects every key."""
+    if "*" in fields:
+
+        def step(matches: list[tuple[Location, Any]]) -> list[tuple[Location, Any]]:
+            return [
+                ((location, key), item)
+                for location, value in matches
+                if isinstance(value, dict)
+                for key, item in value.items()
+            ]
+
+        return step
+
+    if len(fields) == 1:
+        field = fields[0]
+
+        def step(matches: list[tuple[Location, Any]]) -> list[tuple[Location, Any]]:
+            return [
+                ((location, field), value[field])
+                for location, value in matches
+                if isinstance(value, dict) and field in value
+            ]
+
+        return step
+
+    def step(matches: list[tuple[Location, Any]]) -> list[tuple[Location, Any]]:
+        return [
+            ((location, field), value[field])
+            for location, value in matches
+            if isinstance(value, dict)
+            for field in fields
+            if field in value
+        ]
+
+    return step
+
+
+def _index_step(index: int) -> _Step:
+    """One index of a list (or string, as in jsonpath_ng)."""
+
+    def step(matches: list[tuple[Location, Any]]) -> list[tuple[Location, Any]]:
+        return [
+            ((location, index), value[index])
+            for location, value in matches
+            if value and len(value) > index
+        ]
+
+    return step
+
+
+def _slice_step(start: int | None, end: int | None, stride: int | None) -> _Step:
+    """A slice of a list; [*] is the full slice."""
+    full = start is None and end is None and stride is None
+
+    def step(matches: list[tuple[Location, Any]]) -> list[tuple[Location, Any]]:
+        results = []
+        for location, value in matches:
+            if not value:
+                continue
+            if isinstance(value, (dict, int, str)):
+                # jsonpath_ng treats a single value as a one-element list
+                value = [value]
+            if full:
+                results.extend(((location, i), item) for i, item in enumerate(value))
+            else:
+                indexes = range(0, len(value))[start:end:stride]
+                results.extend(((location, i), value[i]) for i in indexes)
+        return results
+
+    return step
+
+
+def _descendants_step(left: _Step, right: _Step) -> _Step:
+    """left..right: right applied at every node below each left match, depth first."""
+
+    def step(matches: list[tuple[Location, Any]]) -> list[tuple[Location, Any]]:
+        results = []
+        for match in left(matches):
+            stack = [match]
+            while stack:
+                location, value = node = stack.pop()
+                results.extend(right([node]))
+                if isinstance(value, list):
+                    children = [((location, i), item) for i, item in enumerate(value)]
+                elif isinstance(value, dict):
+                    children = [((location, key), item) for key, item in value.items()]
+                else:
+                    continue
+                stack.extend(reversed(children))
+        return results
+
+    return step
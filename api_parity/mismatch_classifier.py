@@ -20,21 +20,22 @@ def _extract_paths_from_step_diff(step_diff: dict) -> frozenset[str]:
     """Extract failing paths from a single step's diff data.
 
     Used for both stateless diffs and individual chain steps.
-    Returns frozenset of path strings from body, binary_body, extra_fields,
-    or header differences.
+    Returns frozenset of path strings from body, binary_body, structural_diff,
+    extra_fields, or header differences.
 
-    The Comparator returns mismatch_type=BODY for three distinct sub-cases:
+    The Comparator returns mismatch_type=BODY for four distinct sub-cases:
     - JSON body differences → details["body"]
     - Binary body differences → details["binary_body"]
+    - Structural diff differences → details["structural_diff"]
     - Extra field differences → details["extra_fields"]
     Only one is populated per mismatch (early return in comparator), so we
-    check all three to avoid collapsing distinct failures to frozenset().
+    check all four to avoid collapsing distinct failures to frozenset().
     """
     mismatch_type = step_diff.get("mismatch_type")
     details = step_diff.get("details", {})
 
     if mismatch_type == "body":
-        # Check all three body sub-cases. Comparator early-returns so only
+        # Check all four body sub-cases. Comparator early-returns so only
         # one will have differences, but we check all for robustness.
         body = details.get("body", {})
         differences = body.get("differences", [])
@@ -47,6 +48,12 @@ def _extract_paths_from_step_diff(step_diff: dict) -> frozenset[str]:
             # Prefix with "binary:" so binary paths never collide with JSON paths
             return frozenset(f"binary:{d.get('path', '')}" for d in binary_differences)
 
+        structural_diff = details.get("structural_diff", {})
+        structural_differences = structural_diff.get("differences", [])
+        if structural_differences:
+            # Prefix with "structural:" so unruled paths never collide with rule paths
+            return frozenset(f"structural:{d.get('path', '')}" for d in structural_differences)
+
         extra_fields = details.get("extra_fields", {})
         extra_differences = extra_fields.get("differences", [])
         if extra_differences:
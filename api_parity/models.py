@@ -5,13 +5,23 @@ All models use Pydantic v2. See ARCHITECTURE.md "Internal Data Models" for speci
 
 from __future__ import annotations
 
+import base64
 import re
 from enum import Enum
-from typing import Any
+from typing import Any, Protocol
 
 from typing_extensions import Self
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    SerializerFunctionWrapHandler,
+    field_validator,
+    model_serializer,
+    model_validator,
+)
 
 
 # =============================================================================
@@ -60,14 +70,44 @@ class RequestCase(BaseModel):
         return self
 
 
+class LazyBody(Protocol):
+    """Raw response bytes that are decoded only when first read.
+
+    See ResponseCase.with_lazy_body().
+    """
+
+    content: bytes
+
+    def decode(self) -> tuple[Any, bool]:
+        """Parse the content.
+
+        Returns:
+            Tuple of (parsed body or None, whether the content is kept as
+            body_base64 instead).
+        """
+        ...
+
+
+# Fields of ResponseCase that a LazyBody fills in on first access.
+_LAZY_BODY_FIELDS = frozenset({"body", "body_base64"})
+
+
 class ResponseCase(BaseModel):
     """One HTTP response captured from a target.
 
     Header keys are lowercase. Header values are arrays for repeated headers.
+
+    Responses built with with_lazy_body() hold the raw bytes and parse
+    `body` (JSON/XML/text) or encode `body_base64` on first access, so a
+    response that is never compared past the status code, or whose body no
+    rule reads, never pays for parsing. Serialization, equality and iteration
+    load the body first, so lazy and eager responses are indistinguishable.
     """
 
     model_config = ConfigDict(extra="forbid")
 
+    _lazy_body: LazyBody | None = PrivateAttr(default=None)
+
     status_code: int = Field(description="HTTP status code")
     headers: dict[str, list[str]] = Field(
         default_factory=dict, description="Response headers (lowercase keys, array values)"
@@ -76,6 +116,25 @@ class ResponseCase(BaseModel):
     body_base64: str | None = Field(default=None, description="Body as base64 if binary")
     elapsed_ms: float = Field(description="Response time in milliseconds")
     http_version: str = Field(default="1.1", description="Protocol version")
+    send_skew_ms: float | None = Field(
+        default=None,
+        description="This target's send time minus the other target's, in milliseconds "
+        "(parallel-targets mode only)",
+    )
+    throttled: bool = Field(
+        default=False,
+        description="Target signalled throttling (429/503) under adaptive rate control",
+    )
+    # Streaming capture (--max-body-size). None when the body was read whole.
+    body_size: int | None = Field(default=None, description="Body length in bytes")
+    body_sha256: str | None = Field(default=None, description="Hex SHA-256 of the body")
+    body_truncated: bool = Field(
+        default=False,
+        description="Body exceeded --max-body-size; only size and digest were kept",
+    )
+    body_file: str | None = Field(
+        default=None, description="File holding the full body of a truncated response"
+    )
 
     @model_validator(mode="after")
     def check_body_exclusivity(self) -> Self:
@@ -86,6 +145,79 @@ class ResponseCase(BaseModel):
             )
         return self
 
+    @classmethod
+    def with_lazy_body(cls, lazy_body: LazyBody, **fields: Any) -> Self:
+        """Build a response whose body is decoded from lazy_body on first access.
+
+        Args:
+            lazy_body: The undecoded body.
+            **fields: Every other ResponseCase field (not body/body_base64).
+
+        Returns:
+            ResponseCase with body and body_base64 pending.
+        """
+        response = cls(**fields)
+        response._lazy_body = lazy_body
+        # Absent from __dict__, the fields fall through to __getattr__.
+        del response.__dict__["body"]
+        del response.__dict__["body_base64"]
+        return response
+
+    def __getattr__(self, name: str) -> Any:
+        if name in _LAZY_BODY_FIELDS and self.__pydantic_private__.get("_lazy_body") is not None:
+            self._load_body(name)
+            return self.__dict__[name]
+        return super().__getattr__(name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _LAZY_BODY_FIELDS:
+            self._materialize_body()
+        super().__setattr__(name, value)
+
+    def __eq__(self, other: object) -> bool:
+        self._materialize_body()
+        if isinstance(other, ResponseCase):
+            other._materialize_body()
+        return super().__eq__(other)
+
+    def __iter__(self) -> Any:
+        self._materialize_body()
+        return super().__iter__()
+
+    def __repr_args__(self) -> Any:
+        self._materialize_body()
+        return super().__repr_args__()
+
+    @model_serializer(mode="wrap")
+    def _serialize_loaded(self, handler: SerializerFunctionWrapHandler) -> dict[str, Any]:
+        self._materialize_body()
+        return handler(self)
+
+    def _load_body(self, name: str) -> None:
+        """Fill in `name` (and whatever else the decode yields) from the lazy body."""
+        lazy_body = self.__pydantic_private__["_lazy_body"]
+        if "body" not in self.__dict__:
+            body, is_base64 = lazy_body.decode()
+            self.__dict__["body"] = body
+            if not is_base64:
+                self.__dict__["body_base64"] = None
+        # Binary content: base64 is only built when something reads it.
+        if name == "body_base64" and "body_base64" not in self.__dict__:
+            self.__dict__["body_base64"] = base64.b64encode(lazy_body.content).decode("ascii")
+        if "body_base64" in self.__dict__:
+            self.__pydantic_private__["_lazy_body"] = None  # Release the raw bytes
+            # Restore declaration order so dumps match an eagerly built response.
+            # The reordered dict is swapped in whole, so no reader sees it empty.
+            values = self.__dict__
+            object.__setattr__(
+                self, "__dict__", {name: values[name] for name in type(self).model_fields}
+            )
+
+    def _materialize_body(self) -> None:
+        """Decode any pending body fields."""
+        if self.__pydantic_private__.get("_lazy_body") is not None:
+            self._load_body("body_base64")
+
 
 # =============================================================================
 # Stateful Chain Models
@@ -226,6 +358,10 @@ class BodyRules(BaseModel):
         default=None,
         description="Rule for comparing binary (non-JSON) bodies. Compares base64-encoded strings.",
     )
+    structural_diff: bool = Field(
+        default=False,
+        description="Also report every differing value no field rule covers (opt-in).",
+    )
 
     @model_validator(mode="after")
     def validate_binary_rule_presence(self) -> Self:
@@ -371,6 +507,16 @@ class TargetInfo(BaseModel):
 
     name: str = Field(description="Target name from config")
     base_url: str = Field(description="Base URL used")
+    http2: bool = Field(default=False, description="Whether HTTP/2 was enabled")
+    max_connections: int | None = Field(
+        default=None, description="Connection pool size"
+    )
+    max_keepalive_connections: int | None = Field(
+        default=None, description="Idle connections kept for reuse"
+    )
+    keepalive_expiry: float | None = Field(
+        default=None, description="Seconds an idle connection was kept open"
+    )
 
 
 # ISO 8601 timestamp: YYYY-MM-DDTHH:MM:SS with optional fractional seconds and timezone
@@ -410,6 +556,72 @@ class MismatchMetadata(BaseModel):
 # =============================================================================
 
 
+class TokenBucketConfig(BaseModel):
+    """Token-bucket limit: sustained rate plus burst capacity."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    requests_per_second: float = Field(gt=0, description="Sustained requests per second")
+    burst: int = Field(
+        default=1,
+        ge=1,
+        description="Requests that may go out back-to-back after an idle period (bucket size)",
+    )
+
+
+class AdaptiveRateConfig(BaseModel):
+    """AIMD rate control settings for a target's token buckets."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    min_requests_per_second: float = Field(
+        default=0.5, gt=0, description="Backoff never goes below this rate"
+    )
+    max_requests_per_second: float | None = Field(
+        default=None, gt=0, description="Ramp-up never goes above this rate (default: unbounded)"
+    )
+    increase_step: float = Field(
+        default=1.0, gt=0, description="Requests/second added after each healthy window"
+    )
+    decrease_factor: float = Field(
+        default=0.5, gt=0, lt=1, description="Rate multiplier applied on throttling or a latency jump"
+    )
+    window: int = Field(
+        default=20, ge=5, description="Responses per evaluation window (latency p95 and ramp-up)"
+    )
+    latency_factor: float = Field(
+        default=2.0, gt=1, description="Back off when a window's p95 latency exceeds the best p95 by this factor"
+    )
+
+    @model_validator(mode="after")
+    def validate_bounds(self) -> Self:
+        if (
+            self.max_requests_per_second is not None
+            and self.max_requests_per_second < self.min_requests_per_second
+        ):
+            raise ValueError(
+                f"AdaptiveRateConfig max_requests_per_second ({self.max_requests_per_second}) "
+                f"must be >= min_requests_per_second ({self.min_requests_per_second})"
+            )
+        return self
+
+
+class TargetRateLimitConfig(TokenBucketConfig):
+    """Per-target rate limit with optional per-operation overrides.
+
+    With `adaptive` set, requests_per_second is the starting rate and each
+    bucket is tuned at runtime from 429/503 responses and latency.
+    """
+
+    operations: dict[str, TokenBucketConfig] = Field(
+        default_factory=dict,
+        description="operationId -> bucket used instead of the target-wide one",
+    )
+    adaptive: AdaptiveRateConfig | None = Field(
+        default=None, description="Adjust rates at runtime from throttling and latency"
+    )
+
+
 class TargetConfig(BaseModel):
     """Configuration for a single target."""
 
@@ -440,6 +652,33 @@ class TargetConfig(BaseModel):
         default=None,
         description="OpenSSL cipher string to restrict allowed ciphers (e.g., 'ECDHE+AESGCM')",
     )
+    rate_limit: TargetRateLimitConfig | None = Field(
+        default=None, description="Token-bucket rate limit for this target only"
+    )
+    # Connection configuration. Defaults match httpx's own, so existing
+    # configs keep their behavior; they are spelled out so metadata.json
+    # records the pool a run actually used.
+    http2: bool = Field(
+        default=False, description="Negotiate HTTP/2 (requires the h2 package)"
+    )
+    max_connections: int = Field(
+        default=100, ge=1, description="Maximum open connections to this target"
+    )
+    max_keepalive_connections: int = Field(
+        default=20, ge=0, description="Maximum idle connections kept for reuse"
+    )
+    keepalive_expiry: float = Field(
+        default=5.0, ge=0, description="Seconds an idle connection is kept open"
+    )
+
+    @model_validator(mode="after")
+    def validate_pool_limits(self) -> Self:
+        if self.max_keepalive_connections > self.max_connections:
+            raise ValueError(
+                f"TargetConfig max_keepalive_connections ({self.max_keepalive_connections}) "
+                f"cannot exceed max_connections ({self.max_connections})"
+            )
+        return self
 
     @model_validator(mode="after")
     def validate_cert_key_pair(self) -> Self:
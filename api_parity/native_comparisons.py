@@ -0,0 +1,624 @@
+"""Native Comparisons - Python evaluation of predefined comparisons.
+
+Most field rules use predefineds from comparison_library.json. Evaluating them
+here saves a round-trip to the CEL subprocess for every value pair. Each
+implementation reproduces the result of the predefined's CEL expression for
+the values the Go evaluator would receive: JSON numbers decode as doubles,
+and strings, bools, null, lists and maps keep their types.
+
+A native comparison returns None whenever it cannot be sure of the CEL result,
+and the comparator then evaluates the CEL expression as before. This covers
+expressions that would fail in CEL (e.g. size() of a number), values that do
+not survive the JSON trip to Go unchanged (NaN, out-of-range integers, lone
+surrogates, non-string keys), and libraries whose expression for a predefined
+differs from the one implemented here.
+
+Wildcard rules compare whole columns of index-paired values. The hottest
+predefineds (exact_match, the numeric tolerances and the format checks) have
+column kernels that decide plain scalars inline and hand everything else to
+the per-pair comparison, so a column result always equals the per-pair
+results.
+
+Predefineds without a native implementation always use CEL:
+array_length_tolerance, string_prefix, string_suffix, and both_match_regex
+(user patterns are RE2 syntax).
+
+See DESIGN.md "Native Predefined Comparisons".
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Sequence
+
+from api_parity.models import FieldRule, PredefinedComparison
+
+# Evaluates a value pair: True/False, or None to let CEL decide.
+NativeComparison = Callable[[Any, Any], "bool | None"]
+
+# Evaluates paired columns of values: one NativeComparison result per pair.
+NativeColumnComparison = Callable[[Sequence[Any], Sequence[Any]], "list[bool | None]"]
+
+
+# =============================================================================
+# CEL Value Model
+# =============================================================================
+
+
+def _is_cel_value(value: Any) -> bool:
+    """Whether a value reaches the CEL evaluator unchanged (numbers as doubles).
+
+    json.dumps output that Go cannot decode (NaN, Infinity, integers beyond
+    the double range) fails the whole CEL request. Lone surrogates decode to
+    U+FFFD, which can make different strings equal. Non-string keys are
+    converted to strings. All of these are left to CEL.
+    """
+    value_type = type(value)
+    if value_type is str:
+        return _is_utf8(value)
+    if value is None or value_type is bool:
+        return True
+    if value_type is int:
+        try:
+            float(value)
+        except OverflowError:
+            return False
+        return True
+    if value_type is float:
+        return math.isfinite(value)
+    if value_type is list:
+        return all(_is_cel_value(item) for item in value)
+    if value_type is dict:
+        return all(
+            type(key) is str and _is_utf8(key) and _is_cel_value(item)
+            for key, item in value.items()
+        )
+    return False
+
+
+def _is_utf8(text: str) -> bool:
+    """Whether a string is encodable as UTF-8 (no lone surrogates)."""
+    if text.isascii():
+        return True
+    try:
+        text.encode("utf-8")
+    except UnicodeEncodeError:
+        return False
+    return True
+
+
+def _is_double(value: Any) -> bool:
+    """Whether a value is a CEL double (any JSON number)."""
+    value_type = type(value)
+    return value_type is int or value_type is float
+
+
+def _cel_type(value: Any) -> str:
+    """The CEL type name of a value from _is_cel_value."""
+    if _is_double(value):
+        return "double"
+    if value is None:
+        return "null_type"
+    if type(value) is bool:
+        return "bool"
+    if type(value) is str:
+        return "string"
+    if type(value) is list:
+        return "list"
+    return "map"
+
+
+def _cel_equal(a: Any, b: Any) -> bool:
+    """CEL `a == b` (heterogeneous equality: different types are unequal)."""
+    type_a = _cel_type(a)
+    if type_a != _cel_type(b):
+        return False
+    if type_a == "double":
+        return float(a) == float(b)
+    if type_a == "list":
+        return len(a) == len(b) and all(_cel_equal(x, y) for x, y in zip(a, b))
+    if type_a == "map":
+        return len(a) == len(b) and all(
+            key in b and _cel_equal(item, b[key]) for key, item in a.items()
+        )
+    return a == b
+
+
+def _cel_size(value: Any) -> int | None:
+    """CEL size(): code points, list length, or map size; None if undefined."""
+    if type(value) in (str, list, dict):
+        return len(value)
+    return None
+
+
+def _and(*conjuncts: bool | None) -> bool | None:
+    """CEL `&&` over tri-state conjuncts (None = the conjunct would error).
+
+    A false conjunct makes the result false even if another one errors;
+    otherwise any error makes the result an error, left to CEL.
+    """
+    if False in conjuncts:
+        return False
+    if None in conjuncts:
+        return None
+    return True
+
+
+# =============================================================================
+# Comparisons
+# =============================================================================
+
+
+def _each(check: Callable[[Any], bool | None]) -> NativeComparison:
+    """Comparison of the form `check(a) && check(b)`."""
+    return lambda a, b: _and(check(a), check(b))
+
+
+def _numeric_tolerance(tolerance: float) -> NativeComparison:
+    """`(a - b) <= t && (b - a) <= t`; subtraction is only defined for doubles."""
+
+    def compare(a: Any, b: Any) -> bool | None:
+        if not (_is_double(a) and _is_double(b)):
+            return None
+        a, b = float(a), float(b)
+        return (a - b) <= tolerance and (b - a) <= tolerance
+
+    return compare
+
+
+def _size_equal(a: Any, b: Any) -> bool | None:
+    """`size(a) == size(b)`."""
+    size_a, size_b = _cel_size(a), _cel_size(b)
+    if size_a is None or size_b is None:
+        return None
+    return size_a == size_b
+
+
+def _nonempty(value: Any) -> bool | None:
+    """`size(value) > 0`."""
+    size = _cel_size(value)
+    return None if size is None else size > 0
+
+
+def _scalar_key(value: Any) -> tuple[str, Any] | None:
+    """Hashable key under which CEL-equal scalars collide; None for containers."""
+    cel_type = _cel_type(value)
+    if cel_type == "double":
+        return cel_type, float(value)
+    if cel_type in ("list", "map"):
+        return None
+    return cel_type, value
+
+
+def _unordered_array(a: Any, b: Any) -> bool | None:
+    """`size(a) == size(b) && a.all(x, x in b)`, decided for two lists."""
+    size_a, size_b = _cel_size(a), _cel_size(b)
+    if size_a is not None and size_b is not None and size_a != size_b:
+        return False
+    if type(a) is not list or type(b) is not list:
+        return None
+
+    keys_b = [_scalar_key(item) for item in b]
+    if None not in keys_b:
+        # Scalars only: membership by hashed key instead of pairwise equality
+        members = set(keys_b)
+        return all(_scalar_key(item) in members for item in a)
+    return all(any(_cel_equal(x, y) for y in b) for x in a)
+
+
+def _same_keys(a: Any, b: Any) -> bool | None:
+    """`size(a) == size(b) && a.all(k, k in b)`, decided for two maps."""
+    size_a, size_b = _cel_size(a), _cel_size(b)
+    if size_a is not None and size_b is not None and size_a != size_b:
+        return False
+    if type(a) is not dict or type(b) is not dict:
+        return None
+    return all(key in b for key in a)
+
+
+def _string_contains(substring: str) -> NativeComparison:
+    """`a.contains(s) && b.contains(s)`; contains() is only defined on strings."""
+    return _each(lambda v: substring in v if type(v) is str else None)
+
+
+def _matches(pattern: re.Pattern[str]) -> Callable[[Any], bool | None]:
+    """`value.matches(...)` for one of the library's fixed patterns."""
+    return lambda v: pattern.match(v) is not None if type(v) is str else None
+
+
+def _compare_zero(check: Callable[[float], bool]) -> Callable[[Any], bool | None]:
+    """A comparison of a double against the literal 0; errors for other types."""
+    return lambda v: check(float(v)) if _is_double(v) else None
+
+
+def _is_integer(value: Any) -> bool | None:
+    """`int(value) == value` for a double within int64 range."""
+    if not _is_double(value):
+        return None
+    number = float(value)
+    if abs(number) >= 2.0**62:
+        # Near the int64 limits int() may fail with a range error
+        return None
+    return number.is_integer()
+
+
+def _same_sign(a: Any, b: Any) -> bool | None:
+    """`(a > 0 && b > 0) || (a < 0 && b < 0) || (a == 0 && b == 0)` for doubles."""
+    if not (_is_double(a) and _is_double(b)):
+        return None
+    a, b = float(a), float(b)
+    return (a > 0 and b > 0) or (a < 0 and b < 0) or (a == 0 and b == 0)
+
+
+def _in_range(low: float, high: float) -> NativeComparison:
+    """`(a >= min && a <= max) && (b >= min && b <= max)`."""
+    return _each(lambda v: low <= float(v) <= high if _is_double(v) else None)
+
+
+def _hex_string(a: Any, b: Any) -> bool | None:
+    """`a.matches(hex) && b.matches(hex) && size(a) == size(b)`."""
+    check = _matches(_HEX)
+    return _and(check(a), check(b), _size_equal(a, b))
+
+
+# The library's RE2 patterns as Python patterns with identical results: RE2's
+# \d is ASCII-only and its $ (without the m flag) matches only at the very
+# end, so [0-9] and \Z are spelled out. pattern.match() anchors the ^.
+_UUID = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z")
+_UUID_V4 = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-4[0-9a-fA-F]{3}-[89abAB][0-9a-fA-F]{3}-[0-9a-fA-F]{12}\Z")
+_URL = re.compile(r"https?://[^\t\n\f\r ]+\Z")  # RE2 \s is [\t\n\f\r ]
+_ISO_TIMESTAMP = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}")
+_ISO_DATE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}\Z")
+_JWT = re.compile(r"[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+\Z")
+_BASE64 = re.compile(r"[A-Za-z0-9+/]+={0,2}\Z")
+_HEX = re.compile(r"[0-9a-fA-F]+\Z")
+
+
+# =============================================================================
+# Column Comparisons
+# =============================================================================
+
+# Integers in this range are exact as doubles, so they compare like CEL doubles.
+_EXACT_INT = 2**53
+
+
+def _equal_column(rule: FieldRule, compare: NativeComparison) -> NativeColumnComparison:
+    """`a == b` over columns: ASCII strings, finite doubles, bools and nulls inline."""
+
+    def compare_column(col_a: Sequence[Any], col_b: Sequence[Any]) -> list[bool | None]:
+        results: list[bool | None] = []
+        append = results.append
+        for a, b in zip(col_a, col_b):
+            type_a = type(a)
+            if type_a is type(b):
+                if type_a is str:
+                    if a.isascii() and b.isascii():
+                        append(a == b)
+                        continue
+                elif type_a is float:
+                    if math.isfinite(a) and math.isfinite(b):
+                        append(a == b)
+                        continue
+                elif type_a is int:
+                    if -_EXACT_INT <= a <= _EXACT_INT and -_EXACT_INT <= b <= _EXACT_INT:
+                        append(a == b)
+                        continue
+                elif type_a is bool or a is None:
+                    append(a == b)
+                    continue
+            append(compare(a, b))
+        return results
+
+    return compare_column
+
+
+def _tolerance_column(param: str) -> Callable[[FieldRule, NativeComparison], NativeColumnComparison]:
+    """`(a - b) <= t && (b - a) <= t` over columns: numbers with a finite difference inline."""
+
+    def build(rule: FieldRule, compare: NativeComparison) -> NativeColumnComparison:
+        tolerance = getattr(rule, param)
+
+        def compare_column(col_a: Sequence[Any], col_b: Sequence[Any]) -> list[bool | None]:
+            results: list[bool | None] = []
+            append = results.append
+            for a, b in zip(col_a, col_b):
+                type_a, type_b = type(a), type(b)
+                if (type_a is float or type_a is int) and (type_b is float or type_b is int):
+                    try:
+                        diff = float(a) - float(b)
+                    except OverflowError:
+                        diff = math.inf
+                    # A finite difference means both operands were finite
+                    if math.isfinite(diff):
+                        append(diff <= tolerance and -diff <= tolerance)
+                        continue
+                append(compare(a, b))
+            return results
+
+        return compare_column
+
+    return build
+
+
+def _format_column(pattern: re.Pattern[str]) -> Callable[[FieldRule, NativeComparison], NativeColumnComparison]:
+    """`a.matches(p) && b.matches(p)` over columns: ASCII strings inline."""
+    match = pattern.match
+
+    def build(rule: FieldRule, compare: NativeComparison) -> NativeColumnComparison:
+        def compare_column(col_a: Sequence[Any], col_b: Sequence[Any]) -> list[bool | None]:
+            results: list[bool | None] = []
+            append = results.append
+            for a, b in zip(col_a, col_b):
+                if type(a) is str and type(b) is str and a.isascii() and b.isascii():
+                    append(match(a) is not None and match(b) is not None)
+                else:
+                    append(compare(a, b))
+            return results
+
+        return compare_column
+
+    return build
+
+
+# =============================================================================
+# Registry
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class _NativePredefined:
+    """A predefined with a native implementation.
+
+    Attributes:
+        expr: The library expression the implementation reproduces. If the
+              loaded library defines the predefined differently, CEL is used.
+        build: Returns the comparison for a rule's parameters, or None if the
+               parameters cannot be handled natively.
+        column: Builds a column kernel from the rule and its comparison. If
+                None, columns are compared pair by pair.
+        reflexive: True if the expression holds for every value compared
+                   with itself, without ever erroring.
+    """
+
+    expr: str
+    build: Callable[[FieldRule], NativeComparison | None]
+    column: Callable[[FieldRule, NativeComparison], NativeColumnComparison] | None = None
+    reflexive: bool = False
+
+
+def _fixed(compare: NativeComparison) -> Callable[[FieldRule], NativeComparison]:
+    return lambda rule: compare
+
+
+def _float_param(value: Any) -> float | None:
+    """A float parameter that expands to a CEL double literal, else None."""
+    if type(value) is float and math.isfinite(value):
+        return value
+    return None
+
+
+def _build_tolerance(param: str) -> Callable[[FieldRule], NativeComparison | None]:
+    def build(rule: FieldRule) -> NativeComparison | None:
+        tolerance = _float_param(getattr(rule, param))
+        return None if tolerance is None else _numeric_tolerance(tolerance)
+
+    return build
+
+
+def _build_string_contains(rule: FieldRule) -> NativeComparison | None:
+    substring = rule.substring
+    # A raw newline is not allowed inside a CEL string literal
+    if type(substring) is not str or "\n" in substring or "\r" in substring:
+        return None
+    if not _is_utf8(substring):
+        return None
+    return _string_contains(substring)
+
+
+def _build_in_range(rule: FieldRule) -> NativeComparison | None:
+    low, high = _float_param(rule.min), _float_param(rule.max)
+    if low is None or high is None:
+        return None
+    return _in_range(low, high)
+
+
+_NATIVE_PREDEFINED: dict[str, _NativePredefined] = {
+    "ignore": _NativePredefined("true", _fixed(lambda a, b: True), reflexive=True),
+    "exact_match": _NativePredefined(
+        "a == b", _fixed(_cel_equal), _equal_column, reflexive=True
+    ),
+    "numeric_tolerance": _NativePredefined(
+        "(a - b) <= tolerance && (b - a) <= tolerance", _build_tolerance("tolerance"),
+        _tolerance_column("tolerance"),
+    ),
+    "epoch_seconds_tolerance": _NativePredefined(
+        "(a - b) <= seconds && (b - a) <= seconds", _build_tolerance("seconds"),
+        _tolerance_column("seconds"),
+    ),
+    "epoch_millis_tolerance": _NativePredefined(
+        "(a - b) <= millis && (b - a) <= millis", _build_tolerance("millis"),
+        _tolerance_column("millis"),
+    ),
+    "unordered_array": _NativePredefined(
+        "size(a) == size(b) && a.all(x, x in b)", _fixed(_unordered_array)
+    ),
+    "array_length": _NativePredefined("size(a) == size(b)", _fixed(_size_equal)),
+    "array_nonempty": _NativePredefined(
+        "size(a) > 0 && size(b) > 0", _fixed(_each(_nonempty))
+    ),
+    "string_contains": _NativePredefined(
+        "a.contains(substring) && b.contains(substring)", _build_string_contains
+    ),
+    "string_length_match": _NativePredefined("size(a) == size(b)", _fixed(_size_equal)),
+    "string_nonempty": _NativePredefined(
+        "size(a) > 0 && size(b) > 0", _fixed(_each(_nonempty))
+    ),
+    "uuid_format": _NativePredefined(
+        r"a.matches('^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$')"
+        r" && b.matches('^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$')",
+        _fixed(_each(_matches(_UUID))),
+        _format_column(_UUID),
+    ),
+    "uuid_v4_format": _NativePredefined(
+        r"a.matches('^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-4[0-9a-fA-F]{3}-[89abAB][0-9a-fA-F]{3}-[0-9a-fA-F]{12}$')"
+        r" && b.matches('^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-4[0-9a-fA-F]{3}-[89abAB][0-9a-fA-F]{3}-[0-9a-fA-F]{12}$')",
+        _fixed(_each(_matches(_UUID_V4))),
+        _format_column(_UUID_V4),
+    ),
+    "url_format": _NativePredefined(
+        r"a.matches('^https?://[^\\s]+$') && b.matches('^https?://[^\\s]+$')",
+        _fixed(_each(_matches(_URL))),
+        _format_column(_URL),
+    ),
+    "iso_timestamp_format": _NativePredefined(
+        r"a.matches('^\\d{4}-\\d{2}-\\d{2}T\\d{2}:\\d{2}:\\d{2}')"
+        r" && b.matches('^\\d{4}-\\d{2}-\\d{2}T\\d{2}:\\d{2}:\\d{2}')",
+        _fixed(_each(_matches(_ISO_TIMESTAMP))),
+        _format_column(_ISO_TIMESTAMP),
+    ),
+    "iso_date_format": _NativePredefined(
+        r"a.matches('^\\d{4}-\\d{2}-\\d{2}$') && b.matches('^\\d{4}-\\d{2}-\\d{2}$')",
+        _fixed(_each(_matches(_ISO_DATE))),
+        _format_column(_ISO_DATE),
+    ),
+    "jwt_format": _NativePredefined(
+        r"a.matches('^[A-Za-z0-9_-]+\\.[A-Za-z0-9_-]+\\.[A-Za-z0-9_-]+$')"
+        r" && b.matches('^[A-Za-z0-9_-]+\\.[A-Za-z0-9_-]+\\.[A-Za-z0-9_-]+$')",
+        _fixed(_each(_matches(_JWT))),
+        _format_column(_JWT),
+    ),
+    "base64_format": _NativePredefined(
+        r"a.matches('^[A-Za-z0-9+/]+={0,2}$') && b.matches('^[A-Za-z0-9+/]+={0,2}$')",
+        _fixed(_each(_matches(_BASE64))),
+        _format_column(_BASE64),
+    ),
+    "hex_string": _NativePredefined(
+        r"a.matches('^[0-9a-fA-F]+$') && b.matches('^[0-9a-fA-F]+$') && size(a) == size(b)",
+        _fixed(_hex_string),
+    ),
+    "both_null": _NativePredefined(
+        "a == null && b == null", _fixed(lambda a, b: a is None and b is None)
+    ),
+    "both_null_or_equal": _NativePredefined(
+        "(a == null && b == null) || (a != null && b != null && a == b)",
+        _fixed(lambda a, b: (a is None and b is None) or (
+            a is not None and b is not None and _cel_equal(a, b)
+        )),
+        reflexive=True,
+    ),
+    "same_nullity": _NativePredefined(
+        "(a == null) == (b == null)",
+        _fixed(lambda a, b: (a is None) == (b is None)),
+        reflexive=True,
+    ),
+    "both_boolean": _NativePredefined(
+        "type(a) == bool && type(b) == bool",
+        _fixed(lambda a, b: type(a) is bool and type(b) is bool),
+    ),
+    "type_match": _NativePredefined(
+        "type(a) == type(b)",
+        _fixed(lambda a, b: _cel_type(a) == _cel_type(b)),
+        reflexive=True,
+    ),
+    "both_positive": _NativePredefined(
+        "a > 0 && b > 0", _fixed(_each(_compare_zero(lambda v: v > 0)))
+    ),
+    "both_non_negative": _NativePredefined(
+        "a >= 0 && b >= 0", _fixed(_each(_compare_zero(lambda v: v >= 0)))
+    ),
+    "both_integer": _NativePredefined(
+        "int(a) == a && int(b) == b", _fixed(_each(_is_integer))
+    ),
+    "same_sign": _NativePredefined(
+        "(a > 0 && b > 0) || (a < 0 && b < 0) || (a == 0 && b == 0)", _fixed(_same_sign)
+    ),
+    "both_in_range": _NativePredefined(
+        "(a >= min && a <= max) && (b >= min && b <= max)", _build_in_range
+    ),
+    "same_keys": _NativePredefined(
+        "size(a) == size(b) && a.all(k, k in b)", _fixed(_same_keys)
+    ),
+    "object_nonempty": _NativePredefined(
+        "size(a) > 0 && size(b) > 0", _fixed(_each(_nonempty))
+    ),
+    "binary_exact_match": _NativePredefined(
+        "a == b", _fixed(_cel_equal), _equal_column, reflexive=True
+    ),
+    "binary_length_match": _NativePredefined("size(a) == size(b)", _fixed(_size_equal)),
+    "binary_nonempty": _NativePredefined(
+        "size(a) > 0 && size(b) > 0", _fixed(_each(_nonempty))
+    ),
+}
+
+
+def compile_native_comparison(
+    name: str,
+    predefined: PredefinedComparison,
+    rule: FieldRule,
+) -> NativeComparison | None:
+    """Build the native comparison for a predefined rule.
+
+    Args:
+        name: The predefined's name (rule.predefined).
+        predefined: The predefined as defined in the loaded library.
+        rule: The rule, for its parameters.
+
+    Returns:
+        A callable taking (value_a, value_b) and returning the CEL result,
+        or None from the callable when CEL must decide. None instead of a
+        callable if the predefined has no native implementation, the
+        library defines it differently, or its parameters cannot be
+        handled natively.
+    """
+    native = _NATIVE_PREDEFINED.get(name)
+    if native is None or predefined.expr != native.expr:
+        return None
+    compare = native.build(rule)
+    if compare is None:
+        return None
+
+    def evaluate(value_a: Any, value_b: Any) -> bool | None:
+        if not (_is_cel_value(value_a) and _is_cel_value(value_b)):
+            return None
+        return compare(value_a, value_b)
+
+    return evaluate
+
+
+def compile_native_column(
+    name: str,
+    predefined: PredefinedComparison,
+    rule: FieldRule,
+) -> NativeColumnComparison | None:
+    """Build the column comparison for a predefined rule.
+
+    Args:
+        name: The predefined's name (rule.predefined).
+        predefined: The predefined as defined in the loaded library.
+        rule: The rule, for its parameters.
+
+    Returns:
+        A callable taking two equal-length sequences of values and returning
+        the native comparison's result for each index-paired value, or None
+        under the same conditions as compile_native_comparison().
+    """
+    compare = compile_native_comparison(name, predefined, rule)
+    if compare is None:
+        return None
+    column = _NATIVE_PREDEFINED[name].column
+    if column is None:
+        return lambda col_a, col_b: list(map(compare, col_a, col_b))
+    return column(rule, compare)
+
+
+def is_reflexive(name: str, predefined: PredefinedComparison) -> bool:
+    """Whether a predefined holds for any value compared with itself.
+
+    True for ignore and the equality predefineds (exact_match,
+    both_null_or_equal, same_nullity, type_match), if the loaded library
+    defines them as built in. Such rules cannot fail on identical values.
+    """
+    native = _NATIVE_PREDEFINED.get(name)
+    return native is not None and native.reflexive and predefined.expr == native.expr
@@ -0,0 +1,297 @@
+"""Rate Limiter - Token buckets for per-target request budgets.
+
+Each target can declare its own `rate_limit` (rate, burst, and per-operation
+overrides) in the runtime config. The executor keeps one TargetRateLimiter per
+target, so each backend runs at its own allowed capacity instead of sharing a
+single global budget.
+
+Buckets are reservation-based: taking a token never blocks while holding the
+lock. A caller that finds the bucket empty still takes its token (the balance
+goes negative) and is told how long to wait. Concurrent callers therefore
+queue up at exactly 1/rate spacing, and the same bucket serves threads
+(acquire) and coroutines (acquire_async).
+
+With `rate_limit.adaptive`, an AdaptiveRateController per bucket adjusts the
+rate from responses (AIMD): multiplicative backoff on 429/503, Retry-After,
+or a p95 latency jump; additive ramp-up after each healthy window.
+
+See DESIGN.md "Per-Target Token-Bucket Rate Limits" and "Adaptive Rate
+Control (AIMD)".
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from threading import Lock
+
+from api_parity.models import AdaptiveRateConfig, ResponseCase, TargetRateLimitConfig
+
+# Status codes treated as "slow down" signals under adaptive control.
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+
+
+class TokenBucket:
+    """Thread-safe token bucket with reservation semantics.
+
+    The bucket starts full, so up to `burst` requests go out immediately;
+    after that, one token is added every 1/rate seconds. burst=1 gives plain
+    fixed-interval spacing.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """Initialize the bucket.
+
+        Args:
+            rate: Sustained tokens (requests) per second. Must be positive.
+            burst: Bucket capacity. Must be at least 1.
+
+        Raises:
+            ValueError: If rate or burst is out of range.
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        if burst < 1:
+            raise ValueError(f"burst must be at least 1, got {burst}")
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = Lock()
+
+    @property
+    def rate(self) -> float:
+        """Sustained tokens per second."""
+        return self._rate
+
+    @property
+    def burst(self) -> int:
+        """Bucket capacity."""
+        return self._burst
+
+    def set_rate(self, rate: float) -> None:
+        """Change the sustained rate; tokens accrued so far are kept.
+
+        Args:
+            rate: New tokens per second. Must be positive.
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        with self._lock:
+            self._refill(time.monotonic())
+            self._rate = rate
+
+    def pause(self, seconds: float) -> None:
+        """Hold back the next token for at least `seconds` (e.g., Retry-After).
+
+        Outstanding reservations keep their place; a deeper existing debt is
+        never reduced.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, 1.0 - seconds * self._rate)
+
+    def _refill(self, now: float) -> None:
+        """Add tokens earned since the last update (caller holds the lock)."""
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(float(self._burst), self._tokens + elapsed * self._rate)
+
+    def reserve(self) -> float:
+        """Take one token and return how long to wait before using it.
+
+        Returns:
+            Seconds the caller must wait before sending (0.0 if a token was
+            available).
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    def acquire(self) -> None:
+        """Take one token, sleeping the calling thread until it is usable."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Take one token, sleeping the calling coroutine until it is usable."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def parse_retry_after(value: str) -> float | None:
+    """Parse a Retry-After header value into seconds.
+
+    Args:
+        value: Either delay-seconds ("120") or an HTTP-date.
+
+    Returns:
+        Seconds to wait (>= 0), or None if the value is not parseable.
+    """
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    if not math.isfinite(seconds):
+        return None
+    return max(0.0, seconds)
+
+
+class AdaptiveRateController:
+    """AIMD controller that tunes one bucket's rate from observed responses.
+
+    Backoff (rate *= decrease_factor, floored at min) happens on a 429/503,
+    and on a window whose p95 latency exceeds the best p95 seen so far by
+    latency_factor. A Retry-After header additionally pauses the bucket.
+    Ramp-up (rate += increase_step, capped at max) happens after each window
+    of `window` responses with no throttling and no latency jump.
+
+    Only responses to requests sent after the latest backoff count toward the
+    next one: requests already in flight at the old rate would otherwise
+    trigger a cascade of backoffs for a single overload event.
+    """
+
+    def __init__(self, bucket: TokenBucket, config: AdaptiveRateConfig) -> None:
+        """Initialize the controller.
+
+        Args:
+            bucket: The bucket whose rate is adjusted.
+            config: Adaptive rate settings. The floor is lowered to the
+                    bucket's starting rate if that is already below it.
+        """
+        self._bucket = bucket
+        self._config = config
+        self._min_rate = min(config.min_requests_per_second, bucket.rate)
+        self._latencies: deque[float] = deque()
+        self._best_p95: float | None = None
+        self._last_backoff = float("-inf")
+        self._lock = Lock()
+
+    def record(self, response: ResponseCase, sent_at: float) -> bool:
+        """Feed one response into the controller.
+
+        Args:
+            response: The response received for a request from this bucket.
+            sent_at: time.perf_counter() when the request was sent.
+
+        Returns:
+            True if the response is a throttling signal (429/503).
+        """
+        with self._lock:
+            if response.status_code in THROTTLE_STATUS_CODES:
+                retry_after_values = response.headers.get("retry-after")
+                if retry_after_values:
+                    retry_after = parse_retry_after(retry_after_values[0])
+                    if retry_after:
+                        self._bucket.pause(retry_after)
+                if sent_at >= self._last_backoff:
+                    self._backoff()
+                return True
+
+            if sent_at < self._last_backoff:
+                return False  # Sent at the old rate; says nothing about the new one
+
+            self._latencies.append(response.elapsed_ms)
+            if len(self._latencies) < self._config.window:
+                return False
+
+            p95 = _percentile(self._latencies, 0.95)
+            self._latencies.clear()
+            if self._best_p95 is not None and p95 > self._best_p95 * self._config.latency_factor:
+                self._backoff()
+                return False
+
+            self._best_p95 = p95 if self._best_p95 is None else min(self._best_p95, p95)
+            rate = self._bucket.rate + self._config.increase_step
+            if self._config.max_requests_per_second is not None:
+                rate = min(rate, self._config.max_requests_per_second)
+            self._bucket.set_rate(rate)
+            return False
+
+    def _backoff(self) -> None:
+        """Cut the rate multiplicatively (caller holds the lock)."""
+        self._bucket.set_rate(max(self._min_rate, self._bucket.rate * self._config.decrease_factor))
+        self._latencies.clear()
+        self._last_backoff = time.perf_counter()
+
+
+def _percentile(values: deque[float], fraction: float) -> float:
+    """Nearest-rank percentile of a non-empty sample."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+class TargetRateLimiter:
+    """Token buckets for one target: a target-wide bucket plus overrides.
+
+    Requests for an operation listed under `operations` draw from that
+    operation's own bucket instead of the target-wide one, so a slow endpoint
+    can be throttled harder (or a cheap one allowed more) without changing the
+    rest of the target's budget. With `adaptive` set, every bucket gets its
+    own AdaptiveRateController.
+    """
+
+    def __init__(self, config: TargetRateLimitConfig) -> None:
+        """Initialize buckets from a target's rate_limit config.
+
+        Args:
+            config: The target's rate limit settings.
+        """
+        self._default = TokenBucket(config.requests_per_second, config.burst)
+        self._operations = {
+            op_id: TokenBucket(op_config.requests_per_second, op_config.burst)
+            for op_id, op_config in config.operations.items()
+        }
+        self._controllers: dict[int, AdaptiveRateController] = {}
+        if config.adaptive is not None:
+            for bucket in (self._default, *self._operations.values()):
+                self._controllers[id(bucket)] = AdaptiveRateController(bucket, config.adaptive)
+
+    @property
+    def adaptive(self) -> bool:
+        """Whether rates are adjusted at runtime."""
+        return bool(self._controllers)
+
+    @property
+    def rate(self) -> float:
+        """Current rate of the target-wide bucket."""
+        return self._default.rate
+
+    def bucket_for(self, operation_id: str) -> TokenBucket:
+        """Return the bucket that governs requests for an operation."""
+        return self._operations.get(operation_id, self._default)
+
+    def record(self, operation_id: str, response: ResponseCase, sent_at: float) -> bool:
+        """Report a response to the operation's controller, if adaptive.
+
+        Args:
+            operation_id: Operation the request belonged to.
+            response: The response received.
+            sent_at: time.perf_counter() when the request was sent.
+
+        Returns:
+            True if the response is a throttling signal. Always False when
+            adaptive control is off, so non-adaptive runs compare 429s as
+            ordinary responses.
+        """
+        controller = self._controllers.get(id(self.bucket_for(operation_id)))
+        if controller is None:
+            return False
+        return controller.record(response, sent_at)
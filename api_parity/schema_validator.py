@@ -146,6 +146,9 @@ class SchemaValidator:
         self._spec_path = spec_path
         self._spec: dict[str, Any] = {}
         self._schema_cache: dict[tuple[str, int], ResponseSchema | None] = {}
+        # One validator per schema: constructing Draft4Validator sets up its
+        # keyword dispatch and $ref resolver, which is wasted work per response.
+        self._validator_cache: dict[tuple[str, int], Draft4Validator] = {}
 
         try:
             with open(spec_path) as f:
@@ -198,10 +201,7 @@ class SchemaValidator:
         extra_fields: list[str] = []
 
         try:
-            # Draft4Validator chosen because OpenAPI 3.0 response schemas closely align
-            # with JSON Schema Draft 4. Using a newer draft would reject valid OpenAPI
-            # schemas that use Draft 4 keywords.
-            validator = Draft4Validator(response_schema.schema)
+            validator = self._get_validator(operation_id, status_code, response_schema)
             errors = list(validator.iter_errors(body))
 
             for error in errors:
@@ -301,6 +301,34 @@ class SchemaValidator:
         self._schema_cache[cache_key] = schema
         return schema
 
+    def _get_validator(
+        self,
+        operation_id: str,
+        status_code: int,
+        response_schema: ResponseSchema,
+    ) -> Draft4Validator:
+        """Get the validator for an operation+status_code's response schema.
+
+        Built on first use and cached alongside the schema.
+
+        Args:
+            operation_id: The operationId the schema belongs to.
+            status_code: The HTTP status code the schema belongs to.
+            response_schema: The schema from _get_response_schema().
+
+        Returns:
+            Draft4Validator for the schema.
+        """
+        cache_key = (operation_id, status_code)
+        validator = self._validator_cache.get(cache_key)
+        if validator is None:
+            # Draft4Validator chosen because OpenAPI 3.0 response schemas closely align
+            # with JSON Schema Draft 4. Using a newer draft would reject valid OpenAPI
+            # schemas that use Draft 4 keywords.
+            validator = Draft4Validator(response_schema.schema)
+            self._validator_cache[cache_key] = validator
+        return validator
+
     def _extract_response_schema(
         self,
         operation_id: str,
@@ -0,0 +1,113 @@
+"""Structural Diff - every differing leaf of two JSON bodies.
+
+Field rules only compare the paths they name, so a regression in a field
+nobody wrote a rule for goes unnoticed. diff_bodies() walks both bodies
+together and reports each place where they differ: a leaf with different
+values, a member or item present on one side only, or a container on one
+side and something else on the other.
+
+The walk is iterative (an explicit stack, so nesting depth is not limited
+by Python's recursion limit). Subtrees that compare equal are skipped
+without visiting their nodes. Locations are the linked tuples of
+jsonpath_accessor, so children share their parent's path and a path string
+is only rendered (concrete_path()) for reported differences.
+
+See DESIGN.md "Structural Body Diff".
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from api_parity.jsonpath_accessor import Location
+
+# Reported for the side where a member or item is missing
+MISSING = "<missing>"
+
+# Marks the missing side during the walk (a body may contain "<missing>")
+_ABSENT = object()
+
+# Parsed JSON bodies cannot contain cycles
+_ENCODER = json.JSONEncoder(check_circular=False)
+
+
+def diff_bodies(
+    body_a: Any,
+    body_b: Any,
+    governed: set[Location] | frozenset[Location] = frozenset(),
+) -> list[tuple[Location, Any, Any]]:
+    """(location, value_a, value_b) for each difference, in document order.
+
+    A member or item missing on one side has MISSING as its value there.
+    Values are equal as CEL's `a == b` sees them: 1 and 1.0 are the same
+    number, true and 1 differ, NaN differs from itself.
+
+    Args:
+        body_a: Parsed JSON body from target A.
+        body_b: Parsed JSON body from target B.
+        governed: Locations whose subtrees are left out (covered by rules).
+
+    Returns:
+        One entry per difference; locations render with concrete_path().
+    """
+    differences: list[tuple[Location, Any, Any]] = []
+    stack: list[tuple[Location, Any, Any]] = [(None, body_a, body_b)]
+    while stack:
+        location, a, b = stack.pop()
+        if governed and location in governed:
+            continue
+        type_a, type_b = type(a), type(b)
+        if type_a is dict and type_b is dict:
+            if _equal_subtrees(a, b):
+                continue
+            children = [((location, key), value, b.get(key, _ABSENT)) for key, value in a.items()]
+            children.extend(
+                ((location, key), _ABSENT, value) for key, value in b.items() if key not in a
+            )
+        elif type_a is list and type_b is list:
+            if _equal_subtrees(a, b):
+                continue
+            common = min(len(a), len(b))
+            children = [((location, i), a[i], b[i]) for i in range(common)]
+            children.extend(((location, i), a[i], _ABSENT) for i in range(common, len(a)))
+            children.extend(((location, i), _ABSENT, b[i]) for i in range(common, len(b)))
+        else:
+            if a is _ABSENT or b is _ABSENT:
+                differences.append(
+                    (location, MISSING if a is _ABSENT else a, MISSING if b is _ABSENT else b)
+                )
+            elif not _same_leaf(a, b):
+                differences.append((location, a, b))
+            continue
+        # Children are popped in document order
+        stack.extend(reversed(children))
+    return differences
+
+
+def _equal_subtrees(a: Any, b: Any) -> bool:
+    """Whether two containers hold the same JSON, checked without walking them.
+
+    Python's == treats true as 1, so equal containers are also serialized:
+    the same JSON text cannot hide a bool/number difference. False if they
+    only differ in key order or 1 vs 1.0 (the walk then finds no leaf to
+    report), or nest too deep for either check.
+    """
+    try:
+        return a == b and _ENCODER.encode(a) == _ENCODER.encode(b)
+    except (RecursionError, TypeError, ValueError):
+        return False
+
+
+def _same_leaf(a: Any, b: Any) -> bool:
+    """CEL `a == b` for values that are not both objects or both lists."""
+    type_a, type_b = type(a), type(b)
+    if type_a is type_b:
+        return a == b
+    # JSON numbers are all CEL doubles; bools are not numbers
+    if type_a in (int, float) and type_b in (int, float):
+        try:
+            return float(a) == float(b)
+        except OverflowError:
+            return a == b
+    return False
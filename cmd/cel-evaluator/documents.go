@@ -0,0 +1,135 @@
+package main
+
+import (
+	"container/list"
+	"fmt"
+	"sync"
+)
+
+// maxDocuments bounds the document store. A client uploads one response pair
+// per comparison and releases it when the comparison is done, so only
+// comparisons in flight hold documents. The cap only matters for a client
+// that never releases; the oldest upload is dropped first.
+const maxDocuments = 64
+
+// documentStore holds uploaded JSON documents by data handle.
+//
+// WHY: a body with many rules used to send each rule's values separately, so
+// a subtree that several rules cover (an object and its fields, every item of
+// an array) was encoded by Python and decoded here once per rule. With the
+// pair uploaded once, items name a path instead and the value is looked up in
+// the already decoded document.
+//
+// Thread safety: documents are never modified after upload, so bound values
+// can be read concurrently; the mutex only guards the map and the upload order.
+type documentStore struct {
+	mu     sync.Mutex
+	docs   map[int64]*list.Element
+	order  *list.List // of *document, oldest upload first
+	nextID int64
+}
+
+// document is one upload: named documents, e.g. "a" and "b".
+type document struct {
+	id    int64
+	roots map[string]any
+}
+
+func newDocumentStore() *documentStore {
+	return &documentStore{docs: make(map[int64]*list.Element), order: list.New()}
+}
+
+// put stores an upload and returns its data handle.
+func (s *documentStore) put(roots map[string]any) int64 {
+	s.mu.Lock()
+	defer s.mu.Unlock()
+	s.nextID++
+	s.docs[s.nextID] = s.order.PushBack(&document{id: s.nextID, roots: roots})
+	for s.order.Len() > maxDocuments {
+		oldest := s.order.Remove(s.order.Front()).(*document)
+		delete(s.docs, oldest.id)
+	}
+	return s.nextID
+}
+
+// release drops an upload. Releasing an unknown handle is a no-op.
+func (s *documentStore) release(id int64) {
+	s.mu.Lock()
+	defer s.mu.Unlock()
+	if elem, ok := s.docs[id]; ok {
+		s.order.Remove(elem)
+		delete(s.docs, id)
+	}
+}
+
+// get returns the named documents of an upload.
+func (s *documentStore) get(id int64) (map[string]any, bool) {
+	s.mu.Lock()
+	defer s.mu.Unlock()
+	elem, ok := s.docs[id]
+	if !ok {
+		return nil, false
+	}
+	return elem.Value.(*document).roots, true
+}
+
+// bind returns data plus each variable in refs bound to the value at its path
+// in upload id. data itself is not modified. On failure, the error message is
+// set: "unknown data handle" if the upload is gone, "unresolvable reference"
+// if a path does not lead to a value.
+func (s *documentStore) bind(id int64, data map[string]any, refs map[string][]any) (map[string]any, string) {
+	roots, ok := s.get(id)
+	if !ok {
+		return nil, fmt.Sprintf("unknown data handle %d", id)
+	}
+	bound := make(map[string]any, len(data)+len(refs))
+	for name, value := range data {
+		bound[name] = value
+	}
+	for name, path := range refs {
+		value, ok := resolve(roots, path)
+		if !ok {
+			return nil, fmt.Sprintf("unresolvable reference for %s: %v", name, path)
+		}
+		bound[name] = value
+	}
+	return bound, ""
+}
+
+// resolve follows path from the named documents: the first segment names a
+// document, then strings select object members and numbers list items.
+func resolve(roots map[string]any, path []any) (any, bool) {
+	if len(path) == 0 {
+		return nil, false
+	}
+	name, ok := path[0].(string)
+	if !ok {
+		return nil, false
+	}
+	value, ok := roots[name]
+	if !ok {
+		return nil, false
+	}
+	for _, segment := range path[1:] {
+		switch key := segment.(type) {
+		case string:
+			object, isObject := value.(map[string]any)
+			if !isObject {
+				return nil, false
+			}
+			if value, ok = object[key]; !ok {
+				return nil, false
+			}
+		case float64:
+			items, isList := value.([]any)
+			index := int(key)
+			if !isList || float64(index) != key || index < 0 || index >= len(items) {
+				return nil, false
+			}
+			value = items[index]
+		default:
+			return nil, false
+		}
+	}
+	return value, true
+}
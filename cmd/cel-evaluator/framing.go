@@ -0,0 +1,104 @@
+package main
+
+import (
+	"bufio"
+	"encoding/binary"
+	"errors"
+	"fmt"
+	"io"
+	"math"
+)
+
+// maxLineSize bounds one NDJSON line: a longer line is a read error, which
+// ends the process. Framed messages are bounded only by their 4 GiB length
+// prefix.
+const maxLineSize = 10 * 1024 * 1024
+
+// frameHeaderSize is the length prefix of a framed message: the size of the
+// JSON that follows, as a big-endian uint32.
+const frameHeaderSize = 4
+
+var errLineTooLong = errors.New("line exceeds 10 MB (use framed messages)")
+
+// messageReader reads requests as NDJSON lines until the client switches to
+// framed messages.
+//
+// WHY: a line has to be scanned for its end, growing and copying a buffer as
+// it goes, so lines are capped. A frame states its size up front; its body is
+// read into a buffer allocated once at exactly that size, which is also the
+// slice handed to the request's goroutine (no copy), whatever the size.
+type messageReader struct {
+	r      *bufio.Reader
+	framed bool
+}
+
+func newMessageReader(r io.Reader) *messageReader {
+	return &messageReader{r: bufio.NewReaderSize(r, 64*1024)}
+}
+
+// next returns the next message, or io.EOF once the input ends cleanly.
+func (m *messageReader) next() ([]byte, error) {
+	if m.framed {
+		return m.readFrame()
+	}
+	return m.readLine()
+}
+
+func (m *messageReader) readFrame() ([]byte, error) {
+	var header [frameHeaderSize]byte
+	if _, err := io.ReadFull(m.r, header[:]); err != nil {
+		if err == io.ErrUnexpectedEOF {
+			return nil, fmt.Errorf("truncated frame header: %w", err)
+		}
+		return nil, err
+	}
+	data := make([]byte, binary.BigEndian.Uint32(header[:]))
+	if _, err := io.ReadFull(m.r, data); err != nil {
+		return nil, fmt.Errorf("truncated frame of %d bytes: %w", len(data), err)
+	}
+	return data, nil
+}
+
+// readLine returns one line without its line ending (as bufio.ScanLines).
+func (m *messageReader) readLine() ([]byte, error) {
+	var line []byte
+	for {
+		chunk, err := m.r.ReadSlice('\n')
+		if len(line)+len(chunk) > maxLineSize+1 {
+			return nil, errLineTooLong
+		}
+		line = append(line, chunk...)
+		switch {
+		case err == bufio.ErrBufferFull:
+			continue
+		case err == io.EOF && len(line) > 0:
+			return dropCR(line), nil
+		case err != nil:
+			return nil, err
+		}
+		return dropCR(line[:len(line)-1]), nil
+	}
+}
+
+func dropCR(line []byte) []byte {
+	if len(line) > 0 && line[len(line)-1] == '\r' {
+		return line[:len(line)-1]
+	}
+	return line
+}
+
+// writeFrame writes data as one framed message to w (with flush).
+func writeFrame(w *bufio.Writer, data []byte) error {
+	if uint64(len(data)) > math.MaxUint32 {
+		return fmt.Errorf("message of %d bytes is too large for a frame", len(data))
+	}
+	var header [frameHeaderSize]byte
+	binary.BigEndian.PutUint32(header[:], uint32(len(data)))
+	if _, err := w.Write(header[:]); err != nil {
+		return err
+	}
+	if _, err := w.Write(data); err != nil {
+		return err
+	}
+	return w.Flush()
+}
@@ -0,0 +1,55 @@
+//go:build cshared
+
+// C entry points for building the evaluator as a shared library:
+//
+//	go build -tags cshared -buildmode=c-shared -o libcelevaluator.so ./cmd/cel-evaluator
+//
+// CelCall takes one request, as a NUL-terminated JSON string in the same
+// format as a protocol line, and returns its response the same way. The
+// caller releases each response with CelFree. Calls may be made from several
+// threads at once; they share one program cache and document store.
+package main
+
+// #include <stdlib.h>
+// #include <string.h>
+import "C"
+
+import (
+	"encoding/json"
+	"fmt"
+	"unsafe"
+)
+
+// libraryState holds the programs and documents shared by every CelCall in the process.
+var libraryState = newState()
+
+// CelCall evaluates one request and returns the JSON response, allocated
+// with malloc. A panic is returned as an error response: in-process, it would
+// otherwise take down the host.
+//
+//export CelCall
+func CelCall(request *C.char) (response *C.char) {
+	defer func() {
+		if r := recover(); r != nil {
+			response = encodeResponse(Response{OK: false, Error: fmt.Sprintf("CEL evaluator panic: %v", r)})
+		}
+	}()
+	line := C.GoBytes(unsafe.Pointer(request), C.int(C.strlen(request)))
+	return encodeResponse(respond(line, libraryState))
+}
+
+// CelFree releases a response returned by CelCall.
+//
+//export CelFree
+func CelFree(response *C.char) {
+	C.free(unsafe.Pointer(response))
+}
+
+// encodeResponse marshals resp into a C string owned by the caller.
+func encodeResponse(resp Response) *C.char {
+	data, err := json.Marshal(resp)
+	if err != nil {
+		data, _ = json.Marshal(Response{ID: resp.ID, OK: false, Error: fmt.Sprintf("failed to encode response: %v", err)})
+	}
+	return C.CString(string(data))
+}
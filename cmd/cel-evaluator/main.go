@@ -4,18 +4,63 @@
 // It uses newline-delimited JSON (NDJSON) for communication.
 //
 // Protocol:
-//   Startup: writes {"ready":true}\n
-//   Request: {"id":"<uuid>","expr":"a == b","data":{"a":1,"b":1}}\n
-//   Response: {"id":"<uuid>","ok":true,"result":true}\n
-//   Error: {"id":"<uuid>","ok":false,"error":"..."}\n
+//   Startup: writes {"ready":true,"pipelined":true,"handles":true,"documents":true,"framed":true}\n
+//   Framing: {"id":"<id>","framed":true}\n as the first request -> {"id":"<id>","ok":true}\n
+//   Request: {"id":"<id>","expr":"a == b","data":{"a":1,"b":1}}\n
+//   Response: {"id":"<id>","ok":true,"result":true}\n
+//   Error: {"id":"<id>","ok":false,"error":"..."}\n
+//   Batch request: {"id":"<id>","batch":[{"expr":"a == b","data":{"a":1,"b":1}},...]}\n
+//   Batch response: {"id":"<id>","ok":true,"results":[{"ok":true,"result":true},{"ok":false,"error":"..."},...]}\n
+//   Register: {"id":"<id>","register":[{"expr":"a == b","vars":["a","b"]},...]}\n
+//   Register response: {"id":"<id>","ok":true,"results":[{"ok":true,"handle":1},{"ok":false,"error":"..."},...]}\n
+//   By handle: {"id":"<id>","handle":1,"data":{...}}\n, or batch items {"handle":1,"data":{...}}
+//   Stats: {"id":"<id>","stats":true}\n
+//   Stats response: {"id":"<id>","ok":true,"stats":{"hits":0,"misses":0,"evictions":0,"size":0}}\n
+//   Upload: {"id":"<id>","upload":{"a":<body>,"b":<body>}}\n -> {"id":"<id>","ok":true,"doc":1}\n
+//   By reference: batch items {"handle":1,"data":{...},"doc":1,"refs":{"a":["a","items",0]}}
+//   Release: {"id":"<id>","release":1}\n -> {"id":"<id>","ok":true}\n
+//
+// A batch carries every evaluation the comparator needs for one response pair,
+// so a wildcard rule over thousands of array elements is one round-trip instead
+// of thousands. Results are returned in item order; one item failing does not
+// fail the others.
+//
+// Handles: register compiles each expression once and returns an integer
+// handle for it; evaluations then send the handle instead of the expression
+// text, and skip building the cache key. A handle stays valid until its
+// program is evicted from the cache; evaluating an evicted handle fails with
+// "unknown program handle", and the client registers the expression again.
+//
+// Documents: upload stores JSON documents (a response pair) once and returns
+// a data handle. Batch items then bind variables to paths into them ("refs":
+// the document name, then member names and list indexes) instead of sending
+// the values, so overlapping subtrees are decoded once (see documents.go).
+//
+// Framing: lines are capped at 10 MB. A client that opens with a "framed"
+// request switches both directions, after the response to it, to messages
+// prefixed with their length (see framing.go), which have no such cap.
+//
+// Library: built with -tags cshared -buildmode=c-shared, the same code is a
+// shared library whose CelCall takes one request and returns its response
+// (see library.go), for callers that evaluate in-process.
+//
+// Pipelining: requests are evaluated concurrently by maxInFlight workers, and
+// each response is written as soon as it is ready. Responses can
+// therefore arrive out of request order; the client matches them by id.
+// "pipelined":true in the ready message tells the client it may send requests
+// without waiting for earlier responses. A client that waits for each
+// response before sending the next sees the same strict ordering as before.
 package main
 
 import (
 	"bufio"
+	"container/list"
 	"context"
 	"encoding/json"
 	"fmt"
+	"io"
 	"os"
+	"runtime"
 	"sort"
 	"strings"
 	"sync"
@@ -25,23 +70,82 @@ import (
 	"github.com/google/cel-go/common/types"
 )
 
-// Request is the JSON structure received from Python.
+// Request is the JSON structure received from Python. Either Expr/Data
+// (single evaluation) or Batch is set.
 type Request struct {
-	ID   string         `json:"id"`
-	Expr string         `json:"expr"`
-	Data map[string]any `json:"data"`
+	ID       string           `json:"id"`
+	Expr     string           `json:"expr"`
+	Handle   int64            `json:"handle,omitempty"`
+	Data     map[string]any   `json:"data"`
+	Batch    []BatchItem      `json:"batch,omitempty"`
+	Register []RegisterItem   `json:"register,omitempty"`
+	Stats    bool             `json:"stats,omitempty"`
+	Doc      int64            `json:"doc,omitempty"`
+	Refs     map[string][]any `json:"refs,omitempty"`
+	Upload   map[string]any   `json:"upload,omitempty"`
+	Release  int64            `json:"release,omitempty"`
+	Framed   bool             `json:"framed,omitempty"`
+}
+
+// BatchItem is one (expression or handle, bindings) pair in a batch request.
+type BatchItem struct {
+	Expr   string           `json:"expr"`
+	Handle int64            `json:"handle,omitempty"`
+	Data   map[string]any   `json:"data"`
+	Doc    int64            `json:"doc,omitempty"`
+	Refs   map[string][]any `json:"refs,omitempty"`
+}
+
+// RegisterItem is one expression to compile, with the variables it may use.
+type RegisterItem struct {
+	Expr string   `json:"expr"`
+	Vars []string `json:"vars"`
 }
 
 // Response is the JSON structure sent back to Python.
 type Response struct {
-	ID     string `json:"id"`
+	ID      string        `json:"id"`
+	OK      bool          `json:"ok"`
+	Result  *bool         `json:"result,omitempty"`
+	Error   string        `json:"error,omitempty"`
+	Results []BatchResult `json:"results,omitempty"`
+	Stats   *CacheStats   `json:"stats,omitempty"`
+	Doc     int64         `json:"doc,omitempty"`
+}
+
+// BatchResult is the outcome of one batch or register item, in the same
+// position as the item.
+type BatchResult struct {
 	OK     bool   `json:"ok"`
 	Result *bool  `json:"result,omitempty"`
+	Handle int64  `json:"handle,omitempty"`
 	Error  string `json:"error,omitempty"`
 }
 
-// evaluationTimeout catches pathological expressions without blocking Python indefinitely
-const evaluationTimeout = 5 * time.Second
+// CacheStats counts program cache lookups since startup. A hit found a
+// compiled program; a miss compiled one (or found its handle evicted).
+type CacheStats struct {
+	Hits      uint64 `json:"hits"`
+	Misses    uint64 `json:"misses"`
+	Evictions uint64 `json:"evictions"`
+	Size      int    `json:"size"`
+}
+
+// evaluationTimeout catches pathological expressions without blocking Python
+// indefinitely. Evaluations past it are interrupted, not abandoned: they run
+// with a context cancelled at the deadline. CEL_EVALUATION_TIMEOUT (a Go
+// duration such as "200ms") overrides it, so tests reach the deadline quickly.
+var evaluationTimeout = timeoutFromEnv("CEL_EVALUATION_TIMEOUT", 5*time.Second)
+
+// interruptCheckFrequency is how many comprehension iterations (all, exists,
+// map, filter) cel-go runs between checks of the evaluation's context.
+const interruptCheckFrequency = 100
+
+// maxInFlight is the number of workers, and so bounds how many requests are
+// evaluated at once. Reading stops while all workers are busy, so a client
+// that sends faster than requests are evaluated is held back by the pipe
+// instead of growing Go's memory.
+var maxInFlight = runtime.NumCPU()
 
 // maxCacheSize bounds the compiled-program cache. In practice, the number of
 // unique (expression, variable-names) pairs in a single run equals the number
@@ -49,7 +153,8 @@ const evaluationTimeout = 5 * time.Second
 // is a safety net, not a performance knob.
 const maxCacheSize = 256
 
-// programCache caches compiled CEL programs keyed by (expression, variable names).
+// programCache caches compiled CEL programs keyed by (expression, variable names),
+// and by the handle assigned to each.
 //
 // WHY: Wildcard JSONPath expansion can produce thousands of evaluations of the
 // same expression with the same variable names (e.g., "a == b" with vars {a, b})
@@ -58,36 +163,94 @@ const maxCacheSize = 256
 // can OOM-kill the process on large responses. With caching, we compile once and
 // call prg.Eval() with different data for subsequent hits.
 //
-// Thread safety: The timeout goroutine in evaluate() means a timed-out goroutine
-// could still be reading the cache while the next request's goroutine writes to it.
-// RWMutex allows concurrent reads (the common case) with exclusive writes.
+// When full, the least recently used program is evicted, so a long run with
+// more than maxCacheSize programs keeps its working set cached.
+//
+// Thread safety: Up to maxInFlight requests are evaluated at once (more through
+// the library, one per calling thread). Every lookup reorders the LRU list, so
+// all access takes the mutex.
 type programCache struct {
-	mu       sync.RWMutex
-	programs map[string]cel.Program
+	mu         sync.Mutex
+	byKey      map[string]*list.Element
+	byHandle   map[int64]*list.Element
+	lru        *list.List // of *cacheEntry, most recently used first
+	nextHandle int64
+	stats      CacheStats
+}
+
+// cacheEntry is one compiled program in the cache.
+type cacheEntry struct {
+	key    string
+	handle int64
+	prg    cel.Program
 }
 
 func newProgramCache() *programCache {
-	return &programCache{programs: make(map[string]cel.Program)}
+	return &programCache{
+		byKey:    make(map[string]*list.Element),
+		byHandle: make(map[int64]*list.Element),
+		lru:      list.New(),
+	}
+}
+
+// get returns the cached program and its handle for key, if present.
+func (c *programCache) get(key string) (cel.Program, int64, bool) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	return c.use(c.byKey[key])
 }
 
-// get returns a cached program and true if found, or nil and false if not.
-func (c *programCache) get(key string) (cel.Program, bool) {
-	c.mu.RLock()
-	defer c.mu.RUnlock()
-	prg, ok := c.programs[key]
+// getHandle returns the program registered under handle, if still cached.
+func (c *programCache) getHandle(handle int64) (cel.Program, bool) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	prg, _, ok := c.use(c.byHandle[handle])
 	return prg, ok
 }
 
-// put stores a compiled program. If the cache is full, the entry is silently
-// dropped — the caller will just recompile next time, which is the same cost
-// as before caching existed.
-func (c *programCache) put(key string, prg cel.Program) {
+// use counts a lookup of elem (nil for a miss) and marks it most recently used.
+// Callers hold c.mu.
+func (c *programCache) use(elem *list.Element) (cel.Program, int64, bool) {
+	if elem == nil {
+		c.stats.Misses++
+		return nil, 0, false
+	}
+	c.stats.Hits++
+	c.lru.MoveToFront(elem)
+	entry := elem.Value.(*cacheEntry)
+	return entry.prg, entry.handle, true
+}
+
+// put stores a compiled program and returns its handle. If another goroutine
+// cached the same key meanwhile, that entry's handle is returned instead. If
+// the cache is full, the least recently used entry is evicted.
+func (c *programCache) put(key string, prg cel.Program) int64 {
 	c.mu.Lock()
 	defer c.mu.Unlock()
-	if len(c.programs) >= maxCacheSize {
-		return
+	if elem, ok := c.byKey[key]; ok {
+		return elem.Value.(*cacheEntry).handle
+	}
+	c.nextHandle++
+	entry := &cacheEntry{key: key, handle: c.nextHandle, prg: prg}
+	elem := c.lru.PushFront(entry)
+	c.byKey[key] = elem
+	c.byHandle[entry.handle] = elem
+	for c.lru.Len() > maxCacheSize {
+		oldest := c.lru.Remove(c.lru.Back()).(*cacheEntry)
+		delete(c.byKey, oldest.key)
+		delete(c.byHandle, oldest.handle)
+		c.stats.Evictions++
 	}
-	c.programs[key] = prg
+	return entry.handle
+}
+
+// snapshot returns the lookup counters and current size.
+func (c *programCache) snapshot() CacheStats {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	stats := c.stats
+	stats.Size = c.lru.Len()
+	return stats
 }
 
 // cacheKey builds a lookup key from expression and sorted variable names.
@@ -100,54 +263,145 @@ func cacheKey(expr string, varNames []string) string {
 	return expr + "\n" + strings.Join(sorted, ",")
 }
 
-func main() {
-	writer := bufio.NewWriter(os.Stdout)
-	reader := bufio.NewScanner(os.Stdin)
-	cache := newProgramCache()
+// state is what requests share: compiled programs and uploaded documents.
+type state struct {
+	programs  *programCache
+	documents *documentStore
+}
 
-	// 10 MB buffer for large API response payloads in "data" field
-	const maxTokenSize = 10 * 1024 * 1024
-	reader.Buffer(make([]byte, 64*1024), maxTokenSize)
+func newState() *state {
+	return &state{programs: newProgramCache(), documents: newDocumentStore()}
+}
+
+func main() {
+	out := &replyWriter{w: bufio.NewWriter(os.Stdout)}
+	reader := newMessageReader(os.Stdin)
+	st := newState()
 
 	// Send ready signal
-	if err := writeJSON(writer, map[string]bool{"ready": true}); err != nil {
+	ready := map[string]bool{"ready": true, "pipelined": true, "handles": true, "documents": true, "framed": true}
+	if err := out.write(ready); err != nil {
 		fmt.Fprintf(os.Stderr, "failed to write ready: %v\n", err)
 		os.Exit(1)
 	}
 
-	// Process requests
-	for reader.Scan() {
-		line := reader.Text()
-		if line == "" {
-			continue
+	// Process requests on a fixed pool of workers. A timed-out evaluation
+	// keeps its worker only until its interrupt is noticed.
+	requests := make(chan []byte)
+	var workers sync.WaitGroup
+	for i := 0; i < maxInFlight; i++ {
+		workers.Add(1)
+		go func() {
+			defer workers.Done()
+			for line := range requests {
+				handle(line, st, out)
+			}
+		}()
+	}
+	first := true
+	var readErr error
+	for {
+		// Each message is a new slice, so it can be handed to a worker
+		line, err := reader.next()
+		if err != nil {
+			readErr = err
+			break
 		}
-
-		var req Request
-		if err := json.Unmarshal([]byte(line), &req); err != nil {
-			// Malformed JSON - send error with empty ID
-			resp := Response{ID: "", OK: false, Error: fmt.Sprintf("invalid JSON: %v", err)}
-			writeJSON(writer, resp)
+		if len(line) == 0 {
 			continue
 		}
-
-		resp := evaluate(req, cache)
-		if err := writeJSON(writer, resp); err != nil {
-			fmt.Fprintf(os.Stderr, "failed to write response for %s: %v\n", req.ID, err)
+		if first {
+			// Framing is negotiated before any other request is in flight
+			first = false
+			if switchFraming(line, reader, out) {
+				continue
+			}
 		}
+
+		requests <- line
 	}
+	close(requests)
+	workers.Wait()
 
-	if err := reader.Err(); err != nil {
-		fmt.Fprintf(os.Stderr, "scanner error: %v\n", err)
+	if readErr != io.EOF {
+		fmt.Fprintf(os.Stderr, "read error: %v\n", readErr)
 		os.Exit(1)
 	}
 }
 
-// writeJSON marshals v to JSON and writes it as a single line to w (with flush).
-func writeJSON(w *bufio.Writer, v any) error {
+// switchFraming answers a "framed" request, then switches reader and out to
+// framed messages. Reports whether line was such a request.
+func switchFraming(line []byte, reader *messageReader, out *replyWriter) bool {
+	var req Request
+	if json.Unmarshal(line, &req) != nil || !req.Framed {
+		return false
+	}
+	if err := out.write(Response{ID: req.ID, OK: true}); err != nil {
+		fmt.Fprintf(os.Stderr, "failed to write response for %s: %v\n", req.ID, err)
+	}
+	reader.framed = true
+	out.framed = true
+	return true
+}
+
+// handle decodes one request line, evaluates it and writes the response.
+func handle(line []byte, st *state, out *replyWriter) {
+	resp := respond(line, st)
+	if err := out.write(resp); err != nil {
+		fmt.Fprintf(os.Stderr, "failed to write response for %s: %v\n", resp.ID, err)
+	}
+}
+
+// respond decodes one request and returns its response. Shared by the
+// subprocess loop and the c-shared library entry point (library.go).
+func respond(line []byte, st *state) Response {
+	var req Request
+	if err := json.Unmarshal(line, &req); err != nil {
+		// Malformed JSON - send error with empty ID
+		return Response{ID: "", OK: false, Error: fmt.Sprintf("invalid JSON: %v", err)}
+	}
+
+	switch {
+	case req.Register != nil:
+		return register(req, st.programs)
+	case req.Stats:
+		stats := st.programs.snapshot()
+		return Response{ID: req.ID, OK: true, Stats: &stats}
+	case req.Upload != nil:
+		return Response{ID: req.ID, OK: true, Doc: st.documents.put(req.Upload)}
+	case req.Release != 0:
+		st.documents.release(req.Release)
+		return Response{ID: req.ID, OK: true}
+	case req.Batch != nil:
+		return evaluateBatch(req, st)
+	default:
+		return evaluate(req, st)
+	}
+}
+
+// replyWriter writes whole responses from concurrent goroutines.
+type replyWriter struct {
+	mu     sync.Mutex
+	w      *bufio.Writer
+	framed bool // set before any request goroutine starts
+}
+
+// write marshals v outside the lock, then writes it as one flushed line or frame.
+func (r *replyWriter) write(v any) error {
 	data, err := json.Marshal(v)
 	if err != nil {
 		return err
 	}
+	r.mu.Lock()
+	defer r.mu.Unlock()
+	if r.framed {
+		return writeFrame(r.w, data)
+	}
+	return writeLine(r.w, data)
+}
+
+// writeLine writes data as a single line to w (with flush).
+func writeLine(w *bufio.Writer, data []byte) error {
 	if _, err := w.Write(data); err != nil {
 		return err
 	}
@@ -157,70 +411,145 @@ func writeJSON(w *bufio.Writer, v any) error {
 	return w.Flush()
 }
 
-// evaluate wraps evaluateSync with a timeout.
-func evaluate(req Request, cache *programCache) Response {
+// evaluate runs evaluateSync with a deadline of evaluationTimeout.
+func evaluate(req Request, st *state) Response {
 	ctx, cancel := context.WithTimeout(context.Background(), evaluationTimeout)
 	defer cancel()
+	return evaluateSync(ctx, req, st)
+}
 
-	resultCh := make(chan Response, 1)
-
-	go func() {
-		resultCh <- evaluateSync(req, cache)
-	}()
+// evaluateBatch evaluates every item of a batch request in order.
+//
+// The whole batch shares one evaluationTimeout deadline, the same budget a
+// single request gets, so Python's per-message timeout still holds. The item
+// running at the deadline is interrupted, and items not started by then are
+// skipped; both get a timeout error. Finished items keep their results.
+func evaluateBatch(req Request, st *state) Response {
+	ctx, cancel := context.WithTimeout(context.Background(), evaluationTimeout)
+	defer cancel()
 
-	select {
-	case <-ctx.Done():
-		return Response{ID: req.ID, OK: false, Error: fmt.Sprintf("CEL evaluation timeout (%v)", evaluationTimeout)}
-	case resp := <-resultCh:
-		return resp
+	results := make([]BatchResult, len(req.Batch))
+	for i, item := range req.Batch {
+		if ctx.Err() != nil {
+			results[i] = BatchResult{OK: false, Error: timeoutError}
+			continue
+		}
+		r := evaluateSync(ctx, Request{ID: req.ID, Expr: item.Expr, Handle: item.Handle, Data: item.Data, Doc: item.Doc, Refs: item.Refs}, st)
+		results[i] = BatchResult{OK: r.OK, Result: r.Result, Error: r.Error}
 	}
+	return Response{ID: req.ID, OK: true, Results: results}
 }
 
-// evaluateSync compiles and runs a CEL expression with the given data.
-// Compiled programs are cached by (expression, variable names) so that wildcard
-// expansions that evaluate the same expression thousands of times only compile once.
-func evaluateSync(req Request, cache *programCache) Response {
-	// Collect variable names for cache key
-	varNames := make([]string, 0, len(req.Data))
-	for key := range req.Data {
-		varNames = append(varNames, key)
+// timeoutError is the error of an evaluation interrupted or skipped at the deadline.
+var timeoutError = fmt.Sprintf("CEL evaluation timeout (%v)", evaluationTimeout)
+
+// timeoutFromEnv returns the duration in environment variable name, or
+// fallback if it is unset or not a positive duration.
+func timeoutFromEnv(name string, fallback time.Duration) time.Duration {
+	value := os.Getenv(name)
+	if value == "" {
+		return fallback
+	}
+	d, err := time.ParseDuration(value)
+	if err != nil || d <= 0 {
+		fmt.Fprintf(os.Stderr, "ignoring %s=%q: not a positive duration\n", name, value)
+		return fallback
 	}
-	key := cacheKey(req.Expr, varNames)
+	return d
+}
 
-	prg, cached := cache.get(key)
-	if !cached {
-		// Cache miss: create environment, compile expression, build program.
-		// DynType for all variables since JSON values can be any type.
-		opts := []cel.EnvOption{
-			cel.DefaultUTCTimeZone(true),
-		}
-		for _, name := range varNames {
-			opts = append(opts, cel.Variable(name, cel.DynType))
+// register compiles each item's expression, caches it, and returns its handle.
+// Expressions already cached return their existing handle without compiling.
+func register(req Request, cache *programCache) Response {
+	results := make([]BatchResult, len(req.Register))
+	for i, item := range req.Register {
+		handle, _, errMsg := cachedProgram(item.Expr, item.Vars, cache)
+		if errMsg != "" {
+			results[i] = BatchResult{OK: false, Error: errMsg}
+		} else {
+			results[i] = BatchResult{OK: true, Handle: handle}
 		}
+	}
+	return Response{ID: req.ID, OK: true, Results: results}
+}
 
-		env, err := cel.NewEnv(opts...)
-		if err != nil {
-			return Response{ID: req.ID, OK: false, Error: fmt.Sprintf("CEL environment creation failed: %v", err)}
-		}
+// cachedProgram returns the program for (expr, varNames) and its handle,
+// compiling and caching it on a miss. On failure, the error message is set.
+func cachedProgram(expr string, varNames []string, cache *programCache) (int64, cel.Program, string) {
+	key := cacheKey(expr, varNames)
+	if prg, handle, ok := cache.get(key); ok {
+		return handle, prg, ""
+	}
 
-		ast, issues := env.Compile(req.Expr)
-		if issues != nil && issues.Err() != nil {
-			return Response{ID: req.ID, OK: false, Error: fmt.Sprintf("CEL compile error in expression %q: %v", req.Expr, issues.Err())}
-		}
+	// Cache miss: create environment, compile expression, build program.
+	// DynType for all variables since JSON values can be any type.
+	opts := []cel.EnvOption{
+		cel.DefaultUTCTimeZone(true),
+	}
+	for _, name := range varNames {
+		opts = append(opts, cel.Variable(name, cel.DynType))
+	}
+
+	env, err := cel.NewEnv(opts...)
+	if err != nil {
+		return 0, nil, fmt.Sprintf("CEL environment creation failed: %v", err)
+	}
 
-		var prgErr error
-		prg, prgErr = env.Program(ast)
-		if prgErr != nil {
-			return Response{ID: req.ID, OK: false, Error: fmt.Sprintf("CEL program creation failed: %v", prgErr)}
+	ast, issues := env.Compile(expr)
+	if issues != nil && issues.Err() != nil {
+		return 0, nil, fmt.Sprintf("CEL compile error in expression %q: %v", expr, issues.Err())
+	}
+
+	// OptOptimize folds constants and precomputes regexes once per program,
+	// which pays off because each program is evaluated many times. The
+	// interrupt check lets ContextEval stop comprehensions at the deadline.
+	prg, err := env.Program(ast, cel.EvalOptions(cel.OptOptimize), cel.InterruptCheckFrequency(interruptCheckFrequency))
+	if err != nil {
+		return 0, nil, fmt.Sprintf("CEL program creation failed: %v", err)
+	}
+
+	return cache.put(key, prg), prg, ""
+}
+
+// evaluateSync runs a CEL expression, or the program registered under
+// req.Handle, with the given data and any variables bound by reference,
+// until ctx is done. Compiled programs are cached by (expression, variable
+// names) so that wildcard expansions that evaluate the same expression
+// thousands of times only compile once.
+func evaluateSync(ctx context.Context, req Request, st *state) Response {
+	data := req.Data
+	if len(req.Refs) > 0 {
+		var errMsg string
+		if data, errMsg = st.documents.bind(req.Doc, req.Data, req.Refs); errMsg != "" {
+			return Response{ID: req.ID, OK: false, Error: errMsg}
 		}
+	}
 
-		cache.put(key, prg)
+	var prg cel.Program
+	if req.Handle != 0 {
+		var ok bool
+		if prg, ok = st.programs.getHandle(req.Handle); !ok {
+			return Response{ID: req.ID, OK: false, Error: fmt.Sprintf("unknown program handle %d", req.Handle)}
+		}
+	} else {
+		// Collect variable names for cache key
+		varNames := make([]string, 0, len(data))
+		for key := range data {
+			varNames = append(varNames, key)
+		}
+		var errMsg string
+		if _, prg, errMsg = cachedProgram(req.Expr, varNames, st.programs); errMsg != "" {
+			return Response{ID: req.ID, OK: false, Error: errMsg}
+		}
 	}
 
 	// cel.Program is stateless and thread-safe per cel-go docs — safe to call
-	// Eval() concurrently on a cached program from multiple timeout goroutines.
-	out, _, err := prg.Eval(req.Data)
+	// ContextEval() concurrently on a cached program from several workers.
+	out, _, err := prg.ContextEval(ctx, data)
 	if err != nil {
+		if ctx.Err() != nil {
+			return Response{ID: req.ID, OK: false, Error: timeoutError}
+		}
 		return Response{ID: req.ID, OK: false, Error: fmt.Sprintf("CEL evaluation error: %v", err)}
 	}
 
@@ -122,6 +122,17 @@ else
     exit 1
 fi
 
+# The shared library build needs cgo (a C compiler). Without it, CEL runs in
+# the subprocess built above.
+info "Building CEL evaluator library (in-process, optional)..."
+
+if go build -tags cshared -buildmode=c-shared -o libcelevaluator.so ./cmd/cel-evaluator 2>/dev/null; then
+    rm -f libcelevaluator.h
+    success "CEL evaluator library built: ./libcelevaluator.so"
+else
+    warn "CEL evaluator library not built (needs cgo); using the subprocess"
+fi
+
 echo ""
 
 # ============================================================================
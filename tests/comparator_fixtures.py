@@ -7,6 +7,7 @@ Integration tests with the real CEL runtime are in tests/integration/test_compar
 import pytest
 from unittest.mock import MagicMock
 
+from api_parity.cel_evaluator import CELEvaluationError, DocumentValue
 from api_parity.comparator import Comparator
 from api_parity.models import ComparisonLibrary, PredefinedComparison
 
@@ -18,10 +19,27 @@ def mock_cel() -> MagicMock:
     The mock returns True by default so tests can focus on Comparator logic
     (rule selection, path matching, mismatch reporting) without CEL evaluation.
     Override mock_cel.evaluate.return_value in individual tests to simulate
-    CEL failures or specific return values.
+    CEL failures or specific return values. evaluate_batch calls evaluate once
+    per item, with DocumentValue bindings replaced by their values, so those
+    overrides and call assertions apply to batched evaluations too.
     """
     cel = MagicMock()
     cel.evaluate = MagicMock(return_value=True)
+
+    def evaluate_batch(items, documents=None):
+        results = []
+        for expr, data in items:
+            data = {
+                name: value.value if isinstance(value, DocumentValue) else value
+                for name, value in data.items()
+            }
+            try:
+                results.append(cel.evaluate(expr, data))
+            except CELEvaluationError as e:
+                results.append(e)
+        return results
+
+    cel.evaluate_batch = MagicMock(side_effect=evaluate_batch)
     return cel
 
 
@@ -0,0 +1,190 @@
+"""Conformance tests: native predefined comparisons agree with CEL.
+
+Every predefined with a native implementation (api_parity/native_comparisons.py)
+is evaluated both natively and by the CEL runtime over every pair drawn from a
+corpus of values. Wherever the native comparison decides (returns a bool), the
+CEL result must be the same bool. Where it defers (None), CEL decides in
+production, so nothing is asserted.
+
+Requires: CEL evaluator binary (go build -o cel-evaluator ./cmd/cel-evaluator)
+"""
+
+import itertools
+import json
+from pathlib import Path
+
+import pytest
+
+from api_parity.cel_evaluator import CELEvaluator
+from api_parity.comparator import Comparator
+from api_parity.models import ComparisonLibrary, FieldRule
+from api_parity.native_comparisons import compile_native_comparison
+
+
+# =============================================================================
+# Skip module if CEL binary not built
+# =============================================================================
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+CEL_BINARY = PROJECT_ROOT / "cel-evaluator"
+pytestmark = pytest.mark.skipif(
+    not CEL_BINARY.exists(),
+    reason="CEL evaluator binary not built. Run: go build -o cel-evaluator ./cmd/cel-evaluator"
+)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture(scope="module")
+def cel_evaluator():
+    """Create a real CEL evaluator that persists across the module."""
+    evaluator = CELEvaluator()
+    yield evaluator
+    evaluator.close()
+
+
+@pytest.fixture(scope="module")
+def comparison_library():
+    """Load the real comparison library."""
+    library_path = PROJECT_ROOT / "prototype" / "comparison-rules" / "comparison_library.json"
+    with open(library_path) as f:
+        data = json.load(f)
+    return ComparisonLibrary.model_validate(data)
+
+
+@pytest.fixture(scope="module")
+def comparator(cel_evaluator, comparison_library):
+    """Comparator used only to expand predefineds exactly as in production."""
+    return Comparator(cel_evaluator, comparison_library)
+
+
+# =============================================================================
+# Corpus
+# =============================================================================
+
+# Values covering each CEL type, numeric edge cases, strings near each format
+# pattern's boundaries (including characters where Python's re and RE2 differ),
+# and containers. Every predefined is checked on all ordered pairs.
+CORPUS = [
+    # Numbers
+    0, -0.0, 1, 1.0, -1, 1.5, -2.25, 3, 4.0, 1000, 1000.5, 1700000000, 1700000004.5,
+    2**53, 2**53 + 1, 2**62, 2**63, -(2**63), 1e300, 5e-324, 10,
+    # Non-numbers
+    True, False, None,
+    # Strings
+    "", "a", "abc", "b", "abé", "日本", "日本語", "\U0001F600", 'say "hi"', "back\\slash",
+    "123e4567-e89b-12d3-a456-426614174000",
+    "123e4567-e89b-42d3-a456-426614174000",
+    "123E4567-E89B-42D3-B456-426614174000",
+    "123e4567-e89b-42d3-c456-426614174000",
+    "123e4567e89b12d3a456426614174000",
+    "123e4567-e89b-42d3-a456-426614174000\n",
+    "https://example.com/x", "http://a", "https://", "ftp://example.com",
+    "https://example.com/ x", "https://example.com/\vx", "https://example.com/x\n",
+    "2024-01-15", "2024-01-15T10:30:00Z", "2024-01-15T10:30", "2024-01-15\n",
+    "２０２４-01-15", "٢٠٢٤-01-15",
+    "aaa.bbb.ccc", "a_-.b.c", "aaa.bbb", "aaa.bbb.ccc.ddd",
+    "SGVsbG8=", "SGVsbG8==", "SGVsbG8===", "=", "ab+/",
+    "00ff", "ABCD", "abc", "0x1f", "ＡＢ",
+    # Lists
+    [], [1], [1.0], [1, 2], [2, 1], [1, 1], [1, 3], ["a", "b"], [None], [[1], {"x": 1}],
+    [{"x": 1.0}, [1]], [True, 1],
+    # Maps
+    {}, {"x": 1}, {"x": 1.0}, {"y": 1}, {"x": 1, "y": 2}, {"y": None, "x": []},
+    {"x": {"z": [1, 2]}}, {"x": {"z": [2, 1]}},
+]
+
+# (predefined, params) pairs: every native predefined, with parameters chosen
+# to fall inside the corpus' value ranges.
+RULES = [
+    ("ignore", {}),
+    ("exact_match", {}),
+    ("numeric_tolerance", {"tolerance": 0.5}),
+    ("numeric_tolerance", {"tolerance": 0}),
+    ("epoch_seconds_tolerance", {"seconds": 5}),
+    ("epoch_millis_tolerance", {"millis": 1000}),
+    ("unordered_array", {}),
+    ("array_length", {}),
+    ("array_nonempty", {}),
+    ("string_contains", {"substring": "b"}),
+    ("string_contains", {"substring": 'say "hi"'}),
+    ("string_contains", {"substring": "\\"}),
+    ("string_contains", {"substring": ""}),
+    ("string_length_match", {}),
+    ("string_nonempty", {}),
+    ("uuid_format", {}),
+    ("uuid_v4_format", {}),
+    ("url_format", {}),
+    ("iso_timestamp_format", {}),
+    ("iso_date_format", {}),
+    ("jwt_format", {}),
+    ("base64_format", {}),
+    ("hex_string", {}),
+    ("both_null", {}),
+    ("both_null_or_equal", {}),
+    ("same_nullity", {}),
+    ("both_boolean", {}),
+    ("type_match", {}),
+    ("both_positive", {}),
+    ("both_non_negative", {}),
+    ("both_integer", {}),
+    ("same_sign", {}),
+    ("both_in_range", {"min": -1, "max": 10}),
+    ("both_in_range", {"min": 1.5, "max": 1000.5}),
+    ("same_keys", {}),
+    ("object_nonempty", {}),
+    ("binary_exact_match", {}),
+    ("binary_length_match", {}),
+    ("binary_nonempty", {}),
+]
+
+
+# =============================================================================
+# Conformance
+# =============================================================================
+
+
+@pytest.mark.parametrize(
+    "name,params", RULES, ids=[f"{name}-{i}" for i, (name, _) in enumerate(RULES)]
+)
+def test_native_agrees_with_cel(comparator, comparison_library, cel_evaluator, name, params):
+    """Native and CEL results agree on every pair the native comparison decides."""
+    rule = FieldRule(predefined=name, **params)
+    native = compile_native_comparison(name, comparison_library.predefined[name], rule)
+    assert native is not None, f"{name} has no native comparison"
+    expr = comparator._expand_predefined(rule)
+
+    decided = []
+    for value_a, value_b in itertools.product(CORPUS, repeat=2):
+        result = native(value_a, value_b)
+        if result is not None:
+            decided.append((value_a, value_b, result))
+
+    cel_results = cel_evaluator.evaluate_batch(
+        [(expr, {"a": value_a, "b": value_b}) for value_a, value_b, _ in decided]
+    )
+
+    disagreements = [
+        (value_a, value_b, expected, actual)
+        for (value_a, value_b, expected), actual in zip(decided, cel_results)
+        if actual is not expected
+    ]
+    assert not disagreements, (
+        f"{name}: native and CEL disagree on {len(disagreements)} pairs, "
+        f"e.g. (a, b, native, cel) = {disagreements[:5]}"
+    )
+
+
+def test_corpus_mostly_decided_natively(comparison_library):
+    """The corpus exercises native decisions, not just deferrals to CEL."""
+    native = compile_native_comparison(
+        "exact_match",
+        comparison_library.predefined["exact_match"],
+        FieldRule(predefined="exact_match"),
+    )
+    pairs = list(itertools.product(CORPUS, repeat=2))
+    decided = sum(native(a, b) is not None for a, b in pairs)
+    assert decided == len(pairs)
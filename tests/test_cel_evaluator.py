@@ -7,13 +7,24 @@ These tests verify:
 4. Subprocess lifecycle management
 
 Requires: CEL evaluator binary (go build -o cel-evaluator ./cmd/cel-evaluator)
+
+The binary is passed explicitly, so the subprocess is tested even when the
+shared library build is present (see tests/test_cel_library.py).
 """
 
+import threading
+import time
 from pathlib import Path
 
 import pytest
 
-from api_parity.cel_evaluator import CELEvaluator, CELEvaluationError, CELSubprocessError
+from api_parity.cel_evaluator import (
+    CELEvaluationError,
+    CELEvaluator,
+    CELEvaluatorPool,
+    CELSubprocessError,
+    DocumentValue,
+)
 
 # Skip entire module if CEL binary not built
 CEL_BINARY = Path(__file__).parent.parent / "cel-evaluator"
@@ -28,19 +39,19 @@ class TestCELEvaluatorBasic:
 
     def test_simple_equality_true(self):
         """Test simple equality that returns true."""
-        with CELEvaluator() as evaluator:
+        with CELEvaluator(CEL_BINARY) as evaluator:
             result = evaluator.evaluate("a == b", {"a": 1, "b": 1})
             assert result is True
 
     def test_simple_equality_false(self):
         """Test simple equality that returns false."""
-        with CELEvaluator() as evaluator:
+        with CELEvaluator(CEL_BINARY) as evaluator:
             result = evaluator.evaluate("a == b", {"a": 1, "b": 2})
             assert result is False
 
     def test_string_equality(self):
         """Test string comparison."""
-        with CELEvaluator() as evaluator:
+        with CELEvaluator(CEL_BINARY) as evaluator:
             result = evaluator.evaluate("a == b", {"a": "hello", "b": "hello"})
             assert result is True
 
@@ -49,13 +60,13 @@ class TestCELEvaluatorBasic:
 
     def test_always_true(self):
         """Test ignore expression (always true)."""
-        with CELEvaluator() as evaluator:
+        with CELEvaluator(CEL_BINARY) as evaluator:
             result = evaluator.evaluate("true", {"a": 1, "b": 99999})
             assert result is True
 
     def test_always_false(self):
         """Test always false expression."""
-        with CELEvaluator() as evaluator:
+        with CELEvaluator(CEL_BINARY) as evaluator:
             result = evaluator.evaluate("false", {"a": 1, "b": 1})
             assert result is False
 
@@ -65,7 +76,7 @@ class TestCELEvaluatorNumeric:
 
     def test_numeric_tolerance_within(self):
         """Test numeric tolerance - values within tolerance."""
-        with CELEvaluator() as evaluator:
+        with CELEvaluator(CEL_BINARY) as evaluator:
             # 1.005 and 1.009 differ by 0.004, which is <= 0.01
             result = evaluator.evaluate(
                 "(a - b) <= 0.01 && (b - a) <= 0.01",
@@ -75,7 +86,7 @@ class TestCELEvaluatorNumeric:
 
     def test_numeric_tolerance_outside(self):
         """Test numeric tolerance - values outside tolerance."""
-        with CELEvaluator() as evaluator:
+        with CELEvaluator(CEL_BINARY) as evaluator:
             # 1.0 and 1.02 differ by 0.02, which is > 0.01
             result = evaluator.evaluate(
                 "(a - b) <= 0.01 && (b - a) <= 0.01",
@@ -85,7 +96,7 @@ class TestCELEvaluatorNumeric:
 
     def test_greater_than(self):
         """Test greater than comparison."""
-        with CELEvaluator() as evaluator:
+        with CELEvaluator(CEL_BINARY) as evaluator:
             result = evaluator.evaluate("a > b", {"a": 10, "b": 5})
             assert result is True
 
@@ -94,7 +105,7 @@ class TestCELEvaluatorNumeric:
 
     def test_range_check(self):
         """Test range check expression."""
-        with CELEvaluator() as evaluator:
+        with CELEvaluator(CEL_BINARY) as evaluator:
             result = evaluator.evaluate(
                 "(a >= 0.0 && a <= 1.0) && (b >= 0.0 && b <= 1.0)",
                 {"a": 0.5, "b": 0.7}
@@ -113,19 +124,19 @@ class TestCELEvaluatorArrays:
 
     def test_array_size_equal(self):
         """Test array size comparison."""
-        with CELEvaluator() as evaluator:
+        with CELEvaluator(CEL_BINARY) as evaluator:
             result = evaluator.evaluate("size(a) == size(b)", {"a": [1, 2, 3], "b": [4, 5, 6]})
             assert result is True
 
     def test_array_size_different(self):
         """Test array size comparison with different sizes."""
-        with CELEvaluator() as evaluator:
+        with CELEvaluator(CEL_BINARY) as evaluator:
             result = evaluator.evaluate("size(a) == size(b)", {"a": [1, 2], "b": [1, 2, 3]})
             assert result is False
 
     def test_unordered_array_match(self):
         """Test unordered array comparison - same elements different order."""
-        with CELEvaluator() as evaluator:
+        with CELEvaluator(CEL_BINARY) as evaluator:
             result = evaluator.evaluate(
                 "size(a) == size(b) && a.all(x, x in b)",
                 {"a": [1, 2, 3], "b": [3, 1, 2]}
@@ -134,7 +145,7 @@ class TestCELEvaluatorArrays:
 
     def test_unordered_array_mismatch(self):
         """Test unordered array comparison - different elements."""
-        with CELEvaluator() as evaluator:
+        with CELEvaluator(CEL_BINARY) as evaluator:
             result = evaluator.evaluate(
                 "size(a) == size(b) && a.all(x, x in b)",
                 {"a": [1, 2, 3], "b": [1, 2, 4]}
@@ -147,7 +158,7 @@ class TestCELEvaluatorStrings:
 
     def test_string_non_empty(self):
         """Test non-empty string check."""
-        with CELEvaluator() as evaluator:
+        with CELEvaluator(CEL_BINARY) as evaluator:
             result = evaluator.evaluate("size(a) > 0 && size(b) > 0", {"a": "abc", "b": "xyz"})
             assert result is True
 
@@ -156,7 +167,7 @@ class TestCELEvaluatorStrings:
 
     def test_string_contains(self):
         """Test string contains check."""
-        with CELEvaluator() as evaluator:
+        with CELEvaluator(CEL_BINARY) as evaluator:
             result = evaluator.evaluate('a.contains("world")', {"a": "hello world"})
             assert result is True
 
@@ -165,7 +176,7 @@ class TestCELEvaluatorStrings:
 
     def test_string_starts_with(self):
         """Test string startsWith check."""
-        with CELEvaluator() as evaluator:
+        with CELEvaluator(CEL_BINARY) as evaluator:
             result = evaluator.evaluate('a.startsWith("hello")', {"a": "hello world"})
             assert result is True
 
@@ -175,39 +186,97 @@ class TestCELEvaluatorErrors:
 
     def test_undefined_variable(self):
         """Test error on undefined variable."""
-        with CELEvaluator() as evaluator:
+        with CELEvaluator(CEL_BINARY) as evaluator:
             with pytest.raises(CELEvaluationError) as exc_info:
                 evaluator.evaluate("undefined_var == 1", {"a": 1})
             assert "undefined_var" in str(exc_info.value).lower() or "undeclared" in str(exc_info.value).lower()
 
     def test_syntax_error(self):
         """Test error on syntax error."""
-        with CELEvaluator() as evaluator:
+        with CELEvaluator(CEL_BINARY) as evaluator:
             with pytest.raises(CELEvaluationError) as exc_info:
                 evaluator.evaluate("a ==", {"a": 1})
             assert "error" in str(exc_info.value).lower() or "syntax" in str(exc_info.value).lower()
 
     def test_type_mismatch(self):
         """Test error on type mismatch in expression."""
-        with CELEvaluator() as evaluator:
+        with CELEvaluator(CEL_BINARY) as evaluator:
             with pytest.raises(CELEvaluationError):
                 # size() on an integer should fail
                 evaluator.evaluate("size(a) > 0", {"a": 123})
 
     def test_non_boolean_result(self):
         """Test error when expression doesn't return boolean."""
-        with CELEvaluator() as evaluator:
+        with CELEvaluator(CEL_BINARY) as evaluator:
             with pytest.raises(CELEvaluationError) as exc_info:
                 evaluator.evaluate("a + b", {"a": 1, "b": 2})
             assert "not boolean" in str(exc_info.value).lower() or "bool" in str(exc_info.value).lower()
 
 
+class TestCELEvaluatorBatch:
+    """Tests for evaluate_batch (many expressions in one round-trip)."""
+
+    def test_results_in_item_order(self):
+        """Each item gets its own result, in the order sent."""
+        with CELEvaluator(CEL_BINARY) as evaluator:
+            results = evaluator.evaluate_batch([
+                ("a == b", {"a": 1, "b": 1}),
+                ("a == b", {"a": 1, "b": 2}),
+                ("true", {"a": "x", "b": "y"}),
+            ])
+            assert results == [True, False, True]
+
+    def test_failing_item_does_not_fail_batch(self):
+        """An invalid expression yields an error entry; other items still evaluate."""
+        with CELEvaluator(CEL_BINARY) as evaluator:
+            results = evaluator.evaluate_batch([
+                ("a == b", {"a": 1, "b": 1}),
+                ("a ==", {"a": 1, "b": 1}),
+                ("a == b", {"a": 2, "b": 3}),
+            ])
+            assert results[0] is True
+            assert isinstance(results[1], CELEvaluationError)
+            assert results[2] is False
+
+    def test_unserializable_item_does_not_fail_batch(self):
+        """NaN data yields an error entry instead of breaking the batch line."""
+        with CELEvaluator(CEL_BINARY) as evaluator:
+            results = evaluator.evaluate_batch([
+                ("a == b", {"a": 1, "b": 1}),
+                ("a == b", {"a": float("nan"), "b": 1}),
+                ("a == b", {"a": 2, "b": 3}),
+            ])
+            assert results[0] is True
+            assert isinstance(results[1], CELEvaluationError)
+            assert results[2] is False
+
+    def test_large_batch_split_into_messages(self):
+        """Batches over MAX_BATCH_BYTES are sent as several messages."""
+        with CELEvaluator(CEL_BINARY) as evaluator:
+            evaluator.MAX_BATCH_BYTES = 200
+            items = [("a == b", {"a": i, "b": i if i % 2 else -1}) for i in range(50)]
+            results = evaluator.evaluate_batch(items)
+            assert results == [bool(i % 2) for i in range(50)]
+
+    def test_batch_after_subprocess_crash(self):
+        """A batch sent to a dead subprocess restarts it and is resent."""
+        import signal
+
+        with CELEvaluator(CEL_BINARY) as evaluator:
+            evaluator._process.send_signal(signal.SIGKILL)
+            evaluator._process.wait(timeout=5)
+
+            results = evaluator.evaluate_batch([("a == b", {"a": 1, "b": 1})])
+            assert results == [True]
+            assert evaluator.is_running
+
+
 class TestCELEvaluatorLifecycle:
     """Tests for subprocess lifecycle."""
 
     def test_context_manager(self):
         """Test using CELEvaluator as context manager."""
-        with CELEvaluator() as evaluator:
+        with CELEvaluator(CEL_BINARY) as evaluator:
             assert evaluator.is_running
             result = evaluator.evaluate("a == b", {"a": 1, "b": 1})
             assert result is True
@@ -216,14 +285,14 @@ class TestCELEvaluatorLifecycle:
 
     def test_explicit_close(self):
         """Test explicit close()."""
-        evaluator = CELEvaluator()
+        evaluator = CELEvaluator(CEL_BINARY)
         assert evaluator.is_running
         evaluator.close()
         assert not evaluator.is_running
 
     def test_multiple_evaluations(self):
         """Test multiple evaluations on same instance."""
-        with CELEvaluator() as evaluator:
+        with CELEvaluator(CEL_BINARY) as evaluator:
             for i in range(10):
                 result = evaluator.evaluate("a == b", {"a": i, "b": i})
                 assert result is True
@@ -238,7 +307,7 @@ class TestCELEvaluatorLifecycle:
         """Test automatic recovery when subprocess is killed."""
         import signal
 
-        evaluator = CELEvaluator()
+        evaluator = CELEvaluator(CEL_BINARY)
         try:
             # Verify initial operation works
             result = evaluator.evaluate("a == b", {"a": 1, "b": 1})
@@ -259,7 +328,7 @@ class TestCELEvaluatorLifecycle:
         """Test that MAX_RESTARTS limit is enforced."""
         import signal
 
-        evaluator = CELEvaluator()
+        evaluator = CELEvaluator(CEL_BINARY)
         try:
             # Kill subprocess MAX_RESTARTS times (with timeout to prevent hanging)
             for i in range(CELEvaluator.MAX_RESTARTS):
@@ -284,20 +353,20 @@ class TestCELEvaluatorPredefinedExpressions:
 
     def test_exact_match(self):
         """Test exact_match predefined."""
-        with CELEvaluator() as evaluator:
+        with CELEvaluator(CEL_BINARY) as evaluator:
             # exact_match expands to "a == b"
             assert evaluator.evaluate("a == b", {"a": 42, "b": 42}) is True
             assert evaluator.evaluate("a == b", {"a": 42, "b": 43}) is False
 
     def test_ignore(self):
         """Test ignore predefined."""
-        with CELEvaluator() as evaluator:
+        with CELEvaluator(CEL_BINARY) as evaluator:
             # ignore expands to "true"
             assert evaluator.evaluate("true", {"a": "anything", "b": "different"}) is True
 
     def test_numeric_tolerance_expression(self):
         """Test numeric_tolerance predefined expression."""
-        with CELEvaluator() as evaluator:
+        with CELEvaluator(CEL_BINARY) as evaluator:
             # numeric_tolerance with tolerance=0.01 expands to:
             # (a - b) <= 0.01 && (b - a) <= 0.01
             expr = "(a - b) <= 0.01 && (b - a) <= 0.01"
@@ -306,7 +375,7 @@ class TestCELEvaluatorPredefinedExpressions:
 
     def test_epoch_seconds_tolerance(self):
         """Test epoch timestamp comparison logic."""
-        with CELEvaluator() as evaluator:
+        with CELEvaluator(CEL_BINARY) as evaluator:
             # epoch_seconds_tolerance with seconds=5 expands to:
             # (a - b) <= 5 && (b - a) <= 5
             expr = "(a - b) <= 5 && (b - a) <= 5"
@@ -315,7 +384,7 @@ class TestCELEvaluatorPredefinedExpressions:
 
     def test_both_integer_expression(self):
         """Test both_integer predefined expression."""
-        with CELEvaluator() as evaluator:
+        with CELEvaluator(CEL_BINARY) as evaluator:
             # both_integer expands to: int(a) == a && int(b) == b
             expr = "int(a) == a && int(b) == b"
             # Both integers should pass
@@ -328,7 +397,7 @@ class TestCELEvaluatorPredefinedExpressions:
 
     def test_same_keys_expression(self):
         """Test same_keys predefined expression with maps."""
-        with CELEvaluator() as evaluator:
+        with CELEvaluator(CEL_BINARY) as evaluator:
             # same_keys expands to: size(a) == size(b) && a.all(k, k in b)
             expr = "size(a) == size(b) && a.all(k, k in b)"
             # Same keys should pass
@@ -353,7 +422,7 @@ class TestCELEvaluatorComplexData:
 
     def test_nested_object_access(self):
         """Test accessing nested object fields."""
-        with CELEvaluator() as evaluator:
+        with CELEvaluator(CEL_BINARY) as evaluator:
             data = {
                 "a": {"name": "Alice", "age": 30},
                 "b": {"name": "Alice", "age": 30}
@@ -363,7 +432,7 @@ class TestCELEvaluatorComplexData:
 
     def test_array_of_objects(self):
         """Test with array of objects."""
-        with CELEvaluator() as evaluator:
+        with CELEvaluator(CEL_BINARY) as evaluator:
             data = {
                 "items": [{"id": 1}, {"id": 2}, {"id": 3}]
             }
@@ -372,7 +441,7 @@ class TestCELEvaluatorComplexData:
 
     def test_mixed_types(self):
         """Test with various data types."""
-        with CELEvaluator() as evaluator:
+        with CELEvaluator(CEL_BINARY) as evaluator:
             data = {
                 "str_val": "hello",
                 "int_val": 42,
@@ -388,6 +457,189 @@ class TestCELEvaluatorComplexData:
             assert result is True
 
 
+class TestCELEvaluatorPipelined:
+    """Tests for the pipelined protocol."""
+
+    def test_binary_advertises_pipelining(self):
+        with CELEvaluator(CEL_BINARY) as evaluator:
+            assert evaluator.pipelined is True
+
+    def test_batch_split_into_pipelined_messages(self):
+        """Batches larger than PIPELINE_BATCH_ITEMS keep item order."""
+        count = CELEvaluator.PIPELINE_BATCH_ITEMS * 3 + 7
+        items = [("a == b", {"a": i, "b": i % 5}) for i in range(count)]
+        with CELEvaluator(CEL_BINARY) as evaluator:
+            results = evaluator.evaluate_batch(items)
+        assert results == [i == i % 5 for i in range(count)]
+
+    def test_concurrent_callers_share_subprocess(self):
+        """Evaluations from several threads all get their own results."""
+        errors = []
+
+        def worker(evaluator, n):
+            for i in range(50):
+                value = n * 100 + i
+                try:
+                    if evaluator.evaluate("a + 1 == b", {"a": value, "b": value + 1}) is not True:
+                        errors.append((n, i))
+                except Exception as e:
+                    errors.append((n, i, e))
+
+        with CELEvaluator(CEL_BINARY) as evaluator:
+            threads = [threading.Thread(target=worker, args=(evaluator, n)) for n in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert errors == []
+
+
+class TestCELEvaluatorHandles:
+    """Tests for registered programs and the program cache."""
+
+    def test_program_compiled_once(self):
+        with CELEvaluator(CEL_BINARY) as evaluator:
+            assert evaluator.evaluate_batch([("a == b", {"a": 1, "b": 1})] * 10) == [True] * 10
+            assert evaluator.evaluate("a == b", {"a": 1, "b": 2}) is False
+            stats = evaluator.cache_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 11
+        assert stats["size"] == 1
+
+    def test_compile_error_per_item(self):
+        with CELEvaluator(CEL_BINARY) as evaluator:
+            results = evaluator.evaluate_batch([("a ==", {"a": 1}), ("a == b", {"a": 1, "b": 1})])
+        assert isinstance(results[0], CELEvaluationError)
+        assert "compile" in str(results[0]).lower()
+        assert results[1] is True
+
+    def test_full_cache_evicts_least_recently_used(self):
+        """More programs than the cache holds still evaluate correctly."""
+        items = [("a == b", {"a": i, "b": i, f"v{i}": 0}) for i in range(300)]
+        with CELEvaluator(CEL_BINARY) as evaluator:
+            assert evaluator.evaluate_batch(items) == [True] * 300
+            assert evaluator.evaluate_batch(items) == [True] * 300
+            stats = evaluator.cache_stats()
+        assert stats["evictions"] > 0
+        assert stats["size"] == 256
+
+
+class TestCELEvaluatorFraming:
+    """Tests for length-prefixed messages."""
+
+    def test_binding_over_line_limit(self):
+        """A binding larger than the 10 MB NDJSON line limit evaluates."""
+        large = "x" * (11 * 1024 * 1024)
+        with CELEvaluator(CEL_BINARY) as evaluator:
+            assert evaluator._framed is True
+            assert evaluator.evaluate("a == b", {"a": large, "b": large}) is True
+            assert evaluator._restart_count == 0
+
+
+class TestCELEvaluatorDocuments:
+    """Tests for bindings resolved in uploaded documents."""
+
+    DOCUMENTS = {"a": {"items": [{"n": 1}, {"n": 2}]}, "b": {"items": [{"n": 1}, {"n": 3}]}}
+
+    def test_references_resolved(self):
+        """Bindings take the value at their path (the values passed here are placeholders)."""
+        items = [
+            ("a == b", {"a": DocumentValue("a", ("items", i), None), "b": DocumentValue("b", ("items", i), None)})
+            for i in range(2)
+        ]
+        with CELEvaluator(CEL_BINARY) as evaluator:
+            assert evaluator.evaluate_batch(items, documents=self.DOCUMENTS) == [True, False]
+
+    def test_unresolvable_reference_sent_by_value(self):
+        items = [("a == b", {"a": DocumentValue("a", ("items", 0, "n", 0), 1), "b": 1})]
+        with CELEvaluator(CEL_BINARY) as evaluator:
+            assert evaluator.evaluate_batch(items, documents=self.DOCUMENTS) == [True]
+
+
+class TestCELEvaluatorInterrupt:
+    """Tests for evaluations interrupted at the Go-side deadline."""
+
+    # Billions of iterations: runs far past any deadline unless interrupted
+    RUNAWAY = "a.all(x, a.all(y, x + y >= 0))"
+
+    def test_runaway_batch_item_interrupted(self, monkeypatch):
+        """The item at the deadline and those after it time out, and the worker is freed."""
+        monkeypatch.setenv("CEL_EVALUATION_TIMEOUT", "200ms")
+        items = [
+            (self.RUNAWAY, {"a": list(range(50000))}),
+            ("a == b", {"a": 1, "b": 1}),
+            ("a == b", {"a": 1, "b": 2}),
+        ]
+        with CELEvaluator(CEL_BINARY) as evaluator:
+            results = evaluator.evaluate_batch(items)
+            assert all(isinstance(result, CELEvaluationError) for result in results)
+            assert str(results[0]) == "CEL evaluation timeout (200ms)"
+            assert str(results[1]) == str(results[2]) == str(results[0])
+
+            start = time.monotonic()
+            assert evaluator.evaluate("a == b", {"a": 1, "b": 1}) is True
+            assert time.monotonic() - start < 1.0
+
+
+class TestCELEvaluatorPool:
+    """Tests for the pool of evaluator subprocesses."""
+
+    def test_evaluate(self):
+        """Single evaluations work like CELEvaluator's."""
+        with CELEvaluatorPool(size=2) as pool:
+            assert pool.evaluate("a == b", {"a": 1, "b": 1}) is True
+            with pytest.raises(CELEvaluationError):
+                pool.evaluate("a ==", {"a": 1})
+
+    def test_split_batch_keeps_item_order(self):
+        """A batch split across subprocesses returns results in item order."""
+        count = 3 * CELEvaluatorPool.MIN_SPLIT_ITEMS
+        items = [("a == b", {"a": i, "b": i % 3}) for i in range(count)]
+        with CELEvaluatorPool(size=3) as pool:
+            results = pool.evaluate_batch(items)
+        assert results == [i == i % 3 for i in range(count)]
+
+    def test_concurrent_callers(self):
+        """Evaluations from several threads all get their own results."""
+        errors = []
+
+        def worker(pool, n):
+            for i in range(50):
+                value = n * 100 + i
+                try:
+                    if pool.evaluate("a + 1 == b", {"a": value, "b": value + 1}) is not True:
+                        errors.append((n, i))
+                except Exception as e:
+                    errors.append((n, i, e))
+
+        with CELEvaluatorPool(size=2) as pool:
+            threads = [threading.Thread(target=worker, args=(pool, n)) for n in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert errors == []
+
+    def test_restarts_share_max_restarts(self):
+        """Crashes of any member count against one MAX_RESTARTS budget."""
+        import signal
+
+        with CELEvaluatorPool(size=2) as pool:
+            pool.evaluate("a == b", {"a": 1, "b": 1})
+            for i in range(CELEvaluatorPool.MAX_RESTARTS):
+                member = pool._members[i % 2]
+                member._process.send_signal(signal.SIGKILL)
+                member._process.wait(timeout=5)
+                assert member.evaluate("a == b", {"a": 1, "b": 1}) is True
+
+            member = pool._members[0]
+            member._process.send_signal(signal.SIGKILL)
+            member._process.wait(timeout=5)
+            with pytest.raises(CELSubprocessError) as exc_info:
+                member.evaluate("a == b", {"a": 1, "b": 1})
+            assert "crashed" in str(exc_info.value).lower()
+
+
 class TestCELEvaluatorCleanup:
     """Tests for subprocess cleanup behavior (no binary required)."""
 
@@ -0,0 +1,84 @@
+"""Unit tests for CELEvaluatorPool dispatch.
+
+Members are replaced by fakes, so no CEL binary is needed. Evaluation
+through real subprocesses is tested in tests/test_cel_evaluator.py.
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from api_parity.cel_evaluator import CELEvaluatorPool, CELSubprocessError
+
+
+class TestCELEvaluatorPoolDispatch:
+    """Tests for how the pool spreads evaluations over its members."""
+
+    class FakeMember:
+        """Records what it evaluates instead of running a subprocess."""
+
+        def __init__(self, pool, binary_path):
+            self.lock = threading.Lock()
+            self.in_flight = 0
+            self.batches = []
+
+        def evaluate(self, expression, data):
+            self.batches.append(1)
+            return True
+
+        def evaluate_batch(self, items, documents=None):
+            self.batches.append(len(items))
+            return [data["a"] for _, data in items]
+
+        def close(self):
+            pass
+
+    def make_pool(self, size):
+        with patch("api_parity.cel_evaluator._PoolMember", self.FakeMember):
+            return CELEvaluatorPool(size=size, binary_path="unused")
+
+    def test_small_batch_goes_to_one_member(self):
+        """Batches below the split threshold are not split."""
+        pool = self.make_pool(3)
+        try:
+            items = [("a", {"a": i}) for i in range(CELEvaluatorPool.MIN_SPLIT_ITEMS)]
+            assert pool.evaluate_batch(items) == list(range(len(items)))
+            assert sorted(len(m.batches) for m in pool._members) == [0, 0, 1]
+        finally:
+            pool.close()
+
+    def test_large_batch_split_in_order(self):
+        """Large batches are split into contiguous parts, one per member."""
+        pool = self.make_pool(3)
+        try:
+            items = [("a", {"a": i}) for i in range(2560)]
+            assert pool.evaluate_batch(items) == list(range(len(items)))
+            parts = [size for member in pool._members for size in member.batches]
+            assert sorted(parts) == [852, 854, 854]
+        finally:
+            pool.close()
+
+    def test_least_busy_member_chosen(self):
+        """An evaluation goes to the member with the fewest evaluations in flight."""
+        pool = self.make_pool(3)
+        try:
+            pool._members[0].in_flight = 2
+            pool._members[1].in_flight = 1
+            pool._members[2].in_flight = 1
+            pool.evaluate("a", {"a": 1})
+            assert [len(m.batches) for m in pool._members] == [0, 1, 0]
+        finally:
+            pool.close()
+
+    def test_invalid_size(self):
+        """A pool needs at least one member."""
+        with pytest.raises(ValueError):
+            CELEvaluatorPool(size=0, binary_path="unused")
+
+    def test_closed_pool_raises(self):
+        """Evaluating after close() is a subprocess error, as for CELEvaluator."""
+        pool = self.make_pool(1)
+        pool.close()
+        with pytest.raises(CELSubprocessError):
+            pool.evaluate("a", {"a": 1})
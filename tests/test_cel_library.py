@@ -0,0 +1,91 @@
+"""Tests for evaluating CEL in-process with the shared library build.
+
+Requires: go build -tags cshared -buildmode=c-shared -o libcelevaluator.so ./cmd/cel-evaluator
+(libcelevaluator.dylib on macOS). Tests of choosing between the library and
+the subprocess need neither.
+"""
+
+import threading
+
+import pytest
+
+from api_parity.cel_evaluator import CELEvaluationError, CELEvaluator, CELSubprocessError
+
+CEL_LIBRARY = CELEvaluator.DEFAULT_LIBRARY_PATH
+requires_library = pytest.mark.skipif(
+    not CEL_LIBRARY.exists(),
+    reason="CEL evaluator library not built. Run: "
+    "go build -tags cshared -buildmode=c-shared -o libcelevaluator.so ./cmd/cel-evaluator",
+)
+
+
+@requires_library
+class TestInProcessEvaluation:
+    """Tests for evaluation through the shared library."""
+
+    def test_default_uses_library(self):
+        with CELEvaluator() as evaluator:
+            assert evaluator.in_process
+            assert evaluator.evaluate("a == b", {"a": 1, "b": 1}) is True
+
+    def test_evaluation_error(self):
+        with CELEvaluator(library_path=CEL_LIBRARY) as evaluator:
+            with pytest.raises(CELEvaluationError):
+                evaluator.evaluate("a ==", {"a": 1})
+
+    def test_large_batch_keeps_item_order(self):
+        count = CELEvaluator.PIPELINE_BATCH_ITEMS * 4 + 3
+        items = [("a == b", {"a": i, "b": i % 4}) for i in range(count)]
+        with CELEvaluator(library_path=CEL_LIBRARY) as evaluator:
+            assert evaluator.evaluate_batch(items) == [i == i % 4 for i in range(count)]
+
+    def test_concurrent_callers(self):
+        errors = []
+
+        def worker(evaluator, n):
+            for i in range(50):
+                try:
+                    if evaluator.evaluate("a == b", {"a": n, "b": i % 2 and n}) is not bool(i % 2):
+                        errors.append((n, i))
+                except Exception as e:
+                    errors.append((n, i, e))
+
+        with CELEvaluator(library_path=CEL_LIBRARY) as evaluator:
+            threads = [threading.Thread(target=worker, args=(evaluator, n)) for n in range(1, 5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert errors == []
+
+    def test_closed_evaluator_raises(self):
+        evaluator = CELEvaluator(library_path=CEL_LIBRARY)
+        assert evaluator.is_running
+        evaluator.close()
+        assert not evaluator.is_running
+        with pytest.raises(CELSubprocessError):
+            evaluator.evaluate("a == b", {"a": 1, "b": 1})
+
+
+class TestLibrarySelection:
+    """Tests for choosing between the library and the subprocess (no build required)."""
+
+    def test_missing_library_path_raises(self, tmp_path):
+        with pytest.raises(CELSubprocessError) as exc_info:
+            CELEvaluator(library_path=tmp_path / "libcelevaluator.so")
+        assert "not found" in str(exc_info.value)
+
+    def test_unloadable_library_raises(self, tmp_path):
+        library = tmp_path / "libcelevaluator.so"
+        library.write_text("not a shared library")
+        with pytest.raises(CELSubprocessError) as exc_info:
+            CELEvaluator(library_path=library)
+        assert "Cannot load" in str(exc_info.value)
+
+    def test_subprocess_without_library(self, tmp_path, monkeypatch):
+        """Without the library, the default is the subprocess binary."""
+        monkeypatch.setattr(CELEvaluator, "DEFAULT_LIBRARY_PATH", tmp_path / "missing.so")
+        monkeypatch.setattr(CELEvaluator, "DEFAULT_BINARY_PATH", tmp_path / "cel-evaluator")
+        with pytest.raises(CELSubprocessError) as exc_info:
+            CELEvaluator()
+        assert "binary not found" in str(exc_info.value)
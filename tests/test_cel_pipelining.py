@@ -0,0 +1,292 @@
+"""Unit tests for the pipelined, handle and document CEL protocol on the Python side.
+
+A small Python script stands in for the Go binary, so no CEL binary is
+needed. It evaluates only `a == b`, and can answer out of order, exit
+mid-run, keep just one registered program, resolve references into
+uploaded documents, or switch to length-prefixed messages. Evaluation through the real binary is tested in
+tests/test_cel_evaluator.py.
+"""
+
+import io
+import sys
+
+import pytest
+
+from api_parity.cel_evaluator import CELEvaluator, DocumentValue, _PendingReplies, _write_messages
+
+FAKE_EVALUATOR = """\
+#!{python}
+import json, os, sys
+
+PIPELINED = {pipelined}
+HANDLES = {handles}
+DOCUMENTS = {documents}
+FRAMED = {framed}
+DIE_MARKER = {die_marker!r}
+
+framed = False
+
+def receive():
+    if not framed:
+        return sys.stdin.buffer.readline()
+    header = sys.stdin.buffer.read(4)
+    return sys.stdin.buffer.read(int.from_bytes(header, "big")) if len(header) == 4 else b""
+
+def send(message):
+    data = json.dumps(message).encode()
+    sys.stdout.buffer.write(len(data).to_bytes(4, "big") + data if framed else data + b"\\n")
+    sys.stdout.buffer.flush()
+
+send({{"ready": True, "pipelined": PIPELINED, "handles": HANDLES, "documents": DOCUMENTS,
+       "framed": FRAMED}})
+
+# Only the last registered program is kept; registering evicts the others
+programs = {{}}
+next_handle = 0
+
+documents = {{}}
+
+def bind(item):
+    data = dict(item["data"])
+    for name, path in item.get("refs", {{}}).items():
+        if item["doc"] not in documents:
+            raise LookupError("unknown data handle %d" % item["doc"])
+        value = documents[item["doc"]]
+        try:
+            for segment in path:
+                value = value[segment]
+        except (KeyError, IndexError, TypeError):
+            raise LookupError("unresolvable reference for %s" % name)
+        data[name] = value
+    return data
+
+def evaluate(item):
+    if "handle" in item and item["handle"] not in programs:
+        return {{"ok": False, "error": "unknown program handle %d" % item["handle"]}}
+    try:
+        data = bind(item)
+    except LookupError as e:
+        return {{"ok": False, "error": str(e)}}
+    return {{"ok": True, "result": data["a"] == data["b"]}}
+
+def register(item):
+    global next_handle
+    next_handle += 1
+    programs.clear()
+    programs[next_handle] = item["expr"]
+    return {{"ok": True, "handle": next_handle}}
+
+def reply(request):
+    if "upload" in request:
+        documents[len(documents) + 1] = request["upload"]
+        return {{"id": request["id"], "ok": True, "doc": len(documents)}}
+    if "release" in request:
+        documents.pop(request["release"])
+        return {{"id": request["id"], "ok": True}}
+    if "register" in request:
+        return {{"id": request["id"], "ok": True,
+                 "results": [register(item) for item in request["register"]]}}
+    if "batch" in request:
+        return {{"id": request["id"], "ok": True,
+                 "results": [evaluate(item) for item in request["batch"]]}}
+    return dict(evaluate(request), id=request["id"])
+
+held = None
+while line := receive():
+    request = json.loads(line)
+    if request.get("framed"):
+        send({{"id": request["id"], "ok": True}})
+        framed = True
+        continue
+    items = request.get("batch") or request.get("register") or [request]
+    if any(item.get("expr") == "die" for item in items) and not os.path.exists(DIE_MARKER):
+        open(DIE_MARKER, "w").close()
+        sys.exit(1)
+    if PIPELINED and held is None and request["id"] == "1":
+        # Hold the first request back, so it is answered after the second
+        held = request
+        continue
+    send(reply(request))
+    if held is not None:
+        send(reply(held))
+        held = False
+"""
+
+
+@pytest.fixture
+def fake_binary(tmp_path):
+    """Write a fake evaluator; returns a factory taking pipelined=True/False."""
+
+    def make(pipelined=True, handles=False, documents=False, framed=False):
+        path = tmp_path / "cel-evaluator"
+        path.write_text(
+            FAKE_EVALUATOR.format(
+                python=sys.executable,
+                pipelined="True" if pipelined else "False",
+                handles="True" if handles else "False",
+                documents="True" if documents else "False",
+                framed="True" if framed else "False",
+                die_marker=str(tmp_path / "died"),
+            )
+        )
+        path.chmod(0o755)
+        return path
+
+    return make
+
+
+class TestPipelinedExchange:
+    """Tests for request/response matching over a pipelined subprocess."""
+
+    def test_ready_message_enables_pipelining(self, fake_binary):
+        with CELEvaluator(fake_binary(pipelined=True)) as evaluator:
+            assert evaluator.pipelined is True
+        with CELEvaluator(fake_binary(pipelined=False)) as evaluator:
+            assert evaluator.pipelined is False
+
+    def test_out_of_order_responses_matched_by_id(self, fake_binary, monkeypatch):
+        """Responses arriving in another order still land on their own items."""
+        monkeypatch.setattr(CELEvaluator, "PIPELINE_BATCH_ITEMS", 2)
+        items = [("a == b", {"a": i, "b": i % 2}) for i in range(5)]
+        with CELEvaluator(fake_binary()) as evaluator:
+            assert evaluator.evaluate_batch(items) == [i == i % 2 for i in range(5)]
+            assert evaluator.evaluate("a == b", {"a": 1, "b": 1}) is True
+
+    def test_unanswered_messages_resent_after_crash(self, fake_binary, monkeypatch):
+        """Messages the dead subprocess did not answer are sent to its replacement."""
+        monkeypatch.setattr(CELEvaluator, "PIPELINE_BATCH_ITEMS", 2)
+        items = [("a == b", {"a": 1, "b": 1})] * 3 + [("die", {"a": 1, "b": 2})]
+        with CELEvaluator(fake_binary()) as evaluator:
+            assert evaluator.evaluate_batch(items) == [True, True, True, False]
+            assert evaluator._restart_count == 1
+
+    def test_unpipelined_binary_still_supported(self, fake_binary):
+        """Binaries without "pipelined" get one request at a time."""
+        items = [("a == b", {"a": i, "b": 2}) for i in range(4)]
+        with CELEvaluator(fake_binary(pipelined=False)) as evaluator:
+            assert evaluator.evaluate_batch(items) == [False, False, True, False]
+
+
+class TestHandles:
+    """Tests for evaluating registered programs by handle."""
+
+    def test_registered_once_per_program(self, fake_binary):
+        with CELEvaluator(fake_binary(pipelined=False, handles=True)) as evaluator:
+            assert evaluator.evaluate_batch([("a == b", {"a": 1, "b": 1})] * 3) == [True] * 3
+            assert evaluator.evaluate("a == b", {"b": 2, "a": 1}) is False
+            assert list(evaluator._handles) == [("a == b", ("a", "b")), ("a == b", ("b", "a"))]
+
+    def test_evicted_handle_falls_back_to_expression(self, fake_binary):
+        """Items whose program was evicted still get their result, and are re-registered."""
+        items = [("a == b", {"a": 1, "b": 1}), ("a == b", {"a": 1, "b": 2, "c": 0})]
+        with CELEvaluator(fake_binary(pipelined=False, handles=True)) as evaluator:
+            assert evaluator.evaluate_batch(items) == [True, False]
+            assert list(evaluator._handles) == [("a == b", ("a", "b", "c"))]
+
+    def test_handles_not_resent_to_new_subprocess(self, fake_binary):
+        """After a crash, items are resent by expression, not by a stale handle."""
+        items = [("a == b", {"a": 1, "b": 1}), ("die", {"a": 1, "b": 2})]
+        with CELEvaluator(fake_binary(pipelined=False, handles=True)) as evaluator:
+            evaluator.evaluate("a == b", {"a": 1, "b": 1})
+            generation = evaluator._generation
+            assert evaluator.evaluate_batch(items) == [True, False]
+            assert evaluator._generation == generation + 1
+
+
+class TestDocuments:
+    """Tests for bindings sent as references into uploaded documents.
+
+    Each DocumentValue below carries a value that differs from the one at
+    its path, so results show which of the two was evaluated.
+    """
+
+    DOCUMENTS = {"a": {"items": [1, 2]}, "b": {"items": [1, 3]}}
+
+    def test_bindings_resolved_in_documents(self, fake_binary):
+        items = [
+            ("a == b", {"a": DocumentValue("a", ("items", i), "sent"), "b": DocumentValue("b", ("items", i), 0)})
+            for i in range(2)
+        ]
+        binary = fake_binary(pipelined=False, handles=True, documents=True)
+        with CELEvaluator(binary) as evaluator:
+            assert evaluator.evaluate_batch(items, documents=self.DOCUMENTS) == [True, False]
+
+    def test_unresolvable_reference_sent_by_value(self, fake_binary):
+        """A path the document does not have falls back to the binding's value."""
+        items = [("a == b", {"a": DocumentValue("a", ("items", 5), 7), "b": 7})]
+        binary = fake_binary(pipelined=False, handles=True, documents=True)
+        with CELEvaluator(binary) as evaluator:
+            assert evaluator.evaluate_batch(items, documents=self.DOCUMENTS) == [True]
+
+    def test_values_sent_without_document_support(self, fake_binary):
+        items = [("a == b", {"a": DocumentValue("a", ("items", 0), 0), "b": 0})]
+        with CELEvaluator(fake_binary(pipelined=False, handles=True)) as evaluator:
+            assert evaluator.evaluate_batch(items, documents=self.DOCUMENTS) == [True]
+
+    def test_upload_released(self, fake_binary):
+        """Each batch releases its upload (the fake numbers uploads by how many it holds)."""
+        items = [("a == b", {"a": DocumentValue("a", ("items", 0), 0), "b": 1})]
+        binary = fake_binary(pipelined=False, handles=True, documents=True)
+        with CELEvaluator(binary) as evaluator:
+            for _ in range(2):
+                assert evaluator.evaluate_batch(items, documents=self.DOCUMENTS) == [True]
+            assert evaluator._upload(self.DOCUMENTS, evaluator._generation) == 1
+
+
+class TestFraming:
+    """Tests for length-prefixed messages, negotiated after the ready message."""
+
+    LARGE = "x" * (11 * 1024 * 1024)
+
+    @pytest.mark.parametrize("pipelined", [True, False])
+    def test_large_binding_in_frames(self, fake_binary, pipelined):
+        """A message over the 10 MB line limit is sent whole."""
+        with CELEvaluator(fake_binary(pipelined=pipelined, framed=True)) as evaluator:
+            assert evaluator._framed is True
+            assert evaluator.evaluate("a == b", {"a": self.LARGE, "b": self.LARGE}) is True
+            assert evaluator.evaluate_batch([("a == b", {"a": 1, "b": 2})] * 3) == [False] * 3
+
+    def test_message_parts_written_as_one_frame(self):
+        stream = io.BytesIO()
+        _write_messages(stream, [[b'{"id":"1",', b'"data":', b"[1]}"]], framed=True)
+        assert stream.getvalue() == b'\x00\x00\x00\x15{"id":"1","data":[1]}'
+
+    def test_lines_without_framing_support(self, fake_binary):
+        with CELEvaluator(fake_binary(pipelined=False)) as evaluator:
+            assert evaluator._framed is False
+            assert evaluator.evaluate("a == b", {"a": 1, "b": 1}) is True
+
+    def test_restarted_subprocess_framed_again(self, fake_binary, monkeypatch):
+        monkeypatch.setattr(CELEvaluator, "PIPELINE_BATCH_ITEMS", 2)
+        items = [("a == b", {"a": 1, "b": 1})] * 3 + [("die", {"a": 1, "b": 2})]
+        with CELEvaluator(fake_binary(framed=True)) as evaluator:
+            assert evaluator.evaluate_batch(items) == [True, True, True, False]
+            assert evaluator._restart_count == 1
+            assert evaluator._framed is True
+
+
+class TestPendingReplies:
+    """Tests for matching responses to awaited request ids."""
+
+    def test_resolve_by_id(self):
+        replies = _PendingReplies()
+        first, second = replies.expect("1"), replies.expect("2")
+        replies.resolve({"id": "2", "ok": True})
+        assert second.result(timeout=0) == {"id": "2", "ok": True}
+        assert not first.done()
+
+    def test_unknown_or_discarded_id_dropped(self):
+        replies = _PendingReplies()
+        future = replies.expect("1")
+        replies.discard("1")
+        replies.resolve({"id": "1", "ok": True})
+        replies.resolve({"id": "9", "ok": True})
+        assert not future.done()
+
+    def test_close_resolves_to_none(self):
+        """After the subprocess's output ends, nothing waits forever."""
+        replies = _PendingReplies()
+        future = replies.expect("1")
+        replies.close()
+        assert future.result(timeout=0) is None
+        assert replies.expect("2").result(timeout=0) is None
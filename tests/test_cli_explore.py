@@ -206,6 +206,9 @@ class TestExploreArgs:
             ensure_coverage=False,
             min_hits_per_op=1,
             min_coverage=100,
+            concurrency=1,
+            parallel_targets=False,
+            max_body_size=None,
         )
         args = parse_explore_args(namespace)
         assert isinstance(args, ExploreArgs)
@@ -243,6 +246,9 @@ class TestExploreArgs:
             ensure_coverage=False,
             min_hits_per_op=1,
             min_coverage=100,
+            concurrency=1,
+            parallel_targets=False,
+            max_body_size=None,
         )
         args = parse_explore_args(namespace)
         assert args.stateful is True
@@ -273,6 +279,9 @@ class TestExploreArgs:
             ensure_coverage=True,
             min_hits_per_op=1,
             min_coverage=100,
+            concurrency=1,
+            parallel_targets=False,
+            max_body_size=None,
         )
         args = parse_explore_args(namespace)
         assert args.stateful is True
@@ -306,6 +315,9 @@ class TestExploreArgs:
             ensure_coverage=True,
             min_hits_per_op=1,
             min_coverage=100,
+            concurrency=1,
+            parallel_targets=False,
+            max_body_size=None,
         )
         args = parse_explore_args(namespace)
         assert args.stateful is True
@@ -334,6 +346,9 @@ class TestExploreArgs:
             ensure_coverage=False,
             min_hits_per_op=5,
             min_coverage=80,
+            concurrency=1,
+            parallel_targets=False,
+            max_body_size=None,
         )
         args = parse_explore_args(namespace)
         assert args.min_hits_per_op == 5
@@ -543,6 +558,78 @@ class TestTimeoutOptions:
         assert args.operation_timeout == {"namespace:getUser": 60.0}
 
 
+class TestConcurrencyOption:
+    def test_concurrency_defaults_to_serial(self):
+        """Without --concurrency, explore runs one case at a time."""
+        args = parse_args([
+            "explore",
+            "--spec", "spec.yaml",
+            "--config", "config.yaml",
+            "--target-a", "a",
+            "--target-b", "b",
+            "--out", "./out",
+        ])
+        assert args.concurrency == 1
+
+    def test_custom_concurrency(self):
+        """--concurrency sets the number of cases in flight."""
+        args = parse_args([
+            "explore",
+            "--spec", "spec.yaml",
+            "--config", "config.yaml",
+            "--target-a", "a",
+            "--target-b", "b",
+            "--out", "./out",
+            "--concurrency", "8",
+        ])
+        assert args.concurrency == 8
+
+    def test_concurrency_rejects_zero(self):
+        """--concurrency must be a positive integer."""
+        with pytest.raises(SystemExit):
+            parse_args([
+                "explore",
+                "--spec", "spec.yaml",
+                "--config", "config.yaml",
+                "--target-a", "a",
+                "--target-b", "b",
+                "--out", "./out",
+                "--concurrency", "0",
+            ])
+
+    def test_create_executor_selects_async_above_one(self):
+        """concurrency > 1 selects AsyncExecutor; 1 keeps the serial Executor."""
+        from api_parity.cli import _create_executor
+        from api_parity.executor import AsyncExecutor, Executor
+        from api_parity.models import TargetConfig
+
+        target = TargetConfig(base_url="http://localhost:9999")
+        common = dict(
+            default_timeout=5.0,
+            operation_timeouts={},
+            link_fields=None,
+            requests_per_second=None,
+        )
+        with _create_executor(target, target, concurrency=1, **common) as executor:
+            assert type(executor) is Executor
+        with _create_executor(target, target, concurrency=4, **common) as executor:
+            assert isinstance(executor, AsyncExecutor)
+            assert executor.concurrency == 4
+
+    def test_parallel_targets_flag(self):
+        """--parallel-targets is off by default and enabled by the flag."""
+        base = [
+            "explore",
+            "--spec", "spec.yaml",
+            "--config", "config.yaml",
+            "--target-a", "a",
+            "--target-b", "b",
+            "--out", "./out",
+        ]
+        assert parse_args(base).parallel_targets is False
+        assert parse_args(base + ["--parallel-targets"]).parallel_targets is True
+
+
 class TestChainSignature:
     """Tests for _chain_signature function."""
 
@@ -1401,7 +1488,7 @@ class TestProgressReporterTimingInStatefulExplore:
                 generator=mock_generator,
                 executor=mock_executor,
                 comparator=mock_comparator,
-                comparison_rules=MagicMock(),
+                comparison_plans=MagicMock(),
                 writer=mock_writer,
                 stats=RunStats(),
                 target_a_info=TargetInfo(name="a", base_url="http://a"),
@@ -1409,7 +1496,6 @@ class TestProgressReporterTimingInStatefulExplore:
                 max_chains=None,
                 max_steps=6,
                 seed=42,
-                get_operation_rules=lambda rules, op_id: MagicMock(),
                 progress_reporter=reporter,
             )
 
@@ -1478,7 +1564,7 @@ class TestProgressReporterTimingInStatefulExplore:
                 generator=mock_generator,
                 executor=mock_executor,
                 comparator=MagicMock(),
-                comparison_rules=MagicMock(),
+                comparison_plans=MagicMock(),
                 writer=MagicMock(),
                 stats=RunStats(),
                 target_a_info=TargetInfo(name="a", base_url="http://a"),
@@ -1486,7 +1572,6 @@ class TestProgressReporterTimingInStatefulExplore:
                 max_chains=None,
                 max_steps=6,
                 seed=42,
-                get_operation_rules=lambda rules, op_id: MagicMock(),
                 progress_reporter=reporter,
             )
 
@@ -1502,3 +1587,182 @@ class TestProgressReporterTimingInStatefulExplore:
             )
         finally:
             reporter.stop()
+
+
+class TestConcurrentStatefulExplore:
+    """Stateful explore with --concurrency reports chains in generation order.
+
+    Chains finish out of order (earlier chains are slower), but stats,
+    bundles, and the --log-chains file must match a serial run exactly.
+    """
+
+    @staticmethod
+    def _make_chain(index: int) -> "ChainCase":
+        from api_parity.models import ChainCase, ChainStep, RequestCase
+        ops = [f"op{index}", "opBad" if index % 3 == 0 else "opGood"]
+        steps = [
+            ChainStep(
+                step_index=i,
+                request_template=RequestCase(
+                    case_id=f"c{index}-s{i}",
+                    operation_id=op_id,
+                    method="GET",
+                    path_template=f"/chains/{index}",
+                    rendered_path=f"/chains/{index}",
+                ),
+            )
+            for i, op_id in enumerate(ops)
+        ]
+        return ChainCase(chain_id=f"chain-{index}", steps=steps)
+
+    def _run(self, tmp_path: Path, concurrency: int) -> tuple[str, "RunStats", int]:
+        import asyncio
+        from unittest.mock import MagicMock, patch
+
+        import httpx
+
+        from api_parity.artifact_writer import ArtifactWriter, RunStats
+        from api_parity.cli import _create_executor, _run_stateful_explore
+        from api_parity.models import ComparisonResult, TargetConfig, TargetInfo
+
+        chain_count = 6
+        chains = [self._make_chain(i) for i in range(chain_count)]
+        generator = MagicMock()
+        generator.generate_chains.return_value = chains
+        generator.get_linked_operation_ids.return_value = {"opGood", "opBad"}
+        generator.get_all_operation_ids.return_value = {"opGood", "opBad"}
+        generator.get_link_edges.return_value = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            index = int(request.url.path.rsplit("/", 1)[-1])
+            await asyncio.sleep(0.005 * (chain_count - index))
+            return httpx.Response(200, json={"index": index})
+
+        def sync_handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"index": int(request.url.path.rsplit("/", 1)[-1])})
+
+        transport = httpx.MockTransport(handler if concurrency > 1 else sync_handler)
+        from api_parity.executor import _BaseExecutor
+        original_kwargs = _BaseExecutor._build_client_kwargs
+
+        def build(self, target, timeout):
+            kwargs = original_kwargs(self, target, timeout)
+            kwargs["transport"] = transport
+            return kwargs
+
+        comparator = MagicMock()
+
+        def compare(response_a, response_b, rules, operation_id):
+            if operation_id == "opBad":
+                return ComparisonResult(match=False, summary="bad op", details={})
+            return ComparisonResult(match=True, summary="", details={})
+
+        comparator.compare.side_effect = compare
+        stats = RunStats()
+        writer = ArtifactWriter(tmp_path / f"run-{concurrency}")
+        target = TargetConfig(base_url="http://target")
+
+        with patch.object(_BaseExecutor, "_build_client_kwargs", build):
+            with _create_executor(
+                target,
+                target,
+                default_timeout=5.0,
+                operation_timeouts={},
+                link_fields=None,
+                requests_per_second=None,
+                concurrency=concurrency,
+            ) as executor:
+                _run_stateful_explore(
+                    generator=generator,
+                    executor=executor,
+                    comparator=comparator,
+                    comparison_plans=MagicMock(),
+                    writer=writer,
+                    stats=stats,
+                    target_a_info=TargetInfo(name="a", base_url="http://a"),
+                    target_b_info=TargetInfo(name="b", base_url="http://b"),
+                    max_chains=None,
+                    max_steps=6,
+                    seed=None,
+                    log_chains=True,
+                )
+
+        chains_log = (tmp_path / f"run-{concurrency}" / "chains.txt").read_text()
+        bundle_count = len(list((tmp_path / f"run-{concurrency}" / "mismatches").iterdir()))
+        return chains_log, stats, bundle_count
+
+    def test_concurrent_run_matches_serial(self, tmp_path):
+        serial_log, serial_stats, serial_bundles = self._run(tmp_path, concurrency=1)
+        concurrent_log, concurrent_stats, concurrent_bundles = self._run(tmp_path, concurrency=4)
+
+        assert concurrent_log == serial_log
+        assert "Outcome: MISMATCH" in serial_log
+        assert concurrent_stats.total_chains == serial_stats.total_chains == 6
+        assert concurrent_stats.chain_matches == serial_stats.chain_matches == 4
+        assert concurrent_stats.chain_mismatches == serial_stats.chain_mismatches == 2
+        assert concurrent_bundles == serial_bundles == 2
+
+
+class TestThrottledResponses:
+    """Throttled responses (adaptive rate control) are counted, not compared."""
+
+    @staticmethod
+    def _response(status_code: int, throttled: bool = False):
+        from api_parity.models import ResponseCase
+        return ResponseCase(status_code=status_code, elapsed_ms=1.0, throttled=throttled)
+
+    def test_stateless_throttled_case_not_written(self):
+        from unittest.mock import MagicMock
+
+        from api_parity.artifact_writer import RunStats
+        from api_parity.cli import _run_stateless_explore
+        from api_parity.executor import Executor
+        from api_parity.models import RequestCase, TargetInfo
+
+        case = RequestCase(
+            case_id="c1", operation_id="getWidget", method="GET",
+            path_template="/widgets", rendered_path="/widgets",
+        )
+        generator = MagicMock()
+        generator.generate.return_value = [case]
+        executor = MagicMock()
+        executor.run_ordered.side_effect = lambda items, work, on_result: Executor.run_ordered(
+            executor, items, work, on_result
+        )
+        executor.execute.return_value = (self._response(200), self._response(429, throttled=True))
+        comparator = MagicMock()
+        writer = MagicMock()
+        stats = RunStats()
+
+        _run_stateless_explore(
+            generator=generator,
+            executor=executor,
+            comparator=comparator,
+            comparison_plans=MagicMock(),
+            writer=writer,
+            stats=stats,
+            target_a_info=TargetInfo(name="a", base_url="http://a"),
+            target_b_info=TargetInfo(name="b", base_url="http://b"),
+            seed=None,
+        )
+
+        assert stats.total_cases == 1
+        assert stats.throttled == 1
+        assert stats.mismatches == 0
+        comparator.compare.assert_not_called()
+        writer.write_mismatch.assert_not_called()
+
+    def test_chain_stops_at_throttled_step(self):
+        from unittest.mock import MagicMock
+
+        from api_parity.cli import _ChainRun
+
+        chain = TestConcurrentStatefulExplore._make_chain(1)
+        compare = MagicMock()
+        chain_run = _ChainRun(chain=chain, compare=compare)
+
+        assert chain_run.on_step(self._response(429, throttled=True), self._response(200)) is False
+        assert chain_run.throttled == "Target A 429"
+        assert chain_run.step_ops == ["op1"]
+        assert chain_run.mismatch_found is False
+        compare.assert_not_called()
@@ -160,9 +160,25 @@ class TestReplayArgs:
             validate=False,
             timeout=45.0,
             operation_timeout=[],
+            concurrency=1,
+            parallel_targets=False,
+            max_body_size=None,
         )
         args = parse_replay_args(namespace)
         assert isinstance(args, ReplayArgs)
         assert args.input_dir == Path("./in")
         assert args.timeout == 45.0
         assert args.operation_timeout == {}
+
+    def test_replay_concurrency(self):
+        """--concurrency sets how many bundles are replayed at once."""
+        args = parse_args([
+            "replay",
+            "--config", "runtime.yaml",
+            "--target-a", "a",
+            "--target-b", "b",
+            "--in", "./in",
+            "--out", "./out",
+            "--concurrency", "4",
+        ])
+        assert args.concurrency == 4
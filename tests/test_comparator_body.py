@@ -1,5 +1,6 @@
 """Unit tests for Comparator body comparison and presence modes."""
 
+from api_parity.cel_evaluator import CELEvaluationError, DocumentValue
 from api_parity.models import BodyRules, FieldRule, MismatchType, OperationRules, PresenceMode
 from tests.conftest import make_response_case
 
@@ -300,7 +301,7 @@ class TestBodyComparison:
         response_b = make_response_case(body={"name": "Alice"})
         rules = OperationRules(
             body=BodyRules(
-                field_rules={"$.name": FieldRule(predefined="exact_match")}
+                field_rules={"$.name": FieldRule(expr="a == b")}
             ),
         )
         mock_cel.evaluate.return_value = True
@@ -347,9 +348,9 @@ class TestBodyComparison:
         rules = OperationRules(
             body=BodyRules(
                 field_rules={
-                    "$.id": FieldRule(predefined="exact_match"),
-                    "$.name": FieldRule(predefined="exact_match"),
-                    "$.age": FieldRule(predefined="exact_match"),
+                    "$.id": FieldRule(expr="a == b"),
+                    "$.name": FieldRule(expr="a == b"),
+                    "$.age": FieldRule(expr="a == b"),
                 }
             ),
         )
@@ -384,6 +385,433 @@ class TestBodyComparison:
         assert result.details["body"].differences[0].path == "$.name"
 
 
+class TestBatchedEvaluation:
+    """Body rules are evaluated in one CEL batch per response pair."""
+
+    def test_all_body_evaluations_in_one_batch(self, comparator, mock_cel):
+        """Every rule and every wildcard match goes in a single batch."""
+        items = [{"price": i} for i in range(50)]
+        response_a = make_response_case(body={"id": 1, "items": items})
+        response_b = make_response_case(body={"id": 1, "items": items})
+        rules = OperationRules(
+            body=BodyRules(
+                field_rules={
+                    "$.id": FieldRule(expr="a == b"),
+                    "$.items[*].price": FieldRule(expr="a == b"),
+                }
+            ),
+        )
+
+        result = comparator.compare(response_a, response_b, rules)
+
+        assert result.match is True
+        mock_cel.evaluate_batch.assert_called_once()
+        (batch,), _ = mock_cel.evaluate_batch.call_args
+        assert len(batch) == 51
+        assert batch[1] == ("a == b", {"a": 0, "b": 0})
+
+    def test_batch_errors_and_mismatches_keep_order(self, comparator, mock_cel):
+        """Per-item errors and failures become differences in path order."""
+        response_a = make_response_case(body={"items": [1, 2, 3]})
+        response_b = make_response_case(body={"items": [1, 5, 6]})
+        rules = OperationRules(
+            body=BodyRules(
+                field_rules={"$.items[*]": FieldRule(expr="a == b")}
+            ),
+        )
+        mock_cel.evaluate_batch.side_effect = None
+        mock_cel.evaluate_batch.return_value = [
+            True,
+            CELEvaluationError("boom"),
+            False,
+        ]
+
+        result = comparator.compare(response_a, response_b, rules)
+
+        differences = result.details["body"].differences
+        assert [d.path for d in differences] == ["items.[1]", "items.[2]"]
+        assert differences[0].rule == "error: boom"
+        assert differences[1].rule == "custom"
+
+    def test_no_batch_without_value_comparisons(self, comparator, mock_cel):
+        """No round-trip when no rule needs CEL."""
+        response_a = make_response_case(body={"id": 1})
+        response_b = make_response_case(body={"id": 2})
+        rules = OperationRules(
+            body=BodyRules(
+                field_rules={"$.id": FieldRule(presence=PresenceMode.REQUIRED)}
+            ),
+        )
+
+        result = comparator.compare(response_a, response_b, rules)
+
+        assert result.match is True
+        mock_cel.evaluate_batch.assert_not_called()
+
+
+class TestBodyDocuments:
+    """Tests for sending the bodies once and bindings as paths into them."""
+
+    def test_objects_sent_as_paths(self, comparator, mock_cel):
+        """Enough object bindings send the bodies as documents."""
+        items = [{"id": i, "tags": [i]} for i in range(4)]
+        body = {"items": items}
+        rules = OperationRules(
+            body=BodyRules(field_rules={"$.items[*]": FieldRule(expr="a == b")}),
+        )
+
+        result = comparator.compare(make_response_case(body=body), make_response_case(body=body), rules)
+
+        assert result.match is True
+        (batch,), kwargs = mock_cel.evaluate_batch.call_args
+        assert kwargs["documents"] == {"a": body, "b": body}
+        assert batch[2] == (
+            "a == b",
+            {
+                "a": DocumentValue("a", ("items", 2), items[2]),
+                "b": DocumentValue("b", ("items", 2), items[2]),
+            },
+        )
+
+    def test_few_objects_and_scalars_sent_as_values(self, comparator, mock_cel):
+        body = {"id": 1, "meta": {"v": 1}}
+        rules = OperationRules(
+            body=BodyRules(
+                field_rules={"$.id": FieldRule(expr="a == b"), "$.meta": FieldRule(expr="a == b")}
+            ),
+        )
+
+        comparator.compare(make_response_case(body=body), make_response_case(body=body), rules)
+
+        (batch,), kwargs = mock_cel.evaluate_batch.call_args
+        assert kwargs == {}
+        assert batch == [("a == b", {"a": 1, "b": 1}), ("a == b", {"a": {"v": 1}, "b": {"v": 1}})]
+
+    def test_expression_can_use_whole_bodies(self, comparator, mock_cel):
+        """body_a and body_b bind the whole bodies, for rules that compare across fields."""
+        body_a = {"total": 3, "items": [1, 2]}
+        body_b = {"total": 3, "items": [2, 1]}
+        rules = OperationRules(
+            body=BodyRules(
+                field_rules={"$.total": FieldRule(expr="a == b && a == size(body_a.items)")}
+            ),
+        )
+
+        comparator.compare(make_response_case(body=body_a), make_response_case(body=body_b), rules)
+
+        (batch,), kwargs = mock_cel.evaluate_batch.call_args
+        assert kwargs["documents"] == {"a": body_a, "b": body_b}
+        assert batch[0][1] == {
+            "a": 3,
+            "b": 3,
+            "body_a": DocumentValue("a", (), body_a),
+            "body_b": DocumentValue("b", (), body_b),
+        }
+        mock_cel.evaluate.assert_called_once_with(
+            "a == b && a == size(body_a.items)",
+            {"a": 3, "b": 3, "body_a": body_a, "body_b": body_b},
+        )
+
+
+class TestNativePredefined:
+    """Tests for predefineds evaluated in Python instead of CEL."""
+
+    def test_mismatch_reported_without_cel(self, comparator, mock_cel):
+        """A native mismatch is reported under the predefined's name."""
+        response_a = make_response_case(body={"id": 1, "name": "Alice"})
+        response_b = make_response_case(body={"id": 1.0, "name": "Bob"})
+        rules = OperationRules(
+            body=BodyRules(
+                field_rules={
+                    "$.id": FieldRule(predefined="exact_match"),
+                    "$.name": FieldRule(predefined="exact_match"),
+                }
+            ),
+        )
+
+        result = comparator.compare(response_a, response_b, rules)
+
+        differences = result.details["body"].differences
+        assert [(d.path, d.rule) for d in differences] == [("$.name", "exact_match")]
+        mock_cel.evaluate_batch.assert_not_called()
+
+    def test_undecided_values_fall_back_to_cel(self, comparator, mock_cel):
+        """Values the native comparison cannot decide are evaluated by CEL."""
+        response_a = make_response_case(body={"value": "1"})
+        response_b = make_response_case(body={"value": "1"})
+        rules = OperationRules(
+            body=BodyRules(
+                field_rules={"$.value": FieldRule(predefined="numeric_tolerance", tolerance=0.5)}
+            ),
+        )
+        mock_cel.evaluate.return_value = False
+
+        result = comparator.compare(response_a, response_b, rules)
+
+        assert result.details["body"].differences[0].rule == "numeric_tolerance"
+        mock_cel.evaluate.assert_called_once_with(
+            "(a - b) <= 0.5 && (b - a) <= 0.5", {"a": "1", "b": "1"}
+        )
+
+    def test_redefined_predefined_uses_cel(self, comparator, comparison_library, mock_cel):
+        """A library expression that differs from the built-in one goes to CEL."""
+        comparison_library.predefined["exact_match"].expr = "a != b"
+        response_a = make_response_case(body={"value": 1})
+        response_b = make_response_case(body={"value": 1})
+        rules = OperationRules(
+            body=BodyRules(field_rules={"$.value": FieldRule(predefined="exact_match")}),
+        )
+
+        comparator.compare(response_a, response_b, rules)
+
+        mock_cel.evaluate.assert_called_once_with("a != b", {"a": 1, "b": 1})
+
+    def test_cel_only_predefined(self, comparator, mock_cel):
+        """Predefineds without a native implementation still use CEL."""
+        response_a = make_response_case(body={"code": "abc"})
+        response_b = make_response_case(body={"code": "abd"})
+        rules = OperationRules(
+            body=BodyRules(
+                field_rules={"$.code": FieldRule(predefined="string_prefix", length=2)}
+            ),
+        )
+
+        comparator.compare(response_a, response_b, rules)
+
+        mock_cel.evaluate.assert_called_once()
+
+
+class TestIdenticalBodies:
+    """Rules identical bodies cannot fail are skipped."""
+
+    def test_identical_bodies_skip_equality_rules(self, comparator, mock_cel):
+        """exact_match and ignore rules pass without evaluation."""
+        body = {"id": 1, "items": [{"price": 1.5}, {"price": 2}], "trace": "x"}
+        rules = OperationRules(
+            body=BodyRules(
+                field_rules={
+                    "$.id": FieldRule(predefined="exact_match"),
+                    "$.items[*].price": FieldRule(predefined="exact_match"),
+                    "$.trace": FieldRule(predefined="ignore"),
+                }
+            ),
+        )
+
+        result = comparator.compare(
+            make_response_case(body=body), make_response_case(body=dict(body)), rules
+        )
+
+        assert result.match is True
+        assert comparator.identical_bodies == 1
+
+    def test_ignored_paths_are_masked(self, comparator):
+        """Bodies that differ only under ignore rules still count as identical."""
+        rules = OperationRules(
+            body=BodyRules(
+                field_rules={
+                    "$.id": FieldRule(predefined="exact_match"),
+                    "$.trace": FieldRule(predefined="ignore"),
+                }
+            ),
+        )
+
+        result = comparator.compare(
+            make_response_case(body={"id": 1, "trace": "x"}),
+            make_response_case(body={"id": 1, "trace": "y"}),
+            rules,
+        )
+
+        assert result.match is True
+        assert comparator.identical_bodies == 1
+
+    def test_other_rules_still_evaluated(self, comparator, mock_cel):
+        """Tolerance, custom and required-presence rules run on identical bodies."""
+        body = {"id": 1, "price": "1", "total": 3}
+        rules = OperationRules(
+            body=BodyRules(
+                field_rules={
+                    "$.id": FieldRule(predefined="exact_match"),
+                    "$.price": FieldRule(predefined="numeric_tolerance", tolerance=0.5),
+                    "$.total": FieldRule(expr="a == b"),
+                    "$.missing": FieldRule(presence=PresenceMode.REQUIRED),
+                }
+            ),
+        )
+        mock_cel.evaluate.return_value = False
+
+        result = comparator.compare(
+            make_response_case(body=body), make_response_case(body=dict(body)), rules
+        )
+
+        assert comparator.identical_bodies == 1
+        differences = result.details["body"].differences
+        assert [d.path for d in differences] == ["$.price", "$.total", "$.missing"]
+
+    def test_overlapping_mask_is_not_skipped(self, comparator, mock_cel):
+        """An equality rule under a masked path is evaluated."""
+        rules = OperationRules(
+            body=BodyRules(
+                field_rules={
+                    "$.item": FieldRule(expr="a == b"),
+                    "$.item.id": FieldRule(predefined="exact_match"),
+                }
+            ),
+        )
+        mock_cel.evaluate.return_value = True
+
+        result = comparator.compare(
+            make_response_case(body={"item": {"id": 1}}),
+            make_response_case(body={"item": {"id": 2}}),
+            rules,
+        )
+
+        assert [d.path for d in result.details["body"].differences] == ["$.item.id"]
+
+    def test_json_types_must_match(self, comparator):
+        """1, 1.0 and true are equal in Python but not identical."""
+        rules = OperationRules(
+            body=BodyRules(field_rules={"$.flag": FieldRule(predefined="exact_match")}),
+        )
+
+        result = comparator.compare(
+            make_response_case(body={"flag": True}),
+            make_response_case(body={"flag": 1}),
+            rules,
+        )
+
+        assert result.match is False
+        assert comparator.identical_bodies == 0
+
+    def test_nan_is_never_identical(self, comparator):
+        """Bodies holding NaN go through the rules."""
+        nan = float("nan")
+        rules = OperationRules(
+            body=BodyRules(field_rules={"$.id": FieldRule(predefined="exact_match")}),
+        )
+
+        comparator.compare(
+            make_response_case(body={"id": 1, "value": nan}),
+            make_response_case(body={"id": 1, "value": nan}),
+            rules,
+        )
+
+        assert comparator.identical_bodies == 0
+
+    def test_redefined_predefined_is_not_skipped(
+        self, comparator, comparison_library, mock_cel
+    ):
+        """A library exact_match that is not the built-in one is evaluated."""
+        comparison_library.predefined["exact_match"].expr = "a != b"
+        rules = OperationRules(
+            body=BodyRules(field_rules={"$.value": FieldRule(predefined="exact_match")}),
+        )
+
+        comparator.compare(
+            make_response_case(body={"value": 1}), make_response_case(body={"value": 1}), rules
+        )
+
+        mock_cel.evaluate.assert_called_once_with("a != b", {"a": 1, "b": 1})
+        assert comparator.identical_bodies == 0
+
+
+class TestStructuralDiff:
+    """Opt-in structural diff of the whole body."""
+
+    def test_disabled_by_default(self, comparator):
+        """Without structural_diff, unruled fields are not compared."""
+        rules = OperationRules(body=BodyRules(field_rules={}))
+
+        result = comparator.compare(
+            make_response_case(body={"name": "a"}), make_response_case(body={"name": "b"}), rules
+        )
+
+        assert result.match is True
+        assert "structural_diff" not in result.details
+
+    def test_unruled_difference_reported(self, comparator):
+        """A differing field without a rule is a body mismatch."""
+        rules = OperationRules(
+            body=BodyRules(
+                field_rules={"$.id": FieldRule(predefined="exact_match")}, structural_diff=True
+            ),
+        )
+
+        result = comparator.compare(
+            make_response_case(body={"id": 1, "items": [{"name": "a"}]}),
+            make_response_case(body={"id": 1, "items": [{"name": "b"}]}),
+            rules,
+        )
+
+        assert result.match is False
+        assert result.mismatch_type == MismatchType.BODY
+        assert result.summary == "Structural difference at items.[0].name"
+        differences = result.details["structural_diff"].differences
+        assert [(d.path, d.target_a, d.target_b, d.rule) for d in differences] == [
+            ("items.[0].name", "a", "b", "structural_diff")
+        ]
+
+    def test_rules_take_precedence(self, comparator):
+        """Paths a rule matches on either side, and their subtrees, are left to the rule."""
+        rules = OperationRules(
+            body=BodyRules(
+                field_rules={
+                    "$.items[*].price": FieldRule(predefined="numeric_tolerance", tolerance=1),
+                    "$.meta": FieldRule(predefined="ignore"),
+                    "$.extra": FieldRule(presence=PresenceMode.OPTIONAL, predefined="ignore"),
+                },
+                structural_diff=True,
+            ),
+        )
+
+        result = comparator.compare(
+            make_response_case(
+                body={"items": [{"price": 1.0}], "meta": {"trace": "x"}, "extra": 1}
+            ),
+            make_response_case(body={"items": [{"price": 1.5}], "meta": {"trace": "y"}}),
+            rules,
+        )
+
+        assert result.match is True
+        assert result.details["structural_diff"].match is True
+
+    def test_fallback_rule_paths_take_precedence(self, comparator):
+        """Rules on paths jsonpath_ng evaluates also cover their subtrees."""
+        rules = OperationRules(
+            body=BodyRules(
+                field_rules={
+                    "$.meta.`this`": FieldRule(predefined="ignore"),
+                    "$.trace.`this`": FieldRule(predefined="ignore"),
+                },
+                structural_diff=True,
+            ),
+        )
+
+        result = comparator.compare(
+            make_response_case(body={"meta": {"x": 1}, "trace": "a", "id": 1}),
+            make_response_case(body={"meta": {"x": 2}, "trace": "b", "id": 2}),
+            rules,
+        )
+
+        assert [d.path for d in result.details["structural_diff"].differences] == ["id"]
+
+    def test_runs_after_rule_mismatch_only(self, comparator):
+        """A rule mismatch is reported first; the structural diff is not run."""
+        rules = OperationRules(
+            body=BodyRules(
+                field_rules={"$.id": FieldRule(predefined="exact_match")}, structural_diff=True
+            ),
+        )
+
+        result = comparator.compare(
+            make_response_case(body={"id": 1, "name": "a"}),
+            make_response_case(body={"id": 2, "name": "b"}),
+            rules,
+        )
+
+        assert [d.path for d in result.details["body"].differences] == ["$.id"]
+        assert "structural_diff" not in result.details
+
+
 class TestNullValues:
     """Tests for JSON null value handling."""
 
@@ -393,7 +821,7 @@ class TestNullValues:
         response_b = make_response_case(body={"value": None})
         rules = OperationRules(
             body=BodyRules(
-                field_rules={"$.value": FieldRule(predefined="exact_match")}
+                field_rules={"$.value": FieldRule(expr="a == b")}
             ),
         )
         mock_cel.evaluate.return_value = True
@@ -497,7 +925,7 @@ class TestBinaryBodyComparison:
         response_a = make_response_case(body=None, body_base64="SGVsbG8=")
         response_b = make_response_case(body=None, body_base64="SGVsbG8=")
         rules = OperationRules(
-            body=BodyRules(binary_rule=FieldRule(predefined="exact_match"))
+            body=BodyRules(binary_rule=FieldRule(expr="a == b"))
         )
         mock_cel.evaluate.return_value = True
 
@@ -566,7 +994,7 @@ class TestBinaryBodyComparison:
         response_a = make_response_case(body=None, body_base64="")
         response_b = make_response_case(body=None, body_base64="")
         rules = OperationRules(
-            body=BodyRules(binary_rule=FieldRule(predefined="exact_match"))
+            body=BodyRules(binary_rule=FieldRule(expr="a == b"))
         )
         mock_cel.evaluate.return_value = True
 
@@ -631,3 +1059,94 @@ class TestBinaryRuleValidation:
         # Implicit PARITY (default) should work
         rules = BodyRules(binary_rule=FieldRule(predefined="exact_match"))
         assert rules.binary_rule.presence == PresenceMode.PARITY
+
+
+class TestTruncatedBinaryComparison:
+    """Bodies over --max-body-size are compared by length and SHA-256."""
+
+    @staticmethod
+    def _truncated(size: int, sha256: str):
+        response = make_response_case(body=None)
+        response.body_size = size
+        response.body_sha256 = sha256
+        response.body_truncated = True
+        return response
+
+    def test_exact_match_same_digest(self, comparator, mock_cel):
+        """Identical digests match without calling CEL."""
+        response_a = self._truncated(5_000_000, "ab" * 32)
+        response_b = self._truncated(5_000_000, "ab" * 32)
+        rules = OperationRules(
+            body=BodyRules(binary_rule=FieldRule(predefined="binary_exact_match"))
+        )
+
+        result = comparator.compare(response_a, response_b, rules)
+
+        assert result.match is True
+        mock_cel.evaluate.assert_not_called()
+
+    def test_exact_match_different_digest(self, comparator):
+        """Different digests are a binary body mismatch."""
+        response_a = self._truncated(5_000_000, "ab" * 32)
+        response_b = self._truncated(5_000_000, "cd" * 32)
+        rules = OperationRules(body=BodyRules(binary_rule=FieldRule(predefined="exact_match")))
+
+        result = comparator.compare(response_a, response_b, rules)
+
+        assert result.match is False
+        assert result.mismatch_type == MismatchType.BODY
+        difference = result.details["binary_body"].differences[0]
+        assert difference.rule == "exact_match"
+        assert "5000000 bytes" in difference.target_a
+
+    def test_length_match_uses_base64_length(self, comparator):
+        """binary_length_match keeps its base64 meaning: 4 * ceil(n / 3)."""
+        rules = OperationRules(
+            body=BodyRules(binary_rule=FieldRule(predefined="binary_length_match"))
+        )
+
+        # 3_000_001 and 3_000_002 bytes both encode to 4_000_004 characters.
+        same = comparator.compare(
+            self._truncated(3_000_001, "ab" * 32), self._truncated(3_000_002, "cd" * 32), rules
+        )
+        different = comparator.compare(
+            self._truncated(3_000_000, "ab" * 32), self._truncated(3_000_001, "cd" * 32), rules
+        )
+
+        assert same.match is True
+        assert different.match is False
+
+    def test_truncated_vs_in_memory_binary(self, comparator):
+        """A side within the cap is digested from its base64 body."""
+        response_a = self._truncated(5_000_000, "ab" * 32)
+        response_b = make_response_case(body=None, body_base64="SGVsbG8=")
+        rules = OperationRules(
+            body=BodyRules(binary_rule=FieldRule(predefined="binary_nonempty"))
+        )
+
+        result = comparator.compare(response_a, response_b, rules)
+
+        assert result.match is True
+
+    def test_truncated_vs_no_body_is_presence_mismatch(self, comparator):
+        """A truncated body counts as binary content for the presence check."""
+        response_a = self._truncated(5_000_000, "ab" * 32)
+        response_b = make_response_case(body=None)
+        rules = OperationRules(body=BodyRules(binary_rule=FieldRule(predefined="exact_match")))
+
+        result = comparator.compare(response_a, response_b, rules)
+
+        assert result.match is False
+        assert result.details["binary_body"].differences[0].rule == "binary_presence"
+
+    def test_custom_expression_reported_as_error(self, comparator, mock_cel):
+        """Rules that need the full body are errors, not silent passes."""
+        response_a = self._truncated(5_000_000, "ab" * 32)
+        response_b = self._truncated(5_000_000, "ab" * 32)
+        rules = OperationRules(body=BodyRules(binary_rule=FieldRule(expr='a.startsWith("JVBE")')))
+
+        result = comparator.compare(response_a, response_b, rules)
+
+        assert result.match is False
+        assert "exceeded --max-body-size" in result.details["binary_body"].differences[0].rule
+        mock_cel.evaluate.assert_not_called()
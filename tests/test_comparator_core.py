@@ -1,6 +1,16 @@
-"""Unit tests for Comparator core functionality and NOT_FOUND sentinel."""
+"""Unit tests for Comparator core functionality, NOT_FOUND sentinel and comparison plans."""
+
+from unittest.mock import patch
 
 from api_parity.comparator import NOT_FOUND, _NotFound
+from api_parity.models import (
+    BodyRules,
+    ComparisonRulesFile,
+    FieldRule,
+    MismatchType,
+    OperationRules,
+)
+from tests.conftest import make_response_case
 
 # Import shared fixtures
 pytest_plugins = ["tests.comparator_fixtures"]
@@ -24,3 +34,127 @@ class TestNotFoundSentinel:
     def test_repr(self):
         """NOT_FOUND has a useful repr."""
         assert repr(NOT_FOUND) == "<NOT_FOUND>"
+
+
+class TestComparisonPlan:
+    """Tests for rules compiled into ComparisonPlans."""
+
+    def _rules_file(self, **operation_rules):
+        return ComparisonRulesFile(
+            version="1",
+            default_rules=OperationRules(
+                headers={"X-Version": FieldRule(predefined="exact_match")},
+                body=BodyRules(field_rules={"$.id": FieldRule(predefined="exact_match")}),
+            ),
+            operation_rules=operation_rules,
+        )
+
+    def test_plan_matches_uncompiled_rules(self, comparator):
+        """Comparing with a plan gives the same result as with the rules."""
+        rules = OperationRules(
+            headers={"X-Version": FieldRule(predefined="exact_match")},
+            body=BodyRules(
+                field_rules={
+                    "$.id": FieldRule(predefined="exact_match"),
+                    "$.tags[*]": FieldRule(expr="a == b"),
+                }
+            ),
+        )
+        response_a = make_response_case(headers={"x-version": ["1"]}, body={"id": 1, "tags": ["a"]})
+        response_b = make_response_case(headers={"x-version": ["1"]}, body={"id": 2, "tags": ["a"]})
+
+        plan = comparator.compile_plan(rules)
+
+        assert comparator.compare(response_a, response_b, plan) == comparator.compare(
+            response_a, response_b, rules
+        )
+
+    def test_header_names_matched_case_insensitively(self, comparator):
+        """Header rules written in any case find lowercase response headers."""
+        plans = comparator.compile_plans(self._rules_file())
+        response_a = make_response_case(headers={"x-version": ["1"]}, body={"id": 1})
+        response_b = make_response_case(headers={"x-version": ["2"]}, body={"id": 1})
+
+        result = comparator.compare(response_a, response_b, plans.for_operation("getWidget"))
+
+        assert result.mismatch_type == MismatchType.HEADERS
+        assert result.details["headers"].differences[0].path == "headers.X-Version"
+
+    def test_for_operation_uses_override(self, comparator):
+        """Operations with operation_rules get their own plan; others the default."""
+        plans = comparator.compile_plans(
+            self._rules_file(
+                createWidget=OperationRules(body=BodyRules(field_rules={}))
+            )
+        )
+
+        assert plans.for_operation("createWidget").body_fields == ()
+        assert plans.for_operation("createWidget").headers == plans.default.headers
+        assert plans.for_operation("getWidget") is plans.default
+
+    def test_rules_expanded_once(self, comparator, mock_cel):
+        """Comparisons with a plan do not expand predefineds again."""
+        plan = comparator.compile_plan(
+            OperationRules(
+                body=BodyRules(field_rules={"$.id": FieldRule(predefined="string_prefix", length=2)})
+            )
+        )
+        response = make_response_case(body={"id": "abc"})
+
+        with patch.object(comparator, "_expand_predefined") as expand:
+            comparator.compare(response, response, plan)
+            comparator.compare(response, response, plan)
+
+        expand.assert_not_called()
+        assert mock_cel.evaluate.call_count == 2
+
+    def test_errors_reported_at_compile_time(self, comparator):
+        """Unknown predefineds, missing parameters and bad JSONPaths are listed."""
+        plans = comparator.compile_plans(
+            self._rules_file(
+                createWidget=OperationRules(
+                    status_code=FieldRule(predefined="no_such_rule"),
+                    body=BodyRules(
+                        field_rules={
+                            "$.items[": FieldRule(predefined="exact_match"),
+                            "$.price": FieldRule(predefined="numeric_tolerance"),
+                        },
+                        binary_rule=FieldRule(predefined="also_missing"),
+                    ),
+                ),
+                getWidget=OperationRules(status_code=FieldRule(predefined="exact_match")),
+            )
+        )
+
+        locations = [location for location, _ in plans.errors]
+        assert locations == [
+            "operation_rules.createWidget.status_code",
+            "operation_rules.createWidget.body.field_rules[$.items[]",
+            "operation_rules.createWidget.body.field_rules[$.price]",
+            "operation_rules.createWidget.body.binary_rule",
+        ]
+
+    def test_inherited_errors_reported_once(self, comparator):
+        """A bad default rule is not repeated for operations that inherit it."""
+        rules_file = ComparisonRulesFile(
+            version="1",
+            default_rules=OperationRules(status_code=FieldRule(predefined="no_such_rule")),
+            operation_rules={"getWidget": OperationRules(headers={"etag": FieldRule()})},
+        )
+
+        plans = comparator.compile_plans(rules_file)
+
+        assert [location for location, _ in plans.errors] == ["default_rules.status_code"]
+
+    def test_rule_error_still_reported_as_difference(self, comparator):
+        """A plan with errors compares like uncompiled rules: error differences."""
+        plan = comparator.compile_plan(
+            OperationRules(
+                body=BodyRules(field_rules={"$.id": FieldRule(predefined="no_such_rule")})
+            )
+        )
+        response = make_response_case(body={"id": 1})
+
+        result = comparator.compare(response, response, plan)
+
+        assert result.details["body"].differences[0].rule == "error: Unknown predefined: no_such_rule"
@@ -19,7 +19,7 @@ class TestWildcardPaths:
         response_b = make_response_case(body={"items": [{"id": 1}, {"id": 2}]})
         rules = OperationRules(
             body=BodyRules(
-                field_rules={"$.items[*].id": FieldRule(predefined="exact_match")}
+                field_rules={"$.items[*].id": FieldRule(expr="a == b")}
             ),
         )
         mock_cel.evaluate.return_value = True
@@ -81,6 +81,65 @@ class TestWildcardPaths:
         assert result.details["body"].match is True
 
 
+class TestWildcardColumns:
+    """Tests for comparing wildcard matches as columns."""
+
+    def test_only_failing_elements_reported(self, comparator, mock_cel):
+        """Native rules decide the whole column; only failures become differences."""
+        response_a = make_response_case(body={"items": [{"p": 1.0}, {"p": 2.0}, {"p": 3}, {"p": 4}]})
+        response_b = make_response_case(body={"items": [{"p": 1.0}, {"p": 2.5}, {"p": 3}, {"p": 9}]})
+        rules = OperationRules(
+            body=BodyRules(
+                field_rules={
+                    "$.items[*].p": FieldRule(predefined="numeric_tolerance", tolerance=0.1)
+                }
+            ),
+        )
+
+        result = comparator.compare(response_a, response_b, rules)
+
+        differences = result.details["body"].differences
+        assert len(differences) == 2
+        assert "[1]" in differences[0].path
+        assert "[3]" in differences[1].path
+        assert (differences[1].target_a, differences[1].target_b) == (4, 9)
+        assert differences[0].rule == "numeric_tolerance"
+        mock_cel.evaluate.assert_not_called()
+
+    def test_undecided_elements_sent_to_cel(self, comparator, mock_cel):
+        """Pairs the native comparison cannot decide are still evaluated by CEL."""
+        response_a = make_response_case(body={"items": [{"v": 1}, {"v": float("inf")}]})
+        response_b = make_response_case(body={"items": [{"v": 1}, {"v": float("inf")}]})
+        rules = OperationRules(
+            body=BodyRules(
+                field_rules={"$.items[*].v": FieldRule(predefined="exact_match")}
+            ),
+        )
+        mock_cel.evaluate.return_value = False
+
+        result = comparator.compare(response_a, response_b, rules)
+
+        mock_cel.evaluate.assert_called_once()
+        differences = result.details["body"].differences
+        assert len(differences) == 1
+        assert "[1]" in differences[0].path
+
+    def test_presence_failure_reported_per_element(self, comparator):
+        """A presence rule failing on matches reports every matched element."""
+        response_a = make_response_case(body={"items": [{"id": 1}, {"id": 2}]})
+        response_b = make_response_case(body={"items": [{"id": 1}, {"id": 2}]})
+        rules = OperationRules(
+            body=BodyRules(
+                field_rules={"$.items[*].id": FieldRule(presence="forbidden")}
+            ),
+        )
+
+        result = comparator.compare(response_a, response_b, rules)
+
+        differences = result.details["body"].differences
+        assert [d.rule for d in differences] == ["presence:forbidden"] * 2
+
+
 class TestJSONPathErrors:
     """Tests for JSONPath error handling."""
 
@@ -155,7 +214,7 @@ class TestRecursiveDescentWildcard:
         )
         rules = OperationRules(
             body=BodyRules(
-                field_rules={"$..value": FieldRule(predefined="exact_match")}
+                field_rules={"$..value": FieldRule(expr="a == b")}
             ),
         )
         mock_cel.evaluate.return_value = True
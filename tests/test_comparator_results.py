@@ -161,7 +161,7 @@ class TestEdgeCases:
         response_b = make_response_case(body={"name": "日本語"})
         rules = OperationRules(
             body=BodyRules(
-                field_rules={"$.name": FieldRule(predefined="exact_match")}
+                field_rules={"$.name": FieldRule(expr="a == b")}
             ),
         )
         mock_cel.evaluate.return_value = True
@@ -177,7 +177,7 @@ class TestEdgeCases:
         response_b = make_response_case(body={"active": False})
         rules = OperationRules(
             body=BodyRules(
-                field_rules={"$.active": FieldRule(predefined="exact_match")}
+                field_rules={"$.active": FieldRule(expr="a == b")}
             ),
         )
         mock_cel.evaluate.return_value = False
@@ -193,7 +193,7 @@ class TestEdgeCases:
         response_b = make_response_case(body={"tags": ["a", "b", "c"]})
         rules = OperationRules(
             body=BodyRules(
-                field_rules={"$.tags": FieldRule(predefined="exact_match")}
+                field_rules={"$.tags": FieldRule(expr="a == b")}
             ),
         )
         mock_cel.evaluate.return_value = True
@@ -16,35 +16,17 @@ class TestPredefinedExpansion:
 
     def test_no_params(self, comparator, mock_cel):
         """Predefined with no params expands correctly."""
-        response_a = make_response_case(body={"value": 1})
-        response_b = make_response_case(body={"value": 1})
-        rules = OperationRules(
-            body=BodyRules(
-                field_rules={"$.value": FieldRule(predefined="exact_match")}
-            ),
-        )
-        mock_cel.evaluate.return_value = True
-
-        comparator.compare(response_a, response_b, rules)
+        expr = comparator._expand_predefined(FieldRule(predefined="exact_match"))
 
-        mock_cel.evaluate.assert_called_with("a == b", {"a": 1, "b": 1})
+        assert expr == "a == b"
 
     def test_numeric_param(self, comparator, mock_cel):
         """Numeric parameter substituted correctly."""
-        response_a = make_response_case(body={"value": 1.0})
-        response_b = make_response_case(body={"value": 1.005})
-        rules = OperationRules(
-            body=BodyRules(
-                field_rules={"$.value": FieldRule(predefined="numeric_tolerance", tolerance=0.01)}
-            ),
+        expr = comparator._expand_predefined(
+            FieldRule(predefined="numeric_tolerance", tolerance=0.01)
         )
-        mock_cel.evaluate.return_value = True
-
-        comparator.compare(response_a, response_b, rules)
 
         # Check the expression has the substituted value
-        call_args = mock_cel.evaluate.call_args
-        expr = call_args[0][0]
         assert "0.01" in expr
         assert "tolerance" not in expr
 
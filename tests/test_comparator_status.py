@@ -1,6 +1,6 @@
 """Unit tests for Comparator status code comparison and comparison order."""
 
-from api_parity.models import BodyRules, FieldRule, MismatchType, OperationRules
+from api_parity.models import BodyRules, FieldRule, MismatchType, OperationRules, ResponseCase
 from tests.conftest import make_response_case
 
 # Import shared fixtures
@@ -45,7 +45,8 @@ class TestStatusCodeComparison:
         result = comparator.compare(response_a, response_b, rules)
 
         assert result.match is True
-        mock_cel.evaluate.assert_called()
+        # ignore is evaluated natively, without CEL
+        mock_cel.evaluate.assert_not_called()
 
     def test_rule_returns_false(self, comparator, mock_cel):
         """Status code mismatch when rule returns False."""
@@ -93,9 +94,9 @@ class TestComparisonOrder:
             body={"id": 2},
         )
         rules = OperationRules(
-            headers={"content-type": FieldRule(predefined="exact_match")},
+            headers={"content-type": FieldRule(expr="a == b")},
             body=BodyRules(
-                field_rules={"$.id": FieldRule(predefined="exact_match")}
+                field_rules={"$.id": FieldRule(expr="a == b")}
             ),
         )
         # Header check fails
@@ -107,3 +108,19 @@ class TestComparisonOrder:
         assert result.mismatch_type == MismatchType.HEADERS
         # Body should not be compared (only one CEL call for header)
         assert mock_cel.evaluate.call_count == 1
+
+    def test_status_mismatch_leaves_body_unparsed(self, comparator):
+        """A status mismatch never decodes either body."""
+
+        class _Unreadable:
+            content = b"{}"
+
+            def decode(self):
+                raise AssertionError("body was parsed")
+
+        response_a = ResponseCase.with_lazy_body(_Unreadable(), status_code=200, elapsed_ms=10)
+        response_b = ResponseCase.with_lazy_body(_Unreadable(), status_code=500, elapsed_ms=10)
+
+        result = comparator.compare(response_a, response_b, OperationRules())
+
+        assert result.mismatch_type == MismatchType.STATUS_CODE
@@ -244,6 +244,29 @@ class TestValidateComparisonRules:
         assert len(result.errors) == 1
         assert "headers.content-type" in result.errors[0].message
 
+    def test_invalid_jsonpath_error(
+        self, sample_library: ComparisonLibrary, spec_operation_ids: set[str]
+    ) -> None:
+        """Body rule JSONPaths that do not parse produce an error."""
+        rules = ComparisonRulesFile(
+            version="1",
+            default_rules=OperationRules(
+                body=BodyRules(
+                    field_rules={
+                        "$.items[": FieldRule(predefined="exact_match"),
+                    }
+                )
+            ),
+            operation_rules={},
+        )
+
+        result = validate_comparison_rules(rules, sample_library, spec_operation_ids)
+
+        assert not result.is_valid
+        assert len(result.errors) == 1
+        assert "Invalid JSONPath" in result.errors[0].message
+        assert "body.field_rules[$.items[]" in result.errors[0].message
+
 
 class TestValidateCliOperationIds:
     """Tests for validate_cli_operation_ids function."""
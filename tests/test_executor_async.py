@@ -0,0 +1,379 @@
+"""Tests for AsyncExecutor (concurrent execution on httpx.AsyncClient).
+
+Tests cover:
+- execute()/execute_chain() produce the same data as the serial Executor
+- run_ordered() reports results in input order regardless of finish order
+- The concurrency limit bounds the number of in-flight units
+- RequestError is captured per unit instead of aborting the run
+- Async rate limiting spaces sends without blocking the event loop
+
+HTTP traffic goes through httpx.MockTransport, so no servers are started.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from api_parity.case_generator import LinkFields
+from api_parity.executor import AsyncExecutor, Executor, RequestError
+from api_parity.models import ChainCase, ChainStep, RequestCase, TargetConfig
+
+
+TARGET_A = TargetConfig(base_url="http://target-a")
+TARGET_B = TargetConfig(base_url="http://target-b")
+
+
+def _make_request(case_id: str, path: str = "/widgets", method: str = "GET") -> RequestCase:
+    return RequestCase(
+        case_id=case_id,
+        operation_id="getWidget",
+        method=method,
+        path_template=path,
+        rendered_path=path,
+    )
+
+
+def _with_transport(transport: httpx.BaseTransport | httpx.AsyncBaseTransport):
+    """Patch client construction so both targets use the given mock transport."""
+    original = Executor._build_client_kwargs
+
+    def build(self, target: TargetConfig, timeout: float) -> dict[str, Any]:
+        kwargs = original(self, target, timeout)
+        kwargs["transport"] = transport
+        return kwargs
+
+    return patch("api_parity.executor._BaseExecutor._build_client_kwargs", build)
+
+
+def _echo_handler(request: httpx.Request) -> httpx.Response:
+    """Respond with the host and path so each target's response is distinguishable."""
+    return httpx.Response(
+        200,
+        json={"host": request.url.host, "path": request.url.path},
+        headers={"X-Request-Path": request.url.path},
+    )
+
+
+class TestAsyncExecutorExecute:
+    """execute() matches the serial Executor's output."""
+
+    def test_execute_matches_serial_executor(self) -> None:
+        request = _make_request("case-1", "/widgets/42")
+
+        with _with_transport(httpx.MockTransport(_echo_handler)):
+            with Executor(TARGET_A, TARGET_B) as executor:
+                serial_a, serial_b = executor.execute(request)
+
+            results: list[Any] = []
+            with AsyncExecutor(TARGET_A, TARGET_B, concurrency=4) as executor:
+                executor.run_ordered([request], executor.execute, lambda _, r: results.append(r))
+
+        async_a, async_b = results[0]
+        assert async_a.body == serial_a.body == {"host": "target-a", "path": "/widgets/42"}
+        assert async_b.body == serial_b.body == {"host": "target-b", "path": "/widgets/42"}
+        assert async_a.headers == serial_a.headers
+
+    def test_binary_body_is_base64(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, content=b"\x00\x01\x02", headers={"Content-Type": "application/octet-stream"}
+            )
+
+        results: list[Any] = []
+        with _with_transport(httpx.MockTransport(handler)):
+            with AsyncExecutor(TARGET_A, TARGET_B, concurrency=2) as executor:
+                executor.run_ordered(
+                    [_make_request("bin")], executor.execute, lambda _, r: results.append(r)
+                )
+
+        response_a, _ = results[0]
+        assert response_a.body is None
+        assert response_a.body_base64 == "AAEC"
+
+    def test_concurrency_must_be_positive(self) -> None:
+        with pytest.raises(ValueError, match="concurrency"):
+            AsyncExecutor(TARGET_A, TARGET_B, concurrency=0)
+
+    def test_close_is_idempotent(self) -> None:
+        executor = AsyncExecutor(TARGET_A, TARGET_B, concurrency=2)
+        executor.close()
+        executor.close()
+
+
+class TestRunOrdered:
+    """run_ordered() overlaps work but reports strictly in input order."""
+
+    def test_results_reported_in_input_order(self) -> None:
+        # Earlier cases are slower, so they finish last.
+        async def handler(request: httpx.Request) -> httpx.Response:
+            index = int(request.url.path.rsplit("/", 1)[-1])
+            await asyncio.sleep(0.01 * (5 - index))
+            return httpx.Response(200, json={"index": index})
+
+        requests = [_make_request(f"case-{i}", f"/widgets/{i}") for i in range(6)]
+        reported: list[tuple[str, int]] = []
+
+        def on_result(request: RequestCase, outcome: Any) -> None:
+            response_a, _ = outcome
+            reported.append((request.case_id, response_a.body["index"]))
+
+        with _with_transport(httpx.MockTransport(handler)):
+            with AsyncExecutor(TARGET_A, TARGET_B, concurrency=6) as executor:
+                executor.run_ordered(requests, executor.execute, on_result)
+
+        assert reported == [(f"case-{i}", i) for i in range(6)]
+
+    def test_concurrency_limit_bounds_in_flight_units(self) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={})
+
+        requests = [_make_request(f"case-{i}") for i in range(12)]
+        with _with_transport(httpx.MockTransport(handler)):
+            with AsyncExecutor(TARGET_A, TARGET_B, concurrency=3) as executor:
+                executor.run_ordered(requests, executor.execute, lambda *_: None)
+
+        # Each unit sends A then B serially, so requests in flight == units in flight.
+        assert 1 < peak <= 3
+
+    def test_request_error_passed_to_on_result(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/fail":
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(200, json={})
+
+        requests = [_make_request("ok-1"), _make_request("bad", "/fail"), _make_request("ok-2")]
+        outcomes: dict[str, Any] = {}
+
+        with _with_transport(httpx.MockTransport(handler)):
+            with AsyncExecutor(TARGET_A, TARGET_B, concurrency=2) as executor:
+                executor.run_ordered(
+                    requests, executor.execute, lambda req, r: outcomes.__setitem__(req.case_id, r)
+                )
+
+        assert list(outcomes) == ["ok-1", "bad", "ok-2"]
+        assert isinstance(outcomes["bad"], RequestError)
+        assert "Target A connection error" in str(outcomes["bad"])
+        assert not isinstance(outcomes["ok-2"], RequestError)
+
+    def test_other_exceptions_propagate(self) -> None:
+        def on_result(request: RequestCase, outcome: Any) -> None:
+            raise RuntimeError("comparator crashed")
+
+        requests = [_make_request(f"case-{i}") for i in range(4)]
+        with _with_transport(httpx.MockTransport(_echo_handler)):
+            with AsyncExecutor(TARGET_A, TARGET_B, concurrency=2) as executor:
+                with pytest.raises(RuntimeError, match="comparator crashed"):
+                    executor.run_ordered(requests, executor.execute, on_result)
+
+    def test_serial_executor_run_ordered(self) -> None:
+        outcomes: list[Any] = []
+        requests = [_make_request("a", "/one"), _make_request("b", "/two")]
+
+        with _with_transport(httpx.MockTransport(_echo_handler)):
+            with Executor(TARGET_A, TARGET_B) as executor:
+                executor.run_ordered(requests, executor.execute, lambda _, r: outcomes.append(r))
+
+        assert [resp_a.body["path"] for resp_a, _ in outcomes] == ["/one", "/two"]
+
+
+class TestAsyncExecuteChain:
+    """execute_chain() keeps per-target variables and step order."""
+
+    def _make_chain(self) -> ChainCase:
+        create = RequestCase(
+            case_id="step-0",
+            operation_id="createWidget",
+            method="POST",
+            path_template="/widgets",
+            rendered_path="/widgets",
+            body={"name": "w"},
+            media_type="application/json",
+        )
+        get = RequestCase(
+            case_id="step-1",
+            operation_id="getWidget",
+            method="GET",
+            path_template="/widgets/{widget_id}",
+            path_parameters={"widget_id": "fuzz"},
+            rendered_path="/widgets/fuzz",
+        )
+        return ChainCase(
+            chain_id="chain-1",
+            steps=[
+                ChainStep(step_index=0, request_template=create),
+                ChainStep(
+                    step_index=1,
+                    request_template=get,
+                    link_source={"step": 0, "parameters": {"widget_id": "$response.body#/id"}},
+                ),
+            ],
+        )
+
+    @staticmethod
+    def _handler(request: httpx.Request) -> httpx.Response:
+        # Each target issues its own IDs, like two independent deployments.
+        if request.method == "POST":
+            return httpx.Response(201, json={"id": f"{request.url.host}-id"})
+        return httpx.Response(200, json={"path": request.url.path})
+
+    def test_chain_uses_each_targets_own_ids(self) -> None:
+        link_fields = LinkFields(body_pointers={"id"})
+        chains = [self._make_chain(), self._make_chain()]
+        outcomes: list[Any] = []
+
+        with _with_transport(httpx.MockTransport(self._handler)):
+            with AsyncExecutor(TARGET_A, TARGET_B, link_fields=link_fields, concurrency=2) as executor:
+                executor.run_ordered(
+                    chains,
+                    lambda chain: executor.execute_chain(chain),
+                    lambda _, r: outcomes.append(r),
+                )
+
+        for execution_a, execution_b in outcomes:
+            assert [s.step_index for s in execution_a.steps] == [0, 1]
+            assert execution_a.steps[1].request.rendered_path == "/widgets/target-a-id"
+            assert execution_b.steps[1].request.rendered_path == "/widgets/target-b-id"
+
+    def test_chain_matches_serial_executor(self) -> None:
+        link_fields = LinkFields(body_pointers={"id"})
+        chain = self._make_chain()
+
+        with _with_transport(httpx.MockTransport(self._handler)):
+            with Executor(TARGET_A, TARGET_B, link_fields=link_fields) as executor:
+                serial = executor.execute_chain(chain)
+
+            outcomes: list[Any] = []
+            with AsyncExecutor(TARGET_A, TARGET_B, link_fields=link_fields, concurrency=2) as executor:
+                executor.run_ordered(
+                    [chain], lambda c: executor.execute_chain(c), lambda _, r: outcomes.append(r)
+                )
+
+        def strip_timing(execution: Any) -> list[dict[str, Any]]:
+            dumped = execution.model_dump()["steps"]
+            for step in dumped:
+                step["response"].pop("elapsed_ms")
+            return dumped
+
+        assert strip_timing(outcomes[0][0]) == strip_timing(serial[0])
+        assert strip_timing(outcomes[0][1]) == strip_timing(serial[1])
+
+    def test_on_step_false_stops_chain(self) -> None:
+        link_fields = LinkFields(body_pointers={"id"})
+        seen: list[int] = []
+
+        def on_step(response_a: Any, response_b: Any) -> bool:
+            seen.append(response_a.status_code)
+            return False
+
+        outcomes: list[Any] = []
+        with _with_transport(httpx.MockTransport(self._handler)):
+            with AsyncExecutor(TARGET_A, TARGET_B, link_fields=link_fields, concurrency=2) as executor:
+                executor.run_ordered(
+                    [self._make_chain()],
+                    lambda c: executor.execute_chain(c, on_step=on_step),
+                    lambda _, r: outcomes.append(r),
+                )
+
+        assert seen == [201]
+        assert len(outcomes[0][0].steps) == 1
+
+
+class TestAsyncRateLimit:
+    """Async rate limiting reserves send slots and sleeps outside the lock."""
+
+    def test_slots_spaced_by_min_interval(self) -> None:
+        executor = AsyncExecutor(TARGET_A, TARGET_B, requests_per_second=10.0, concurrency=4)
+        sleeps: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        async def reserve_three() -> None:
+            for _ in range(3):
+                await executor._wait_for_rate_limit()
+
+        try:
+            with patch("api_parity.executor.time.monotonic", return_value=100.0), \
+                    patch("api_parity.executor.asyncio.sleep", fake_sleep):
+                executor._loop.run_until_complete(reserve_three())
+        finally:
+            executor.close()
+
+        # First send goes immediately; the next two queue 0.1s apart.
+        assert sleeps == pytest.approx([0.1, 0.2])
+
+    def test_no_rate_limit_no_sleep(self) -> None:
+        executor = AsyncExecutor(TARGET_A, TARGET_B, concurrency=2)
+        try:
+            with patch("api_parity.executor.asyncio.sleep") as mock_sleep:
+                executor._loop.run_until_complete(executor._wait_for_rate_limit())
+            mock_sleep.assert_not_called()
+        finally:
+            executor.close()
+
+
+class TestJsonRequestBody:
+    """Request bodies are built by the shared helper for both executors."""
+
+    def test_json_body_sent(self) -> None:
+        received: list[Any] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            received.append(json.loads(request.content))
+            return httpx.Response(200, json={})
+
+        request = RequestCase(
+            case_id="post",
+            operation_id="createWidget",
+            method="POST",
+            path_template="/widgets",
+            rendered_path="/widgets",
+            body={"name": "gizmo"},
+            media_type="application/json",
+        )
+        with _with_transport(httpx.MockTransport(handler)):
+            with AsyncExecutor(TARGET_A, TARGET_B, concurrency=2) as executor:
+                executor.run_ordered([request], executor.execute, lambda *_: None)
+
+        assert received == [{"name": "gizmo"}, {"name": "gizmo"}]
+
+
+class TestLazyResponseBody:
+    """Response bodies are parsed only when something reads them."""
+
+    def test_xml_parsed_on_first_body_access(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b"<item><id>1</id></item>", headers={"content-type": "application/xml"})
+
+        with _with_transport(httpx.MockTransport(handler)):
+            with Executor(TARGET_A, TARGET_B) as executor:
+                with patch("api_parity.executor.xml_to_dict", return_value={"item": {"id": "1"}}) as parse:
+                    response_a, _ = executor.execute(_make_request("case-1"))
+                    assert response_a.status_code == 200
+                    parse.assert_not_called()
+
+                    assert response_a.body == {"item": {"id": "1"}}
+                    parse.assert_called_once()
+
+    def test_empty_body_built_eagerly(self) -> None:
+        with _with_transport(httpx.MockTransport(lambda request: httpx.Response(204))):
+            with Executor(TARGET_A, TARGET_B) as executor:
+                response_a, _ = executor.execute(_make_request("case-1"))
+
+        assert "body" in response_a.__dict__
+        assert response_a.body is None
+        assert response_a.body_base64 is None
@@ -16,7 +16,7 @@ import pytest
 from unittest.mock import patch
 
 from api_parity.case_generator import HeaderRef, LinkFields, _MISSING
-from api_parity.executor import Executor
+from api_parity.executor import Executor, _ExtractionPlan, _RequestTemplate
 from api_parity.models import (
     ChainCase,
     ChainStep,
@@ -500,6 +500,139 @@ class TestApplyLinkOverrides:
         assert result.path_parameters["widget_id"] == "widgets/abc-123"
 
 
+# =============================================================================
+# _ExtractionPlan: LinkFields compiled for variable extraction
+# =============================================================================
+
+
+class TestExtractionPlan:
+    """Test the extraction plan compiled from LinkFields."""
+
+    def test_plan_precomputes_pointers_aliases_and_headers(self):
+        """Pointers are pre-split, aliases resolved, header keys built."""
+        link_fields = LinkFields(
+            body_pointers={"data/user/userId", "items/0/id", "meta/id"},
+            headers=[
+                HeaderRef(name="set-cookie", original_name="Set-Cookie", index=1),
+                HeaderRef(name="set-cookie", original_name="Set-Cookie", index=0),
+                HeaderRef(name="location", original_name="Location", index=None),
+            ],
+        )
+        plan = _ExtractionPlan.from_link_fields(link_fields)
+
+        assert dict(plan.body_pointers)["data/user/userId"] == ("data", "user", "userId")
+        # "id" is ambiguous (items/0/id, meta/id), so it gets no alias
+        assert dict(plan.aliases) == {"userId": "data/user/userId"}
+        assert plan.headers == (
+            (
+                "set-cookie",
+                "header/set-cookie",
+                ((0, "header/set-cookie/0"), (1, "header/set-cookie/1")),
+            ),
+            ("location", "header/location", ()),
+        )
+
+    def test_extract_variables_uses_plan(self, executor):
+        """Extraction fills pointer, alias, and header keys."""
+        response = ResponseCase(
+            status_code=201,
+            headers={"location": ["/widgets/1"], "x-resource-id": ["r-1", "r-2"]},
+            body={"id": "top", "data": {"nested_id": "n-1"}},
+            elapsed_ms=1.0,
+        )
+        assert executor._extract_variables(response) == {
+            "id": "top",
+            "data/nested_id": "n-1",
+            "nested_id": "n-1",
+            "header/location": ["/widgets/1"],
+            "header/x-resource-id": ["r-1", "r-2"],
+            "header/x-resource-id/0": "r-1",
+        }
+
+
+# =============================================================================
+# _RequestTemplate: compiled chain step templates
+# =============================================================================
+
+
+class TestRequestTemplate:
+    """Test building per-target requests from a compiled template."""
+
+    def test_overrides_and_variables_in_one_build(self):
+        """Link overrides and placeholder substitution are applied together."""
+        template = RequestCase(
+            case_id="test-1",
+            operation_id="updateWidget",
+            method="PUT",
+            path_template="/widgets/{widget_id}",
+            path_parameters={"widget_id": "fuzz-uuid"},
+            rendered_path="/widgets/fuzz-uuid",
+            query={"owner": ["{id}"], "page": ["1"]},
+            headers={"X-Request-Id": ["fuzz"]},
+            body={"name": "w-{id}", "tags": ["{id}", "fixed"], "count": 3},
+        )
+        result = _RequestTemplate(template).build(
+            {"widget_id": "/real-id", "x-request-id": "req-1"},
+            {"id": "abc"},
+        )
+
+        assert result.path_parameters == {"widget_id": "real-id"}
+        assert result.rendered_path == "/widgets/real-id"
+        assert result.query == {"owner": ["abc"], "page": ["1"]}
+        assert result.headers == {"X-Request-Id": ["req-1"]}
+        assert result.body == {"name": "w-abc", "tags": ["abc", "fixed"], "count": 3}
+
+    def test_template_not_mutated(self):
+        """Building a request leaves the template and its body untouched."""
+        template = RequestCase(
+            case_id="test-1",
+            operation_id="createWidget",
+            method="POST",
+            path_template="/widgets",
+            rendered_path="/widgets",
+            query={"owner": ["{id}"]},
+            body={"outer": {"name": "{id}"}, "static": {"a": 1}},
+        )
+        compiled = _RequestTemplate(template)
+        result_a = compiled.build({}, {"id": "a-id"})
+        result_b = compiled.build({}, {"id": "b-id"})
+
+        assert template.query == {"owner": ["{id}"]}
+        assert template.body == {"outer": {"name": "{id}"}, "static": {"a": 1}}
+        assert result_a.body["outer"] == {"name": "a-id"}
+        assert result_b.body["outer"] == {"name": "b-id"}
+        # Subtrees without placeholders are not copied
+        assert result_a.body["static"] is template.body["static"]
+
+    def test_nothing_to_fill_returns_template(self):
+        """A template without placeholders or overrides is reused as-is."""
+        template = RequestCase(
+            case_id="test-1",
+            operation_id="getWidget",
+            method="GET",
+            path_template="/widgets/{widget_id}",
+            path_parameters={"widget_id": "fuzz-uuid"},
+            rendered_path="/widgets/fuzz-uuid",
+            body={"name": "plain"},
+        )
+        result = _RequestTemplate(template).build({}, {"id": "abc"})
+        assert result is template
+
+    def test_direct_match_path_parameter(self):
+        """A path parameter equal to a variable name is replaced by its value."""
+        template = RequestCase(
+            case_id="test-1",
+            operation_id="getWidget",
+            method="GET",
+            path_template="/widgets/{widget_id}",
+            path_parameters={"widget_id": "id"},
+            rendered_path="/widgets/id",
+        )
+        result = _RequestTemplate(template).build({}, {"id": "abc"})
+        assert result.path_parameters == {"widget_id": "abc"}
+        assert result.rendered_path == "/widgets/abc"
+
+
 # =============================================================================
 # End-to-end: link resolution in execute_chain
 # =============================================================================
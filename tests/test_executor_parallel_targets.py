@@ -0,0 +1,173 @@
+"""Tests for parallel-targets mode (A and B sent at the same time).
+
+Tests cover:
+- Both executors overlap the two sends instead of waiting for A first
+- send_skew_ms is recorded with opposite signs, and only in parallel mode
+- Error precedence matches serial mode (A's error wins)
+- Chains still use each target's own extracted variables
+
+HTTP traffic goes through httpx.MockTransport, so no servers are started.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any
+
+import httpx
+import pytest
+
+from api_parity.case_generator import LinkFields
+from api_parity.executor import AsyncExecutor, Executor, RequestError
+from api_parity.models import ChainCase, ChainStep, RequestCase
+from tests.test_executor_async import TARGET_A, TARGET_B, _echo_handler, _make_request, _with_transport
+
+
+def _run_async(executor: AsyncExecutor, request: RequestCase) -> Any:
+    """Execute one request on an AsyncExecutor and return its outcome."""
+    outcomes: list[Any] = []
+    executor.run_ordered([request], executor.execute, lambda _, r: outcomes.append(r))
+    return outcomes[0]
+
+
+class TestSyncParallelTargets:
+    """Executor with parallel_targets=True."""
+
+    def test_sends_overlap(self) -> None:
+        # Each handler waits for the other target's request to arrive. A serial
+        # executor would block on the barrier and time out.
+        barrier = threading.Barrier(2, timeout=2)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            barrier.wait()
+            return httpx.Response(200, json={"host": request.url.host})
+
+        with _with_transport(httpx.MockTransport(handler)):
+            with Executor(TARGET_A, TARGET_B, parallel_targets=True) as executor:
+                response_a, response_b = executor.execute(_make_request("case-1"))
+
+        assert response_a.body == {"host": "target-a"}
+        assert response_b.body == {"host": "target-b"}
+
+    def test_send_skew_recorded(self) -> None:
+        with _with_transport(httpx.MockTransport(_echo_handler)):
+            with Executor(TARGET_A, TARGET_B, parallel_targets=True) as executor:
+                response_a, response_b = executor.execute(_make_request("case-1"))
+
+        assert response_a.send_skew_ms is not None
+        assert response_a.send_skew_ms == pytest.approx(-response_b.send_skew_ms)
+
+    def test_serial_mode_has_no_skew(self) -> None:
+        with _with_transport(httpx.MockTransport(_echo_handler)):
+            with Executor(TARGET_A, TARGET_B) as executor:
+                response_a, response_b = executor.execute(_make_request("case-1"))
+
+        assert response_a.send_skew_ms is None
+        assert response_b.send_skew_ms is None
+
+    def test_target_a_error_wins(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
+
+        with _with_transport(httpx.MockTransport(handler)):
+            with Executor(TARGET_A, TARGET_B, parallel_targets=True) as executor:
+                with pytest.raises(RequestError, match="Target A connection error"):
+                    executor.execute(_make_request("case-1"))
+
+    def test_target_b_error_raised(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.host == "target-b":
+                raise httpx.ReadTimeout("slow", request=request)
+            return httpx.Response(200, json={})
+
+        with _with_transport(httpx.MockTransport(handler)):
+            with Executor(TARGET_A, TARGET_B, parallel_targets=True) as executor:
+                with pytest.raises(RequestError, match="Target B request timeout"):
+                    executor.execute(_make_request("case-1"))
+
+
+class TestAsyncParallelTargets:
+    """AsyncExecutor with parallel_targets=True."""
+
+    def test_sends_overlap(self) -> None:
+        arrived: set[str] = set()
+        both_arrived = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            arrived.add(request.url.host)
+            if len(arrived) == 2:
+                both_arrived.set()
+            await asyncio.wait_for(both_arrived.wait(), timeout=2)
+            return httpx.Response(200, json={"host": request.url.host})
+
+        with _with_transport(httpx.MockTransport(handler)):
+            with AsyncExecutor(TARGET_A, TARGET_B, parallel_targets=True, concurrency=2) as executor:
+                response_a, response_b = _run_async(executor, _make_request("case-1"))
+
+        assert response_a.body == {"host": "target-a"}
+        assert response_b.body == {"host": "target-b"}
+        assert response_a.send_skew_ms == pytest.approx(-response_b.send_skew_ms)
+
+    def test_target_a_error_wins(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
+
+        with _with_transport(httpx.MockTransport(handler)):
+            with AsyncExecutor(TARGET_A, TARGET_B, parallel_targets=True, concurrency=2) as executor:
+                outcome = _run_async(executor, _make_request("case-1"))
+
+        assert isinstance(outcome, RequestError)
+        assert "Target A connection error" in str(outcome)
+
+
+class TestParallelTargetsChain:
+    """Chains keep per-target variables when both targets are sent together."""
+
+    @staticmethod
+    def _handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            return httpx.Response(201, json={"id": f"{request.url.host}-id"})
+        return httpx.Response(200, json={"path": request.url.path})
+
+    @staticmethod
+    def _make_chain() -> ChainCase:
+        create = RequestCase(
+            case_id="step-0",
+            operation_id="createWidget",
+            method="POST",
+            path_template="/widgets",
+            rendered_path="/widgets",
+            body={"name": "w"},
+            media_type="application/json",
+        )
+        get = RequestCase(
+            case_id="step-1",
+            operation_id="getWidget",
+            method="GET",
+            path_template="/widgets/{widget_id}",
+            path_parameters={"widget_id": "fuzz"},
+            rendered_path="/widgets/fuzz",
+        )
+        return ChainCase(
+            chain_id="chain-1",
+            steps=[
+                ChainStep(step_index=0, request_template=create),
+                ChainStep(
+                    step_index=1,
+                    request_template=get,
+                    link_source={"step": 0, "parameters": {"widget_id": "$response.body#/id"}},
+                ),
+            ],
+        )
+
+    def test_chain_uses_each_targets_own_ids(self) -> None:
+        link_fields = LinkFields(body_pointers={"id"})
+
+        with _with_transport(httpx.MockTransport(self._handler)):
+            with Executor(TARGET_A, TARGET_B, link_fields=link_fields, parallel_targets=True) as executor:
+                execution_a, execution_b = executor.execute_chain(self._make_chain())
+
+        assert execution_a.steps[1].request.rendered_path == "/widgets/target-a-id"
+        assert execution_b.steps[1].request.rendered_path == "/widgets/target-b-id"
+        assert all(step.response.send_skew_ms is not None for step in execution_a.steps)
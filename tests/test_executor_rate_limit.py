@@ -7,11 +7,13 @@ Tests cover:
 - No rate limiting when disabled
 - TLS/mTLS configuration is passed to httpx.Client correctly
 - Cipher configuration creates proper SSL context
+- Connection pool limits and HTTP/2 are passed to httpx
 """
 
 import ssl
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
 from api_parity.executor import Executor, ExecutorError
@@ -338,6 +340,52 @@ class TestBuildClientKwargs:
                 executor.close()
 
 
+class TestConnectionKwargs:
+    """Tests for pool limits and HTTP/2 in _build_client_kwargs."""
+
+    def test_pool_limits_passed_as_httpx_limits(self) -> None:
+        """Test that the target's pool settings become httpx.Limits."""
+        target = TargetConfig(
+            base_url="http://localhost:8000",
+            max_connections=8,
+            max_keepalive_connections=4,
+            keepalive_expiry=30.0,
+        )
+
+        with patch("api_parity.executor.httpx.Client"):
+            executor = Executor(target, target)
+            try:
+                kwargs = executor._build_client_kwargs(target, 30.0)
+
+                assert kwargs["limits"] == httpx.Limits(
+                    max_connections=8, max_keepalive_connections=4, keepalive_expiry=30.0
+                )
+                assert "http2" not in kwargs
+            finally:
+                executor.close()
+
+    def test_http2_enabled_when_h2_installed(self) -> None:
+        """Test that http2=True is passed through when h2 is importable."""
+        target = TargetConfig(base_url="https://api.example.com", http2=True)
+
+        with patch("api_parity.executor.httpx.Client"), \
+                patch("api_parity.executor.importlib.util.find_spec", return_value=MagicMock()):
+            executor = Executor(target, target)
+            try:
+                kwargs = executor._build_client_kwargs(target, 30.0)
+                assert kwargs["http2"] is True
+            finally:
+                executor.close()
+
+    def test_http2_without_h2_raises(self) -> None:
+        """Test that a missing h2 package is reported as an ExecutorError."""
+        target = TargetConfig(base_url="https://api.example.com", http2=True)
+
+        with patch("api_parity.executor.importlib.util.find_spec", return_value=None):
+            with pytest.raises(ExecutorError, match="'h2' package is not installed"):
+                Executor(target, target)
+
+
 class TestHttpxClientKwargsIntegration:
     """Tests that verify httpx.Client is actually called with the correct kwargs from _build_client_kwargs."""
 
@@ -445,7 +493,7 @@ class TestHttpxClientKwargsIntegration:
 
                 for call in mock_client_cls.call_args_list:
                     # Only expected kwargs should be present
-                    assert set(call.kwargs.keys()) == {"base_url", "headers", "timeout"}
+                    assert set(call.kwargs.keys()) == {"base_url", "headers", "timeout", "limits"}
             finally:
                 executor.close()
 
@@ -0,0 +1,204 @@
+"""Tests for streaming response capture (--max-body-size).
+
+Tests cover:
+- Bodies within the cap are parsed as before, plus length and SHA-256
+- Bodies over the cap are spilled to a file and recorded by digest only
+- Both executors capture identically
+- Spill files are released after on_result and the directory on close()
+- Bundles keep a copy of spilled bodies
+
+HTTP traffic goes through httpx.MockTransport, so no servers are started.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+from api_parity.artifact_writer import ArtifactWriter
+from api_parity.executor import AsyncExecutor, Executor, RequestError, _BodyCapture
+from api_parity.models import ComparisonResult, MismatchType, TargetInfo
+from tests.test_executor_async import TARGET_A, TARGET_B, _make_request, _with_transport
+
+PAYLOAD = bytes(range(256)) * 40  # 10240 bytes
+PAYLOAD_SHA256 = hashlib.sha256(PAYLOAD).hexdigest()
+
+
+def _binary_handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        200, content=PAYLOAD, headers={"Content-Type": "application/octet-stream"}
+    )
+
+
+class TestBodyCapture:
+    """_BodyCapture keeps at most max_size bytes in memory."""
+
+    def test_small_body_stays_in_memory(self, tmp_path: Path) -> None:
+        capture = _BodyCapture(max_size=100, spill_dir=str(tmp_path))
+        capture.feed(b"hello ")
+        capture.feed(b"world")
+        capture.close()
+
+        assert capture.truncated is False
+        assert capture.content == b"hello world"
+        assert capture.size == 11
+        assert capture.sha256 == hashlib.sha256(b"hello world").hexdigest()
+        assert os.listdir(tmp_path) == []
+
+    def test_large_body_spills_in_full(self, tmp_path: Path) -> None:
+        capture = _BodyCapture(max_size=1000, spill_dir=str(tmp_path))
+        for offset in range(0, len(PAYLOAD), 512):
+            capture.feed(PAYLOAD[offset:offset + 512])
+        capture.close()
+
+        assert capture.truncated is True
+        assert capture.size == len(PAYLOAD)
+        assert capture.sha256 == PAYLOAD_SHA256
+        assert Path(capture.spill_path).read_bytes() == PAYLOAD
+
+    def test_discard_removes_spill_file(self, tmp_path: Path) -> None:
+        capture = _BodyCapture(max_size=1, spill_dir=str(tmp_path))
+        capture.feed(b"abc")
+        capture.discard()
+
+        assert capture.spill_path is None
+        assert os.listdir(tmp_path) == []
+
+
+class TestStreamingExecute:
+    """Executors stream bodies when max_body_size is set."""
+
+    def test_within_cap_parsed_with_digest(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"id": 1})
+
+        with _with_transport(httpx.MockTransport(handler)):
+            with Executor(TARGET_A, TARGET_B, max_body_size=1024) as executor:
+                response_a, _ = executor.execute(_make_request("case-1"))
+
+        assert response_a.body == {"id": 1}
+        assert response_a.body_truncated is False
+        assert response_a.body_size == len(b'{"id":1}')
+        assert response_a.body_sha256 == hashlib.sha256(b'{"id":1}').hexdigest()
+
+    def test_over_cap_truncated(self) -> None:
+        with _with_transport(httpx.MockTransport(_binary_handler)):
+            with Executor(TARGET_A, TARGET_B, max_body_size=1024) as executor:
+                response_a, response_b = executor.execute(_make_request("case-1"))
+                spilled = Path(response_a.body_file).read_bytes()
+
+        assert response_a.body is None
+        assert response_a.body_base64 is None
+        assert response_a.body_truncated is True
+        assert response_a.body_size == len(PAYLOAD)
+        assert response_a.body_sha256 == response_b.body_sha256 == PAYLOAD_SHA256
+        assert spilled == PAYLOAD
+
+    def test_no_cap_records_no_digest(self) -> None:
+        with _with_transport(httpx.MockTransport(_binary_handler)):
+            with Executor(TARGET_A, TARGET_B) as executor:
+                response_a, _ = executor.execute(_make_request("case-1"))
+
+        assert response_a.body_sha256 is None
+        assert response_a.body_size is None
+        assert response_a.body_base64 is not None
+
+    def test_async_matches_sync(self) -> None:
+        outcomes: list[Any] = []
+        with _with_transport(httpx.MockTransport(_binary_handler)):
+            with AsyncExecutor(TARGET_A, TARGET_B, max_body_size=1024, concurrency=2) as executor:
+                executor.run_ordered(
+                    [_make_request("case-1")],
+                    executor.execute,
+                    lambda _, result: outcomes.append(
+                        (result[0].model_copy(), Path(result[0].body_file).read_bytes())
+                    ),
+                )
+
+        response_a, spilled = outcomes[0]
+        assert response_a.body_truncated is True
+        assert response_a.body_sha256 == PAYLOAD_SHA256
+        assert spilled == PAYLOAD
+
+    def test_max_body_size_must_be_positive(self) -> None:
+        with pytest.raises(ValueError, match="max_body_size"):
+            Executor(TARGET_A, TARGET_B, max_body_size=0)
+
+    def test_read_error_discards_partial_spill(self) -> None:
+        class FailingStream(httpx.SyncByteStream):
+            def __iter__(self):
+                yield PAYLOAD
+                raise httpx.ReadError("connection reset")
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, stream=FailingStream())
+
+        with _with_transport(httpx.MockTransport(handler)):
+            with Executor(TARGET_A, TARGET_B, max_body_size=1024) as executor:
+                with pytest.raises(RequestError, match="Target A request error"):
+                    executor.execute(_make_request("case-1"))
+                assert os.listdir(executor._spill_dir) == []
+
+
+class TestSpillLifetime:
+    """Spill files are deleted once their result has been reported."""
+
+    def test_released_after_on_result(self) -> None:
+        seen: list[str] = []
+
+        def on_result(_: Any, result: Any) -> None:
+            seen.extend(response.body_file for response in result)
+            assert all(os.path.exists(path) for path in seen[-2:])
+
+        with _with_transport(httpx.MockTransport(_binary_handler)):
+            with Executor(TARGET_A, TARGET_B, max_body_size=1024) as executor:
+                executor.run_ordered(
+                    [_make_request("case-1"), _make_request("case-2")], executor.execute, on_result
+                )
+                assert os.listdir(executor._spill_dir) == []
+
+        assert len(seen) == 4
+
+    def test_close_removes_spill_dir(self) -> None:
+        with _with_transport(httpx.MockTransport(_binary_handler)):
+            executor = Executor(TARGET_A, TARGET_B, max_body_size=1024)
+            spill_dir = executor._spill_dir
+            executor.execute(_make_request("case-1"))
+            executor.close()
+
+        assert not os.path.exists(spill_dir)
+
+
+class TestBundleCopiesSpilledBody:
+    """Mismatch bundles keep their own copy of a truncated body."""
+
+    def test_stateless_bundle(self, tmp_path: Path) -> None:
+        writer = ArtifactWriter(tmp_path)
+        diff = ComparisonResult(
+            match=False,
+            mismatch_type=MismatchType.BODY,
+            summary="Binary body mismatch",
+            details={},
+        )
+        request = _make_request("case-1")
+
+        with _with_transport(httpx.MockTransport(_binary_handler)):
+            with Executor(TARGET_A, TARGET_B, max_body_size=1024) as executor:
+                response_a, response_b = executor.execute(request)
+                bundle = writer.write_mismatch(
+                    request,
+                    response_a,
+                    response_b,
+                    diff,
+                    TargetInfo(name="a", base_url="http://target-a"),
+                    TargetInfo(name="b", base_url="http://target-b"),
+                )
+
+        assert (bundle / "target_a.body").read_bytes() == PAYLOAD
+        assert (bundle / "target_b.body").read_bytes() == PAYLOAD
+        assert '"body_file": "target_a.body"' in (bundle / "target_a.json").read_text()
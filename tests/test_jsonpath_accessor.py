@@ -0,0 +1,204 @@
+"""Tests for compiled JSONPath accessors.
+
+Every compiled lookup must return the same matches, in the same order and
+with the same concrete paths, as jsonpath_ng's find().
+"""
+
+import copy
+
+import pytest
+from jsonpath_ng import parse
+
+from api_parity.jsonpath_accessor import (
+    compile_jsonpath,
+    concrete_path,
+    location_segments,
+    replace_matches,
+)
+
+BODY = {
+    "id": "root",
+    "items": [
+        {"id": 1, "tags": ["a", "b"], "meta": {"id": "m1"}},
+        {"id": 2, "tags": [], "meta": None},
+        {"name": "no id"},
+    ],
+    "x.y": {"n m": 1},
+    "single": {"id": 3},
+    "text": "abc",
+    "zero": 0,
+}
+
+
+def jsonpath_ng_matches(path, body):
+    """What jsonpath_ng reports: (concrete path, value) per match."""
+    return [(str(match.full_path), match.value) for match in parse(path).find(body)]
+
+
+def accessor_matches(path, body):
+    """What the compiled accessor reports, with paths rendered."""
+    return [
+        (concrete_path(location), value)
+        for location, value in compile_jsonpath(parse(path)).find(body)
+    ]
+
+
+class TestAgreement:
+    """Compiled lookups agree with jsonpath_ng."""
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "$",
+            "$.id",
+            "id",
+            "$.items[*].id",
+            "$.items[0].tags[1]",
+            "$.items[-1]",
+            "$.items[1:]",
+            "$.items[::2].id",
+            "$..id",
+            "$..items[*].id",
+            "$.items..id",
+            "$.*",
+            "$.single.*",
+            "$.id,text",
+            "$['x.y']['n m']",
+            "$.text[*]",  # a string is sliced as a one-element list
+            "$.single[*].id",  # so is an object
+            "$.zero[*]",  # falsy values match nothing
+            "$.missing[*].id",
+            "$.items[*].meta.id",
+        ],
+    )
+    def test_same_matches_and_paths(self, path):
+        """Values, order and concrete paths are identical."""
+        accessor = compile_jsonpath(parse(path))
+
+        assert accessor.compiled
+        assert accessor_matches(path, BODY) == jsonpath_ng_matches(path, BODY)
+
+    @pytest.mark.parametrize("path", ["$.items.`this`", "$.items.`parent`", "$.id | $.text"])
+    def test_other_nodes_fall_back(self, path):
+        """Paths outside the compiled subset use jsonpath_ng."""
+        accessor = compile_jsonpath(parse(path))
+
+        assert not accessor.compiled
+        assert accessor_matches(path, BODY) == jsonpath_ng_matches(path, BODY)
+
+
+class TestConcretePath:
+    """Tests for rendering match locations."""
+
+    def test_root(self):
+        """The root itself renders as $."""
+        assert concrete_path(None) == "$"
+
+    def test_fields_and_indexes(self):
+        """Fields join with dots; indexes are bracketed."""
+        assert concrete_path((((None, "items"), 0), "id")) == "items.[0].id"
+
+    def test_field_with_jsonpath_literal_quoted(self):
+        """Field names containing JSONPath syntax are quoted."""
+        assert concrete_path(((None, "x.y"), "n m")) == "'x.y'.n m"
+
+
+class TestLocationSegments:
+    """Tests for match locations as paths from the root."""
+
+    def test_root(self):
+        assert location_segments(None) == ()
+
+    def test_fields_and_indexes(self):
+        assert location_segments((((None, "items"), 0), "id")) == ("items", 0, "id")
+
+    def test_fallback_location_has_no_segments(self):
+        """jsonpath_ng matches carry a rendered path, not segments."""
+        assert location_segments("items.[0].id") is None
+
+
+def replaced_at_matches(paths, body, value):
+    """Reference for replace_matches(): set value at every location find() reports."""
+    body = copy.deepcopy(body)
+    locations = [
+        location for path in paths for location, _ in compile_jsonpath(parse(path)).find(body)
+    ]
+    for location in locations:
+        segments = []
+        while location is not None:
+            location, segment = location
+            segments.append(segment)
+        if not segments:
+            return value
+        target = body
+        for segment in reversed(segments[1:]):
+            target = target[segment]
+        target[segments[0]] = value
+    return body
+
+
+class TestReplaceMatches:
+    """Tests for masking the matches of compiled paths."""
+
+    @pytest.mark.parametrize(
+        "paths",
+        [
+            ["$.id"],
+            ["$.items[*].id"],
+            ["$.items[*].meta.id", "$.items[0]"],
+            ["$.items[-1]", "$.items[0].tags[*]"],
+            ["$.items[::2].tags", "$.*"],
+            ["$.single.*", "$['x.y']['n m']"],
+            ["$.missing.id", "$.zero"],
+            ["$"],
+        ],
+    )
+    def test_same_as_replacing_found_matches(self, paths):
+        """Every location find() reports, and nothing else, is replaced."""
+        accessors = [compile_jsonpath(parse(path)) for path in paths]
+
+        result = replace_matches(BODY, accessors, "<masked>")
+
+        assert result == replaced_at_matches(paths, BODY, "<masked>")
+
+    def test_body_not_modified(self):
+        """Containers on the way to a match are copied."""
+        original = copy.deepcopy(BODY)
+
+        replace_matches(BODY, [compile_jsonpath(parse("$.items[*].meta.id"))], 0)
+
+        assert BODY == original
+
+    @pytest.mark.parametrize("path", ["$..id", "$.id | $.text", "$.text[*]", "$.single[*]"])
+    def test_unsupported_paths_raise(self, path):
+        """Paths with '..', jsonpath_ng fallbacks and slices of single values raise."""
+        with pytest.raises(ValueError):
+            replace_matches(BODY, [compile_jsonpath(parse(path))], 0)
+
+
+class TestMayOverlap:
+    """Tests for deciding whether two paths can reach each other's matches."""
+
+    @pytest.mark.parametrize(
+        "path_a,path_b,expected",
+        [
+            ("$.id", "$.id", True),
+            ("$.id", "$.name", False),
+            ("$.items", "$.items[*].id", True),  # one is above the other
+            ("$.items[*].id", "$.items[*].name", False),
+            ("$.items[0].id", "$.items[1].id", False),
+            ("$.items[0].id", "$.items[-1].id", True),
+            ("$.items[1:].id", "$.items[0].id", True),
+            ("$.*", "$.id", True),
+            ("$.id,name", "$.name", True),
+            ("$.items[0]", "$.items.id", False),  # indexes and fields never meet
+            ("$..id", "$.name", True),
+            ("$", "$.id", True),
+        ],
+    )
+    def test_overlap(self, path_a, path_b, expected):
+        """Decided per step, symmetrically."""
+        a, b = compile_jsonpath(parse(path_a)), compile_jsonpath(parse(path_b))
+
+        assert a.may_overlap(b) is expected
+        assert b.may_overlap(a) is expected
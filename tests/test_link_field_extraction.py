@@ -16,6 +16,8 @@ from api_parity.case_generator import (
     _MISSING,
     extract_link_fields_from_spec,
     extract_by_jsonpointer,
+    extract_by_segments,
+    split_jsonpointer,
     _get_operation_id,
 )
 
@@ -512,6 +514,28 @@ class TestExtractByJsonpointer:
         assert result == "nested"
 
 
+class TestSplitJsonpointer:
+    """Tests for split_jsonpointer and extract_by_segments."""
+
+    def test_splits_and_decodes_segments(self):
+        """Segments are split on / and RFC 6901 escapes decoded."""
+        assert split_jsonpointer("level~1one/sub~0field/0") == ("level/one", "sub~field", "0")
+
+    def test_empty_pointer_has_no_segments(self):
+        """The empty pointer refers to the whole document."""
+        data = {"id": "abc"}
+        assert split_jsonpointer("") == ()
+        assert extract_by_segments(data, ()) is data
+
+    def test_extract_by_segments_matches_pointer(self):
+        """Pre-split segments extract the same values as the pointer string."""
+        data = {"items": [{"id": "first"}, None], "a/b": 1}
+        for pointer in ["items/0/id", "items/1/id", "items/5", "a~1b", "missing/x"]:
+            assert extract_by_segments(data, split_jsonpointer(pointer)) is (
+                extract_by_jsonpointer(data, pointer)
+            )
+
+
 class TestCaseGeneratorLinkFields:
     """Tests for CaseGenerator.get_link_fields() method."""
 
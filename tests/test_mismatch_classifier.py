@@ -204,6 +204,20 @@ class TestMismatchDedupKey:
         key = mismatch_dedup_key("op1", diff)
         assert key == ("op1", "body", frozenset({"extra:$.custom_field"}))
 
+    def test_structural_diff_mismatch_has_distinct_key(self):
+        """Structural diff mismatches use structural_diff paths, not empty frozenset."""
+        diff = {
+            "mismatch_type": "body",
+            "details": {
+                "body": {"match": True, "differences": []},
+                "structural_diff": {
+                    "differences": [{"path": "items.[0].name", "a_value": "x", "b_value": "y"}]
+                },
+            },
+        }
+        key = mismatch_dedup_key("op1", diff)
+        assert key == ("op1", "body", frozenset({"structural:items.[0].name"}))
+
     def test_binary_and_json_body_produce_different_keys(self):
         """Binary body mismatch and JSON body mismatch for same op are distinct."""
         binary_diff = {
@@ -181,6 +181,68 @@ class TestResponseCase:
         assert resp.http_version == "1.1"
 
 
+class _CountingBody:
+    """LazyBody stub that records how often it is decoded."""
+
+    def __init__(self, content: bytes, body, is_base64: bool = False):
+        self.content = content
+        self._result = (body, is_base64)
+        self.decode_calls = 0
+
+    def decode(self):
+        self.decode_calls += 1
+        return self._result
+
+
+class TestResponseCaseLazyBody:
+    def test_not_decoded_until_body_read(self):
+        lazy = _CountingBody(b'{"id": 1}', {"id": 1})
+        resp = ResponseCase.with_lazy_body(lazy, status_code=200, elapsed_ms=10)
+        assert resp.status_code == 200
+        assert lazy.decode_calls == 0
+        assert resp.body == {"id": 1}
+        assert resp.body == {"id": 1}
+        assert resp.body_base64 is None
+        assert lazy.decode_calls == 1
+
+    def test_dump_and_equality_match_eager(self):
+        lazy = _CountingBody(b'{"id": 1}', {"id": 1})
+        resp = ResponseCase.with_lazy_body(lazy, status_code=200, elapsed_ms=10)
+        eager = ResponseCase(status_code=200, elapsed_ms=10, body={"id": 1})
+        assert resp == eager
+        assert list(resp.model_dump()) == list(eager.model_dump())
+        assert resp.model_dump_json() == eager.model_dump_json()
+
+    def test_iteration_and_dict_include_body(self):
+        lazy = _CountingBody(b'{"id": 1}', {"id": 1})
+        resp = ResponseCase.with_lazy_body(lazy, status_code=200, elapsed_ms=10)
+        eager = ResponseCase(status_code=200, elapsed_ms=10, body={"id": 1})
+        assert dict(resp) == dict(eager)
+        assert [name for name, _ in resp] == [name for name, _ in eager]
+
+    def test_binary_base64_built_on_access(self):
+        lazy = _CountingBody(b"\x00\x01", None, is_base64=True)
+        resp = ResponseCase.with_lazy_body(lazy, status_code=200, elapsed_ms=10)
+        assert resp.body is None
+        assert "body_base64" not in resp.__dict__
+        assert resp.body_base64 == "AAE="
+
+    def test_assignment_replaces_pending_body(self):
+        lazy = _CountingBody(b'{"id": 1}', {"id": 1})
+        resp = ResponseCase.with_lazy_body(lazy, status_code=200, elapsed_ms=10)
+        resp.body = {"id": 2}
+        assert resp.body == {"id": 2}
+        assert resp.body_base64 is None
+
+    def test_model_copy_loads_independently(self):
+        lazy = _CountingBody(b'"x"', "x")
+        resp = ResponseCase.with_lazy_body(lazy, status_code=200, elapsed_ms=10)
+        copy = resp.model_copy(update={"status_code": 201})
+        assert copy.status_code == 201
+        assert copy.body == "x"
+        assert resp.body == "x"
+
+
 # =============================================================================
 # FieldRule Tests
 # =============================================================================
@@ -637,6 +699,51 @@ class TestTargetConfig:
         assert restored == target
         assert restored.ciphers == "ECDHE+AESGCM"
 
+    def test_with_rate_limit(self):
+        """Test target config with a token-bucket rate limit and overrides."""
+        target = TargetConfig(
+            base_url="https://staging.example.com",
+            rate_limit={
+                "requests_per_second": 20,
+                "burst": 5,
+                "operations": {"createReport": {"requests_per_second": 1}},
+            },
+        )
+        assert target.rate_limit.requests_per_second == 20
+        assert target.rate_limit.burst == 5
+        assert target.rate_limit.operations["createReport"].requests_per_second == 1
+        assert target.rate_limit.operations["createReport"].burst == 1
+
+    def test_rate_limit_rejects_non_positive_rate(self):
+        """Test that a zero or negative rate is rejected."""
+        with pytest.raises(ValueError, match="greater than 0"):
+            TargetConfig(base_url="http://localhost", rate_limit={"requests_per_second": 0})
+
+    def test_rate_limit_rejects_zero_burst(self):
+        """Test that burst must allow at least one request."""
+        with pytest.raises(ValueError, match="greater than or equal to 1"):
+            TargetConfig(
+                base_url="http://localhost",
+                rate_limit={"requests_per_second": 5, "burst": 0},
+            )
+
+    def test_connection_defaults_match_httpx(self):
+        """Test that pool defaults equal httpx's, so existing configs are unchanged."""
+        target = TargetConfig(base_url="http://localhost")
+        assert target.http2 is False
+        assert target.max_connections == 100
+        assert target.max_keepalive_connections == 20
+        assert target.keepalive_expiry == 5.0
+
+    def test_keepalive_cannot_exceed_max_connections(self):
+        """Test that the idle pool must fit within the connection limit."""
+        with pytest.raises(ValueError, match="cannot exceed max_connections"):
+            TargetConfig(
+                base_url="http://localhost",
+                max_connections=10,
+                max_keepalive_connections=20,
+            )
+
 
 class TestRuntimeConfig:
     def test_full_config_serialization(self):
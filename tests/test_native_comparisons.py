@@ -0,0 +1,269 @@
+"""Tests for native (Python) evaluation of predefined comparisons.
+
+Agreement with the CEL runtime on the same inputs is checked in
+tests/integration/test_native_comparisons_cel.py.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from api_parity.models import ComparisonLibrary, FieldRule, PredefinedComparison
+from api_parity.native_comparisons import (
+    compile_native_column,
+    compile_native_comparison,
+    is_reflexive,
+)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture(scope="module")
+def library() -> ComparisonLibrary:
+    """The production comparison library."""
+    library_path = PROJECT_ROOT / "prototype" / "comparison-rules" / "comparison_library.json"
+    with open(library_path) as f:
+        return ComparisonLibrary.model_validate(json.load(f))
+
+
+def native(library: ComparisonLibrary, name: str, **params):
+    """Compile the native comparison for a predefined from the library."""
+    rule = FieldRule(predefined=name, **params)
+    return compile_native_comparison(name, library.predefined[name], rule)
+
+
+class TestCompilation:
+    """Tests for which rules get a native comparison."""
+
+    def test_common_predefined_compiled(self, library):
+        """Parameterless predefineds from the library compile."""
+        assert native(library, "exact_match") is not None
+        assert native(library, "uuid_format") is not None
+
+    def test_predefined_without_native(self, library):
+        """Predefineds with user patterns or ext functions stay on CEL."""
+        assert native(library, "both_match_regex", pattern="^x$") is None
+        assert native(library, "string_prefix", length=3) is None
+
+    def test_library_expression_differs(self):
+        """A predefined redefined by the library is left to CEL."""
+        predefined = PredefinedComparison(description="Loose", params=[], expr="a != null")
+        rule = FieldRule(predefined="exact_match")
+        assert compile_native_comparison("exact_match", predefined, rule) is None
+
+    def test_missing_param_not_compiled(self, library):
+        """Missing parameters are left to the comparator's config error."""
+        assert native(library, "numeric_tolerance") is None
+
+    def test_string_param_with_newline_not_compiled(self, library):
+        """A substring CEL cannot parse as a literal is left to CEL."""
+        assert native(library, "string_contains", substring="a\nb") is None
+
+    def test_reflexive_predefined(self, library):
+        """Equality predefineds always hold for a value and itself; others may not."""
+        assert is_reflexive("exact_match", library.predefined["exact_match"])
+        assert is_reflexive("type_match", library.predefined["type_match"])
+        assert not is_reflexive("numeric_tolerance", library.predefined["numeric_tolerance"])
+        assert not is_reflexive("uuid_format", library.predefined["uuid_format"])
+
+    def test_redefined_predefined_not_reflexive(self):
+        """Reflexivity is only known for the built-in expression."""
+        predefined = PredefinedComparison(description="Loose", params=[], expr="a != b")
+        assert not is_reflexive("exact_match", predefined)
+
+
+class TestEquality:
+    """Tests for exact_match semantics (CEL heterogeneous equality)."""
+
+    @pytest.mark.parametrize(
+        "a,b,expected",
+        [
+            (1, 1, True),
+            (1, 1.0, True),  # JSON numbers are all doubles in CEL
+            (1, "1", False),
+            (True, 1, False),
+            (None, None, True),
+            (None, 0, False),
+            ([1, {"x": 2}], [1.0, {"x": 2}], True),
+            ([1, 2], [2, 1], False),
+            ({"x": 1, "y": 2}, {"y": 2, "x": 1}, True),
+            ({"x": 1}, {"x": 1, "y": 2}, False),
+        ],
+    )
+    def test_exact_match(self, library, a, b, expected):
+        """Values compare like CEL's == on JSON-decoded values."""
+        assert native(library, "exact_match")(a, b) is expected
+
+    @pytest.mark.parametrize(
+        "value",
+        [float("nan"), float("inf"), 10**400, "\ud800", {1: "x"}, (1, 2)],
+    )
+    def test_values_not_representable_defer(self, library, value):
+        """Values that do not reach CEL unchanged are left to CEL."""
+        assert native(library, "exact_match")(value, value) is None
+
+
+class TestNumeric:
+    """Tests for numeric predefineds."""
+
+    def test_numeric_tolerance(self, library):
+        """Tolerance bounds are inclusive in both directions."""
+        compare = native(library, "numeric_tolerance", tolerance=0.5)
+        assert compare(1, 1.5) is True
+        assert compare(1.6, 1) is False
+
+    def test_numeric_tolerance_non_number_defers(self, library):
+        """Subtraction on non-numbers is a CEL error, left to CEL."""
+        assert native(library, "numeric_tolerance", tolerance=1)("1", "1") is None
+
+    def test_both_integer(self, library):
+        """Whole doubles are integers; huge magnitudes are left to CEL."""
+        compare = native(library, "both_integer")
+        assert compare(3, 4.0) is True
+        assert compare(3, 4.5) is False
+        assert compare(2.0**63, 1) is None
+
+    def test_false_conjunct_decides_despite_error(self, library):
+        """`false && error` is false in CEL, so a false side decides."""
+        compare = native(library, "both_positive")
+        assert compare(-1, "x") is False
+        assert compare(1, "x") is None
+
+    def test_same_sign(self, library):
+        """Zero only matches zero."""
+        compare = native(library, "same_sign")
+        assert compare(-2, -0.5) is True
+        assert compare(0, 1) is False
+
+    def test_both_in_range(self, library):
+        """Range bounds are inclusive."""
+        compare = native(library, "both_in_range", min=0, max=10)
+        assert compare(0, 10) is True
+        assert compare(0, 10.5) is False
+
+
+class TestCollections:
+    """Tests for size, array and object predefineds."""
+
+    def test_unordered_array(self, library):
+        """Same elements in any order; sizes must match."""
+        compare = native(library, "unordered_array")
+        assert compare([1, "x", None], [None, 1.0, "x"]) is True
+        assert compare([1, 3], [1, 2]) is False
+        # Membership only, like the CEL expression: duplicates are not counted
+        assert compare([1, 1], [1, 2]) is True
+        assert compare([{"a": 1}], [{"a": 1}]) is True
+        assert compare([1, 2], [1]) is False
+
+    def test_same_keys(self, library):
+        """Key sets compare regardless of values."""
+        compare = native(library, "same_keys")
+        assert compare({"x": 1, "y": 2}, {"y": 0, "x": None}) is True
+        assert compare({"x": 1}, {"y": 1}) is False
+
+    def test_size_counts_code_points(self, library):
+        """String size is in code points, as in CEL."""
+        assert native(library, "string_length_match")("日本", "ab") is True
+
+    def test_size_of_number_defers(self, library):
+        """size() of a number is a CEL error, left to CEL."""
+        assert native(library, "array_length")(1, 1) is None
+
+
+class TestStrings:
+    """Tests for string and format predefineds."""
+
+    def test_string_contains(self, library):
+        """Both strings must contain the substring."""
+        compare = native(library, "string_contains", substring='say "hi"')
+        assert compare('they say "hi"', 'say "hi" back') is True
+        assert compare('say "hi"', "say hello") is False
+
+    @pytest.mark.parametrize(
+        "name,good,bad",
+        [
+            ("uuid_format", "123e4567-e89b-12d3-a456-426614174000", "123e4567e89b12d3a456426614174000"),
+            ("uuid_v4_format", "123e4567-e89b-42d3-a456-426614174000", "123e4567-e89b-12d3-a456-426614174000"),
+            ("url_format", "https://example.com/x", "https://example.com/ x"),
+            ("iso_timestamp_format", "2024-01-15T10:30:00Z", "2024-01-15 10:30:00"),
+            ("iso_date_format", "2024-01-15", "2024-01-15T00:00:00"),
+            ("jwt_format", "aaa.bbb.ccc", "aaa.bbb"),
+            ("base64_format", "SGVsbG8=", "SGVsbG8==="),
+        ],
+    )
+    def test_formats(self, library, name, good, bad):
+        """Format predefineds accept and reject like their RE2 patterns."""
+        compare = native(library, name)
+        assert compare(good, good) is True
+        assert compare(good, bad) is False
+
+    def test_end_anchor_rejects_trailing_newline(self, library):
+        """RE2's $ matches only at the end, unlike Python's."""
+        assert native(library, "iso_date_format")("2024-01-15\n", "2024-01-15") is False
+
+    def test_digit_class_is_ascii(self, library):
+        """RE2's \\d only matches ASCII digits."""
+        assert native(library, "iso_date_format")("２０２４-01-15", "2024-01-15") is False
+
+    def test_hex_string_requires_same_length(self, library):
+        """hex_string also compares lengths."""
+        compare = native(library, "hex_string")
+        assert compare("00ff", "ABCD") is True
+        assert compare("00ff", "ABC") is False
+
+
+class TestTypes:
+    """Tests for null and type predefineds."""
+
+    def test_type_match_numbers(self, library):
+        """Integers and floats are both CEL doubles."""
+        compare = native(library, "type_match")
+        assert compare(1, 2.5) is True
+        assert compare(1, "1") is False
+        assert compare(True, 1) is False
+
+    def test_both_null_or_equal(self, library):
+        """Null matches only null; other values compare by equality."""
+        compare = native(library, "both_null_or_equal")
+        assert compare(None, None) is True
+        assert compare(None, 0) is False
+        assert compare(2, 2.0) is True
+
+
+# Values on both sides of the column kernels' inline checks
+COLUMN_VALUES = [
+    0, 1, 1.0, -1.5, 2**53, 2**53 + 1, 10**400, float("nan"), float("inf"),
+    True, None, "", "abc", "abé", "\ud800", "2024-01-15", "2024-01-15\n",
+    "123e4567-e89b-12d3-a456-426614174000", [1], {"x": 1},
+]
+
+
+class TestColumns:
+    """Tests for column comparisons over wildcard matches."""
+
+    @pytest.mark.parametrize(
+        "name,params",
+        [
+            ("exact_match", {}),
+            ("numeric_tolerance", {"tolerance": 0.5}),
+            ("epoch_seconds_tolerance", {"seconds": 5.0}),
+            ("iso_date_format", {}),
+            ("uuid_format", {}),
+            ("same_keys", {}),  # no column kernel: pair by pair
+        ],
+    )
+    def test_column_matches_pairwise(self, library, name, params):
+        """A column result equals the per-pair results, index by index."""
+        rule = FieldRule(predefined=name, **params)
+        column = compile_native_column(name, library.predefined[name], rule)
+        compare = native(library, name, **params)
+        col_a = [a for a in COLUMN_VALUES for _ in COLUMN_VALUES]
+        col_b = [b for _ in COLUMN_VALUES for b in COLUMN_VALUES]
+
+        assert column(col_a, col_b) == [compare(a, b) for a, b in zip(col_a, col_b)]
+
+    def test_no_column_without_native(self, library):
+        """Predefineds left to CEL have no column comparison either."""
+        rule = FieldRule(predefined="both_match_regex", pattern="^x$")
+        assert compile_native_column("both_match_regex", library.predefined["both_match_regex"], rule) is None
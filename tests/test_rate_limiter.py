@@ -0,0 +1,276 @@
+"""Tests for token-bucket rate limiting (api_parity.rate_limiter).
+
+Tests cover:
+- Burst capacity is available immediately, then tokens refill at the rate
+- Reservations queue concurrent callers at 1/rate spacing
+- Per-operation overrides select their own bucket
+- Executors apply each target's bucket independently
+- Adaptive control backs off on throttling/latency and ramps up additively
+"""
+
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from api_parity.executor import AsyncExecutor, Executor
+from api_parity.models import AdaptiveRateConfig, ResponseCase, TargetConfig, TargetRateLimitConfig
+from api_parity.rate_limiter import (
+    AdaptiveRateController,
+    TargetRateLimiter,
+    TokenBucket,
+    parse_retry_after,
+)
+from tests.test_executor_async import TARGET_A, _echo_handler, _make_request, _with_transport
+
+
+class FakeClock:
+    """Controllable stand-in for time.monotonic()."""
+
+    def __init__(self, now: float = 100.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucket:
+    def test_burst_then_spacing(self) -> None:
+        clock = FakeClock()
+        with patch("api_parity.rate_limiter.time.monotonic", clock):
+            bucket = TokenBucket(rate=10.0, burst=3)
+            delays = [bucket.reserve() for _ in range(5)]
+
+        # Three tokens available up front; the next two queue 0.1s apart
+        assert delays == pytest.approx([0.0, 0.0, 0.0, 0.1, 0.2])
+
+    def test_refill_caps_at_burst(self) -> None:
+        clock = FakeClock()
+        with patch("api_parity.rate_limiter.time.monotonic", clock):
+            bucket = TokenBucket(rate=10.0, burst=2)
+            bucket.reserve()
+            bucket.reserve()
+            clock.now += 60.0  # Long idle period refills only up to burst
+            delays = [bucket.reserve() for _ in range(3)]
+
+        assert delays == pytest.approx([0.0, 0.0, 0.1])
+
+    def test_partial_refill(self) -> None:
+        clock = FakeClock()
+        with patch("api_parity.rate_limiter.time.monotonic", clock):
+            bucket = TokenBucket(rate=4.0, burst=1)
+            assert bucket.reserve() == 0.0
+            clock.now += 0.125  # Half a token
+            assert bucket.reserve() == pytest.approx(0.125)
+
+    def test_acquire_sleeps_for_reservation(self) -> None:
+        clock = FakeClock()
+        with patch("api_parity.rate_limiter.time.monotonic", clock), \
+                patch("api_parity.rate_limiter.time.sleep") as mock_sleep:
+            bucket = TokenBucket(rate=2.0)
+            bucket.acquire()
+            bucket.acquire()
+
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args[0][0] == pytest.approx(0.5)
+
+    def test_invalid_arguments(self) -> None:
+        with pytest.raises(ValueError, match="rate"):
+            TokenBucket(rate=0)
+        with pytest.raises(ValueError, match="burst"):
+            TokenBucket(rate=1.0, burst=0)
+
+
+class TestTargetRateLimiter:
+    def test_operation_override_uses_own_bucket(self) -> None:
+        limiter = TargetRateLimiter(TargetRateLimitConfig(
+            requests_per_second=50,
+            burst=10,
+            operations={"slowReport": {"requests_per_second": 1}},
+        ))
+
+        assert limiter.bucket_for("slowReport").rate == 1
+        assert limiter.bucket_for("slowReport").burst == 1
+        assert limiter.bucket_for("getWidget").rate == 50
+        assert limiter.bucket_for("getWidget") is limiter.bucket_for("listWidgets")
+
+
+class TestExecutorTargetBuckets:
+    def test_targets_have_independent_buckets(self) -> None:
+        limited = TargetConfig(
+            base_url="http://localhost:8001",
+            rate_limit={"requests_per_second": 5, "burst": 2},
+        )
+        unlimited = TargetConfig(base_url="http://localhost:8002")
+
+        executor = Executor(limited, unlimited)
+        try:
+            assert set(executor._target_rate_limiters) == {"Target A"}
+            assert executor._target_rate_limiters["Target A"].bucket_for("op").burst == 2
+        finally:
+            executor.close()
+
+    def test_same_config_gets_separate_buckets(self) -> None:
+        target = TargetConfig(
+            base_url="http://localhost:8001",
+            rate_limit={"requests_per_second": 5},
+        )
+
+        executor = AsyncExecutor(target, target, concurrency=2)
+        try:
+            bucket_a = executor._target_rate_limiters["Target A"].bucket_for("op")
+            bucket_b = executor._target_rate_limiters["Target B"].bucket_for("op")
+            assert bucket_a is not bucket_b
+        finally:
+            executor.close()
+
+    def test_execute_waits_only_on_limited_target(self) -> None:
+        limited = TargetConfig(
+            base_url="http://target-a",
+            rate_limit={"requests_per_second": 2, "operations": {"bulkExport": {"requests_per_second": 0.5}}},
+        )
+        unlimited = TargetConfig(base_url="http://target-b")
+        clock = FakeClock()
+
+        with _with_transport(httpx.MockTransport(_echo_handler)), \
+                patch("api_parity.rate_limiter.time.monotonic", clock), \
+                patch("api_parity.rate_limiter.time.sleep") as mock_sleep:
+            with Executor(limited, unlimited) as executor:
+                executor.execute(_make_request("case-1"))
+                executor.execute(_make_request("case-2"))
+                export = _make_request("case-3")
+                export.operation_id = "bulkExport"
+                executor.execute(export)
+                executor.execute(export)
+
+        # Second getWidget waits 1/2s on A's bucket; bulkExport has its own
+        # bucket (first call free, second waits 2s). B never waits.
+        assert [c.args[0] for c in mock_sleep.call_args_list] == pytest.approx([0.5, 2.0])
+
+
+def _response(status_code: int = 200, elapsed_ms: float = 10.0, retry_after: str | None = None) -> ResponseCase:
+    headers = {"retry-after": [retry_after]} if retry_after is not None else {}
+    return ResponseCase(status_code=status_code, headers=headers, elapsed_ms=elapsed_ms)
+
+
+class TestTokenBucketAdjustments:
+    def test_set_rate_keeps_accrued_tokens(self) -> None:
+        clock = FakeClock()
+        with patch("api_parity.rate_limiter.time.monotonic", clock):
+            bucket = TokenBucket(rate=1.0)
+            bucket.reserve()
+            bucket.set_rate(10.0)
+            assert bucket.reserve() == pytest.approx(0.1)
+
+    def test_pause_delays_next_token(self) -> None:
+        clock = FakeClock()
+        with patch("api_parity.rate_limiter.time.monotonic", clock):
+            bucket = TokenBucket(rate=10.0, burst=5)
+            bucket.pause(3.0)
+            assert bucket.reserve() == pytest.approx(3.0)
+
+
+class TestParseRetryAfter:
+    def test_delay_seconds(self) -> None:
+        assert parse_retry_after("120") == 120.0
+
+    def test_http_date_in_past_is_zero(self) -> None:
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_garbage(self) -> None:
+        assert parse_retry_after("soon") is None
+
+
+class TestAdaptiveRateController:
+    @staticmethod
+    def _controller(rate: float = 10.0, **config) -> tuple[TokenBucket, AdaptiveRateController]:
+        bucket = TokenBucket(rate=rate)
+        return bucket, AdaptiveRateController(bucket, AdaptiveRateConfig(**config))
+
+    def test_throttle_backs_off_multiplicatively(self) -> None:
+        bucket, controller = self._controller(rate=10.0, min_requests_per_second=3.0)
+
+        assert controller.record(_response(429), sent_at=time.perf_counter()) is True
+        assert bucket.rate == pytest.approx(5.0)
+        assert controller.record(_response(503), sent_at=time.perf_counter()) is True
+        assert bucket.rate == pytest.approx(3.0)  # Floored at min
+
+    def test_in_flight_throttles_do_not_cascade(self) -> None:
+        bucket, controller = self._controller(rate=16.0)
+        sent_before = time.perf_counter()
+
+        controller.record(_response(429), sent_at=sent_before)
+        controller.record(_response(429), sent_at=sent_before)
+        controller.record(_response(429), sent_at=sent_before)
+
+        # All three were sent at the old rate: one backoff, not three
+        assert bucket.rate == pytest.approx(8.0)
+
+    def test_retry_after_pauses_bucket(self) -> None:
+        bucket, controller = self._controller(rate=10.0)
+        with patch.object(bucket, "pause") as mock_pause:
+            controller.record(_response(429, retry_after="7"), sent_at=time.perf_counter())
+        mock_pause.assert_called_once_with(7.0)
+
+    def test_healthy_window_ramps_up_additively(self) -> None:
+        bucket, controller = self._controller(
+            rate=10.0, window=5, increase_step=2.0, max_requests_per_second=13.0
+        )
+        for _ in range(5):
+            assert controller.record(_response(), sent_at=time.perf_counter()) is False
+        assert bucket.rate == pytest.approx(12.0)
+
+        for _ in range(5):
+            controller.record(_response(), sent_at=time.perf_counter())
+        assert bucket.rate == pytest.approx(13.0)  # Capped at max
+
+    def test_latency_jump_backs_off(self) -> None:
+        bucket, controller = self._controller(rate=10.0, window=5, latency_factor=2.0)
+        for _ in range(5):
+            controller.record(_response(elapsed_ms=10.0), sent_at=time.perf_counter())
+        assert bucket.rate == pytest.approx(11.0)
+
+        for _ in range(5):
+            controller.record(_response(elapsed_ms=50.0), sent_at=time.perf_counter())
+        assert bucket.rate == pytest.approx(5.5)
+
+    def test_non_adaptive_limiter_never_throttles(self) -> None:
+        limiter = TargetRateLimiter(TargetRateLimitConfig(requests_per_second=5))
+        assert limiter.adaptive is False
+        assert limiter.record("op", _response(429), sent_at=time.perf_counter()) is False
+
+
+class TestExecutorThrottleMarking:
+    @staticmethod
+    def _handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "target-b":
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={})
+
+    def test_adaptive_target_marks_throttled(self) -> None:
+        target_a = TargetConfig(base_url="http://target-a")
+        target_b = TargetConfig(
+            base_url="http://target-b",
+            rate_limit={"requests_per_second": 100, "adaptive": {}},
+        )
+
+        with _with_transport(httpx.MockTransport(self._handler)):
+            with Executor(target_a, target_b) as executor:
+                response_a, response_b = executor.execute(_make_request("case-1"))
+                rates = executor.adaptive_rates()
+
+        assert response_a.throttled is False
+        assert response_b.throttled is True
+        assert rates == {"Target B": pytest.approx(50.0)}
+
+    def test_without_adaptive_429_is_ordinary(self) -> None:
+        target_b = TargetConfig(base_url="http://target-b", rate_limit={"requests_per_second": 100})
+
+        with _with_transport(httpx.MockTransport(self._handler)):
+            with Executor(TARGET_A, target_b) as executor:
+                _, response_b = executor.execute(_make_request("case-1"))
+                assert executor.adaptive_rates() == {}
+
+        assert response_b.status_code == 429
+        assert response_b.throttled is False
@@ -745,6 +745,15 @@ class TestEdgeCases:
         # Cache key should exist
         assert ("listStrictWidgets", 200) in validator._schema_cache
 
+    def test_validation_caches_validators(self, validator):
+        """One validator is built per operation+status and reused."""
+        validator.validate_response({"widgets": [], "total": 0}, "listStrictWidgets", 200)
+        cached = validator._validator_cache[("listStrictWidgets", 200)]
+        result = validator.validate_response({"widgets": "oops", "total": 0}, "listStrictWidgets", 200)
+        assert result.valid is False
+        assert validator._validator_cache[("listStrictWidgets", 200)] is cached
+        assert list(validator._validator_cache) == [("listStrictWidgets", 200)]
+
 
 # =============================================================================
 # Operation Index Tests
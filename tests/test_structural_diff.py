@@ -0,0 +1,84 @@
+"""Tests for the structural body diff."""
+
+import json
+
+from api_parity.jsonpath_accessor import concrete_path
+from api_parity.structural_diff import MISSING, diff_bodies
+
+
+def rendered(differences):
+    """Differences with their locations rendered."""
+    return [(concrete_path(location), a, b) for location, a, b in differences]
+
+
+class TestDiffBodies:
+    """Tests for diff_bodies()."""
+
+    def test_identical_bodies(self):
+        """Equal bodies have no differences."""
+        body = {"id": 1, "items": [{"tags": ["a"]}], "meta": None}
+        assert diff_bodies(body, json.loads(json.dumps(body))) == []
+
+    def test_differing_leaves_in_document_order(self):
+        """Every differing leaf is reported, in A's order, with B-only members last."""
+        body_a = {"id": 1, "items": [{"p": 1}, {"p": 2}], "name": "x"}
+        body_b = {"extra": True, "id": 2, "items": [{"p": 1}, {"p": 3}], "name": "x"}
+
+        assert rendered(diff_bodies(body_a, body_b)) == [
+            ("id", 1, 2),
+            ("items.[1].p", 2, 3),
+            ("extra", MISSING, True),
+        ]
+
+    def test_missing_members_and_items(self):
+        """Members and items on one side only are reported whole."""
+        body_a = {"list": [1, 2, 3], "obj": {"x": 1}}
+        body_b = {"list": [1]}
+
+        assert rendered(diff_bodies(body_a, body_b)) == [
+            ("list.[1]", 2, MISSING),
+            ("list.[2]", 3, MISSING),
+            ("obj", {"x": 1}, MISSING),
+        ]
+
+    def test_container_type_change(self):
+        """An object on one side and a list on the other is one difference."""
+        assert rendered(diff_bodies({"x": {"a": 1}}, {"x": [1]})) == [("x", {"a": 1}, [1])]
+
+    def test_root_scalars(self):
+        """Differing scalar bodies are reported at $."""
+        assert rendered(diff_bodies(1, 2)) == [("$", 1, 2)]
+
+    def test_cel_equality(self):
+        """1 and 1.0 are equal; true and 1 are not, even inside equal-looking containers."""
+        body_a = {"count": 1, "flags": [True, False]}
+        body_b = {"count": 1.0, "flags": [1, False]}
+
+        assert rendered(diff_bodies(body_a, body_b)) == [("flags.[0]", True, 1)]
+
+    def test_key_order_ignored(self):
+        """Members in a different order are not differences."""
+        assert diff_bodies({"a": 1, "b": [1]}, {"b": [1], "a": 1}) == []
+
+    def test_missing_placeholder_in_body(self):
+        """A body value equal to the placeholder is not mistaken for a missing member."""
+        assert rendered(diff_bodies({"x": MISSING}, {})) == [("x", MISSING, MISSING)]
+
+    def test_governed_subtrees_skipped(self):
+        """Locations covered by rules are left out with everything below them."""
+        body_a = {"id": 1, "items": [{"p": 1, "q": 1}], "meta": {"t": 1}}
+        body_b = {"id": 2, "items": [{"p": 2, "q": 2}], "meta": {"t": 2}}
+        governed = {(None, "id"), (((None, "items"), 0), "p"), (None, "meta")}
+
+        assert rendered(diff_bodies(body_a, body_b, governed)) == [("items.[0].q", 1, 2)]
+
+    def test_deep_nesting(self):
+        """Nesting beyond the recursion limit is walked."""
+        body_a, body_b = [1], [2]
+        for _ in range(5000):
+            body_a, body_b = [body_a], [body_b]
+
+        differences = diff_bodies(body_a, body_b)
+
+        assert [(a, b) for _, a, b in differences] == [(1, 2)]
+        assert concrete_path(differences[0][0]).count("[0]") == 5001